@@ -1,36 +1,89 @@
-"""Top-level package for piel."""
+"""Top-level package for piel.
 
+The subpackages and the functions star-exported from the top-level modules are loaded lazily on first attribute
+access, so that ``import piel`` does not pull in jax, pandas or matplotlib until they are needed.
+"""
+
+import importlib
 import os
 import pathlib
 
-# Libraries - Do not change the order
-import piel.types as types  # NOQA: F401
-import piel.models as models  # NOQA: F401
-import piel.units as units  # NOQA: F401
-import piel.materials as materials  # NOQA: F401
-import piel.tools as tools  # NOQA: F401
-
-# Functions
-from piel.file_system import *  # NOQA: F403
-from piel.project_structure import *  # NOQA: F403
-from piel.utils import *  # NOQA: F403
-from piel.connectivity import *  # NOQA: F403
-
-import piel.analysis as analysis  # NOQA: F401
-import piel.base as base  # NOQA: F401
-import piel.experimental as experimental  # NOQA: F401
-import piel.file_system as file_system  # NOQA: F401
-import piel.develop as develop  # NOQA: F401
-import piel.visual as visual  # NOQA: F401
-import piel.integration as integration  # NOQA: F401
-import piel.flows as flows  # NOQA: F401
+# Libraries - Listed in their original import order
+_LAZY_SUBMODULES = (
+    "types",
+    "models",
+    "units",
+    "materials",
+    "tools",
+    "analysis",
+    "base",
+    "experimental",
+    "file_system",
+    "develop",
+    "visual",
+    "integration",
+    "flows",
+)
+
+# Functions - Modules whose public names are exported at the top level, later modules take precedence
+_LAZY_STAR_EXPORT_MODULES = (
+    "file_system",
+    "project_structure",
+    "utils",
+    "connectivity",
+)
 
 os.environ["PIEL_PACKAGE_DIRECTORY"] = str(
     pathlib.Path(__file__).parent.parent.resolve()
 )
 
-create_piel_home_directory()  # NOQA: F405
-
 __author__ = """Dario Quintero"""
 __email__ = "darioaquintero@gmail.com"
 __version__ = "0.1.0"
+
+
+def _get_star_export_names(module) -> list[str]:
+    """
+    Returns the names a ``from module import *`` statement would export.
+    """
+    if hasattr(module, "__all__"):
+        return list(module.__all__)
+    return [name for name in vars(module) if not name.startswith("_")]
+
+
+def _compose_all() -> list[str]:
+    """
+    Imports all the lazy modules and returns the names exported at the top level.
+    """
+    all_names = list(_LAZY_SUBMODULES) + list(_LAZY_STAR_EXPORT_MODULES)
+    for module_name in _LAZY_STAR_EXPORT_MODULES:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        all_names.extend(_get_star_export_names(module))
+    return list(dict.fromkeys(all_names))
+
+
+def __getattr__(name: str):
+    # The star export modules are also attributes of the package, as when they were imported eagerly
+    if name in _LAZY_SUBMODULES or name in _LAZY_STAR_EXPORT_MODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+
+    if name == "__all__":
+        all_names = _compose_all()
+        globals()["__all__"] = all_names
+        return all_names
+
+    if not name.startswith("_"):
+        for module_name in reversed(_LAZY_STAR_EXPORT_MODULES):
+            module = importlib.import_module(f"{__name__}.{module_name}")
+            if name in _get_star_export_names(module):
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_compose_all()))
@@ -7,3 +7,4 @@ from . import electro_optic
 from . import electronic
 from . import metrics
 from . import signals
+from . import timing
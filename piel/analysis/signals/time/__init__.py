@@ -1,14 +1,35 @@
 from piel.analysis.signals.time.core.compose import compose_pulses_into_signal
 from piel.analysis.signals.time.core.dimension import resize_data_time_signal_units
-from piel.analysis.signals.time.core.metrics import extract_peak_to_peak_metrics_list
+from piel.analysis.signals.time.core.metrics import (
+    convert_metrics_table_to_scalar_metric_collection,
+    extract_mean_metrics_list,
+    extract_multi_data_time_signal_metrics_table,
+    extract_multi_time_signal_statistical_metrics,
+    extract_peak_to_peak_metrics_list,
+    extract_statistical_metrics_collection,
+)
+from piel.analysis.signals.time.core.pulse import (
+    compose_pulse_set,
+    convert_pulse_set_to_multi_data_time_signal,
+    extract_pulse_set_metrics,
+    get_pulse_view,
+)
 from piel.analysis.signals.time.core.threshold import (
     extract_signal_above_threshold,
+    extract_pulse_set_above_threshold,
+    extract_pulse_set_from_signal,
     extract_pulses_from_signal,
     is_pulse_above_threshold,
 )
-from piel.analysis.signals.time.core.transition import extract_rising_edges
+from piel.analysis.signals.time.core.transition import (
+    extract_edge_transitions,
+    extract_falling_edges,
+    extract_rising_edges,
+    extract_transition_times,
+)
 from piel.analysis.signals.time.core.transform import offset_time_signals
 from piel.analysis.signals.time.core.split import (
+    extract_pulse_index_ranges_per_threshold,
     separate_per_pulse_threshold,
     split_compose_per_pulse_threshold,
 )
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 from piel.types import (
     MultiDataTimeSignal,
     ScalarMetric,
@@ -7,54 +8,153 @@ from piel.types import (
 )
 from piel.types.units import V
 from piel.analysis.metrics import aggregate_scalar_metrics_collection
+from .pulse import reduce_index_ranges
 
 
-def extract_mean_metrics_list(
-    multi_data_time_signal: MultiDataTimeSignal, **kwargs
+def extract_multi_data_time_signal_metrics_table(
+    multi_data_time_signal: MultiDataTimeSignal,
+) -> pd.DataFrame:
+    """
+    Computes the statistics of every signal in a ``MultiDataTimeSignal`` in a single vectorized pass. The data of all
+    the signals is packed once into a flat ragged array, and each statistic is reduced over the index range of each
+    signal with ``reduceat``.
+
+    Args:
+        multi_data_time_signal (MultiDataTimeSignal): A collection of time signals to analyze.
+
+    Returns:
+        pd.DataFrame: One row per signal with the ``data_name``, ``count``, ``mean``, ``min``, ``max``,
+        ``peak_to_peak`` and population ``standard_deviation`` columns. The statistics of empty signals are NaN.
+    """
+    data_arrays = [
+        np.asarray(signal.data, dtype=float).ravel()
+        for signal in multi_data_time_signal
+    ]
+    count = np.array([len(data) for data in data_arrays], dtype=np.int64)
+    stop_indexes = np.cumsum(count)
+    start_indexes = stop_indexes - count
+    flat_data = np.concatenate(data_arrays) if data_arrays else np.empty(0, dtype=float)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = (
+            reduce_index_ranges(np.add, flat_data, start_indexes, stop_indexes) / count
+        )
+        min_values = reduce_index_ranges(
+            np.minimum, flat_data, start_indexes, stop_indexes
+        )
+        max_values = reduce_index_ranges(
+            np.maximum, flat_data, start_indexes, stop_indexes
+        )
+        # Two-pass variance against each signal mean to avoid cancellation
+        squared_deviation = (flat_data - np.repeat(mean, count)) ** 2
+        variance = (
+            reduce_index_ranges(np.add, squared_deviation, start_indexes, stop_indexes)
+            / count
+        )
+
+    return pd.DataFrame(
+        {
+            "data_name": [signal.data_name for signal in multi_data_time_signal],
+            "count": count,
+            "mean": mean,
+            "min": min_values,
+            "max": max_values,
+            "peak_to_peak": max_values - min_values,
+            "standard_deviation": np.sqrt(variance),
+        }
+    )
+
+
+def convert_metrics_table_to_scalar_metric_collection(
+    metrics_table: pd.DataFrame,
+    analysis_type: EdgeTransitionAnalysisTypes = "mean",
+    metric_kwargs_list: list[dict] = None,
+    **kwargs,
 ) -> ScalarMetricCollection:
     """
-    Extracts scalar metrics from a collection of rising edge signals. Standard deviation is not calculated as this just
-    computes individual metrics list.
+    Converts a metrics table from ``extract_multi_data_time_signal_metrics_table`` into a ``ScalarMetricCollection``
+    with one ``ScalarMetric`` per signal.
 
     Args:
-        multi_data_time_signal (List[DataTimeSignalData]): A list of rising edge signals.
+        metrics_table (pd.DataFrame): The per-signal metrics table.
+        analysis_type (EdgeTransitionAnalysisTypes): Either "mean", where the metric value is the signal mean and
+            keeps its min and max, or "peak_to_peak", where all the metric fields are the peak-to-peak value.
+        metric_kwargs_list (list[dict], optional): Additional keyword arguments for each ScalarMetric.
 
     Returns:
-        ScalarMetricCollection: A collection of ScalarMetric instances containing the extracted metrics.
+        ScalarMetricCollection: A collection of ScalarMetric instances for each signal.
     """
-    if not multi_data_time_signal:
-        raise ValueError("The multi_signal list is empty.")
+    if metric_kwargs_list is None:
+        metric_kwargs_list = [dict() for _ in range(len(metrics_table))]
 
     if kwargs.get("unit") is None:
         kwargs["unit"] = V
 
-    metrics_list = []
+    if analysis_type == "mean":
+        value = metrics_table["mean"].to_numpy()
+        min_values = metrics_table["min"].to_numpy()
+        max_values = metrics_table["max"].to_numpy()
+        metric_unit_kwargs = {}
+    elif analysis_type == "peak_to_peak":
+        value = min_values = max_values = metrics_table["peak_to_peak"].to_numpy()
+        metric_unit_kwargs = {"unit": kwargs.get("unit")}
+    else:
+        raise TypeError(
+            f"Undefined analysis type. Current options are: {str(EdgeTransitionAnalysisTypes)}. Feel free to contribute to this."
+        )
 
-    for signal in multi_data_time_signal:
-        if not signal.data:
-            raise ValueError(f"Signal '{signal.data_name}' has an empty data array.")
+    metrics_list = [
+        ScalarMetric(
+            value=float(value_i),
+            mean=float(value_i),
+            min=float(min_i),
+            max=float(max_i),
+            standard_deviation=None,
+            count=None,
+            **metric_unit_kwargs,
+            **metric_kwargs_i,
+        )
+        for value_i, min_i, max_i, metric_kwargs_i in zip(
+            value, min_values, max_values, metric_kwargs_list
+        )
+    ]
 
-        data_array = np.array(signal.data)
+    return ScalarMetricCollection(metrics=metrics_list, **kwargs)
 
-        mean_val = float(np.mean(data_array))
-        min_val = float(np.min(data_array))
-        max_val = float(np.max(data_array))
-        std_dev = None
-        count = None
 
-        # Assuming 'value' is the mean; adjust if different meaning is intended
-        scalar_metric = ScalarMetric(
-            value=mean_val,
-            mean=mean_val,
-            min=min_val,
-            max=max_val,
-            standard_deviation=std_dev,
-            count=count,
-        )
+def _validate_metrics_table(metrics_table: pd.DataFrame) -> None:
+    """
+    Raises if the metrics table has no signals or any of its signals has no data.
+    """
+    if len(metrics_table) == 0:
+        raise ValueError("The multi_data_time_signal list is empty.")
 
-        metrics_list.append(scalar_metric)
+    empty_signals = metrics_table["data_name"][metrics_table["count"] == 0]
+    if len(empty_signals) > 0:
+        raise ValueError(f"Signal '{empty_signals.iloc[0]}' has an empty data array.")
 
-    return ScalarMetricCollection(metrics=metrics_list, **kwargs)
+
+def extract_mean_metrics_list(
+    multi_data_time_signal: MultiDataTimeSignal, **kwargs
+) -> ScalarMetricCollection:
+    """
+    Extracts scalar metrics from a collection of rising edge signals. Standard deviation is not calculated as this just
+    computes individual metrics list.
+
+    Args:
+        multi_data_time_signal (List[DataTimeSignalData]): A list of rising edge signals.
+
+    Returns:
+        ScalarMetricCollection: A collection of ScalarMetric instances containing the extracted metrics.
+    """
+    if not multi_data_time_signal:
+        raise ValueError("The multi_signal list is empty.")
+
+    metrics_table = extract_multi_data_time_signal_metrics_table(multi_data_time_signal)
+    _validate_metrics_table(metrics_table)
+    return convert_metrics_table_to_scalar_metric_collection(
+        metrics_table, analysis_type="mean", **kwargs
+    )
 
 
 def extract_peak_to_peak_metrics_list(
@@ -76,43 +176,29 @@ def extract_peak_to_peak_metrics_list(
     Raises:
         ValueError: If the input list is empty or any signal has an empty data array.
     """
-    if not multi_data_time_signal:
-        raise ValueError("The multi_data_time_signal list is empty.")
-
-    if metric_kwargs_list is None:
-        metric_kwargs_list = [dict().copy() for _ in range(len(multi_data_time_signal))]
-
-    if kwargs.get("unit") is None:
-        kwargs["unit"] = V
-
-    metrics_list = []
-
-    i = 0
-    for signal in multi_data_time_signal:
-        if not signal.data:
-            raise ValueError(f"Signal '{signal.data_name}' has an empty data array.")
-
-        data_array = np.array(signal.data)
-
-        min_val = float(np.min(data_array))
-        max_val = float(np.max(data_array))
-        peak_to_peak = max_val - min_val
-
-        scalar_metric = ScalarMetric(
-            value=peak_to_peak,  # Using peak-to-peak as the primary value
-            mean=peak_to_peak,  # Mean is not applicable for peak-to-peak
-            min=peak_to_peak,  # Min is already represented in peak-to-peak
-            max=peak_to_peak,  # Max is already represented in peak-to-peak
-            standard_deviation=None,  # Not applicable
-            count=None,  # Not applicable
-            unit=kwargs.get("unit"),
-            **metric_kwargs_list[i],
-        )
-
-        metrics_list.append(scalar_metric)
-        i += 1
-
-    return ScalarMetricCollection(metrics=metrics_list, **kwargs)
+    metrics_table = extract_multi_data_time_signal_metrics_table(multi_data_time_signal)
+    _validate_metrics_table(metrics_table)
+    return convert_metrics_table_to_scalar_metric_collection(
+        metrics_table,
+        analysis_type="peak_to_peak",
+        metric_kwargs_list=metric_kwargs_list,
+        **kwargs,
+    )
+
+
+def _aggregate_metrics_table(
+    metrics_table: pd.DataFrame,
+    analysis_type: EdgeTransitionAnalysisTypes,
+    **kwargs,
+) -> ScalarMetric:
+    """
+    Aggregates a metrics table into a single ScalarMetric with ``aggregate_scalar_metrics_collection``.
+    """
+    _validate_metrics_table(metrics_table)
+    metrics_collection = convert_metrics_table_to_scalar_metric_collection(
+        metrics_table, analysis_type=analysis_type, **kwargs
+    )
+    return aggregate_scalar_metrics_collection(metrics_collection)
 
 
 def extract_multi_time_signal_statistical_metrics(
@@ -131,18 +217,10 @@ def extract_multi_time_signal_statistical_metrics(
         ScalarMetric: Aggregated ScalarMetrics instance containing the extracted metrics.
 
     """
-    if analysis_type == "mean":
-        metrics_list = extract_mean_metrics_list(multi_data_time_signal, **kwargs)
-    elif analysis_type == "peak_to_peak":
-        metrics_list = extract_peak_to_peak_metrics_list(
-            multi_data_time_signal, **kwargs
-        )
-    else:
-        raise TypeError(
-            f"Undefined analysis type. Current options are: {str(EdgeTransitionAnalysisTypes)}. Feel free to contribute to this."
-        )
-    aggregate_metrics = aggregate_scalar_metrics_collection(metrics_list)
-    return aggregate_metrics
+    metrics_table = extract_multi_data_time_signal_metrics_table(multi_data_time_signal)
+    return _aggregate_metrics_table(
+        metrics_table, analysis_type=analysis_type, **kwargs
+    )
 
 
 def extract_statistical_metrics_collection(
@@ -165,12 +243,11 @@ def extract_statistical_metrics_collection(
             f"analysis_types must be a list of EdgeTransitionAnalysisTypes: {EdgeTransitionAnalysisTypes}."
         )
 
-    metrics_list = list()
-
-    for analysis in analysis_types:
-        aggregated_metrics = extract_multi_time_signal_statistical_metrics(
-            multi_data_time_signal, analysis_type=analysis
-        )
-        metrics_list.append(aggregated_metrics)
+    # The signals are packed and reduced once for all the analysis types
+    metrics_table = extract_multi_data_time_signal_metrics_table(multi_data_time_signal)
+    metrics_list = [
+        _aggregate_metrics_table(metrics_table, analysis_type=analysis)
+        for analysis in analysis_types
+    ]
 
     return ScalarMetricCollection(metrics=metrics_list, **kwargs)
@@ -0,0 +1,202 @@
+import numpy as np
+import pandas as pd
+from typing import Optional
+from piel.types import DataTimeSignalData, MultiDataTimeSignal, PulseSet
+
+
+def reduce_index_ranges(
+    ufunc: np.ufunc,
+    values: np.ndarray,
+    start_indexes: np.ndarray,
+    stop_indexes: np.ndarray,
+    empty_value: float = np.nan,
+) -> np.ndarray:
+    """
+    Applies a ufunc reduction, such as ``np.add`` or ``np.maximum``, over many ``[start, stop)`` index ranges of the
+    same array in a single ``reduceat`` call. The ranges may overlap and do not need to be sorted.
+
+    Args:
+        ufunc (np.ufunc): The binary ufunc used for the reduction.
+        values (np.ndarray): The one-dimensional array to reduce.
+        start_indexes (np.ndarray): The start index of each range.
+        stop_indexes (np.ndarray): The exclusive stop index of each range.
+        empty_value (float, optional): The value assigned to empty ranges. Defaults to ``np.nan``.
+
+    Returns:
+        np.ndarray: The reduction of each index range.
+    """
+    values = np.asarray(values, dtype=float)
+    start_indexes = np.asarray(start_indexes, dtype=np.int64)
+    stop_indexes = np.asarray(stop_indexes, dtype=np.int64)
+
+    if start_indexes.size == 0:
+        return np.empty(0, dtype=float)
+
+    # reduceat over the interleaved [start, stop] indexes reduces each range at the even positions. The padding keeps
+    # ``stop == len(values)`` a valid reduceat index.
+    padded_values = np.append(values, 0.0)
+    interleaved_indexes = np.minimum(
+        np.column_stack([start_indexes, stop_indexes]).ravel(), len(values)
+    )
+    reduced = ufunc.reduceat(padded_values, interleaved_indexes)[::2]
+    return np.where(stop_indexes > start_indexes, reduced, empty_value)
+
+
+def compose_pulse_set(
+    signal_data: DataTimeSignalData,
+    start_indexes: np.ndarray,
+    stop_indexes: np.ndarray,
+    peak_indexes: Optional[np.ndarray] = None,
+) -> PulseSet:
+    """
+    Composes a ``PulseSet`` from the ``[start, stop)`` sample index ranges of pulses within a signal.
+
+    Args:
+        signal_data (DataTimeSignalData): The parent signal the pulses belong to.
+        start_indexes (np.ndarray): The start sample index of each pulse.
+        stop_indexes (np.ndarray): The exclusive stop sample index of each pulse.
+        peak_indexes (np.ndarray, optional): The sample index of the peak of each pulse.
+
+    Returns:
+        PulseSet: The pulses referencing the parent signal arrays.
+    """
+    time_s = np.asarray(signal_data.time_s, dtype=float)
+    data = np.asarray(signal_data.data, dtype=float)
+
+    if len(time_s) != len(data):
+        raise ValueError("time_s and data must have the same length.")
+
+    start_indexes = np.asarray(start_indexes, dtype=np.int64)
+    stop_indexes = np.asarray(stop_indexes, dtype=np.int64)
+    if start_indexes.shape != stop_indexes.shape:
+        raise ValueError("start_indexes and stop_indexes must have the same shape.")
+
+    return PulseSet(
+        time_s=time_s,
+        data=data,
+        start_indexes=start_indexes,
+        stop_indexes=stop_indexes,
+        peak_indexes=np.asarray(
+            peak_indexes if peak_indexes is not None else [], dtype=np.int64
+        ),
+        data_name=signal_data.data_name,
+        time_s_unit=signal_data.time_s_unit,
+        data_unit=signal_data.data_unit,
+    )
+
+
+def get_pulse_view(
+    pulse_set: PulseSet, pulse_index: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the time and data arrays of a single pulse as views of the parent arrays, without copying.
+
+    Args:
+        pulse_set (PulseSet): The pulse collection.
+        pulse_index (int): The index of the pulse within the collection.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The ``(time_s, data)`` views of the pulse.
+    """
+    start = int(pulse_set.start_indexes[pulse_index])
+    stop = int(pulse_set.stop_indexes[pulse_index])
+    return pulse_set.time_s[start:stop], pulse_set.data[start:stop]
+
+
+def extract_pulse_set_metrics(pulse_set: PulseSet) -> pd.DataFrame:
+    """
+    Computes the metrics of all the pulses in a ``PulseSet`` at once with ``reduceat`` over the parent arrays.
+
+    The width of a pulse is the time between its first and last sample, and its area is the trapezoidal integral of
+    the data over that interval.
+
+    Args:
+        pulse_set (PulseSet): The pulse collection.
+
+    Returns:
+        pd.DataFrame: One row per pulse with the ``start_index``, ``stop_index``, ``start_time_s``, ``peak``,
+        ``mean``, ``width_s`` and ``area`` columns.
+    """
+    time_s = np.asarray(pulse_set.time_s, dtype=float)
+    data = np.asarray(pulse_set.data, dtype=float)
+    start_indexes = np.asarray(pulse_set.start_indexes, dtype=np.int64)
+    stop_indexes = np.asarray(pulse_set.stop_indexes, dtype=np.int64)
+    sample_amount = stop_indexes - start_indexes
+
+    peak = reduce_index_ranges(np.maximum, data, start_indexes, stop_indexes)
+    total = reduce_index_ranges(np.add, data, start_indexes, stop_indexes)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / sample_amount
+
+    # Each trapezoid spans two consecutive samples, so a pulse [start, stop) contains the trapezoids [start, stop - 1)
+    trapezoids = 0.5 * (data[1:] + data[:-1]) * np.diff(time_s)
+    area = reduce_index_ranges(
+        np.add,
+        trapezoids,
+        start_indexes,
+        np.maximum(stop_indexes - 1, start_indexes),
+        empty_value=0.0,
+    )
+
+    width_s = np.zeros(len(start_indexes), dtype=float)
+    non_empty = sample_amount > 0
+    width_s[non_empty] = (
+        time_s[stop_indexes[non_empty] - 1] - time_s[start_indexes[non_empty]]
+    )
+
+    return pd.DataFrame(
+        {
+            "start_index": start_indexes,
+            "stop_index": stop_indexes,
+            "start_time_s": time_s[np.minimum(start_indexes, len(time_s) - 1)]
+            if len(time_s) > 0
+            else np.full(len(start_indexes), np.nan),
+            "peak": peak,
+            "mean": mean,
+            "width_s": width_s,
+            "area": area,
+        }
+    )
+
+
+def convert_pulse_set_to_multi_data_time_signal(
+    pulse_set: PulseSet,
+    data_time_signal_kwargs: Optional[dict] = None,
+) -> MultiDataTimeSignal:
+    """
+    Copies every pulse of a ``PulseSet`` into its own ``DataTimeSignalData`` instance. Pulses are named after their
+    peak index when available, or after their position in the collection otherwise.
+
+    Args:
+        pulse_set (PulseSet): The pulse collection.
+        data_time_signal_kwargs (dict, optional): Additional keyword arguments for DataTimeSignalData.
+
+    Returns:
+        MultiDataTimeSignal: A list of DataTimeSignalData instances, each representing a pulse.
+    """
+    if data_time_signal_kwargs is None:
+        data_time_signal_kwargs = {}
+
+    data_time_signal_kwargs = {
+        "time_s_unit": pulse_set.time_s_unit,
+        "data_unit": pulse_set.data_unit,
+        **data_time_signal_kwargs,
+    }
+
+    if len(pulse_set.peak_indexes) == len(pulse_set.start_indexes):
+        pulse_labels = [int(peak_index) for peak_index in pulse_set.peak_indexes]
+    else:
+        pulse_labels = list(range(1, len(pulse_set.start_indexes) + 1))
+
+    multi_data_time_signal = []
+    for pulse_index, pulse_label in enumerate(pulse_labels):
+        time_s, data = get_pulse_view(pulse_set, pulse_index)
+        multi_data_time_signal.append(
+            DataTimeSignalData(
+                time_s=time_s.tolist(),
+                data=data.tolist(),
+                data_name=f"{pulse_set.data_name}_pulse_{pulse_label}",
+                **data_time_signal_kwargs,
+            )
+        )
+    return multi_data_time_signal
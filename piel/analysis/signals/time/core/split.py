@@ -1,15 +1,178 @@
 # separate_pulse_thresholds.py
 import numpy as np
-from typing import List, Optional, Dict
+import warnings
+from scipy.signal import find_peaks
+from typing import List, Optional, Dict, Sequence
 from piel.types import (
     DataTimeSignalData,
     MultiDataTimeSignal,
 )  # Adjust the import path as needed
-from .threshold import (
-    extract_pulses_from_signal,
-    is_pulse_above_threshold,
-)  # Ensure this import path is correct
 from .compose import compose_pulses_into_signal
+from .pulse import reduce_index_ranges
+
+
+def _per_threshold_values(
+    values: float | Sequence[float], threshold_amount: int, name: str
+) -> np.ndarray:
+    """
+    Broadcasts a scalar or per-threshold sequence into an array with one value per threshold.
+    """
+    values = np.atleast_1d(np.asarray(values, dtype=float))
+    if values.size == 1:
+        values = np.repeat(values, threshold_amount)
+    if values.size != threshold_amount:
+        raise ValueError(
+            f"{name} must be a scalar or have one value per threshold, got {values.size} values for {threshold_amount} thresholds."
+        )
+    return values
+
+
+def _extract_pulse_peaks_per_threshold(
+    signal_data: DataTimeSignalData,
+    signal_thresholds: Sequence[float],
+    trigger_delay_s: float,
+    trigger_window_s: float = 25e-9,
+    pre_pulse_time_s: float | Sequence[float] = 1e-9,
+    post_pulse_time_s: float | Sequence[float] = 1e-9,
+    min_pulse_distance_s: Optional[float] = None,
+) -> tuple[List[np.ndarray], List[np.ndarray]]:
+    """
+    Implements ``extract_pulse_index_ranges_per_threshold``, also returning the detected peak index of each pulse.
+    """
+    thresholds = np.asarray(signal_thresholds, dtype=float)
+    if thresholds.ndim != 1 or thresholds.size == 0:
+        raise ValueError("signal_thresholds must be a non-empty sequence of floats.")
+    if np.any(np.diff(thresholds) >= 0):
+        raise ValueError("signal_thresholds must be strictly descending.")
+
+    threshold_amount = thresholds.size
+    pre_pulse_time_s = _per_threshold_values(
+        pre_pulse_time_s, threshold_amount, "pre_pulse_time_s"
+    )
+    post_pulse_time_s = _per_threshold_values(
+        post_pulse_time_s, threshold_amount, "post_pulse_time_s"
+    )
+    if min_pulse_distance_s is None:
+        min_pulse_distance_s = pre_pulse_time_s + post_pulse_time_s
+    else:
+        min_pulse_distance_s = _per_threshold_values(
+            min_pulse_distance_s, threshold_amount, "min_pulse_distance_s"
+        )
+
+    time_s = np.asarray(signal_data.time_s, dtype=float)
+    data = np.asarray(signal_data.data, dtype=float)
+
+    if len(time_s) != len(data):
+        raise ValueError("time_s and data must have the same length.")
+    if len(time_s) < 2:
+        raise ValueError(
+            "time_s array must contain at least two elements to calculate sampling rate."
+        )
+
+    sampling_rate = 1.0 / np.mean(np.diff(time_s))
+
+    index_ranges = []
+    peak_indexes = []
+    first_band_peak_times = None
+    for band in range(threshold_amount):
+        # find_peaks requires a distance of at least one sample
+        band_peak_indexes, properties = find_peaks(
+            data,
+            height=thresholds[band],
+            distance=max(min_pulse_distance_s[band] * sampling_rate, 1.0),
+        )
+        if band > 0:
+            # Band k holds the peaks with thresholds[k] <= height < thresholds[k - 1]
+            band_peak_indexes = band_peak_indexes[
+                properties["peak_heights"] < thresholds[band - 1]
+            ]
+        band_peak_times = time_s[band_peak_indexes]
+
+        # Windows of every peak, resolved against the sorted time array
+        window_starts = np.searchsorted(
+            time_s,
+            np.maximum(band_peak_times - pre_pulse_time_s[band], time_s[0]),
+            side="left",
+        )
+        window_stops = np.searchsorted(
+            time_s,
+            np.minimum(band_peak_times + post_pulse_time_s[band], time_s[-1]),
+            side="right",
+        )
+
+        if band == 0:
+            first_band_peak_times = band_peak_times
+        else:
+            # Maximum of every window without copying each segment
+            window_maximums = reduce_index_ranges(
+                np.maximum, data, window_starts, window_stops, empty_value=-np.inf
+            )
+            # A first band peak within (peak_time - trigger_window_s, peak_time - trigger_delay_s) triggers the pulse
+            preceding_amount = np.searchsorted(
+                first_band_peak_times, band_peak_times - trigger_delay_s, side="left"
+            )
+            outside_window_amount = np.searchsorted(
+                first_band_peak_times, band_peak_times - trigger_window_s, side="right"
+            )
+            keep = (preceding_amount > outside_window_amount) & (
+                window_maximums < thresholds[0]
+            )
+            band_peak_indexes = band_peak_indexes[keep]
+            window_starts = window_starts[keep]
+            window_stops = window_stops[keep]
+
+        index_ranges.append(np.column_stack([window_starts, window_stops]))
+        peak_indexes.append(band_peak_indexes)
+    return index_ranges, peak_indexes
+
+
+def extract_pulse_index_ranges_per_threshold(
+    signal_data: DataTimeSignalData,
+    signal_thresholds: Sequence[float],
+    trigger_delay_s: float,
+    trigger_window_s: float = 25e-9,
+    pre_pulse_time_s: float | Sequence[float] = 1e-9,
+    post_pulse_time_s: float | Sequence[float] = 1e-9,
+    min_pulse_distance_s: Optional[float | Sequence[float]] = None,
+) -> List[np.ndarray]:
+    """
+    Classifies all the pulses in a signal against a set of descending thresholds.
+
+    The peaks of each band are detected with a single ``find_peaks`` call at its threshold and minimum peak distance,
+    and only the peaks below the previous threshold are kept in that band. Pulses of every band below the first are
+    only kept when a first-band pulse peaks between ``trigger_window_s`` and ``trigger_delay_s`` before them, which
+    is resolved with ``np.searchsorted`` over the sorted first-band peak times rather than comparing every pair of
+    pulses. Lower-band pulses whose extraction window reaches the first threshold are discarded so that the bands are
+    exclusive, and every pulse is returned once even if several first-band pulses trigger it.
+
+    Parameters:
+        signal_data (DataTimeSignalData): The input signal data containing multiple pulses.
+        signal_thresholds (Sequence[float]): Strictly descending thresholds that define each pulse band.
+        trigger_delay_s (float): Minimum time (in seconds) between a first-band pulse and a following lower-band pulse.
+        trigger_window_s (float, optional): Maximum time (in seconds) between a first-band pulse and a following lower-band pulse.
+                                            Defaults to 25e-9.
+        pre_pulse_time_s (float | Sequence[float], optional): Time (in seconds) to include before each detected pulse,
+                                                             either for all bands or per threshold. Defaults to 1e-9.
+        post_pulse_time_s (float | Sequence[float], optional): Time (in seconds) to include after each detected pulse,
+                                                              either for all bands or per threshold. Defaults to 1e-9.
+        min_pulse_distance_s (float | Sequence[float], optional): Minimum distance (in seconds) between consecutive
+                                                detected peaks, either for all bands or per threshold. If not provided,
+                                                it is the pre and post pulse time of each band.
+
+    Returns:
+        List[np.ndarray]: One ``(pulse_amount, 2)`` integer array per threshold with the ``[start, stop)`` sample
+        index range of each pulse in that band.
+    """
+    index_ranges, _ = _extract_pulse_peaks_per_threshold(
+        signal_data=signal_data,
+        signal_thresholds=signal_thresholds,
+        trigger_delay_s=trigger_delay_s,
+        trigger_window_s=trigger_window_s,
+        pre_pulse_time_s=pre_pulse_time_s,
+        post_pulse_time_s=post_pulse_time_s,
+        min_pulse_distance_s=min_pulse_distance_s,
+    )
+    return index_ranges
 
 
 def separate_per_pulse_threshold(
@@ -22,34 +185,51 @@ def separate_per_pulse_threshold(
     first_post_pulse_time_s: float = 1e-9,
     second_pre_pulse_time_s: float = 1e-9,
     second_post_pulse_time_s: float = 1e-9,
-    noise_std_multiplier: float = 3.0,
+    noise_std_multiplier: Optional[float] = None,
     data_time_signal_kwargs: Optional[Dict] = None,
 ) -> List[MultiDataTimeSignal]:
     """
     Separates pulses in a signal into two categories based on two threshold values.
 
+    The pulses are classified with ``extract_pulse_index_ranges_per_threshold``, so only the pulses that are returned
+    are copied into ``DataTimeSignalData`` instances. Each pulse is named after its detected peak index, and each low
+    pulse is returned once even if several high pulses trigger it.
+
     Parameters:
         signal_data (DataTimeSignalData): The input signal data containing multiple pulses.
         first_signal_threshold (float): The higher threshold to categorize pulses.
         second_signal_threshold (float): The lower threshold to categorize pulses.
         trigger_delay_s (float): Minimum time (in seconds) between pulses to prevent overlap.
+        trigger_window_s (float, optional): Maximum time (in seconds) between a high pulse and a following low pulse.
+                                            Defaults to 25e-9.
         first_pre_pulse_time_s (float, optional): Time (in seconds) to include before each detected pulse.
-                                           Defaults to 0.01.
+                                           Defaults to 1e-9.
         first_post_pulse_time_s (float, optional): Time (in seconds) to include after each detected pulse.
-                                            Defaults to 0.01.\
+                                            Defaults to 1e-9.
         second_pre_pulse_time_s (float, optional): Time (in seconds) to include before each detected pulse.
-                                           Defaults to 0.01.
+                                           Defaults to 1e-9.
         second_post_pulse_time_s (float, optional): Time (in seconds) to include after each detected pulse.
-                                            Defaults to 0.01.
-        noise_std_multiplier (float, optional): Multiplier for noise standard deviation to set detection threshold.
-                                                Defaults to 3.0.
+                                            Defaults to 1e-9.
+        noise_std_multiplier (float, optional): Deprecated. The pulses are detected at the explicit thresholds, so the
+                                                noise based detection threshold is never used.
         data_time_signal_kwargs (dict, optional): Additional keyword arguments for DataTimeSignalData.
 
     Returns:
-        List[MultiDataTimeSignal]: A list containing a single `MultiDataTimeSignal` instance:
+        List[MultiDataTimeSignal]: A list containing two pulse lists:
             - `high_threshold_pulses`: List of `DataTimeSignalData` for pulses above `first_signal_threshold`.
             - `low_threshold_pulses`: List of `DataTimeSignalData` for pulses above `second_signal_threshold` but below `first_signal_threshold`.
+
+    Raises:
+        ValueError: If no pulses are detected above the `first_signal_threshold`.
     """
+    if noise_std_multiplier is not None:
+        warnings.warn(
+            "noise_std_multiplier has no effect as the pulses are detected at the explicit thresholds, "
+            "and will be removed.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
     if data_time_signal_kwargs is None:
         data_time_signal_kwargs = {}
 
@@ -59,74 +239,38 @@ def separate_per_pulse_threshold(
             "second_signal_threshold must be less than first_signal_threshold."
         )
 
-    # Extract high-threshold pulses
-    high_threshold_pulses = extract_pulses_from_signal(
-        full_data=signal_data,
-        pre_pulse_time_s=first_pre_pulse_time_s,
-        post_pulse_time_s=first_post_pulse_time_s,
-        noise_std_multiplier=noise_std_multiplier,
-        min_pulse_height=first_signal_threshold,
-        data_time_signal_kwargs=data_time_signal_kwargs,
+    index_ranges, peak_indexes = _extract_pulse_peaks_per_threshold(
+        signal_data=signal_data,
+        signal_thresholds=[first_signal_threshold, second_signal_threshold],
+        trigger_delay_s=trigger_delay_s,
+        trigger_window_s=trigger_window_s,
+        pre_pulse_time_s=[first_pre_pulse_time_s, second_pre_pulse_time_s],
+        post_pulse_time_s=[first_post_pulse_time_s, second_post_pulse_time_s],
     )
+    if len(peak_indexes[0]) == 0:
+        raise ValueError("No pulses detected based on the provided criteria.")
 
-    # Extract low-threshold pulses
-    low_threshold_pulses = extract_pulses_from_signal(
-        full_data=signal_data,
-        pre_pulse_time_s=second_pre_pulse_time_s,
-        post_pulse_time_s=second_post_pulse_time_s,
-        noise_std_multiplier=noise_std_multiplier,
-        min_pulse_height=second_signal_threshold,
-        data_time_signal_kwargs=data_time_signal_kwargs,
-    )
+    time_s = np.asarray(signal_data.time_s)
+    data = np.asarray(signal_data.data)
+
+    pulse_lists = []
+    for band_index_ranges, band_peak_indexes in zip(index_ranges, peak_indexes):
+        pulse_lists.append(
+            [
+                DataTimeSignalData(
+                    time_s=time_s[start:stop].tolist(),
+                    data=data[start:stop].tolist(),
+                    data_name=f"{signal_data.data_name}_pulse_{peak_index}",
+                    **data_time_signal_kwargs,
+                )
+                for (start, stop), peak_index in zip(
+                    band_index_ranges, band_peak_indexes
+                )
+            ]
+        )
 
-    # Filter low-threshold pulses by excluding those that exceed the first_signal_threshold
-    filtered_low_threshold_pulses = [
-        pulse
-        for pulse in low_threshold_pulses
-        if not is_pulse_above_threshold(pulse, first_signal_threshold)
-    ]
-
-    # Function to find the peak time of a pulse
-    def get_pulse_peak_time(pulse: DataTimeSignalData) -> float:
-        if not pulse.data or not pulse.time_s:
-            return float("inf")  # Assign a large value if pulse data is empty
-        max_idx = np.argmax(pulse.data)
-        return pulse.time_s[max_idx]
-
-    # Get peak times for all high threshold pulses
-    high_pulse_peak_times = [
-        get_pulse_peak_time(pulse) for pulse in high_threshold_pulses
-    ]
-
-    # Filter low_threshold_pulses to ensure they are at least `trigger_delay_s` away from any high_threshold_pulse
-    filtered_low_threshold_pulses = []
-    for low_pulse in low_threshold_pulses:
-        low_pulse_peak_time = get_pulse_peak_time(low_pulse)
-        # print("low")
-        # print(low_pulse_peak_time)
-        # Check distance from all high pulse peaks
-        for high_peak in high_pulse_peak_times:
-            # print("high")
-            # print(high_peak)
-            # print("diff")
-            # print(abs(high_peak - low_pulse_peak_time))
-            if (
-                (abs(low_pulse_peak_time - high_peak) > trigger_delay_s)
-                and (high_peak < low_pulse_peak_time)
-                and (high_peak > low_pulse_peak_time - trigger_window_s)
-            ):
-                filtered_low_threshold_pulses.append(low_pulse)
-                # print(True)
-
-    # Additionally, ensure that low_threshold_pulses do not exceed the first_signal_threshold
-    # This is to categorize pulses exclusively
-    final_low_threshold_pulses = [
-        pulse
-        for pulse in filtered_low_threshold_pulses
-        if not is_pulse_above_threshold(pulse, first_signal_threshold)
-    ]
-
-    return [high_threshold_pulses, final_low_threshold_pulses]
+    high_threshold_pulses, low_threshold_pulses = pulse_lists
+    return [high_threshold_pulses, low_threshold_pulses]
 
 
 def split_compose_per_pulse_threshold(
@@ -138,7 +282,7 @@ def split_compose_per_pulse_threshold(
     first_post_pulse_time_s: float = 1e-9,
     second_pre_pulse_time_s: float = 1e-9,
     second_post_pulse_time_s: float = 1e-9,
-    noise_std_multiplier: float = 3.0,
+    noise_std_multiplier: Optional[float] = None,
     start_time_s: Optional[float] = None,
     end_time_s: Optional[float] = None,
     data_time_signal_kwargs: Optional[Dict] = None,
@@ -159,8 +303,7 @@ def split_compose_per_pulse_threshold(
                                            Defaults to 0.01.
         second_post_pulse_time_s (float, optional): Time (in seconds) to include after each detected second pulse.
                                             Defaults to 0.01.
-        noise_std_multiplier (float, optional): Multiplier for noise standard deviation to set detection threshold.
-                                                Defaults to 3.0.
+        noise_std_multiplier (float, optional): Deprecated, see ``separate_per_pulse_threshold``.
         data_time_signal_kwargs (dict, optional): Additional keyword arguments for DataTimeSignalData.
         start_time_s (float, optional): Start time of the composed signal. If not provided, uses the first pulse's start time.
         end_time_s (float, optional): End time of the composed signal. If not provided, uses the last pulse's end time.
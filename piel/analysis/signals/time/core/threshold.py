@@ -1,35 +1,32 @@
 import numpy as np
 from scipy.signal import find_peaks
-from piel.types import DataTimeSignalData, MultiDataTimeSignal
+from piel.types import DataTimeSignalData, MultiDataTimeSignal, PulseSet
 from typing import Optional, List
+from .pulse import compose_pulse_set, convert_pulse_set_to_multi_data_time_signal
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def extract_signal_above_threshold(
+def extract_pulse_set_above_threshold(
     signal_data: DataTimeSignalData,
     threshold: float,
     min_pulse_width_s: float = 0.0,
-    noise_floor: float = 0.0,
-) -> MultiDataTimeSignal:
+) -> PulseSet:
     """
-    Extracts all pulses from the input signal that exceed the specified threshold.
+    Extracts the index ranges of all the pulses in the input signal that exceed the specified threshold.
 
     Args:
         signal_data (DataTimeSignalData): The original signal data containing time and data arrays.
         threshold (float): The data value threshold to identify pulses.
         min_pulse_width_s (float, optional): The minimum duration (in seconds) for a pulse to be considered valid.
                                              Pulses shorter than this duration will be ignored. Defaults to 0.0.
-        noise_floor (float, optional): The value to assign to non-pulse regions in the extracted pulses.
-                                       Defaults to 0.0.
 
     Returns:
-        MultiDataTimeSignal: A list of DataTimeSignalData instances, each representing a detected pulse.
+        PulseSet: The detected pulses as index ranges of the original signal.
     """
-    # Convert lists to NumPy arrays for efficient processing
-    time = np.array(signal_data.time_s)
-    data = np.array(signal_data.data)
+    time = np.asarray(signal_data.time_s, dtype=float)
+    data = np.asarray(signal_data.data, dtype=float)
 
     if len(time) != len(data):
         raise ValueError("Time and data arrays must have the same length.")
@@ -37,73 +34,71 @@ def extract_signal_above_threshold(
     # Identify where data exceeds the threshold
     above_threshold = data > threshold
 
-    # Find rising and falling edges
-    edges = np.diff(above_threshold.astype(int))
-    pulse_start_indices = (
-        np.where(edges == 1)[0] + 1
-    )  # +1 to correct the index after diff
-    pulse_end_indices = np.where(edges == -1)[0] + 1
-
-    # Handle edge cases where the signal starts or ends above the threshold
-    if above_threshold[0]:
-        pulse_start_indices = np.insert(pulse_start_indices, 0, 0)
-    if above_threshold[-1]:
-        pulse_end_indices = np.append(pulse_end_indices, len(data))
+    # Find rising and falling edges, padding so that pulses at the signal boundaries are closed
+    edges = np.diff(np.concatenate(([0], above_threshold.astype(np.int8), [0])))
+    pulse_start_indices = np.flatnonzero(edges == 1)
+    pulse_end_indices = np.flatnonzero(edges == -1)
 
     logger.debug(f"Detected {len(pulse_start_indices)} potential pulses.")
 
-    # Initialize list to hold extracted pulses
-    extracted_pulses: MultiDataTimeSignal = []
-
-    # Iterate over each detected pulse
-    for idx, (start_idx, end_idx) in enumerate(
-        zip(pulse_start_indices, pulse_end_indices), start=1
-    ):
-        pulse_duration = time[end_idx - 1] - time[start_idx]
-
-        if pulse_duration < min_pulse_width_s:
-            logger.debug(
-                f"Pulse {idx} ignored due to insufficient width: {pulse_duration}s < {min_pulse_width_s}s."
-            )
-            continue  # Skip pulses that are too short
-
-        # Extract the pulse time and data
-        pulse_time = time[start_idx:end_idx]
-        pulse_data = data[start_idx:end_idx]
-
-        # Optionally, assign noise_floor to non-pulse regions if maintaining original array length
-        # Here, we create pulses with their own time and data arrays
-
-        # Create a DataTimeSignalData instance for the pulse
-        pulse_signal = DataTimeSignalData(
-            time_s=pulse_time.tolist(),
-            data=pulse_data.tolist(),
-            data_name=f"{signal_data.data_name}_pulse_{idx}",
-        )
+    pulse_durations = time[pulse_end_indices - 1] - time[pulse_start_indices]
+    is_wide_enough = pulse_durations >= min_pulse_width_s
+    logger.debug(
+        f"{np.count_nonzero(~is_wide_enough)} pulses ignored due to insufficient width < {min_pulse_width_s}s."
+    )
 
-        extracted_pulses.append(pulse_signal)
+    pulse_set = compose_pulse_set(
+        signal_data=signal_data,
+        start_indexes=pulse_start_indices[is_wide_enough],
+        stop_indexes=pulse_end_indices[is_wide_enough],
+    )
 
-        logger.debug(
-            f"Pulse {idx} extracted: Start={time[start_idx]}s, End={time[end_idx - 1]}s, Duration={pulse_duration}s."
-        )
+    logger.info(f"Total pulses extracted: {len(pulse_set.start_indexes)}.")
+
+    return pulse_set
+
+
+def extract_signal_above_threshold(
+    signal_data: DataTimeSignalData,
+    threshold: float,
+    min_pulse_width_s: float = 0.0,
+    noise_floor: float = 0.0,
+) -> MultiDataTimeSignal:
+    """
+    Extracts all pulses from the input signal that exceed the specified threshold.
 
-    logger.info(f"Total pulses extracted: {len(extracted_pulses)}.")
+    The pulses are detected with ``extract_pulse_set_above_threshold``, use it directly to avoid copying each pulse.
 
-    return extracted_pulses
+    Args:
+        signal_data (DataTimeSignalData): The original signal data containing time and data arrays.
+        threshold (float): The data value threshold to identify pulses.
+        min_pulse_width_s (float, optional): The minimum duration (in seconds) for a pulse to be considered valid.
+                                             Pulses shorter than this duration will be ignored. Defaults to 0.0.
+        noise_floor (float, optional): The value to assign to non-pulse regions in the extracted pulses.
+                                       Defaults to 0.0.
 
+    Returns:
+        MultiDataTimeSignal: A list of DataTimeSignalData instances, each representing a detected pulse.
+    """
+    pulse_set = extract_pulse_set_above_threshold(
+        signal_data=signal_data,
+        threshold=threshold,
+        min_pulse_width_s=min_pulse_width_s,
+    )
+    return convert_pulse_set_to_multi_data_time_signal(pulse_set)
 
-def extract_pulses_from_signal(
+
+def extract_pulse_set_from_signal(
     full_data: DataTimeSignalData,
     pre_pulse_time_s: float = 0.01,
     post_pulse_time_s: float = 0.01,
     noise_std_multiplier: float = 3.0,
     min_pulse_height: Optional[float] = None,
     min_pulse_distance_s: Optional[float] = None,
-    data_time_signal_kwargs: Optional[dict] = None,
-) -> List[DataTimeSignalData]:
+) -> PulseSet:
     """
-    Detects and extracts pulses from a DataTimeSignalData instance, including segments
-    before and after each pulse up to the noise floor.
+    Detects pulses in a DataTimeSignalData instance and returns the index ranges that include the segments
+    before and after each pulse.
 
     Parameters:
         full_data (DataTimeSignalData): The input signal data containing multiple pulses.
@@ -114,26 +109,21 @@ def extract_pulses_from_signal(
                                             it is set to noise_std_multiplier * noise_std.
         min_pulse_distance_s (float, optional): Minimum distance (in seconds) between consecutive pulses.
                                               If not provided, it is set based on the pre_pulse_time and post_pulse_time.
-        data_time_signal_kwargs (dict, optional): Additional keyword arguments for DataTimeSignalData.
 
     Returns:
-        List[DataTimeSignalData]: A list of DataTimeSignalData instances, each representing an extracted pulse.
+        PulseSet: The detected pulses as index ranges of the original signal, including their peak indexes.
     """
-    if data_time_signal_kwargs is None:
-        data_time_signal_kwargs = {}
-
-    data = np.array(full_data.data)
-    time_s = np.array(full_data.time_s)
+    data = np.asarray(full_data.data, dtype=float)
+    time_s = np.asarray(full_data.time_s, dtype=float)
 
     if len(time_s) != len(data):
         raise ValueError("time_s and data must have the same length.")
 
-    # Compute baseline and noise statistics
-    baseline = np.mean(data)
-    noise_std = np.std(data)
-
     # Set detection threshold
     if min_pulse_height is None:
+        # Compute baseline and noise statistics
+        baseline = np.mean(data)
+        noise_std = np.std(data)
         detection_threshold = baseline + noise_std_multiplier * noise_std
     else:
         detection_threshold = min_pulse_height
@@ -166,40 +156,61 @@ def extract_pulses_from_signal(
     if len(peaks) == 0:
         raise ValueError("No pulses detected based on the provided criteria.")
 
-    extracted_pulses = []
-
-    for peak_idx in peaks:
-        # Define window around the peak
-        peak_time = time_s[peak_idx]
-
-        # Determine pre-pulse start time
-        pre_start_time = peak_time - pre_pulse_time_s
-        pre_start_time = max(pre_start_time, time_s[0])
-
-        # Determine post-pulse end time
-        post_end_time = peak_time + post_pulse_time_s
-        post_end_time = min(post_end_time, time_s[-1])
+    # Windows around all the peaks, clipped to the signal and resolved against the sorted time array
+    peak_times = time_s[peaks]
+    pre_start_times = np.maximum(peak_times - pre_pulse_time_s, time_s[0])
+    post_end_times = np.minimum(peak_times + post_pulse_time_s, time_s[-1])
+    pre_start_indexes = np.searchsorted(time_s, pre_start_times, side="left")
+    post_end_indexes = np.searchsorted(time_s, post_end_times, side="right")
+
+    return compose_pulse_set(
+        signal_data=full_data,
+        start_indexes=pre_start_indexes,
+        stop_indexes=post_end_indexes,
+        peak_indexes=peaks,
+    )
 
-        # Find indices corresponding to pre_start_time and post_end_time
-        pre_start_idx = np.searchsorted(time_s, pre_start_time, side="left")
-        post_end_idx = np.searchsorted(time_s, post_end_time, side="right")
 
-        # Extract the segment
-        segment_time = time_s[pre_start_idx:post_end_idx]
-        segment_data = data[pre_start_idx:post_end_idx]
+def extract_pulses_from_signal(
+    full_data: DataTimeSignalData,
+    pre_pulse_time_s: float = 0.01,
+    post_pulse_time_s: float = 0.01,
+    noise_std_multiplier: float = 3.0,
+    min_pulse_height: Optional[float] = None,
+    min_pulse_distance_s: Optional[float] = None,
+    data_time_signal_kwargs: Optional[dict] = None,
+) -> List[DataTimeSignalData]:
+    """
+    Detects and extracts pulses from a DataTimeSignalData instance, including segments
+    before and after each pulse up to the noise floor.
 
-        # Create a new DataTimeSignalData instance for the pulse
-        pulse_data_name = f"{full_data.data_name}_pulse_{peak_idx}"
-        extracted_pulse = DataTimeSignalData(
-            time_s=segment_time.tolist(),
-            data=segment_data.tolist(),
-            data_name=pulse_data_name,
-            **data_time_signal_kwargs,
-        )
+    The pulses are detected with ``extract_pulse_set_from_signal``, use it directly to avoid copying each pulse.
 
-        extracted_pulses.append(extracted_pulse)
+    Parameters:
+        full_data (DataTimeSignalData): The input signal data containing multiple pulses.
+        pre_pulse_time_s (float): Time (in seconds) to include before each detected pulse.
+        post_pulse_time_s (float): Time (in seconds) to include after each detected pulse.
+        noise_std_multiplier (float): Multiplier for noise standard deviation to set detection threshold.
+        min_pulse_height (float, optional): Minimum height of a pulse to be detected. If not provided,
+                                            it is set to noise_std_multiplier * noise_std.
+        min_pulse_distance_s (float, optional): Minimum distance (in seconds) between consecutive pulses.
+                                              If not provided, it is set based on the pre_pulse_time and post_pulse_time.
+        data_time_signal_kwargs (dict, optional): Additional keyword arguments for DataTimeSignalData.
 
-    return extracted_pulses
+    Returns:
+        List[DataTimeSignalData]: A list of DataTimeSignalData instances, each representing an extracted pulse.
+    """
+    pulse_set = extract_pulse_set_from_signal(
+        full_data=full_data,
+        pre_pulse_time_s=pre_pulse_time_s,
+        post_pulse_time_s=post_pulse_time_s,
+        noise_std_multiplier=noise_std_multiplier,
+        min_pulse_height=min_pulse_height,
+        min_pulse_distance_s=min_pulse_distance_s,
+    )
+    return convert_pulse_set_to_multi_data_time_signal(
+        pulse_set, data_time_signal_kwargs=data_time_signal_kwargs
+    )
 
 
 def is_pulse_above_threshold(pulse: DataTimeSignalData, threshold: float) -> bool:
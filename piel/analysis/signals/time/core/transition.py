@@ -1,7 +1,203 @@
 import numpy as np
+import pandas as pd
+from typing import Literal
 from piel.types import DataTimeSignalData, MultiDataTimeSignal
 
 
+def _compose_edge_thresholds(
+    data: np.ndarray,
+    lower_threshold_ratio: float,
+    upper_threshold_ratio: float,
+) -> tuple[float, float]:
+    """
+    Calculates the absolute lower and upper thresholds as fractions of the signal amplitude.
+    """
+    data_min = np.min(data)
+    data_max = np.max(data)
+    amplitude = data_max - data_min
+
+    lower_threshold = data_min + lower_threshold_ratio * amplitude
+    upper_threshold = data_min + upper_threshold_ratio * amplitude
+    return lower_threshold, upper_threshold
+
+
+def _extract_rising_edge_index_ranges(
+    data: np.ndarray,
+    lower_threshold: float,
+    upper_threshold: float,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the ``[start, stop)`` index ranges of every transition from below ``lower_threshold`` to
+    ``upper_threshold`` without iterating over the samples.
+
+    An edge starts at the sample before an upwards crossing of ``lower_threshold`` and ends at the first following
+    sample that reaches ``upper_threshold``. Edges whose data falls back below ``lower_threshold`` before reaching
+    ``upper_threshold`` are discarded.
+    """
+    is_below_lower = data < lower_threshold
+    crossing_indexes = np.flatnonzero(is_below_lower[:-1] & ~is_below_lower[1:])
+
+    # The trailing sentinel marks crossings that never reach the upper threshold or never fall back
+    upper_indexes = np.append(np.flatnonzero(data >= upper_threshold), len(data))
+    below_lower_indexes = np.append(np.flatnonzero(is_below_lower), len(data))
+
+    # First sample at or after each crossing that reaches the upper threshold or falls back below the lower one
+    first_upper_indexes = upper_indexes[
+        np.searchsorted(upper_indexes, crossing_indexes + 1, side="left")
+    ]
+    first_below_indexes = below_lower_indexes[
+        np.searchsorted(below_lower_indexes, crossing_indexes + 1, side="left")
+    ]
+
+    is_complete_edge = (first_upper_indexes < len(data)) & (
+        first_upper_indexes < first_below_indexes
+    )
+    return crossing_indexes[is_complete_edge], first_upper_indexes[is_complete_edge] + 1
+
+
+def _interpolate_crossing_times(
+    time: np.ndarray,
+    data: np.ndarray,
+    before_indexes: np.ndarray,
+    threshold: float,
+) -> np.ndarray:
+    """
+    Linearly interpolates the time at which the data crosses ``threshold`` between each sample in
+    ``before_indexes`` and the following sample.
+    """
+    time_before = time[before_indexes]
+    data_before = data[before_indexes]
+    time_after = time[before_indexes + 1]
+    data_after = data[before_indexes + 1]
+    return time_before + (threshold - data_before) * (time_after - time_before) / (
+        data_after - data_before
+    )
+
+
+def extract_edge_transitions(
+    signal: DataTimeSignalData,
+    lower_threshold_ratio: float = 0.1,
+    upper_threshold_ratio: float = 0.9,
+    edge_type: Literal["rising", "falling"] = "rising",
+) -> pd.DataFrame:
+    """
+    Extracts all the rising or falling edges of a signal in a single vectorized pass. A rising edge is a transition
+    from the lower to the upper threshold and a falling edge is a transition from the upper to the lower threshold.
+
+    The threshold crossing times are linearly interpolated between samples, so the transition times have sub-sample
+    resolution.
+
+    Args:
+        signal (DataTimeSignalData): The input signal data.
+        lower_threshold_ratio (float): Lower threshold as a fraction of signal amplitude (default 0.1).
+        upper_threshold_ratio (float): Upper threshold as a fraction of signal amplitude (default 0.9).
+        edge_type (Literal["rising", "falling"]): The type of edges to extract (default "rising").
+
+    Returns:
+        pd.DataFrame: One row per edge with the ``start_index`` and exclusive ``stop_index`` of the edge samples,
+        the interpolated ``start_crossing_time_s`` and ``end_crossing_time_s`` of the first and second thresholds
+        crossed, and the ``transition_time_s`` between them.
+    """
+    time = np.asarray(signal.time_s, dtype=float)
+    data = np.asarray(signal.data, dtype=float)
+
+    if len(time) != len(data):
+        raise ValueError("time_s and data must be of the same length.")
+
+    if edge_type not in ("rising", "falling"):
+        raise ValueError(f"edge_type must be 'rising' or 'falling', got {edge_type}.")
+
+    if len(data) < 2:
+        start_indexes = stop_indexes = np.empty(0, dtype=np.int64)
+        start_crossing_time_s = end_crossing_time_s = np.empty(0, dtype=float)
+    else:
+        lower_threshold, upper_threshold = _compose_edge_thresholds(
+            data, lower_threshold_ratio, upper_threshold_ratio
+        )
+        if edge_type == "falling":
+            # A falling edge is a rising edge of the inverted signal between the inverted thresholds
+            data = -data
+            lower_threshold, upper_threshold = -upper_threshold, -lower_threshold
+
+        start_indexes, stop_indexes = _extract_rising_edge_index_ranges(
+            data, lower_threshold, upper_threshold
+        )
+        start_crossing_time_s = _interpolate_crossing_times(
+            time, data, start_indexes, lower_threshold
+        )
+        end_crossing_time_s = _interpolate_crossing_times(
+            time, data, stop_indexes - 2, upper_threshold
+        )
+
+    return pd.DataFrame(
+        {
+            "start_index": start_indexes,
+            "stop_index": stop_indexes,
+            "start_crossing_time_s": start_crossing_time_s,
+            "end_crossing_time_s": end_crossing_time_s,
+            "transition_time_s": end_crossing_time_s - start_crossing_time_s,
+        }
+    )
+
+
+def extract_transition_times(
+    signal: DataTimeSignalData,
+    lower_threshold_ratio: float = 0.1,
+    upper_threshold_ratio: float = 0.9,
+    edge_type: Literal["rising", "falling"] = "rising",
+) -> np.ndarray:
+    """
+    Extracts the rise or fall times of all the edges of a signal between the lower and upper thresholds.
+
+    Args:
+        signal (DataTimeSignalData): The input signal data.
+        lower_threshold_ratio (float): Lower threshold as a fraction of signal amplitude (default 0.1).
+        upper_threshold_ratio (float): Upper threshold as a fraction of signal amplitude (default 0.9).
+        edge_type (Literal["rising", "falling"]): The type of edges to extract (default "rising").
+
+    Returns:
+        np.ndarray: The interpolated transition time of each edge in seconds.
+    """
+    return extract_edge_transitions(
+        signal=signal,
+        lower_threshold_ratio=lower_threshold_ratio,
+        upper_threshold_ratio=upper_threshold_ratio,
+        edge_type=edge_type,
+    )["transition_time_s"].to_numpy()
+
+
+def _extract_edges(
+    signal: DataTimeSignalData,
+    lower_threshold_ratio: float,
+    upper_threshold_ratio: float,
+    edge_type: Literal["rising", "falling"],
+) -> MultiDataTimeSignal:
+    """
+    Copies the samples of each rising or falling edge into its own DataTimeSignalData instance.
+    """
+    edge_transitions = extract_edge_transitions(
+        signal=signal,
+        lower_threshold_ratio=lower_threshold_ratio,
+        upper_threshold_ratio=upper_threshold_ratio,
+        edge_type=edge_type,
+    )
+    time = np.asarray(signal.time_s)
+    data = np.asarray(signal.data)
+
+    edges: MultiDataTimeSignal = []
+    for edge_index, (start_idx, stop_idx) in enumerate(
+        zip(edge_transitions["start_index"], edge_transitions["stop_index"]), start=1
+    ):
+        edges.append(
+            DataTimeSignalData(
+                time_s=time[start_idx:stop_idx].tolist(),
+                data=data[start_idx:stop_idx].tolist(),
+                data_name=f"{signal.data_name}_{edge_type}_edge_{edge_index}",
+            )
+        )
+    return edges
+
+
 def extract_rising_edges(
     signal: DataTimeSignalData,
     lower_threshold_ratio: float = 0.1,
@@ -18,57 +214,33 @@ def extract_rising_edges(
     Returns:
         MultiDataTimeSignal: A list of DataTimeSignalData instances, each representing a rising edge.
     """
-    # Convert lists to numpy arrays for efficient processing
-    time = np.array(signal.time_s)
-    data = np.array(signal.data)
+    return _extract_edges(
+        signal=signal,
+        lower_threshold_ratio=lower_threshold_ratio,
+        upper_threshold_ratio=upper_threshold_ratio,
+        edge_type="rising",
+    )
 
-    if len(time) != len(data):
-        raise ValueError("time_s and data must be of the same length.")
 
-    # Determine signal amplitude range
-    data_min = np.min(data)
-    data_max = np.max(data)
-    amplitude = data_max - data_min
+def extract_falling_edges(
+    signal: DataTimeSignalData,
+    lower_threshold_ratio: float = 0.1,
+    upper_threshold_ratio: float = 0.9,
+) -> MultiDataTimeSignal:
+    """
+    Extracts falling edges from a signal defined as transitions from upper_threshold to lower_threshold.
 
-    # Calculate absolute threshold values
-    lower_threshold = data_min + lower_threshold_ratio * amplitude
-    upper_threshold = data_min + upper_threshold_ratio * amplitude
+    Args:
+        signal (DataTimeSignalData): The input signal data.
+        lower_threshold_ratio (float): Lower threshold as a fraction of signal amplitude (default 0.1).
+        upper_threshold_ratio (float): Upper threshold as a fraction of signal amplitude (default 0.9).
 
-    # Initialize list to hold rising edges
-    rising_edges: MultiDataTimeSignal = []
-
-    # State variables
-    in_rising = False
-    start_idx = None
-
-    for i in range(1, len(data)):
-        # Detect transition from below lower_threshold to above lower_threshold
-        if not in_rising:
-            if data[i - 1] < lower_threshold and data[i] >= lower_threshold:
-                start_idx = i - 1  # Potential start of rising edge
-                in_rising = True
-        else:
-            # Check if signal has reached upper_threshold
-            if data[i] >= upper_threshold:
-                end_idx = i
-                # Extract the segment corresponding to the rising edge
-                edge_time = time[start_idx : end_idx + 1]
-                edge_data = data[start_idx : end_idx + 1]
-
-                # Create a new DataTimeSignalData instance for the rising edge
-                edge_signal = DataTimeSignalData(
-                    time_s=edge_time.tolist(),
-                    data=edge_data.tolist(),
-                    data_name=f"{signal.data_name}_rising_edge_{len(rising_edges) + 1}",
-                )
-                rising_edges.append(edge_signal)
-
-                # Reset state
-                in_rising = False
-                start_idx = None
-            elif data[i] < lower_threshold:
-                # False alarm, reset state
-                in_rising = False
-                start_idx = None
-
-    return rising_edges
+    Returns:
+        MultiDataTimeSignal: A list of DataTimeSignalData instances, each representing a falling edge.
+    """
+    return _extract_edges(
+        signal=signal,
+        lower_threshold_ratio=lower_threshold_ratio,
+        upper_threshold_ratio=upper_threshold_ratio,
+        edge_type="falling",
+    )
@@ -1,7 +1,7 @@
 from typing import List, Optional
 
 from piel.types import DataTimeSignalData, ScalarMetricCollection
-from piel.analysis.signals.time.core.split import extract_pulses_from_signal
+from piel.analysis.signals.time.core.threshold import extract_pulses_from_signal
 from piel.analysis.signals.time.core.metrics import extract_peak_to_peak_metrics_list
 
 
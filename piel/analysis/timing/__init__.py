@@ -0,0 +1,11 @@
+from .monte_carlo import (
+    compose_monte_carlo_timing_analysis,
+    propagate_delay_samples,
+    sample_connection_delays,
+)
+from .static import (
+    compose_static_timing_analysis,
+    extract_critical_path,
+    resolve_time_metric_statistics,
+    update_connection_timing,
+)
@@ -0,0 +1,234 @@
+"""
+Monte Carlo timing analysis over the connectivity graph of a component hierarchy. The connection delays of many
+samples are drawn as arrays and propagated through the graph one topological level at a time, so the samples are
+never iterated over in Python.
+"""
+
+import numpy as np
+from typing import Optional
+from piel.types import (
+    ComponentTypes,
+    ConnectivityGraph,
+    MonteCarloTimingAnalysis,
+    StaticTimingAnalysis,
+)
+from .static import compose_static_timing_analysis
+
+__all__ = [
+    "compose_monte_carlo_timing_analysis",
+    "propagate_delay_samples",
+    "sample_connection_delays",
+]
+
+# The amount of sampled arrival and delay values held in memory at once
+MONTE_CARLO_CHUNK_ELEMENTS = 2**22
+
+
+def sample_connection_delays(
+    analysis: StaticTimingAnalysis,
+    sample_amount: int,
+    seed: Optional[int | np.random.Generator] = None,
+) -> np.ndarray:
+    """
+    Samples the delay of every connection from a normal distribution with its mean and standard deviation. If a
+    connection defines a ``min`` below its ``max``, its samples are clipped to that range.
+
+    Args:
+        analysis (StaticTimingAnalysis): The analysis with the resolved connection delay statistics.
+        sample_amount (int): The amount of samples.
+        seed (Optional[int | np.random.Generator]): The random seed or generator.
+
+    Returns:
+        np.ndarray: The ``(sample_amount, n_connections)`` delay samples in seconds.
+    """
+    random_generator = np.random.default_rng(seed)
+    connection_delays_s = random_generator.normal(
+        loc=analysis.edge_delay_mean_s,
+        scale=analysis.edge_delay_standard_deviation_s,
+        size=(sample_amount, len(analysis.edge_delay_mean_s)),
+    )
+    # Unset bounds resolve to the mean, so only the connections with a delay range are clipped
+    has_range = analysis.edge_delay_min_s < analysis.edge_delay_max_s
+    if np.any(has_range):
+        connection_delays_s[:, has_range] = np.clip(
+            connection_delays_s[:, has_range],
+            analysis.edge_delay_min_s[has_range],
+            analysis.edge_delay_max_s[has_range],
+        )
+    return connection_delays_s
+
+
+def _compose_propagation_levels(
+    analysis: StaticTimingAnalysis,
+) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Groups the connections by the topological level of their target port, so that the arrival times of all the
+    ports of a level can be calculated at once. Returns the connection IDs of each level sorted by target port, the
+    start of each target port in them and the target port IDs.
+    """
+    port_levels = np.zeros(len(analysis.graph.ports), dtype=np.int64)
+    for port_id in analysis.topological_order:
+        incoming_edge_ids = analysis.incoming_edge_ids[
+            analysis.incoming_edge_pointers[port_id] : analysis.incoming_edge_pointers[
+                port_id + 1
+            ]
+        ]
+        if len(incoming_edge_ids) > 0:
+            port_levels[port_id] = (
+                port_levels[analysis.edge_source_ids[incoming_edge_ids]].max() + 1
+            )
+
+    edge_levels = port_levels[analysis.edge_target_ids]
+    edge_ids = np.lexsort((analysis.edge_target_ids, edge_levels))
+    level_starts = np.searchsorted(
+        edge_levels[edge_ids], np.arange(1, port_levels.max(initial=0) + 2)
+    )
+
+    propagation_levels = []
+    for level_start, level_stop in zip(level_starts[:-1], level_starts[1:]):
+        level_edge_ids = edge_ids[level_start:level_stop]
+        target_ids, reduce_starts = np.unique(
+            analysis.edge_target_ids[level_edge_ids], return_index=True
+        )
+        propagation_levels.append((level_edge_ids, reduce_starts, target_ids))
+    return propagation_levels
+
+
+def propagate_delay_samples(
+    analysis: StaticTimingAnalysis,
+    connection_delays_s: np.ndarray,
+    propagation_levels: Optional[list] = None,
+) -> np.ndarray:
+    """
+    Propagates sampled connection delays through the graph. The latest arrival time of every port is calculated for
+    all the samples at once, one topological level at a time.
+
+    Args:
+        analysis (StaticTimingAnalysis): The analysis of the graph.
+        connection_delays_s (np.ndarray): The ``(n_samples, n_connections)`` delay samples in seconds.
+        propagation_levels (Optional[list]): The precomposed propagation levels of the graph, to reuse across calls.
+
+    Returns:
+        np.ndarray: The ``(n_samples, n_ports)`` arrival time samples in seconds.
+    """
+    connection_delays_s = np.asarray(connection_delays_s, dtype=float)
+    if propagation_levels is None:
+        propagation_levels = _compose_propagation_levels(analysis)
+
+    arrival_times_s = np.broadcast_to(
+        analysis.start_arrival_time_s,
+        (connection_delays_s.shape[0], len(analysis.start_arrival_time_s)),
+    ).copy()
+    for level_edge_ids, reduce_starts, target_ids in propagation_levels:
+        edge_arrival_times_s = (
+            arrival_times_s[:, analysis.edge_source_ids[level_edge_ids]]
+            + connection_delays_s[:, level_edge_ids]
+        )
+        arrival_times_s[:, target_ids] = np.maximum.reduceat(
+            edge_arrival_times_s, reduce_starts, axis=1
+        )
+    return arrival_times_s
+
+
+def compose_monte_carlo_timing_analysis(
+    components: StaticTimingAnalysis
+    | ConnectivityGraph
+    | ComponentTypes
+    | list[ComponentTypes],
+    sample_amount: int = 10000,
+    timing_budget_s: Optional[float] = None,
+    percentiles: tuple[float, ...] = (50, 90, 99, 99.9),
+    endpoint_references: Optional[list[str]] = None,
+    seed: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    frequency_Hz: Optional[float] = None,
+) -> MonteCarloTimingAnalysis:
+    """
+    Estimates the delay distribution of the endpoints of a graph by sampling the delay of every connection from its
+    ``TimeMetric`` statistics, see ``sample_connection_delays``, and propagating the samples through the graph with
+    ``propagate_delay_samples``. The samples are processed in chunks so that the memory is bounded for millions of
+    samples.
+
+    Args:
+        components (StaticTimingAnalysis | ConnectivityGraph | ComponentTypes | list[ComponentTypes]): The static
+            timing analysis of the graph, or the graph or components to compose it from.
+        sample_amount (int): The amount of samples.
+        timing_budget_s (Optional[float]): The delay the endpoints must be reached within to calculate the timing
+            yield.
+        percentiles (tuple[float, ...]): The delay percentiles to calculate.
+        endpoint_references (Optional[list[str]]): The ports to analyse. Defaults to the ports with incoming but
+            without outgoing connections.
+        seed (Optional[int]): The random seed.
+        chunk_size (Optional[int]): The amount of samples propagated at once. Defaults to a chunk size that bounds
+            the memory of each chunk.
+        frequency_Hz (Optional[float]): The frequency to resolve the dispersive timing metrics at.
+
+    Returns:
+        MonteCarloTimingAnalysis: The delay statistics and timing yield of the endpoints.
+    """
+    if isinstance(components, StaticTimingAnalysis):
+        analysis = components
+    else:
+        analysis = compose_static_timing_analysis(components, frequency_Hz=frequency_Hz)
+
+    if endpoint_references is None:
+        is_endpoint = (np.diff(analysis.incoming_edge_pointers) > 0) & (
+            np.diff(analysis.outgoing_edge_pointers) == 0
+        )
+        endpoint_ids = np.flatnonzero(is_endpoint)
+        port_references = analysis.port_references
+        endpoint_references = [port_references[port_id] for port_id in endpoint_ids]
+    else:
+        endpoint_ids = [
+            analysis.graph.get_port_id(reference) for reference in endpoint_references
+        ]
+        if None in endpoint_ids:
+            raise ValueError(
+                f"Port {endpoint_references[endpoint_ids.index(None)]} not found in the graph."
+            )
+        endpoint_ids = np.array(endpoint_ids, dtype=np.int64)
+
+    if chunk_size is None:
+        chunk_size = max(
+            MONTE_CARLO_CHUNK_ELEMENTS
+            // max(len(analysis.graph.ports) + len(analysis.edge_source_ids), 1),
+            1,
+        )
+
+    random_generator = np.random.default_rng(seed)
+    propagation_levels = _compose_propagation_levels(analysis)
+    endpoint_delays_s = np.empty((sample_amount, len(endpoint_ids)))
+    for chunk_start in range(0, sample_amount, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, sample_amount)
+        arrival_times_s = propagate_delay_samples(
+            analysis,
+            sample_connection_delays(
+                analysis, chunk_stop - chunk_start, seed=random_generator
+            ),
+            propagation_levels=propagation_levels,
+        )
+        endpoint_delays_s[chunk_start:chunk_stop] = arrival_times_s[:, endpoint_ids]
+
+    percentiles = np.asarray(percentiles, dtype=float)
+    delays_s = endpoint_delays_s.max(axis=1, initial=-np.inf)
+    endpoint_timing_yield = timing_yield = None
+    if timing_budget_s is not None:
+        endpoint_timing_yield = np.mean(endpoint_delays_s <= timing_budget_s, axis=0)
+        timing_yield = float(np.mean(delays_s <= timing_budget_s))
+
+    return MonteCarloTimingAnalysis(
+        endpoint_references=list(endpoint_references),
+        sample_amount=sample_amount,
+        percentiles=percentiles,
+        endpoint_delay_mean_s=endpoint_delays_s.mean(axis=0),
+        endpoint_delay_standard_deviation_s=endpoint_delays_s.std(axis=0),
+        endpoint_delay_percentiles_s=np.percentile(
+            endpoint_delays_s, percentiles, axis=0
+        ).T.reshape(len(endpoint_ids), len(percentiles)),
+        delay_mean_s=float(delays_s.mean()),
+        delay_standard_deviation_s=float(delays_s.std()),
+        delay_percentiles_s=np.percentile(delays_s, percentiles),
+        timing_budget_s=timing_budget_s,
+        endpoint_timing_yield=endpoint_timing_yield,
+        timing_yield=timing_yield,
+    )
@@ -0,0 +1,503 @@
+"""
+Static timing analysis over the connectivity graph of a component hierarchy. The delays of the connections are
+propagated once in topological order, so the analysis is linear in the amount of ports and connections.
+"""
+
+import collections
+import heapq
+import math
+import numpy as np
+from typing import Optional
+from piel.types import (
+    ComponentTypes,
+    ConnectivityGraph,
+    DispersiveTimeMetrics,
+    StaticTimingAnalysis,
+    TimeMetric,
+    TimeMetricsTypes,
+)
+
+__all__ = [
+    "compose_static_timing_analysis",
+    "extract_critical_path",
+    "resolve_time_metric_statistics",
+    "update_connection_timing",
+]
+
+
+def resolve_time_metric_statistics(
+    time: TimeMetricsTypes,
+    frequency_Hz: Optional[float] = None,
+) -> tuple[float, float, float, float]:
+    """
+    Resolves the delay statistics of a timing metric. Unset statistics, which are None or zero by default, fall
+    back to the ``value``, or to the mean for the ``min`` and ``max``.
+
+    A ``DispersiveTimeMetrics`` is resolved at the frequency nearest to ``frequency_Hz``. If no frequency is
+    provided, the envelope of all the frequencies is used: the latest mean and maximum, the earliest minimum and the
+    largest standard deviation.
+
+    Args:
+        time (TimeMetricsTypes): The timing metric.
+        frequency_Hz (Optional[float]): The frequency to resolve a dispersive timing metric at.
+
+    Returns:
+        tuple[float, float, float, float]: The mean, minimum, maximum and standard deviation of the delay in seconds.
+    """
+    if isinstance(time, DispersiveTimeMetrics):
+        if len(time.frequency_group) == 0:
+            return 0.0, 0.0, 0.0, 0.0
+
+        if frequency_Hz is not None:
+            nearest_frequency = min(
+                time.frequency_group,
+                key=lambda frequency: abs(frequency - frequency_Hz),
+            )
+            return resolve_time_metric_statistics(
+                time.frequency_group[nearest_frequency]
+            )
+
+        statistics = np.array(
+            [
+                resolve_time_metric_statistics(time_i)
+                for time_i in time.frequency_group.values()
+            ]
+        )
+        return (
+            float(statistics[:, 0].max()),
+            float(statistics[:, 1].min()),
+            float(statistics[:, 2].max()),
+            float(statistics[:, 3].max()),
+        )
+
+    if not isinstance(time, TimeMetric):
+        raise TypeError(f"Expected a TimeMetricsTypes, got {type(time)} instead.")
+
+    mean = float(time.mean or time.value or 0)
+    return (
+        mean,
+        float(time.min or mean),
+        float(time.max or mean),
+        float(time.standard_deviation or 0),
+    )
+
+
+def _compose_csr(
+    node_ids: np.ndarray, node_amount: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Groups the edges by a node, returning the edge IDs sorted by node and the start of each node in them.
+    """
+    edge_ids = np.argsort(node_ids, kind="stable")
+    pointers = np.zeros(node_amount + 1, dtype=np.int64)
+    np.cumsum(np.bincount(node_ids, minlength=node_amount), out=pointers[1:])
+    return edge_ids, pointers
+
+
+def _compose_topological_order(
+    target_ids: np.ndarray,
+    outgoing_edge_ids: np.ndarray,
+    outgoing_pointers: np.ndarray,
+) -> np.ndarray:
+    """
+    Sorts the nodes topologically with Kahn's algorithm.
+    """
+    node_amount = len(outgoing_pointers) - 1
+    in_degree = np.bincount(target_ids, minlength=node_amount)
+    node_queue = collections.deque(np.flatnonzero(in_degree == 0).tolist())
+    topological_order = []
+    while len(node_queue) > 0:
+        node_id = node_queue.popleft()
+        topological_order.append(node_id)
+        for edge_id in outgoing_edge_ids[
+            outgoing_pointers[node_id] : outgoing_pointers[node_id + 1]
+        ]:
+            target_id = target_ids[edge_id]
+            in_degree[target_id] -= 1
+            if in_degree[target_id] == 0:
+                node_queue.append(target_id)
+
+    if len(topological_order) != node_amount:
+        raise ValueError(
+            "The connections contain a cycle, so the static timing analysis is undefined."
+        )
+    return np.array(topological_order, dtype=np.int64)
+
+
+def _calculate_clark_maximum(
+    mean_a: float,
+    standard_deviation_a: float,
+    mean_b: float,
+    standard_deviation_b: float,
+) -> tuple[float, float]:
+    """
+    Approximates the maximum of two independent normal distributions as a normal distribution, with Clark's
+    moment matching.
+    """
+    theta = math.hypot(standard_deviation_a, standard_deviation_b)
+    if theta == 0:
+        return max(mean_a, mean_b), 0.0
+
+    alpha = (mean_a - mean_b) / theta
+    cdf_alpha = 0.5 * (1 + math.erf(alpha / math.sqrt(2)))
+    pdf_alpha = math.exp(-0.5 * alpha**2) / math.sqrt(2 * math.pi)
+    mean = mean_a * cdf_alpha + mean_b * (1 - cdf_alpha) + theta * pdf_alpha
+    second_moment = (
+        (mean_a**2 + standard_deviation_a**2) * cdf_alpha
+        + (mean_b**2 + standard_deviation_b**2) * (1 - cdf_alpha)
+        + (mean_a + mean_b) * theta * pdf_alpha
+    )
+    return mean, math.sqrt(max(second_moment - mean**2, 0.0))
+
+
+def _calculate_arrival_time(
+    analysis: StaticTimingAnalysis,
+    node_id: int,
+    incoming_edge_ids: np.ndarray,
+) -> tuple[float, float, float, float, int]:
+    """
+    Combines the arrival times of the incoming connections of a port.
+    """
+    if len(incoming_edge_ids) == 0:
+        start_arrival_time_s = float(analysis.start_arrival_time_s[node_id])
+        return start_arrival_time_s, start_arrival_time_s, start_arrival_time_s, 0.0, -1
+
+    source_ids = analysis.edge_source_ids[incoming_edge_ids]
+    arrival_min_s = np.min(
+        analysis.arrival_time_min_s[source_ids]
+        + analysis.edge_delay_min_s[incoming_edge_ids]
+    )
+    arrival_max_s = (
+        analysis.arrival_time_max_s[source_ids]
+        + analysis.edge_delay_max_s[incoming_edge_ids]
+    )
+    critical_index = int(np.argmax(arrival_max_s))
+
+    arrival_mean_s = (
+        analysis.arrival_time_mean_s[source_ids]
+        + analysis.edge_delay_mean_s[incoming_edge_ids]
+    )
+    arrival_standard_deviation_s = np.hypot(
+        analysis.arrival_time_standard_deviation_s[source_ids],
+        analysis.edge_delay_standard_deviation_s[incoming_edge_ids],
+    )
+    mean_s, standard_deviation_s = (
+        float(arrival_mean_s[0]),
+        float(arrival_standard_deviation_s[0]),
+    )
+    for mean_i_s, standard_deviation_i_s in zip(
+        arrival_mean_s[1:], arrival_standard_deviation_s[1:]
+    ):
+        mean_s, standard_deviation_s = _calculate_clark_maximum(
+            mean_s, standard_deviation_s, float(mean_i_s), float(standard_deviation_i_s)
+        )
+
+    return (
+        mean_s,
+        float(arrival_min_s),
+        float(arrival_max_s[critical_index]),
+        standard_deviation_s,
+        int(incoming_edge_ids[critical_index]),
+    )
+
+
+def _calculate_required_time(
+    analysis: StaticTimingAnalysis,
+    node_id: int,
+    outgoing_edge_ids: np.ndarray,
+    endpoint_required_time_s: float,
+) -> float:
+    """
+    Calculates the latest time a port can be reached without delaying any of its endpoints.
+    """
+    if len(outgoing_edge_ids) == 0:
+        return endpoint_required_time_s
+    return float(
+        np.min(
+            analysis.required_time_s[analysis.edge_target_ids[outgoing_edge_ids]]
+            - analysis.edge_delay_max_s[outgoing_edge_ids]
+        )
+    )
+
+
+def _get_endpoint_required_time(analysis: StaticTimingAnalysis) -> float:
+    """
+    Returns the required time of the endpoints, which defaults to the latest arrival time.
+    """
+    if analysis.required_time_constraint_s is not None:
+        return analysis.required_time_constraint_s
+    if len(analysis.arrival_time_max_s) == 0:
+        return 0.0
+    return float(np.max(analysis.arrival_time_max_s))
+
+
+def _propagate_arrival_times(
+    analysis: StaticTimingAnalysis, seed_node_ids: list[int]
+) -> None:
+    """
+    Recalculates the arrival times of the seed ports and of every port whose arrival time changes as a result,
+    in topological order.
+    """
+    incoming_edge_ids = analysis.incoming_edge_ids
+    incoming_pointers = analysis.incoming_edge_pointers
+    outgoing_edge_ids = analysis.outgoing_edge_ids
+    outgoing_pointers = analysis.outgoing_edge_pointers
+    topological_position = analysis.topological_position
+
+    node_heap = [
+        (int(topological_position[node_id]), node_id) for node_id in set(seed_node_ids)
+    ]
+    heapq.heapify(node_heap)
+    queued_node_ids = set(seed_node_ids)
+    while len(node_heap) > 0:
+        _, node_id = heapq.heappop(node_heap)
+        queued_node_ids.discard(node_id)
+        arrival_time = _calculate_arrival_time(
+            analysis,
+            node_id,
+            incoming_edge_ids[
+                incoming_pointers[node_id] : incoming_pointers[node_id + 1]
+            ],
+        )
+        previous_arrival_time = (
+            analysis.arrival_time_mean_s[node_id],
+            analysis.arrival_time_min_s[node_id],
+            analysis.arrival_time_max_s[node_id],
+            analysis.arrival_time_standard_deviation_s[node_id],
+            analysis.critical_edge_ids[node_id],
+        )
+        if arrival_time == previous_arrival_time:
+            continue
+
+        (
+            analysis.arrival_time_mean_s[node_id],
+            analysis.arrival_time_min_s[node_id],
+            analysis.arrival_time_max_s[node_id],
+            analysis.arrival_time_standard_deviation_s[node_id],
+            analysis.critical_edge_ids[node_id],
+        ) = arrival_time
+        for edge_id in outgoing_edge_ids[
+            outgoing_pointers[node_id] : outgoing_pointers[node_id + 1]
+        ]:
+            target_id = int(analysis.edge_target_ids[edge_id])
+            if target_id not in queued_node_ids:
+                queued_node_ids.add(target_id)
+                heapq.heappush(
+                    node_heap, (int(topological_position[target_id]), target_id)
+                )
+
+
+def _propagate_required_times(
+    analysis: StaticTimingAnalysis, seed_node_ids: Optional[list[int]] = None
+) -> None:
+    """
+    Recalculates the required times of the seed ports and of every port whose required time changes as a result,
+    in reverse topological order. All the ports are recalculated if no seed ports are provided.
+    """
+    endpoint_required_time_s = _get_endpoint_required_time(analysis)
+    incoming_edge_ids = analysis.incoming_edge_ids
+    incoming_pointers = analysis.incoming_edge_pointers
+    outgoing_edge_ids = analysis.outgoing_edge_ids
+    outgoing_pointers = analysis.outgoing_edge_pointers
+    topological_position = analysis.topological_position
+
+    if seed_node_ids is None:
+        seed_node_ids = analysis.topological_order.tolist()
+    # The positions are negated so that the latest port in topological order is recalculated first
+    node_heap = [
+        (-int(topological_position[node_id]), node_id) for node_id in set(seed_node_ids)
+    ]
+    heapq.heapify(node_heap)
+    queued_node_ids = set(seed_node_ids)
+    while len(node_heap) > 0:
+        _, node_id = heapq.heappop(node_heap)
+        queued_node_ids.discard(node_id)
+        required_time_s = _calculate_required_time(
+            analysis,
+            node_id,
+            outgoing_edge_ids[
+                outgoing_pointers[node_id] : outgoing_pointers[node_id + 1]
+            ],
+            endpoint_required_time_s,
+        )
+        if required_time_s == analysis.required_time_s[node_id]:
+            continue
+
+        analysis.required_time_s[node_id] = required_time_s
+        for edge_id in incoming_edge_ids[
+            incoming_pointers[node_id] : incoming_pointers[node_id + 1]
+        ]:
+            source_id = int(analysis.edge_source_ids[edge_id])
+            if source_id not in queued_node_ids:
+                queued_node_ids.add(source_id)
+                heapq.heappush(
+                    node_heap, (-int(topological_position[source_id]), source_id)
+                )
+
+    analysis.slack_s[:] = analysis.required_time_s - analysis.arrival_time_max_s
+
+
+def compose_static_timing_analysis(
+    components: ConnectivityGraph | ComponentTypes | list[ComponentTypes],
+    required_time_s: Optional[float] = None,
+    start_arrival_times_s: Optional[dict[str, float]] = None,
+    frequency_Hz: Optional[float] = None,
+) -> StaticTimingAnalysis:
+    """
+    Propagates the delays of the connections of a component hierarchy in topological order to calculate the
+    earliest, latest and statistical arrival time of every port, and then propagates the required time of the
+    endpoints backwards to calculate the slack of every port.
+
+    Each connection is a timing arc from its first port to its second port, with the delay of its ``time`` metric,
+    see ``resolve_time_metric_statistics``. The ports without incoming connections are the start points of the
+    analysis and the ports without outgoing connections are its endpoints.
+
+    Args:
+        components (ConnectivityGraph | ComponentTypes | list[ComponentTypes]): The connectivity graph, or the
+            components to compose it from with ``piel.compose_connectivity_graph``.
+        required_time_s (Optional[float]): The time by which every endpoint must be reached. Defaults to the
+            latest arrival time, so that the critical path has zero slack.
+        start_arrival_times_s (Optional[dict[str, float]]): The arrival time of each start port reference.
+            Defaults to zero.
+        frequency_Hz (Optional[float]): The frequency to resolve the dispersive timing metrics at.
+
+    Returns:
+        StaticTimingAnalysis: The arrival times, required times and slack of every port.
+    """
+    if isinstance(components, ConnectivityGraph):
+        graph = components
+    else:
+        from piel.connectivity import compose_connectivity_graph
+
+        graph = compose_connectivity_graph(components)
+
+    port_amount = len(graph.ports)
+    edges = graph.edges
+    delay_statistics = np.array(
+        [
+            resolve_time_metric_statistics(
+                getattr(connection, "time", TimeMetric()), frequency_Hz=frequency_Hz
+            )
+            for connection in graph.connections
+        ],
+        dtype=float,
+    ).reshape(-1, 4)
+
+    start_arrival_time_s = np.zeros(port_amount)
+    for port_reference, arrival_time_s in (start_arrival_times_s or {}).items():
+        port_id = graph.get_port_id(port_reference)
+        if port_id is None:
+            raise ValueError(f"Port {port_reference} not found in the graph.")
+        start_arrival_time_s[port_id] = arrival_time_s
+
+    incoming_edge_ids, incoming_edge_pointers = _compose_csr(edges[:, 1], port_amount)
+    outgoing_edge_ids, outgoing_edge_pointers = _compose_csr(edges[:, 0], port_amount)
+    topological_order = _compose_topological_order(
+        edges[:, 1], outgoing_edge_ids, outgoing_edge_pointers
+    )
+    topological_position = np.empty_like(topological_order)
+    topological_position[topological_order] = np.arange(port_amount)
+
+    analysis = StaticTimingAnalysis(
+        graph=graph,
+        edge_source_ids=edges[:, 0].copy(),
+        edge_target_ids=edges[:, 1].copy(),
+        edge_delay_mean_s=delay_statistics[:, 0].copy(),
+        edge_delay_min_s=delay_statistics[:, 1].copy(),
+        edge_delay_max_s=delay_statistics[:, 2].copy(),
+        edge_delay_standard_deviation_s=delay_statistics[:, 3].copy(),
+        incoming_edge_ids=incoming_edge_ids,
+        incoming_edge_pointers=incoming_edge_pointers,
+        outgoing_edge_ids=outgoing_edge_ids,
+        outgoing_edge_pointers=outgoing_edge_pointers,
+        topological_order=topological_order,
+        topological_position=topological_position,
+        start_arrival_time_s=start_arrival_time_s,
+        # NaN never compares equal, so every port is calculated in the first propagation
+        arrival_time_mean_s=np.full(port_amount, np.nan),
+        arrival_time_min_s=np.full(port_amount, np.nan),
+        arrival_time_max_s=np.full(port_amount, np.nan),
+        arrival_time_standard_deviation_s=np.full(port_amount, np.nan),
+        critical_edge_ids=np.full(port_amount, -1, dtype=np.int64),
+        required_time_constraint_s=required_time_s,
+        required_time_s=np.full(port_amount, np.nan),
+        slack_s=np.full(port_amount, np.nan),
+    )
+    _propagate_arrival_times(analysis, analysis.topological_order.tolist())
+    _propagate_required_times(analysis)
+    return analysis
+
+
+def update_connection_timing(
+    analysis: StaticTimingAnalysis,
+    connection_id: int,
+    time: TimeMetricsTypes,
+    frequency_Hz: Optional[float] = None,
+) -> StaticTimingAnalysis:
+    """
+    Updates the delay of a single connection and incrementally recalculates only the arrival times downstream of
+    it and the required times upstream of it. If the endpoint required time defaults to the latest arrival time and
+    it changes, all the required times are recalculated.
+
+    Args:
+        analysis (StaticTimingAnalysis): The analysis, updated in place.
+        connection_id (int): The ID of the connection in ``analysis.graph.connections``.
+        time (TimeMetricsTypes): The new timing metric of the connection.
+        frequency_Hz (Optional[float]): The frequency to resolve a dispersive timing metric at.
+
+    Returns:
+        StaticTimingAnalysis: The updated analysis.
+    """
+    (
+        analysis.edge_delay_mean_s[connection_id],
+        analysis.edge_delay_min_s[connection_id],
+        analysis.edge_delay_max_s[connection_id],
+        analysis.edge_delay_standard_deviation_s[connection_id],
+    ) = resolve_time_metric_statistics(time, frequency_Hz=frequency_Hz)
+
+    connection = analysis.graph.connections[connection_id]
+    if hasattr(connection, "time"):
+        connection.time = time
+
+    previous_endpoint_required_time_s = _get_endpoint_required_time(analysis)
+    _propagate_arrival_times(analysis, [int(analysis.edge_target_ids[connection_id])])
+    if _get_endpoint_required_time(analysis) != previous_endpoint_required_time_s:
+        _propagate_required_times(analysis)
+    else:
+        _propagate_required_times(
+            analysis, [int(analysis.edge_source_ids[connection_id])]
+        )
+    return analysis
+
+
+def extract_critical_path(
+    analysis: StaticTimingAnalysis,
+    endpoint_reference: Optional[str] = None,
+) -> list[str]:
+    """
+    Traces the latest arriving path back from an endpoint to its start port.
+
+    Args:
+        analysis (StaticTimingAnalysis): The analysis.
+        endpoint_reference (Optional[str]): The port to trace back from. Defaults to the port with the worst slack,
+            and the latest arrival time among those.
+
+    Returns:
+        list[str]: The port references of the path from its start port to the endpoint.
+    """
+    if endpoint_reference is None:
+        if len(analysis.slack_s) == 0:
+            return []
+        # Sorts by slack first and by the latest arrival second
+        node_id = int(np.lexsort((-analysis.arrival_time_max_s, analysis.slack_s))[0])
+    else:
+        node_id = analysis.graph.get_port_id(endpoint_reference)
+        if node_id is None:
+            raise ValueError(f"Port {endpoint_reference} not found in the graph.")
+
+    port_references = analysis.port_references
+    critical_path = [port_references[node_id]]
+    while analysis.critical_edge_ids[node_id] >= 0:
+        node_id = int(analysis.edge_source_ids[analysis.critical_edge_ids[node_id]])
+        critical_path.append(port_references[node_id])
+    return critical_path[::-1]
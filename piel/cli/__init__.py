@@ -2,6 +2,7 @@ from .activate import *
 from .core import *
 from .develop import *
 from .main import *
+from .profile import *
 from .run import *
 from .utils import *
 from .environment import *
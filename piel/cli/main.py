@@ -1,4 +1,5 @@
 import click
+from ..file_system import create_piel_home_directory
 
 __all__ = ["main"]
 
@@ -7,3 +8,5 @@ __all__ = ["main"]
 def main(args=None):
     """CLI Interface for piel There are available many helper commands to help you set up your
     environment and design your projects."""
+    # The home directory is created on use rather than when piel is imported
+    create_piel_home_directory()
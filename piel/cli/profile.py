@@ -0,0 +1,292 @@
+import click
+import json
+import re
+import subprocess
+import sys
+from .main import main
+
+__all__ = [
+    "check_import_time_budget",
+    "compose_import_profile_tree",
+    "parse_import_time_log",
+    "profile_import",
+]
+
+IMPORT_PROFILE_START_MARKER = "piel-import-profile-start"
+_IMPORT_TIME_LINE_PATTERN = re.compile(
+    r"^import time:\s+(?P<self_us>\d+) \|\s+(?P<cumulative_us>\d+) \| (?P<indent>\s*)(?P<name>\S+)\s*$"
+)
+
+# Runs in a fresh interpreter so every import is measured from a cold start. The instrumentation modules are
+# imported before the marker so that they are excluded from the profile.
+_IMPORT_PROFILE_SCRIPT = """
+import json, os, sys, tracemalloc
+trace_memory = {trace_memory!r}
+if trace_memory:
+    tracemalloc.start()
+print({marker!r}, file=sys.stderr, flush=True)
+for module_name in {module_names!r}:
+    __import__(module_name)
+module_memory = {{}}
+peak_memory = 0
+if trace_memory:
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    file_modules = {{
+        os.path.realpath(module.__file__): name
+        for name, module in list(sys.modules.items())
+        if getattr(module, "__file__", None)
+    }}
+    for statistic in tracemalloc.take_snapshot().statistics("filename"):
+        name = file_modules.get(os.path.realpath(statistic.traceback[0].filename))
+        if name is not None:
+            module_memory[name] = module_memory.get(name, 0) + statistic.size
+print(json.dumps({{"module_memory": module_memory, "peak_memory": peak_memory}}))
+"""
+
+
+def parse_import_time_log(import_time_log: str) -> list[dict]:
+    """
+    Parses the output of ``python -X importtime`` into the import tree.
+
+    The log is written in post-order, so the children of each module are listed before it at one level deeper.
+
+    Args:
+        import_time_log (str): The ``-X importtime`` log.
+
+    Returns:
+        import_profile (list[dict]): One dictionary per imported module in import order, with its ``name``,
+        ``depth``, ``self_time_s``, ``cumulative_time_s``, the ``memory_bytes`` and ``cumulative_memory_bytes`` to be
+        filled in by ``profile_import``, and the list of ``children`` indexes.
+    """
+    import_profile = []
+    # Indexes of the modules whose parent has not been parsed yet
+    orphan_indexes = []
+    for line in import_time_log.splitlines():
+        match = _IMPORT_TIME_LINE_PATTERN.match(line)
+        if match is None:
+            continue
+        depth = len(match.group("indent")) // 2
+        children = [
+            index
+            for index in orphan_indexes
+            if import_profile[index]["depth"] == depth + 1
+        ]
+        orphan_indexes = [index for index in orphan_indexes if index not in children]
+        orphan_indexes.append(len(import_profile))
+        import_profile.append(
+            {
+                "name": match.group("name"),
+                "depth": depth,
+                "self_time_s": int(match.group("self_us")) * 1e-6,
+                "cumulative_time_s": int(match.group("cumulative_us")) * 1e-6,
+                "memory_bytes": 0,
+                "cumulative_memory_bytes": 0,
+                "children": children,
+            }
+        )
+    return import_profile
+
+
+def profile_import(
+    module_names: list[str],
+    trace_memory: bool = False,
+    python_executable: str | None = None,
+) -> tuple[list[dict], int]:
+    """
+    Measures the import time of each module imported by ``module_names`` in a fresh interpreter. Optionally, the
+    memory allocated by the code of each module during the import is traced with ``tracemalloc``, which slows down
+    the import.
+
+    Args:
+        module_names (list[str]): The entry point modules to import in order.
+        trace_memory (bool): Whether to trace the memory allocated by each module. Defaults to False.
+        python_executable (str, optional): The interpreter to profile. Defaults to the current one.
+
+    Returns:
+        import_profile (list[dict]): The import tree from ``parse_import_time_log`` with the ``memory_bytes``
+        allocated by the code of each module and the ``cumulative_memory_bytes`` including its imports.
+        peak_memory (int): The peak traced memory in bytes, 0 if the memory is not traced.
+    """
+    script = _IMPORT_PROFILE_SCRIPT.format(
+        trace_memory=trace_memory,
+        marker=IMPORT_PROFILE_START_MARKER,
+        module_names=list(module_names),
+    )
+    result = subprocess.run(
+        [python_executable or sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise ImportError(
+            f"Importing {module_names} failed with:\n{result.stderr.splitlines()[-1]}"
+        )
+
+    import_time_log = result.stderr.split(IMPORT_PROFILE_START_MARKER, 1)[-1]
+    import_profile = parse_import_time_log(import_time_log)
+    memory_profile = json.loads(result.stdout.splitlines()[-1])
+    # The children are listed before their parent, so their cumulative memory is known when the parent is reached
+    for module_profile in import_profile:
+        module_profile["memory_bytes"] = memory_profile["module_memory"].get(
+            module_profile["name"], 0
+        )
+        module_profile["cumulative_memory_bytes"] = module_profile[
+            "memory_bytes"
+        ] + sum(
+            import_profile[child_index]["cumulative_memory_bytes"]
+            for child_index in module_profile["children"]
+        )
+    return import_profile, memory_profile["peak_memory"]
+
+
+def compose_import_profile_tree(
+    import_profile: list[dict],
+    maximum_depth: int | None = None,
+    minimum_time_s: float = 0.0,
+) -> str:
+    """
+    Renders the import tree with the slowest imports first at every level.
+
+    Args:
+        import_profile (list[dict]): The import tree from ``parse_import_time_log``.
+        maximum_depth (int, optional): The deepest level to render. Defaults to all the levels.
+        minimum_time_s (float): Modules with a lower cumulative import time are hidden. Defaults to 0.
+
+    Returns:
+        import_profile_tree (str): The rendered tree, one module per line.
+    """
+    lines = [f"{'cumulative [ms]':>15} {'self [ms]':>10} {'memory [kB]':>12}  module"]
+
+    def by_cumulative_time(index):
+        return -import_profile[index]["cumulative_time_s"]
+
+    def render(index):
+        module_profile = import_profile[index]
+        if module_profile["cumulative_time_s"] < minimum_time_s:
+            return
+        lines.append(
+            f"{module_profile['cumulative_time_s'] * 1e3:>15.1f} "
+            f"{module_profile['self_time_s'] * 1e3:>10.1f} "
+            f"{module_profile['cumulative_memory_bytes'] / 1e3:>12.1f}  "
+            f"{'  ' * module_profile['depth']}{module_profile['name']}"
+        )
+        if maximum_depth is None or module_profile["depth"] < maximum_depth:
+            for child_index in sorted(
+                module_profile["children"], key=by_cumulative_time
+            ):
+                render(child_index)
+
+    root_indexes = [
+        index
+        for index, module_profile in enumerate(import_profile)
+        if module_profile["depth"] == 0
+    ]
+    for root_index in sorted(root_indexes, key=by_cumulative_time):
+        render(root_index)
+    return "\n".join(lines)
+
+
+def check_import_time_budget(
+    budgets_s: dict[str, float],
+    python_executable: str | None = None,
+) -> list[dict]:
+    """
+    Measures the cold start import time of each entry point in its own fresh interpreter and compares it with its
+    budget. The import time of an entry point includes all the top-level imports it triggers, such as its parent
+    packages.
+
+    Args:
+        budgets_s (dict[str, float]): The import time budget in seconds of each entry point module.
+        python_executable (str, optional): The interpreter to profile. Defaults to the current one.
+
+    Returns:
+        budget_results (list[dict]): One dictionary per entry point with its ``name``, ``import_time_s``,
+        ``budget_s`` and whether it is ``within_budget``.
+    """
+    budget_results = []
+    for module_name, budget_s in budgets_s.items():
+        import_profile, _ = profile_import(
+            [module_name], python_executable=python_executable
+        )
+        import_time_s = sum(
+            module_profile["cumulative_time_s"]
+            for module_profile in import_profile
+            if module_profile["depth"] == 0
+        )
+        budget_results.append(
+            {
+                "name": module_name,
+                "import_time_s": import_time_s,
+                "budget_s": budget_s,
+                "within_budget": import_time_s <= budget_s,
+            }
+        )
+    return budget_results
+
+
+def _parse_budget(context, parameter, values):
+    budgets_s = {}
+    for value in values:
+        module_name, separator, budget_s = value.partition("=")
+        try:
+            budgets_s[module_name] = float(budget_s)
+        except ValueError:
+            separator = ""
+        if not separator or not module_name:
+            raise click.BadParameter(f"Expected MODULE=SECONDS, got {value}.")
+    return budgets_s
+
+
+@click.command(
+    name="profile-import",
+    help="Profiles the import time and memory of the given modules, piel by default.",
+)
+@click.argument("module_names", nargs=-1)
+@click.option("--depth", type=int, default=None, help="Deepest import level to show.")
+@click.option(
+    "--min-time-ms",
+    type=float,
+    default=1.0,
+    show_default=True,
+    help="Hide modules that import faster than this.",
+)
+@click.option(
+    "--memory/--no-memory",
+    default=False,
+    help="Trace the memory allocated by each module, slows down the import.",
+)
+@click.option(
+    "--budget",
+    "budgets_s",
+    multiple=True,
+    callback=_parse_budget,
+    help="MODULE=SECONDS import time budget of an entry point, can be repeated.",
+)
+def profile_import_command(module_names, depth, min_time_ms, memory, budgets_s):
+    """Prints the ranked import tree and fails if an entry point exceeds its import time budget."""
+    if len(module_names) > 0 or len(budgets_s) == 0:
+        import_profile, peak_memory = profile_import(
+            list(module_names) or ["piel"], trace_memory=memory
+        )
+        click.echo(
+            compose_import_profile_tree(
+                import_profile, maximum_depth=depth, minimum_time_s=min_time_ms * 1e-3
+            )
+        )
+        if memory:
+            click.echo(f"Peak traced memory: {peak_memory / 1e6:.1f} MB")
+
+    if len(budgets_s) > 0:
+        budget_results = check_import_time_budget(budgets_s)
+        for budget_result in budget_results:
+            status = "OK" if budget_result["within_budget"] else "EXCEEDED"
+            click.echo(
+                f"{status}: {budget_result['name']} imported in "
+                f"{budget_result['import_time_s']:.3f} s, budget {budget_result['budget_s']:.3f} s"
+            )
+        if not all(budget_result["within_budget"] for budget_result in budget_results):
+            sys.exit(1)
+    return 0
+
+
+main.add_command(profile_import_command)
@@ -1,3 +1,4 @@
+import collections
 import logging
 from typing import Optional, Callable
 from piel.types import (
@@ -6,6 +7,7 @@ from piel.types import (
     PhysicalConnection,
     ConnectionTypes,
     ComponentTypes,
+    ConnectivityGraph,
     TimeMetric,
     PhysicalComponent,
 )
@@ -15,8 +17,11 @@ logger = logging.getLogger(__name__)
 
 
 __all__ = [
+    "add_components_to_connectivity_graph",
+    "compose_connectivity_graph",
     "create_all_connections",
     "create_component_connections",
+    "create_connectivity_graph_connections",
     "create_sequential_component_path",
     "create_connection_list_from_ports_lists",
 ]
@@ -146,6 +151,8 @@ def create_component_connections(
     if isinstance(connection_reference_str_list[0], str):
         connection_reference_str_list = [connection_reference_str_list]
 
+    # The last component with a given name takes precedence
+    component_dict = {component.name: component for component in components}
     connection_list = []
 
     for connection_reference in connection_reference_str_list:
@@ -158,16 +165,11 @@ def create_component_connections(
         component1_name, port1_name = connection_reference[0].split(".")
         component2_name, port2_name = connection_reference[1].split(".")
 
-        # Initialize connection
-        port1 = None
-        port2 = None
-
         # Get the port references
-        for component in components:
-            if component.name == component1_name:
-                port1 = component.get_port(port1_name)
-            if component.name == component2_name:
-                port2 = component.get_port(port2_name)
+        component1 = component_dict.get(component1_name, None)
+        component2 = component_dict.get(component2_name, None)
+        port1 = None if component1 is None else component1.get_port(port1_name)
+        port2 = None if component2 is None else component2.get_port(port2_name)
 
         # Check if the connection were found
         if port1 is None or port2 is None:
@@ -182,6 +184,228 @@ def create_component_connections(
     return connection_list
 
 
+def _index_component(
+    graph: ConnectivityGraph,
+    component: ComponentTypes,
+    component_path: str,
+    parent_id: int,
+) -> int:
+    """
+    Adds a component and its ports to the graph, and returns its ID.
+    """
+    if component_path in graph.component_ids:
+        raise ValueError(f"Component {component_path} is already in the graph.")
+
+    component_id = len(graph.components)
+    graph.components.append(component)
+    graph.component_paths.append(component_path)
+    graph.component_ids[component_path] = component_id
+    graph.component_parent_ids.append(parent_id)
+    graph.component_children_ids.append([])
+    if parent_id >= 0:
+        graph.component_children_ids[parent_id].append(component_id)
+
+    port_prefix = f"{component_path}." if component_path else ""
+    for port in component.ports:
+        port_id = len(graph.ports)
+        graph.ports.append(port)
+        graph.port_component_ids.append(component_id)
+        # As in ``Component.get_port``, the last port with a given name takes precedence
+        graph.port_ids[f"{port_prefix}{port.name}"] = port_id
+        graph.port_object_ids[id(port)] = port_id
+        graph.adjacency.append([])
+    return component_id
+
+
+def _add_connection_to_graph(
+    graph: ConnectivityGraph, connection: Connection, port_ids: tuple[int, int]
+) -> None:
+    """
+    Adds a connection between two indexed ports to the graph.
+    """
+    graph.connections.append(connection)
+    graph.connection_port_ids.append(port_ids)
+    graph.adjacency[port_ids[0]].append(port_ids[1])
+    graph.adjacency[port_ids[1]].append(port_ids[0])
+
+
+def _index_component_connections(
+    graph: ConnectivityGraph, component: ComponentTypes
+) -> None:
+    """
+    Adds the connections defined in a component, and in its subcomponents, between the ports indexed in the graph.
+    """
+    for connection in component.connections:
+        # A physical connection groups the connections it physically implements
+        for connection_i in getattr(connection, "connections", [connection]):
+            ports = getattr(connection_i, "ports", connection_i)
+            port_ids = tuple(
+                graph.port_object_ids.get(id(port), None) for port in ports
+            )
+            if len(port_ids) != 2 or None in port_ids:
+                logger.debug(
+                    f"Skipping connection {connection_i} of {component.name}, as its ports are not in the graph."
+                )
+                continue
+            _add_connection_to_graph(graph, connection_i, port_ids)
+
+    for subcomponent in component.components:
+        _index_component_connections(graph, subcomponent)
+
+
+def add_components_to_connectivity_graph(
+    graph: ConnectivityGraph,
+    components: ComponentTypes | list[ComponentTypes],
+    parent_path: Optional[str] = None,
+    index_connections: bool = True,
+) -> ConnectivityGraph:
+    """
+    Incrementally adds components, their subcomponents, ports and connections to an existing connectivity graph.
+    The existing IDs are not changed. The components are added at the top level, or under the ``parent_path``
+    component, with the path of each subcomponent composed from the names of its parents.
+
+    Parameters
+    ----------
+    graph : ConnectivityGraph
+        The graph to update in place.
+    components : ComponentTypes | list[ComponentTypes]
+        The components to add.
+    parent_path : Optional[str], optional
+        The path of the component in the graph the components are added to. The default is None.
+    index_connections : bool, optional
+        Whether to add the connections defined in the components. The default is True.
+
+    Returns
+    -------
+    ConnectivityGraph
+        The updated graph.
+    """
+    if not isinstance(components, (list, tuple)):
+        components = [components]
+
+    if parent_path is None:
+        parent_id = -1
+    elif parent_path in graph.component_ids:
+        parent_id = graph.component_ids[parent_path]
+    else:
+        raise ValueError(f"Component {parent_path} not found in the graph.")
+
+    # Breadth first, so that the ports of all the components are indexed before their connections are resolved
+    component_queue = collections.deque(
+        (component, parent_id, parent_path) for component in components
+    )
+    while len(component_queue) > 0:
+        component, component_parent_id, component_parent_path = (
+            component_queue.popleft()
+        )
+        component_path = (
+            f"{component_parent_path}.{component.name}"
+            if component_parent_path
+            else component.name
+        )
+        component_id = _index_component(
+            graph, component, component_path, component_parent_id
+        )
+        component_queue.extend(
+            (subcomponent, component_id, component_path)
+            for subcomponent in component.components
+        )
+
+    if index_connections:
+        for component in components:
+            _index_component_connections(graph, component)
+
+    return graph
+
+
+def compose_connectivity_graph(
+    components: ComponentTypes | list[ComponentTypes],
+) -> ConnectivityGraph:
+    """
+    Indexes a component hierarchy once into a ``ConnectivityGraph``, so that its components and ports can be looked
+    up by their dot notation reference and its connections traversed through the adjacency lists.
+
+    If a single component is provided, it is the root of the hierarchy with an empty path: its ports are referenced
+    by their name alone and its subcomponents by their names. If a list is provided, each component is a top level component
+    referenced by its name.
+
+    Parameters
+    ----------
+    components : ComponentTypes | list[ComponentTypes]
+        The root component, or the top level components.
+
+    Returns
+    -------
+    ConnectivityGraph
+        The indexed connectivity graph.
+    """
+    graph = ConnectivityGraph()
+    if isinstance(components, (list, tuple)):
+        return add_components_to_connectivity_graph(graph, components)
+
+    _index_component(graph, components, "", -1)
+    add_components_to_connectivity_graph(
+        graph, components.components, parent_path="", index_connections=False
+    )
+    _index_component_connections(graph, components)
+    return graph
+
+
+def create_connectivity_graph_connections(
+    graph: ConnectivityGraph,
+    connection_reference_str_list: list[str] | list[list[str]],
+) -> list[Connection]:
+    """
+    The indexed equivalent of ``create_component_connections``, which creates the connections between the ports of a
+    connectivity graph from their dot notation references, such as ``["lattice.mzi_0.out0", "lattice.mzi_1.in0"]``.
+    Each reference is resolved with a single dictionary lookup and the connections are added to the graph.
+
+    Parameters
+    ----------
+    graph : ConnectivityGraph
+        The connectivity graph, updated in place.
+    connection_reference_str_list : list[str] | list[list[str]]
+        The pairs of port references to connect.
+
+    Returns
+    -------
+    list[Connection]
+        The list of connections created.
+    """
+    if len(connection_reference_str_list) == 0:
+        raise ValueError(
+            "The list of connection references must have at least one connection."
+        )
+
+    if isinstance(connection_reference_str_list[0], str):
+        connection_reference_str_list = [connection_reference_str_list]
+
+    connection_list = []
+    for connection_reference in connection_reference_str_list:
+        if (
+            not isinstance(connection_reference, (list, tuple))
+            or len(connection_reference) != 2
+        ):
+            raise ValueError("Each connection reference must be a list of two strings.")
+
+        port_ids = tuple(
+            graph.port_ids.get(port_reference, None)
+            for port_reference in connection_reference
+        )
+        if None in port_ids:
+            raise ValueError(
+                f"Could not find the connection for the connection {connection_reference}"
+            )
+
+        connection = Connection(
+            ports=(graph.ports[port_ids[0]], graph.ports[port_ids[1]])
+        )
+        _add_connection_to_graph(graph, connection, port_ids)
+        connection_list.append(connection)
+
+    return connection_list
+
+
 def create_sequential_component_path(
     components: list[ComponentTypes], name: str = "", **kwargs
 ) -> ComponentTypes:
@@ -210,21 +434,24 @@ def create_sequential_component_path(
             "At least two components are required to create a sequential path."
         )
 
+    from piel.analysis.timing.static import resolve_time_metric_statistics
+
     connections = []
-    total_time_value = 0  # = TimeMetric(name=name, attrs={}, value=0, mean=0, min=0, max=0, standard_deviation=0)
+    # The mean, min, max and variance of independent delays add along the path
+    total_time_statistics = [0.0, 0.0, 0.0, 0.0]
 
     for i in range(len(components) - 1):
         current_component = components[i]
         next_component = components[i + 1]
 
         # Assume the first port is output and the second is input
-        if len(current_component.connection) < 1 or len(next_component.connection) < 1:
+        if len(current_component.ports) < 2 or len(next_component.ports) < 1:
             raise ValueError(
                 f"Component {current_component.name} or {next_component.name} doesn't have enough connection."
             )
 
-        output_port = current_component.connection[1]
-        input_port = next_component.connection[0]
+        output_port = current_component.ports[1]
+        input_port = next_component.ports[0]
 
         # Create connection with timing information
         connection_time = (
@@ -239,16 +466,24 @@ def create_sequential_component_path(
         connections.append(physical_connection)
 
         # Update total time
-        total_time_value += connection_time.value
-        # TODO total_time.mean += connection_time.mean
-        # TODO total_time.min += connection_time.min
-        # TODO total_time.max += connection_time.max
-        # Assuming standard deviation is not simply additive
-
-    total_time = TimeMetric(value=total_time_value)
-    # TODO implement full network timing analysis
+        mean, minimum, maximum, standard_deviation = resolve_time_metric_statistics(
+            connection_time
+        )
+        total_time_statistics[0] += mean
+        total_time_statistics[1] += minimum
+        total_time_statistics[2] += maximum
+        total_time_statistics[3] += standard_deviation**2
+
+    total_time = TimeMetric(
+        value=total_time_statistics[0],
+        mean=total_time_statistics[0],
+        min=total_time_statistics[1],
+        max=total_time_statistics[2],
+        standard_deviation=total_time_statistics[3] ** 0.5,
+    )
+    # See ``piel.analysis.timing.compose_static_timing_analysis`` for the timing analysis of arbitrary networks
 
-    top_level_ports = [components[0].connection[0], components[-1].connection[-1]]
+    top_level_ports = [components[0].ports[0], components[-1].ports[-1]]
     # TODO best define top level connection
 
     top_level_connection = Connection(ports=top_level_ports, time=total_time)
@@ -261,8 +496,8 @@ def create_sequential_component_path(
     connections.append(top_level_physical_connection)
 
     ports = [
-        components[0].connection[0],
-        components[-1].connection[-1],
+        components[0].ports[0],
+        components[-1].ports[-1],
     ]
 
     logger.debug(f"Sequential Component connections: {connections}")
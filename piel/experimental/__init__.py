@@ -19,7 +19,9 @@ from .measurements.data.dc import (
     extract_signal_data_from_csv,
     extract_signal_data_from_dataframe,
     extract_dc_sweeps_from_operating_point_csv,
+    extract_dc_sweeps_from_operating_point_dataframe,
     extract_dc_sweep_experiment_data_from_csv,
+    split_operating_point_dataframe,
     extract_dc_metrics_from_experiment_data,
 )
 from .measurements.data.electro_optic import (
@@ -32,8 +34,15 @@ from .measurements.data.propagation import (
 from .measurements.data.frequency import (
     extract_s_parameter_data_from_vna_measurement,
     extract_power_sweep_data_from_vna_measurement,
+    extract_power_sweep_data_from_vna_measurement_collection,
     extract_power_sweep_s2p_to_network_transmission,
     extract_power_sweep_s2p_to_dataframe,
+    convert_power_sweep_s2p_to_dense_network_transmission,
+    convert_power_sweep_s2p_to_network_transmission,
+    convert_power_sweep_s2p_array_to_s_parameters,
+    extract_power_sweep_s2p_files_to_dense_network_transmissions,
+    load_power_sweep_s2p_array,
+    load_power_sweep_s2p_arrays,
     convert_row_to_sdict,
 )
 from .measurements.data.extract import (
@@ -10,6 +10,10 @@ from .extract import (
     extract_propagation_delay_measurement_sweep_data,
     extract_waveform_to_dataframe,
     extract_to_data_time_signal,
+    extract_to_data_time_signal_from_binary_cache,
+    extract_waveform_to_binary_cache,
+    get_waveform_binary_cache_paths,
+    is_waveform_binary_cache_valid,
     extract_to_signal_measurement,
     combine_channel_data,
     parse_column_name,
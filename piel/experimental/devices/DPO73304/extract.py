@@ -1,3 +1,7 @@
+import json
+import os
+import pathlib
+import numpy as np
 import pandas as pd
 import logging
 
@@ -18,7 +22,7 @@ from piel.types import (
     ScalarMetric,
     ScalarMetricCollection,
 )
-from piel.file_system import return_path
+from piel.file_system import read_json, return_path
 from .types import ParsedColumnInfo
 
 
@@ -107,8 +111,234 @@ def extract_waveform_to_dataframe(file: PathTypes) -> pd.DataFrame:
     return pd.read_csv(file, header=0, names=["time_s", "voltage_V"], usecols=[3, 4])
 
 
+WAVEFORM_CACHE_COLUMNS = ("time_s", "voltage_V")
+"""
+Columns of the DPO73304 waveform csv files that are stored in the binary cache.
+"""
+
+
+def get_waveform_binary_cache_paths(
+    file: PathTypes,
+    cache_directory: PathTypes | None = None,
+) -> dict[str, pathlib.Path]:
+    """
+    Returns the paths of the binary cache files of a waveform csv file. There is one ``.npy`` file per column and a
+    ``.json`` metadata sidecar. By default, the cache is stored in a ``.piel_cache`` directory next to the csv file.
+
+    Parameters
+    ----------
+    file : PathTypes
+        The path to the csv file.
+    cache_directory : PathTypes, optional
+        The directory where the cache is stored.
+
+    Returns
+    -------
+    dict[str, pathlib.Path]
+        The ``metadata`` sidecar path and the ``.npy`` path of each column.
+    """
+    file = return_path(file)
+    if cache_directory is None:
+        cache_directory = file.parent / ".piel_cache"
+    cache_directory = return_path(cache_directory)
+
+    cache_paths = {"metadata": cache_directory / f"{file.name}.json"}
+    for column in WAVEFORM_CACHE_COLUMNS:
+        cache_paths[column] = cache_directory / f"{file.name}.{column}.npy"
+    return cache_paths
+
+
+def _compose_waveform_source_metadata(file: pathlib.Path) -> dict:
+    """
+    Composes the metadata that identifies the version of a waveform csv file, used to invalidate the cache.
+    """
+    file_stat = file.stat()
+    return {
+        "source_file": str(file.resolve()),
+        "source_size": file_stat.st_size,
+        "source_mtime_ns": file_stat.st_mtime_ns,
+    }
+
+
+def extract_waveform_to_binary_cache(
+    file: PathTypes,
+    cache_directory: PathTypes | None = None,
+    chunk_size: int = 1_000_000,
+    overwrite: bool = False,
+) -> dict[str, pathlib.Path]:
+    """
+    Converts a waveform csv file into a memory-mappable binary cache, unless a valid cache already exists. The csv is
+    parsed in chunks of ``chunk_size`` rows that are streamed straight into the ``.npy`` files, so the full waveform
+    is never held in memory. The metadata sidecar records the size and modification time of the csv file and is
+    written last, so an interrupted conversion is never reused.
+
+    Parameters
+    ----------
+    file : PathTypes
+        The path to the csv file.
+    cache_directory : PathTypes, optional
+        The directory where the cache is stored. Defaults to a ``.piel_cache`` directory next to the csv file.
+    chunk_size : int, optional
+        The amount of csv rows parsed at a time.
+    overwrite : bool, optional
+        Regenerate the cache even if it is valid.
+
+    Returns
+    -------
+    dict[str, pathlib.Path]
+        The ``metadata`` sidecar path and the ``.npy`` path of each column.
+    """
+    file = return_path(file)
+    cache_paths = get_waveform_binary_cache_paths(file, cache_directory)
+
+    if not overwrite and is_waveform_binary_cache_valid(file, cache_directory):
+        logger.debug(f"Reusing waveform binary cache for file: {file}")
+        return cache_paths
+
+    logger.debug(f"Creating waveform binary cache for file: {file}")
+    cache_paths["metadata"].parent.mkdir(parents=True, exist_ok=True)
+    # Any existing metadata is removed first so the cache is invalid until it is complete
+    cache_paths["metadata"].unlink(missing_ok=True)
+
+    dtype = np.dtype("<f8")
+    temporary_paths = {
+        column: cache_paths[column].with_suffix(".npy.tmp")
+        for column in WAVEFORM_CACHE_COLUMNS
+    }
+    column_files = dict()
+    row_count = 0
+    try:
+        for column in WAVEFORM_CACHE_COLUMNS:
+            column_files[column] = open(temporary_paths[column], "wb")
+
+        # The npy headers reserve space for the row count to grow, so they are rewritten in place once it is known
+        header_lengths = dict()
+        for column, column_file in column_files.items():
+            np.lib.format.write_array_header_1_0(
+                column_file,
+                {"descr": dtype.str, "fortran_order": False, "shape": (0,)},
+            )
+            header_lengths[column] = column_file.tell()
+
+        for chunk in pd.read_csv(
+            file,
+            header=0,
+            names=list(WAVEFORM_CACHE_COLUMNS),
+            usecols=[3, 4],
+            chunksize=chunk_size,
+        ):
+            for column, column_file in column_files.items():
+                column_file.write(chunk[column].to_numpy(dtype=dtype).tobytes())
+            row_count += len(chunk)
+
+        for column, column_file in column_files.items():
+            column_file.seek(0)
+            np.lib.format.write_array_header_1_0(
+                column_file,
+                {"descr": dtype.str, "fortran_order": False, "shape": (row_count,)},
+            )
+            if column_file.tell() != header_lengths[column]:
+                raise ValueError(
+                    f"The npy header of column {column} changed length for {row_count} rows."
+                )
+        for column_file in column_files.values():
+            column_file.close()
+        for column in WAVEFORM_CACHE_COLUMNS:
+            os.replace(temporary_paths[column], cache_paths[column])
+    finally:
+        # The temporary files only remain if the conversion failed
+        for column_file in column_files.values():
+            column_file.close()
+        for temporary_path in temporary_paths.values():
+            temporary_path.unlink(missing_ok=True)
+
+    metadata = _compose_waveform_source_metadata(file)
+    metadata["row_count"] = row_count
+    metadata["columns"] = {
+        column: cache_paths[column].name for column in WAVEFORM_CACHE_COLUMNS
+    }
+    with open(cache_paths["metadata"], "w") as metadata_file:
+        json.dump(metadata, metadata_file, indent=4)
+
+    return cache_paths
+
+
+def is_waveform_binary_cache_valid(
+    file: PathTypes,
+    cache_directory: PathTypes | None = None,
+) -> bool:
+    """
+    Checks whether the binary cache of a waveform csv file exists and matches the current size and modification
+    time of the csv file.
+
+    Parameters
+    ----------
+    file : PathTypes
+        The path to the csv file.
+    cache_directory : PathTypes, optional
+        The directory where the cache is stored.
+
+    Returns
+    -------
+    bool
+        Whether the cache can be reused.
+    """
+    file = return_path(file)
+    cache_paths = get_waveform_binary_cache_paths(file, cache_directory)
+    if not all(path.exists() for path in cache_paths.values()):
+        return False
+
+    try:
+        metadata = read_json(cache_paths["metadata"])
+    except (OSError, ValueError):
+        return False
+
+    source_metadata = _compose_waveform_source_metadata(file)
+    return all(
+        metadata.get(key) == value
+        for key, value in source_metadata.items()
+        if key != "source_file"
+    )
+
+
+def extract_to_data_time_signal_from_binary_cache(
+    file: PathTypes,
+    cache_directory: PathTypes | None = None,
+    chunk_size: int = 1_000_000,
+) -> DataTimeSignalData:
+    """
+    Extracts a waveform csv file as a DataTimeSignal backed by read-only ``np.memmap`` arrays of its binary cache. The
+    cache is created on the first load, and recreated whenever the csv file changes.
+
+    Parameters
+    ----------
+    file : PathTypes
+        The path to the csv file.
+    cache_directory : PathTypes, optional
+        The directory where the cache is stored. Defaults to a ``.piel_cache`` directory next to the csv file.
+    chunk_size : int, optional
+        The amount of csv rows parsed at a time when creating the cache.
+
+    Returns
+    -------
+    DataTimeSignalData
+        The waveform files as a DataTimeSignal without loading them into memory.
+    """
+    logger.debug(f"Extracting waveform from binary cache of file: {file}")
+    cache_paths = extract_waveform_to_binary_cache(
+        file, cache_directory=cache_directory, chunk_size=chunk_size
+    )
+    return DataTimeSignalData(
+        time_s=np.load(cache_paths["time_s"], mmap_mode="r"),
+        data=np.load(cache_paths["voltage_V"], mmap_mode="r"),
+        data_name="voltage_V",
+    )
+
+
 def extract_to_data_time_signal(
     file: PathTypes,
+    use_cache: bool = False,
+    cache_directory: PathTypes | None = None,
 ) -> DataTimeSignalData:
     """
     Extracts the waveform files from a csv file and returns it as a DataTimeSignal that can be used to analyse the signal with other methods.
@@ -117,12 +347,21 @@ def extract_to_data_time_signal(
     ----------
     file : PathTypes
         The path to the csv file.
+    use_cache : bool, optional
+        Load the waveform through its memory-mapped binary cache, see ``extract_to_data_time_signal_from_binary_cache``.
+    cache_directory : PathTypes, optional
+        The directory where the binary cache is stored.
 
     Returns
     -------
     DataTimeSignalData
         The waveform files as a DataTimeSignal.
     """
+    if use_cache:
+        return extract_to_data_time_signal_from_binary_cache(
+            file, cache_directory=cache_directory
+        )
+
     logger.debug(f"Extracting waveform from file: {file}")
     dataframe = extract_waveform_to_dataframe(file)
     data_time_signal = DataTimeSignalData(
@@ -219,7 +458,13 @@ def extract_propagation_delay_measurement_sweep_data(
 
 def extract_oscilloscope_data_from_measurement(
     oscilloscope_measurement: OscilloscopeMeasurement,
+    use_cache: bool = False,
+    cache_directory: PathTypes | None = None,
 ) -> OscilloscopeMeasurementData:
+    """
+    Extracts the measurements and waveforms of an oscilloscope measurement. If ``use_cache`` is enabled, the waveforms
+    are loaded through their memory-mapped binary cache.
+    """
     logger.debug(
         f"Extracting oscilloscope data from measurement: {oscilloscope_measurement}"
     )
@@ -248,7 +493,9 @@ def extract_oscilloscope_data_from_measurement(
             # Try appending to parent directory if file does not exist
             file = oscilloscope_measurement.parent_directory / waveform_file
         if file.exists():
-            waveform_data = extract_to_data_time_signal(file)
+            waveform_data = extract_to_data_time_signal(
+                file, use_cache=use_cache, cache_directory=cache_directory
+            )
             waveform_data_list.append(waveform_data)
         else:
             raise FileNotFoundError(f"Waveform file {file} does not exist.")
@@ -320,6 +567,8 @@ def extract_to_signal_measurement(file: PathTypes, **kwargs) -> ScalarMetricColl
 
 def combine_channel_data(
     channel_file: list[PathTypes],
+    use_cache: bool = False,
+    cache_directory: PathTypes | None = None,
 ) -> MultiDataTimeSignal:
     """
     Extracts the waveform files from a list of csv files and returns it as a MultiDataTimeSignal that can be used to analyse the signals together.
@@ -328,6 +577,10 @@ def combine_channel_data(
     ----------
     channel_file : list[PathTypes]
         The list of paths to the csv files.
+    use_cache : bool, optional
+        Load the waveforms through their memory-mapped binary cache.
+    cache_directory : PathTypes, optional
+        The directory where the binary caches are stored.
 
     Returns
     -------
@@ -337,7 +590,9 @@ def combine_channel_data(
     multi_channel_data_time_signals = list()
 
     for file in channel_file:
-        data_time_signal_i = extract_to_data_time_signal(file)
+        data_time_signal_i = extract_to_data_time_signal(
+            file, use_cache=use_cache, cache_directory=cache_directory
+        )
         multi_channel_data_time_signals.append(data_time_signal_i)
 
     return multi_channel_data_time_signals
@@ -1,3 +1,6 @@
+import concurrent.futures
+import functools
+import numpy as np
 import pandas as pd
 from piel.types import PathTypes, V, A, Unit
 from piel.file_system import return_path
@@ -249,12 +252,158 @@ def extract_signal_data_from_csv(
     )
 
 
+def split_operating_point_dataframe(
+    dataframe: pd.DataFrame,
+    unique_operating_point_columns: list[str],
+) -> tuple[list[dict], list[pd.DataFrame]]:
+    """
+    Splits a full operating point dataframe into one dataframe per unique operating point in a single pass. The rows
+    are grouped by the unique operating point columns and stably reordered so that every operating point becomes a
+    contiguous slice of the same sorted dataframe, in the order each operating point first appears.
+
+    Parameters
+    ----------
+
+    dataframe : pd.DataFrame
+        The dataframe containing the DC sweep data of all the operating points.
+    unique_operating_point_columns : list[str]
+        The unique operating point columns.
+
+    Returns
+    -------
+    tuple[list[dict], list[pd.DataFrame]]
+        The unique operating point parameters and the DC sweep data of each operating point.
+    """
+    operating_point_codes = (
+        dataframe.groupby(unique_operating_point_columns, sort=False, dropna=False)
+        .ngroup()
+        .to_numpy()
+    )
+    row_order = np.argsort(operating_point_codes, kind="stable")
+    sorted_dataframe = dataframe.iloc[row_order]
+
+    operating_point_row_amount = np.bincount(operating_point_codes)
+    stop_indexes = np.cumsum(operating_point_row_amount)
+    start_indexes = stop_indexes - operating_point_row_amount
+
+    parameters_list = (
+        sorted_dataframe[unique_operating_point_columns]
+        .iloc[start_indexes]
+        .to_dict(orient="records")
+    )
+    operating_point_dataframes = [
+        sorted_dataframe.iloc[start:stop]
+        for start, stop in zip(start_indexes, stop_indexes)
+    ]
+    return parameters_list, operating_point_dataframes
+
+
+def extract_dc_sweeps_from_operating_point_dataframe(
+    dataframe: pd.DataFrame,
+    input_signal_name_list: list[VoltageCurrentSignalNamePair],
+    output_signal_name_list: list[str],
+    power_signal_name_list: list[VoltageCurrentSignalNamePair],
+    unique_operating_point_columns: list[str],
+    max_workers: int | None = None,
+    **kwargs,
+) -> DCSweepMeasurementDataCollection:
+    """
+    Extract DC sweep data from a full operating point dataframe. The rows of every unique operating point are split
+    in a single pass with ``split_operating_point_dataframe``, and the DC sweep data of each operating point is
+    extracted from its slice.
+
+    Parameters
+    ----------
+
+    dataframe : pd.DataFrame
+        The dataframe containing the DC sweep data of all the operating points.
+    input_signal_name_list : list[VoltageCurrentSignalNamePair]
+        The pairs of sourcemeter voltage and current signal names.
+    output_signal_name_list : list[str]
+        The multimeter signals.
+    power_signal_name_list : list[VoltageCurrentSignalNamePair]
+        The pairs of sourcemeter voltage and current signal names relating to power lines.
+    unique_operating_point_columns : list[str]
+        The unique operating point columns.
+    max_workers : int, optional
+        If provided, the signals of the operating points are constructed in a process pool with this many workers.
+        Useful for sweeps with thousands of operating points.
+    **kwargs
+        Additional keyword arguments.
+
+    Returns
+    -------
+    DCMeasurementDataCollection
+        The DC sweep data collection.
+    """
+    _, operating_point_dataframes = split_operating_point_dataframe(
+        dataframe=dataframe,
+        unique_operating_point_columns=unique_operating_point_columns,
+    )
+    return _extract_dc_sweeps_from_operating_point_dataframes(
+        operating_point_dataframes=operating_point_dataframes,
+        input_signal_name_list=input_signal_name_list,
+        output_signal_name_list=output_signal_name_list,
+        power_signal_name_list=power_signal_name_list,
+        max_workers=max_workers,
+        **kwargs,
+    )
+
+
+def _extract_dc_sweeps_from_operating_point_dataframes(
+    operating_point_dataframes: list[pd.DataFrame],
+    input_signal_name_list: list[VoltageCurrentSignalNamePair],
+    output_signal_name_list: list[str],
+    power_signal_name_list: list[VoltageCurrentSignalNamePair],
+    max_workers: int | None = None,
+    **kwargs,
+) -> DCSweepMeasurementDataCollection:
+    """
+    Extracts the DC sweep data of each operating point dataframe, optionally in a process pool.
+    """
+    extract_operating_point_signal_data = functools.partial(
+        _extract_signal_data_from_operating_point_dataframe,
+        input_signal_name_list=input_signal_name_list,
+        output_signal_name_list=output_signal_name_list,
+        power_signal_name_list=power_signal_name_list,
+        **kwargs,
+    )
+
+    if max_workers is None:
+        dc_sweep_data = [
+            extract_operating_point_signal_data(operating_point_data)
+            for operating_point_data in operating_point_dataframes
+        ]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            dc_sweep_data = list(
+                executor.map(
+                    extract_operating_point_signal_data, operating_point_dataframes
+                )
+            )
+
+    return DCSweepMeasurementDataCollection(collection=dc_sweep_data)
+
+
+def _extract_signal_data_from_operating_point_dataframe(
+    operating_point_data: pd.DataFrame, **kwargs
+) -> SignalDCCollection:
+    """
+    Picklable wrapper of ``extract_signal_data_from_dataframe`` with the dataframe as the positional argument, so it
+    can be mapped over a process pool.
+    """
+    return extract_signal_data_from_dataframe(dataframe=operating_point_data, **kwargs)
+
+
 def extract_dc_sweeps_from_operating_point_csv(
     file_path: PathTypes,
     input_signal_name_list: list[VoltageCurrentSignalNamePair],
     output_signal_name_list: list[str],
     power_signal_name_list: list[VoltageCurrentSignalNamePair],
     unique_operating_point_columns: list[str],
+    max_workers: int | None = None,
     **kwargs,
 ) -> DCSweepMeasurementDataCollection:
     """
@@ -276,6 +425,8 @@ def extract_dc_sweeps_from_operating_point_csv(
         The pairs of sourcemeter voltage and current signal names relating to power lines.
     unique_operating_point_columns : list[str]
         The unique operating point columns.
+    max_workers : int, optional
+        If provided, the signals of the operating points are constructed in a process pool with this many workers.
     **kwargs
         Additional keyword arguments.
 
@@ -287,30 +438,15 @@ def extract_dc_sweeps_from_operating_point_csv(
     file = return_path(file_path)
     dataframe = pd.read_csv(file)
 
-    # Extract the unique operating points
-    unique_operating_points = dataframe[
-        unique_operating_point_columns
-    ].drop_duplicates()
-
-    # Iterate through the unique operating points and extract the DC sweep data
-    dc_sweep_data = []
-
-    for _, operating_point in unique_operating_points.iterrows():
-        operating_point_data = dataframe[
-            (dataframe[unique_operating_point_columns] == operating_point).all(axis=1)
-        ]
-
-        dc_sweep = extract_signal_data_from_dataframe(
-            dataframe=operating_point_data,
-            input_signal_name_list=input_signal_name_list,
-            output_signal_name_list=output_signal_name_list,
-            power_signal_name_list=power_signal_name_list,
-            **kwargs,
-        )
-
-        dc_sweep_data.append(dc_sweep)
-
-    return DCSweepMeasurementDataCollection(collection=dc_sweep_data)
+    return extract_dc_sweeps_from_operating_point_dataframe(
+        dataframe=dataframe,
+        input_signal_name_list=input_signal_name_list,
+        output_signal_name_list=output_signal_name_list,
+        power_signal_name_list=power_signal_name_list,
+        unique_operating_point_columns=unique_operating_point_columns,
+        max_workers=max_workers,
+        **kwargs,
+    )
 
 
 def extract_dc_sweep_experiment_data_from_csv(
@@ -319,6 +455,7 @@ def extract_dc_sweep_experiment_data_from_csv(
     output_signal_name_list: list[str],
     power_signal_name_list: list[VoltageCurrentSignalNamePair],
     unique_operating_point_columns: list[str],
+    max_workers: int | None = None,
     **kwargs,
 ) -> ExperimentData:
     """
@@ -326,6 +463,8 @@ def extract_dc_sweep_experiment_data_from_csv(
     for multiple operating points. The unique operating point columns are used to extract the unique operating points
     from the CSV file. The DC sweep data is then extracted for each unique operating point. The DC sweep data is returned as a ExperimentData with the unique_operating_point_columns as part of the parameter_list definition, and the sweep data as part of the collection DCSweepMeasurementDataCollection.
 
+    The CSV file is only read once, and the operating points are split in a single pass.
+
     Parameters
     ----------
 
@@ -339,6 +478,8 @@ def extract_dc_sweep_experiment_data_from_csv(
         The pairs of sourcemeter voltage and current signal names of the power lines.
     unique_operating_point_columns : list[str]
         The unique operating point columns.
+    max_workers : int, optional
+        If provided, the signals of the operating points are constructed in a process pool with this many workers.
     **kwargs
         Additional keyword arguments.
 
@@ -350,19 +491,17 @@ def extract_dc_sweep_experiment_data_from_csv(
     file = return_path(file_path)
     dataframe = pd.read_csv(file)
 
-    # Extract the unique operating points
-    unique_operating_points = dataframe[
-        unique_operating_point_columns
-    ].drop_duplicates()
-
-    parameters_list = unique_operating_points.to_dict(orient="records")
+    parameters_list, operating_point_dataframes = split_operating_point_dataframe(
+        dataframe=dataframe,
+        unique_operating_point_columns=unique_operating_point_columns,
+    )
 
-    data_collection = extract_dc_sweeps_from_operating_point_csv(
-        file_path=file_path,
+    data_collection = _extract_dc_sweeps_from_operating_point_dataframes(
+        operating_point_dataframes=operating_point_dataframes,
         input_signal_name_list=input_signal_name_list,
         output_signal_name_list=output_signal_name_list,
         power_signal_name_list=power_signal_name_list,
-        unique_operating_point_columns=unique_operating_point_columns,
+        max_workers=max_workers,
         **kwargs,
     )
 
@@ -1,4 +1,5 @@
 import logging
+from pydantic import ValidationError
 from piel.types import PathTypes
 from piel.types.experimental import (
     Experiment,
@@ -16,6 +17,7 @@ from piel.types.experimental import (
 from piel.experimental.measurements.map import (
     measurement_to_data_map,
     measurement_to_data_method_map,
+    measurement_collection_to_data_method_map,
     measurement_data_to_measurement_collection_data_map,
 )
 
@@ -27,13 +29,31 @@ def extract_data_from_measurement_collection(
     measurement_to_data_map: dict = measurement_to_data_map,
     measurement_to_data_method_map: dict = measurement_to_data_method_map,
     skip_missing: bool = False,
+    measurement_collection_to_data_method_map: dict = measurement_collection_to_data_method_map,
     **kwargs,
 ) -> MeasurementDataCollectionTypes:
     """
     The goal of this function is to compose the data from a collection of measurement references.
     Based on each type of measurement, it will apply an extraction function based on the data mapping accordingly.
     It will return a collection of data measurement which is inherent to the type of the measurement collection provided.
+
+    Collection types in ``measurement_collection_to_data_method_map`` are extracted by a single call over all their
+    measurements. If a file cannot be read, or the files cannot be stacked into a single array, each measurement is
+    extracted one at a time instead.
     """
+    extract_collection_data_method = measurement_collection_to_data_method_map.get(
+        getattr(measurement_collection, "type", None)
+    )
+    if extract_collection_data_method is not None:
+        try:
+            return extract_collection_data_method(measurement_collection)
+        except ValidationError:
+            # Data that does not validate is an error rather than a reason to fall back
+            raise
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"extract_data_from_measurement_collection: Extracting the measurements of {measurement_collection.name} one at a time as the collection extraction failed: {e}"
+            )
     measurement_data_collection: MeasurementDataCollectionTypes = list()
 
     logger.debug(
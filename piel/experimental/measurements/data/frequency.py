@@ -5,10 +5,12 @@ from piel.types.experimental import (
 from piel.types import (
     PathTypes,
     VNAPowerSweepMeasurement,
+    VNAPowerSweepMeasurementCollection,
     VNAPowerSweepMeasurementData,
+    FrequencyMeasurementDataCollection,
+    DenseNetworkTransmission,
     NetworkTransmission,
     Phasor,
-    PathTransmission,
     dBm,
     degree,
 )
@@ -35,16 +37,66 @@ def extract_s_parameter_data_from_vna_measurement(
 def extract_power_sweep_data_from_vna_measurement(
     measurement: VNAPowerSweepMeasurement, **kwargs
 ) -> VNAPowerSweepMeasurementData:
+    """
+    Extracts the power sweep of a VNA measurement into a NetworkTransmission. The S2P file is parsed at once by
+    `load_power_sweep_s2p_array`.
+
+    Args:
+        measurement (VNAPowerSweepMeasurement): The measurement.
+
+    Returns:
+        VNAPowerSweepMeasurementData: The power sweep data of the measurement.
+    """
     logger.debug("Extracting frequency array state")
-    frequency_array_state = extract_power_sweep_s2p_to_network_transmission(
-        file_path=measurement.spectrum_file
+    p_in_dbm, s = convert_power_sweep_s2p_array_to_s_parameters(
+        load_power_sweep_s2p_array(measurement.spectrum_file)
     )
+    frequency_array_state = _compose_power_sweep_dense_network_transmission(
+        p_in_dbm, s
+    ).to_network_transmission()
     logger.debug(f"Frequency array state: {frequency_array_state}")
     return VNAPowerSweepMeasurementData(
         name=measurement.name, network=frequency_array_state
     )
 
 
+def extract_power_sweep_data_from_vna_measurement_collection(
+    measurement_collection: VNAPowerSweepMeasurementCollection,
+    max_workers: int | None = None,
+    **kwargs,
+) -> FrequencyMeasurementDataCollection:
+    """
+    Extracts the power sweeps of all the measurements in a VNA power sweep collection. The S2P files are read
+    concurrently by `load_power_sweep_s2p_arrays` and converted as a single stacked array, rather than one
+    measurement at a time by `extract_power_sweep_data_from_vna_measurement`.
+
+    Args:
+        measurement_collection (VNAPowerSweepMeasurementCollection): The measurement collection.
+        max_workers (int | None): The maximum amount of threads reading the files.
+
+    Returns:
+        FrequencyMeasurementDataCollection: The power sweep data of each measurement.
+    """
+    measurements = measurement_collection.collection
+    p_in_dbm, s = convert_power_sweep_s2p_array_to_s_parameters(
+        load_power_sweep_s2p_arrays(
+            [measurement.spectrum_file for measurement in measurements],
+            max_workers=max_workers,
+        )
+    )
+    return FrequencyMeasurementDataCollection(
+        collection=[
+            VNAPowerSweepMeasurementData(
+                name=measurement.name,
+                network=_compose_power_sweep_dense_network_transmission(
+                    p_in_dbm[measurement_index], s[measurement_index]
+                ).to_network_transmission(),
+            )
+            for measurement_index, measurement in enumerate(measurements)
+        ]
+    )
+
+
 # TODO move everything down here to another file.
 
 
@@ -56,7 +108,7 @@ def extract_power_sweep_s2p_to_dataframe(
 
     This function reads an S2P file, parses its numerical data, and organizes it into a structured
     pandas DataFrame. It skips comment lines and ensures that each data line contains the expected
-    number of columns. If discrepancies are found, warnings are printed, and those lines are skipped.
+    number of columns. If discrepancies are found, those lines are skipped and a warning is logged.
 
     Parameters:
     -----------
@@ -98,62 +150,216 @@ def extract_power_sweep_s2p_to_dataframe(
     ------
     - Lines in the S2P file starting with '!' or '#' are treated as comments or headers and are skipped.
     - Each valid data line is expected to have exactly 9 numerical values corresponding to the defined columns.
-    - If a line does not have 9 values or contains non-numeric data, a warning or error is printed, and the line is skipped.
+    - If a line does not have 9 values or contains non-numeric data, it is skipped and a warning is logged.
+    - The numerical data is parsed at once by `load_power_sweep_s2p_array`.
     """
     import pandas as pd
 
-    # Define the column names
-    column_names = [
-        "p_in_dbm",
-        "s_11_db",
-        "s_11_deg",
-        "s_21_db",
-        "s_21_deg",
-        "s_12_db",
-        "s_12_deg",
-        "s_22_db",
-        "s_22_deg",
-    ]
+    df = pd.DataFrame(
+        load_power_sweep_s2p_array(file_path),
+        columns=POWER_SWEEP_S2P_COLUMNS,
+        **kwargs,
+    )
+    df["input_frequency_Hz"] = input_frequency_Hz
 
-    # Initialize a list to store data rows
-    data_rows = []
+    return df
+
+
+POWER_SWEEP_S2P_COLUMNS = [
+    "p_in_dbm",
+    "s_11_db",
+    "s_11_deg",
+    "s_21_db",
+    "s_21_deg",
+    "s_12_db",
+    "s_12_deg",
+    "s_22_db",
+    "s_22_deg",
+]
+"""
+The columns of each data line of an S2P power sweep file.
+"""
 
-    # Open and read the file
+
+def _load_power_sweep_s2p_lines(file_path: PathTypes) -> np.ndarray:
+    """
+    Parses the data lines of an S2P power sweep file one by one, skipping and counting the malformed lines. This is
+    the fallback of `load_power_sweep_s2p_array` for files that cannot be parsed at once.
+    """
+    data_rows = []
+    skipped_line_numbers = []
     with open(file_path, "r") as file:
         for line_number, line in enumerate(file, start=1):
-            line = line.strip()
-            # Skip lines starting with '!' or '#'
-            if line.startswith(("!", "#")):
+            line = line.split("!", 1)[0].strip()
+            if not line or line.startswith("#"):
                 continue
-            # Split the line into parts based on whitespace
             parts = line.split()
-            if len(parts) != 9:
-                # Optionally handle or log unexpected number of columns
-                print(
-                    f"Warning: Unexpected number of columns ({len(parts)}) in line {line_number}: {line}"
-                )
-                continue
-            # Convert all parts to float
             try:
-                float_parts = [float(part) for part in parts]
-                data_rows.append(float_parts)
-            except ValueError as e:
-                # Optionally handle or log conversion errors
-                print(f"Error converting line {line_number} to floats: {line}\n{e}")
-                continue
+                if len(parts) != len(POWER_SWEEP_S2P_COLUMNS):
+                    raise ValueError
+                data_rows.append([float(part) for part in parts])
+            except ValueError:
+                skipped_line_numbers.append(line_number)
+
+    if skipped_line_numbers:
+        logger.warning(
+            f"Skipped {len(skipped_line_numbers)} malformed lines in {file_path}, "
+            f"expected {len(POWER_SWEEP_S2P_COLUMNS)} numerical values in lines {skipped_line_numbers}."
+        )
+    return np.array(data_rows, dtype=float).reshape(-1, len(POWER_SWEEP_S2P_COLUMNS))
 
-    # Create a DataFrame
-    df = pd.DataFrame(data_rows, columns=column_names, **kwargs)
-    df["input_frequency_Hz"] = input_frequency_Hz
 
-    return df
+def load_power_sweep_s2p_array(file_path: PathTypes) -> np.ndarray:
+    """
+    Loads the numerical data of an S2P power sweep file into an array with one row per input power level and the
+    columns in `POWER_SWEEP_S2P_COLUMNS`. The comments and the option line are stripped and the whole numerical block
+    is parsed at once. If the file contains malformed lines, they are skipped and a single warning is logged.
 
+    Args:
+        file_path (PathTypes): The path to the S2P file.
 
-def convert_power_sweep_s2p_to_network_transmission(
+    Returns:
+        np.ndarray: The ``(n_power, 9)`` power sweep data.
+    """
+    import warnings
+
+    try:
+        with warnings.catch_warnings():
+            # Empty files are handled by the reshape below
+            warnings.simplefilter("ignore", UserWarning)
+            data = np.loadtxt(file_path, comments=("!", "#"), dtype=float, ndmin=2)
+    except ValueError:
+        return _load_power_sweep_s2p_lines(file_path)
+
+    if data.size == 0:
+        return np.empty((0, len(POWER_SWEEP_S2P_COLUMNS)))
+    if data.shape[1] != len(POWER_SWEEP_S2P_COLUMNS):
+        return _load_power_sweep_s2p_lines(file_path)
+    return data
+
+
+def load_power_sweep_s2p_arrays(
+    file_paths: list[PathTypes], max_workers: int | None = None
+) -> np.ndarray:
+    """
+    Loads the numerical data of many S2P power sweep files concurrently, such as the files of a power sweep at each
+    input frequency, and stacks them into a single array. See `load_power_sweep_s2p_array`.
+
+    Args:
+        file_paths (list[PathTypes]): The paths to the S2P files.
+        max_workers (int | None): The maximum amount of threads reading the files.
+
+    Returns:
+        np.ndarray: The ``(n_files, n_power, 9)`` power sweep data.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    file_paths = list(file_paths)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        arrays = list(executor.map(load_power_sweep_s2p_array, file_paths))
+
+    power_amounts = {array.shape[0] for array in arrays}
+    if len(power_amounts) > 1:
+        raise ValueError(
+            f"The power sweep files must have the same amount of input power levels, found {sorted(power_amounts)}."
+        )
+    return (
+        np.stack(arrays) if arrays else np.empty((0, 0, len(POWER_SWEEP_S2P_COLUMNS)))
+    )
+
+
+def convert_power_sweep_s2p_array_to_s_parameters(
+    data: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Converts power sweep data loaded by `load_power_sweep_s2p_array` or `load_power_sweep_s2p_arrays` into the
+    input powers and the complex S-matrices of each input power level. The S-matrices follow the port order in
+    `POWER_SWEEP_S2P_PORT_MAP`, so ``s_ij`` is ``s[..., i - 1, j - 1]`` as in scikit-rf.
+
+    Args:
+        data (np.ndarray): The ``(..., n_power, 9)`` power sweep data.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The ``(..., n_power)`` input powers in dBm and the ``(..., n_power, 2, 2)``
+        complex S-matrices.
+    """
+    data = np.asarray(data, dtype=float)
+    # The S-parameter columns are ordered s_11, s_21, s_12, s_22, which is the column-major order of s[..., i - 1, j - 1]
+    magnitude_db = data[..., 1::2].reshape(*data.shape[:-1], 2, 2).swapaxes(-1, -2)
+    phase_deg = data[..., 2::2].reshape(*data.shape[:-1], 2, 2).swapaxes(-1, -2)
+    s = 10 ** (magnitude_db / 20) * np.exp(1j * np.deg2rad(phase_deg))
+    return data[..., 0], s
+
+
+def extract_power_sweep_s2p_files_to_dense_network_transmissions(
+    file_paths: list[PathTypes],
+    input_frequencies_Hz: list[float] | np.ndarray,
+    max_workers: int | None = None,
+) -> list[DenseNetworkTransmission]:
+    """
+    Extracts the power sweep S2P files measured at each input frequency into a DenseNetworkTransmission per file.
+    The files are read concurrently by `load_power_sweep_s2p_arrays`, and the S-matrices of each transmission are
+    views of a single ``(n_frequency, n_power, 2, 2)`` array.
+
+    Args:
+        file_paths (list[PathTypes]): The paths to the S2P files.
+        input_frequencies_Hz (list[float] | np.ndarray): The input frequency of each file in Hz.
+        max_workers (int | None): The maximum amount of threads reading the files.
+
+    Returns:
+        list[DenseNetworkTransmission]: The transmission of each file.
+    """
+    file_paths = list(file_paths)
+    input_frequencies_Hz = np.asarray(input_frequencies_Hz, dtype=float)
+    if len(input_frequencies_Hz) != len(file_paths):
+        raise ValueError(
+            f"Expected an input frequency for each of the {len(file_paths)} files, got {len(input_frequencies_Hz)}."
+        )
+
+    p_in_dbm, s = convert_power_sweep_s2p_array_to_s_parameters(
+        load_power_sweep_s2p_arrays(file_paths, max_workers=max_workers)
+    )
+    return [
+        _compose_power_sweep_dense_network_transmission(
+            p_in_dbm[file_index], s[file_index], input_frequency_Hz
+        )
+        for file_index, input_frequency_Hz in enumerate(input_frequencies_Hz)
+    ]
+
+
+def _compose_power_sweep_dense_network_transmission(
+    p_in_dbm: np.ndarray, s: np.ndarray, input_frequency_Hz: float = 0
+) -> DenseNetworkTransmission:
+    """
+    Composes the DenseNetworkTransmission of the input powers and S-matrices of a power sweep at an input frequency.
+    """
+    return DenseNetworkTransmission(
+        input=Phasor(
+            magnitude=p_in_dbm,
+            phase=np.zeros(len(p_in_dbm)),
+            frequency=np.full(len(p_in_dbm), input_frequency_Hz, dtype=float),
+            magnitude_unit=dBm,
+            phase_unit=degree,
+        ),
+        s=s,
+        port_map=dict(POWER_SWEEP_S2P_PORT_MAP),
+    )
+
+
+POWER_SWEEP_S2P_PORT_MAP = {"in0": 0, "out0": 1}
+"""
+The ports of the S2P power sweep S-matrices. The S-parameter ``s_ij`` is ``s[..., i - 1, j - 1]`` as in scikit-rf,
+which is the transmission of the ``(port_j, port_i)`` path, so ``s_21`` is the ``("in0", "out0")`` path.
+"""
+
+
+def convert_power_sweep_s2p_to_dense_network_transmission(
     dataframe,
-) -> NetworkTransmission:
+) -> DenseNetworkTransmission:
     """
-    Converts a pandas DataFrame containing S2P power sweep data into a NetworkTransmission object.
+    Converts a pandas DataFrame containing S2P power sweep data into a DenseNetworkTransmission object, with one
+    ``(2, 2)`` complex S-matrix per input power level composed from the magnitude and phase columns at once. The
+    S-parameter ``s_ij`` is ``s[:, i - 1, j - 1]``, as in a scikit-rf Network.
 
     The DataFrame is expected to have the following columns:
         - 'input_frequency_Hz': Frequency in Hz.
@@ -175,34 +381,18 @@ def convert_power_sweep_s2p_to_network_transmission(
     num_points = len(dataframe)
     logger.debug(f"Number of data points (input power levels): {num_points}")
 
-    # Extract input power in dBm as a list
-    p_in_dbm = dataframe["p_in_dbm"].tolist()
-    logger.debug(f"Input power (dBm): {p_in_dbm}")
-
-    # Create Phasor for input
+    # Create Phasor for input, with no phase information for input power
     phasor = Phasor(
-        magnitude=p_in_dbm,
-        phase=[0.0] * num_points,  # No phase information for input power
-        frequency=[input_frequency_Hz]
-        * num_points,  # Replicate frequency to match length
+        magnitude=dataframe["p_in_dbm"].to_numpy(dtype=float),
+        phase=np.zeros(num_points),
+        frequency=np.full(num_points, input_frequency_Hz, dtype=float),
         magnitude_unit=dBm,
         phase_unit=degree,
     )
-    logger.debug(f"Input Phasor created: {phasor}")
 
-    # Define S-parameters and corresponding port mappings
-    s_params = ["s_11", "s_21", "s_12", "s_22"]
-    port_mappings = {
-        "s_11": ("in0", "in0"),
-        "s_21": ("in0", "out0"),
-        "s_12": ("out0", "in0"),
-        "s_22": ("out0", "out0"),
-    }
-
-    # Initialize network transmissions list
-    network: list[PathTransmission] = []
-
-    for s_param in s_params:
+    s = np.empty((num_points, 2, 2), dtype=complex)
+    for output_index, input_index in np.ndindex(2, 2):
+        s_param = f"s_{output_index + 1}{input_index + 1}"
         db_col = f"{s_param}_db"
         deg_col = f"{s_param}_deg"
 
@@ -213,54 +403,40 @@ def convert_power_sweep_s2p_to_network_transmission(
                 f"DataFrame must contain columns '{db_col}' and '{deg_col}' for S-parameter '{s_param}'."
             )
 
-        # Extract magnitude in dB and phase in degrees
-        s_db = dataframe[db_col].tolist()
-        s_deg = dataframe[deg_col].tolist()
-        logger.debug(
-            f"S-parameter {s_param}: magnitude (dB)={s_db}, phase (deg)={s_deg}"
-        )
+        # Convert dB to linear magnitude and degrees to radians
+        s[:, output_index, input_index] = 10 ** (
+            dataframe[db_col].to_numpy(dtype=float) / 20
+        ) * np.exp(1j * np.deg2rad(dataframe[deg_col].to_numpy(dtype=float)))
 
-        # Convert dB to linear magnitude
-        magnitude_linear = 10 ** (np.array(s_db) / 20)
-        magnitude_linear = magnitude_linear.tolist()
-        logger.debug(f"S-parameter {s_param}: linear magnitude={magnitude_linear}")
-
-        # Ensure phase is in degrees and convert if necessary
-        # Assuming 's_deg' is already in degrees. If in radians, convert using np.rad2deg.
-        phase_deg = s_deg  # Modify if conversion is needed
-
-        # Create Phasor for transmission
-        transmission_phasor = Phasor(
-            magnitude=s_db,
-            phase=phase_deg,
-            frequency=[input_frequency_Hz]
-            * num_points,  # Replicate frequency to match length
-            phase_unit=degree,
-        )
-        logger.debug(
-            f"S-parameter {s_param} Transmission Phasor created: {transmission_phasor}"
-        )
+    return DenseNetworkTransmission(
+        input=phasor,
+        s=s,
+        port_map=dict(POWER_SWEEP_S2P_PORT_MAP),
+    )
 
-        # Retrieve port mapping
-        connection = port_mappings[s_param]
 
-        # Create PathTransmission instance
-        path_transmission = PathTransmission(
-            connection=connection,  # Assuming connection is a tuple of (input_port, output_port)
-            transmission=transmission_phasor,
-        )
-        logger.debug(f"PathTransmission for {s_param} created: {path_transmission}")
+def convert_power_sweep_s2p_to_network_transmission(
+    dataframe,
+) -> NetworkTransmission:
+    """
+    Converts a pandas DataFrame containing S2P power sweep data into a NetworkTransmission object. The transmission
+    of each path is composed from the dense S-parameters, see ``convert_power_sweep_s2p_to_dense_network_transmission``
+    to operate on the S-parameters directly. The S-parameter ``s_ij`` is the ``(port_j, port_i)`` path, so ``s_21`` is
+    the ``("in0", "out0")`` path.
 
-        # Append to network list
-        network.append(path_transmission)
+    The DataFrame is expected to have the following columns:
+        - 'input_frequency_Hz': Frequency in Hz.
+        - 'p_in_dbm': Input power in dBm.
+        - S-parameter magnitude and phase columns for each S-parameter, e.g., 's_11_db', 's_11_deg', etc.
 
-    # Create NetworkTransmission instance
-    network_transmission = NetworkTransmission(
-        input=phasor,
-        network=network,
-    )
+    Assumptions:
+        - All rows correspond to the same input frequency. If multiple frequencies are present, the first one is used.
+        - Each row represents a different input power level.
+    """
+    network_transmission = convert_power_sweep_s2p_to_dense_network_transmission(
+        dataframe
+    ).to_network_transmission()
     logger.debug(f"NetworkTransmission created: {network_transmission}")
-
     return network_transmission
 
 
@@ -44,6 +44,7 @@ from piel.experimental.measurements.frequency import (
 from piel.experimental.measurements.data.frequency import (
     extract_s_parameter_data_from_vna_measurement,
     extract_power_sweep_data_from_vna_measurement,
+    extract_power_sweep_data_from_vna_measurement_collection,
 )
 from piel.experimental.measurements.data.oscilloscope import (
     extract_oscilloscope_data_from_measurement,
@@ -82,6 +83,11 @@ measurement_to_data_method_map = {
     "VNAPowerSweepMeasurement": extract_power_sweep_data_from_vna_measurement,
 }
 
+# Collections whose measurements are extracted together rather than one at a time
+measurement_collection_to_data_method_map = {
+    "VNAPowerSweepMeasurementCollection": extract_power_sweep_data_from_vna_measurement_collection,
+}
+
 measurement_to_collection_map = {
     "OscilloscopeMeasurement": OscilloscopeMeasurementCollection,
     "PropagationDelayMeasurement": PropagationDelayMeasurementCollection,
@@ -3,8 +3,9 @@ import piel
 from piel.types import PathTypes
 from piel.file_system import return_path
 from piel.types.experimental import ExperimentData
-from piel.experimental.measurements.data.extract import load_experiment_data_from_directory
-from piel.visual.experimental import auto_plot_from_experiment_data
+from piel.experimental.measurements.data.extract import (
+    load_experiment_data_from_directory,
+)
 
 
 def create_plots_from_experiment_data(
@@ -58,6 +59,9 @@ def create_plots_from_experiment_data(
 
     piel.create_new_directory(plot_output_directory)
 
+    # Imported here as piel.visual.experimental imports piel.experimental when it is loaded first
+    from piel.visual.experimental import auto_plot_from_experiment_data
+
     # Now we need to iterate through each MeasurementData and generate the plot accordingly.
     plots, plots_paths = auto_plot_from_experiment_data(
         experiment_data=experiment_data,
@@ -7,12 +7,29 @@ from .digital_logic import (
     layout_truth_table,
 )
 from .digital_electro_optic import (
+    add_truth_table_bit_to_phase_data,
     add_truth_table_phase_to_bit_data,
+    compile_bit_phase_map,
+    convert_optical_transitions_to_truth_table,
     convert_phase_to_bit_iterable,
+    filter_and_correct_truth_table,
+    filter_truth_table_array,
+    find_truth_table_array_conflicts,
     find_nearest_bit_for_phase,
+    find_nearest_bits_for_phases,
     find_nearest_phase_for_bit,
 )
 from .electro_optic import (
+    calculate_classical_transition_probability_amplitudes_batch,
+    calculate_switch_unitaries_batch,
+    compose_network_matrix_batch_from_models,
+    construct_unitary_transition_probability_performance,
+    construct_unitary_transition_probability_performance_array,
+    convert_fock_state_transition_amplitudes_to_dictionary,
+    convert_fock_state_transition_amplitudes_to_optical_state_transitions,
+    convert_switch_unitary_batch_to_dictionaries,
+    iterate_network_matrix_batches_from_models,
+    iterate_switch_unitaries_batches,
     extract_phase_from_fock_state_transitions,
     format_electro_optic_fock_transition,
     generate_s_parameter_circuit_from_photonic_circuit,
@@ -1,18 +1,108 @@
 from collections import OrderedDict
 import numpy as np
+import pandas as pd
 from typing import Optional, Callable
 from ..types import (
     BitPhaseMap,
     BitsType,
+    CompiledBitPhaseMap,
     PhaseMapType,
     OpticalStateTransitions,
     TruthTable,
+    TruthTableArray,
     TruthTableLogicType,
-    convert_tuple_to_string,
+    convert_digit_tuples_to_strings,
     convert_to_bits,
 )
 
 
+def compile_bit_phase_map(
+    bit_phase_map: BitPhaseMap | CompiledBitPhaseMap,
+) -> CompiledBitPhaseMap:
+    """
+    Compiles a BitPhaseMap into a lookup that maps phases to bits with a binary search over the sorted unique
+    phases, and bits to phases with a dictionary. A compiled map is returned unchanged, so it can be passed to all
+    the bit-phase mapping functions to compile it only once.
+
+    Args:
+        bit_phase_map (BitPhaseMap | CompiledBitPhaseMap): The phase-bits mapping.
+
+    Returns:
+        CompiledBitPhaseMap: The compiled lookup.
+    """
+    if isinstance(bit_phase_map, CompiledBitPhaseMap):
+        return bit_phase_map
+
+    bits = np.array(
+        [convert_to_bits(bits_i) for bits_i in bit_phase_map.bits], dtype=object
+    )
+    phase = np.asarray(bit_phase_map.phase)
+    unique_phase, phase_first_index = np.unique(phase, return_index=True)
+
+    bits_phase_indexes = dict()
+    for index, bits_i in enumerate(bits):
+        bits_phase_indexes.setdefault(bits_i, []).append(index)
+
+    return CompiledBitPhaseMap(
+        phase=unique_phase,
+        phase_bits=bits[phase_first_index],
+        phase_first_index=phase_first_index,
+        bits_phase={
+            bits_i: phase[indexes] for bits_i, indexes in bits_phase_indexes.items()
+        },
+        max_bit_length=len(bits[-1]),
+    )
+
+
+def find_nearest_bits_for_phases(
+    phases: PhaseMapType | np.ndarray,
+    bit_phase_map: BitPhaseMap | CompiledBitPhaseMap,
+    rounding_function: Optional[Callable] = None,
+    pad_bits: bool = True,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Maps a batch of phases to the bits of their nearest phase in the phase-bits mapping. When two phases are equally
+    near, the one that appears first in the mapping is used, and the bits of a phase are those of its first entry.
+
+    Args:
+        phases (PhaseMapType | np.ndarray): The target phases.
+        bit_phase_map (BitPhaseMap | CompiledBitPhaseMap): The phase-bits mapping.
+        rounding_function (Optional[Callable]): Rounding function to apply to each target phase.
+        pad_bits (bool): Whether to pad the bits to the length of the last bits in the mapping. Defaults to True.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The bits and the nearest phase of each target phase.
+    """
+    bit_phase_map = compile_bit_phase_map(bit_phase_map)
+
+    if rounding_function:
+        phases = [rounding_function(phase_i) for phase_i in phases]
+    phases = np.asarray(phases, dtype=float)
+
+    upper_indexes = np.clip(
+        np.searchsorted(bit_phase_map.phase, phases), 0, len(bit_phase_map.phase) - 1
+    )
+    lower_indexes = np.maximum(upper_indexes - 1, 0)
+    lower_distance = np.abs(phases - bit_phase_map.phase[lower_indexes])
+    upper_distance = np.abs(phases - bit_phase_map.phase[upper_indexes])
+    is_upper_nearest = (upper_distance < lower_distance) | (
+        (upper_distance == lower_distance)
+        & (
+            bit_phase_map.phase_first_index[upper_indexes]
+            < bit_phase_map.phase_first_index[lower_indexes]
+        )
+    )
+    nearest_indexes = np.where(is_upper_nearest, upper_indexes, lower_indexes)
+
+    bits = bit_phase_map.phase_bits[nearest_indexes]
+    if pad_bits:
+        bits = np.array(
+            [bits_i.zfill(bit_phase_map.max_bit_length) for bits_i in bits],
+            dtype=object,
+        ).reshape(bits.shape)
+    return bits, bit_phase_map.phase[nearest_indexes]
+
+
 def add_truth_table_bit_to_phase_data(
     truth_table: TruthTable,
     bit_phase_map: BitPhaseMap,
@@ -27,7 +117,7 @@ def add_truth_table_bit_to_phase_data(
 
     Args:
         truth_table (pd.DataFrame): The dataframe that contains the bit column.
-        bit_phase_map (BitPhaseMap): The dataframe that maps the phase to the bit.
+        bit_phase_map (BitPhaseMap | CompiledBitPhaseMap): The dataframe that maps the phase to the bit.
         bit_phase_column_name (str): The name of the bit column in the dataframe.
 
     Returns:
@@ -36,6 +126,9 @@ def add_truth_table_bit_to_phase_data(
     if bit_phase_column_name is None:
         bit_phase_column_name = "bits"
 
+    # The lookup is compiled once for all the rows
+    bit_phase_map = compile_bit_phase_map(bit_phase_map)
+
     phase_list = []
     # Iterate through the dataframe's phase tuples column
     for bit_phase_i in getattr(
@@ -79,7 +172,7 @@ def add_truth_table_phase_to_bit_data(
 
     Args:
         truth_table (pd.DataFrame): The dataframe that contains the phase column.
-        bit_phase_map (BitPhaseMap): The dataframe that maps the phase to the bit.
+        bit_phase_map (BitPhaseMap | CompiledBitPhaseMap): The dataframe that maps the phase to the bit.
         rounding_function (Optional[Callable]): The rounding function that is used to round the phase to the nearest
             phase in the phase_bit_dataframe.
 
@@ -89,36 +182,19 @@ def add_truth_table_phase_to_bit_data(
     if phase_column_name is None:
         phase_column_name = "phase"
 
-    bit_list = []
-    # Iterate through the dataframe's phase tuples column
-    for phase_tuple in getattr(
-        truth_table, phase_column_name
-    ):  # TODO update on truth table declaration
-        if not isinstance(phase_tuple, BitPhaseMap):
-            phase_tuple = tuple([phase_tuple])
-
-        # Convert the tuple of phases into bitstrings using convert_phase_array_to_bit_array
-        bits = convert_phase_to_bit_iterable(
-            phase_tuple, bit_phase_map, rounding_function
-        )
-
-        # Add the bits to the final list
-        bit_list.extend(tuple([bits]))
-
-    bits_tuple = tuple(bit_list)
-    # Transpose the bits_tuple using zip(*bits_tuple)
-    transposed_bits_tuple = list(zip(*bits_tuple))
-
-    phase_bit_array_length = len(bits_tuple[0])
-    for phase_iterable_id_i in range(phase_bit_array_length):
-        # Initialise lists
-        # TODO auto select which one to implement
-        # TODO adsuming given ordering
-        ordered_dict_i = OrderedDict(
-            (i, value)
-            for i, value in enumerate(transposed_bits_tuple[phase_iterable_id_i])
-        )
-        setattr(truth_table, f"bit_phase_{phase_iterable_id_i}", ordered_dict_i)
+    # The phases of all the rows are mapped to their bits in a single lookup
+    # TODO update on truth table declaration
+    phase_array = np.array(
+        list(getattr(truth_table, phase_column_name).values()), dtype=float
+    )
+    bits, _ = find_nearest_bits_for_phases(
+        phase_array.ravel(),
+        compile_bit_phase_map(bit_phase_map),
+        rounding_function=rounding_function,
+    )
+    # Each row keeps the bits of its phase, or the list of bits of its phase tuple
+    bits = bits.reshape(phase_array.shape).tolist()
+    setattr(truth_table, "bit_phase_0", OrderedDict(enumerate(bits)))
 
     return truth_table
 
@@ -137,7 +213,7 @@ def convert_optical_transitions_to_truth_table(
     else:
         raise ValueError(f"Invalid logic type: {logic}")
 
-    phase_bit_array_length = len(transitions_dataframe["phase"][0])
+    phase_bit_array_length = len(transitions_dataframe["phase"].iloc[0])
     truth_table_raw = dict()
 
     # Check if all input and output connection are in the dataframe
@@ -147,36 +223,31 @@ def convert_optical_transitions_to_truth_table(
         if port_i == "phase":
             continue
 
-        if not isinstance(transitions_dataframe.loc[0, port_i], tuple):
-            print(transitions_dataframe.loc[0, port_i])
+        if not isinstance(transitions_dataframe[port_i].iloc[0], tuple):
+            print(transitions_dataframe[port_i].iloc[0])
             continue
 
-        truth_table_raw[f"{port_i}_str"] = transitions_dataframe.loc[:, port_i].apply(
-            convert_tuple_to_string
+        truth_table_raw[f"{port_i}_str"] = convert_digit_tuples_to_strings(
+            transitions_dataframe[port_i]
         )
 
-        truth_table_raw[f"{port_i}_str"] = truth_table_raw[f"{port_i}_str"].apply(
-            lambda x: "".join(str(x))
-        )
-        truth_table_raw[f"{port_i}_str"] = truth_table_raw[
-            f"{port_i}_str"
-        ].values.tolist()
-
     for phase_iterable_id_i in range(phase_bit_array_length):
         # Initialise lists
         truth_table_raw[f"bit_phase_{phase_iterable_id_i}"] = list()
         output_ports_list.append(f"bit_phase_{phase_iterable_id_i}")
 
-    for transition_id_i in range(len(transitions_dataframe)):
-        bit_phase = convert_phase_to_bit_iterable(
-            phase=transitions_dataframe["phase"].iloc[transition_id_i],
-            bit_phase_map=bit_phase_map,
-        )
-
-        for phase_iterable_id_i in range(phase_bit_array_length):
-            truth_table_raw[f"bit_phase_{phase_iterable_id_i}"].append(
-                bit_phase[phase_iterable_id_i]
-            )
+    # All the transition phases are mapped to bits in a single batched lookup
+    transition_phases = np.array(
+        [tuple(phase_i) for phase_i in transitions_dataframe["phase"]], dtype=float
+    ).reshape(len(transitions_dataframe), phase_bit_array_length)
+    transition_bits, _ = find_nearest_bits_for_phases(
+        transition_phases.ravel(), compile_bit_phase_map(bit_phase_map)
+    )
+    transition_bits = transition_bits.reshape(transition_phases.shape)
+    for phase_iterable_id_i in range(phase_bit_array_length):
+        truth_table_raw[f"bit_phase_{phase_iterable_id_i}"] = transition_bits[
+            :, phase_iterable_id_i
+        ].tolist()
 
     input_ports = ["input_fock_state_str"]
     output_ports = output_ports_list
@@ -207,42 +278,19 @@ def convert_phase_to_bit_iterable(
 
     Args:
         phase(Iterable): Iterable of phases to map to bitstrings.
-        bit_phase_map(BitPhaseMap): Dataframe containing the phase-bits mapping.
+        bit_phase_map(BitPhaseMap | CompiledBitPhaseMap): Dataframe containing the phase-bits mapping.
         rounding_function(Callable): Rounding function to apply to the target phase.
 
     Returns:
-        bit_array(tuple): Tuple of bitstrings corresponding to the phases.
+        bit_array(tuple): Tuple of bitstrings corresponding to the phases, padded to the length of the last bits.
     """
-    # Determine the maximum length of the bitstrings in the dataframe
-    # Assumes last bit phase mapping is the largest one
-    max_bit_length = len(bit_phase_map.bits[-1])
-
-    bit_array = []
-
-    for phase_i in phase:
-        # Apply rounding function if provided
-        if rounding_function:
-            phase_i = rounding_function(phase_i)
-
-        # Check if phase is in the dataframe
-        matched_rows = bit_phase_map.dataframe.loc[
-            bit_phase_map.dataframe["phase"] == phase_i, "bits"
-        ]
-
-        # If exact phase is not found, use the nearest phase bit representation
-        if matched_rows.empty:
-            bitstring, _ = find_nearest_bit_for_phase(
-                phase_i, bit_phase_map, rounding_function
-            )
-        else:
-            bitstring = matched_rows.iloc[0]
-
-        # Pad the bitstring to the maximum length
-        full_length_bitstring = bitstring.zfill(max_bit_length)
-
-        bit_array.append(full_length_bitstring)
-
-    return tuple(bit_array)
+    # An exact phase match is the nearest phase, so both are resolved by the nearest phase lookup
+    bits, _ = find_nearest_bits_for_phases(
+        phases=list(phase),
+        bit_phase_map=bit_phase_map,
+        rounding_function=rounding_function,
+    )
+    return tuple(bits.tolist())
 
 
 def find_nearest_bit_for_phase(
@@ -257,31 +305,19 @@ def find_nearest_bit_for_phase(
 
     Args:
         target_phase(float): Target phase to map to.
-        bit_phase_map(pd.DataFrame): Dataframe containing the phase-bits mapping.
+        bit_phase_map(BitPhaseMap | CompiledBitPhaseMap): Dataframe containing the phase-bits mapping.
         rounding_function(Callable): Rounding function to apply to the target phase.
 
     Returns:
         bitstring(str): Bitstring corresponding to the nearest phase.
     """
-    # TODO interim pydantic-dataframe migration
-    bit_phase_map = bit_phase_map.dataframe
-
-    # Apply rounding function if provided
-    if rounding_function:
-        target_phase = rounding_function(target_phase)
-
-    # Find the nearest phase from the dataframe
-    phases = bit_phase_map["phase"].values
-    nearest_phase = phases[
-        np.argmin(np.abs(phases - target_phase))
-    ]  # TODO implement rounding function here.
-
-    # Get the corresponding bitstring for the nearest phase
-    bitstring = bit_phase_map.loc[bit_phase_map["phase"] == nearest_phase, "bits"].iloc[
-        0
-    ]
-
-    return bitstring, nearest_phase
+    bits, nearest_phase = find_nearest_bits_for_phases(
+        phases=[target_phase],
+        bit_phase_map=bit_phase_map,
+        rounding_function=rounding_function,
+        pad_bits=False,
+    )
+    return bits[0], nearest_phase[0]
 
 
 def find_nearest_phase_for_bit(
@@ -293,32 +329,24 @@ def find_nearest_phase_for_bit(
 
     Args:
         bits (AbstractBitsType): Bitstring to map to a phase.
-        phase_map (BitPhaseMap): Dataframe containing the phase-bits mapping.
+        phase_map (BitPhaseMap | CompiledBitPhaseMap): Dataframe containing the phase-bits mapping.
 
     Returns:
         Tuple[str, ...]: Tuple of phases or an empty tuple if no match is found.
     """
     bits = convert_to_bits(bits)
+    phase_map = compile_bit_phase_map(phase_map)
 
-    try:
-        # Find all phases corresponding to the given bitstring
-        matching_phases = phase_map.dataframe.loc[
-            phase_map.dataframe["bits"] == bits, "phase"
-        ].values
-
-        # Check if any phases were found
-        if len(matching_phases) == 0:
-            print(f"No phases found for bits: {bits}")
-            return tuple()
+    # Find all phases corresponding to the given bitstring
+    matching_phases = phase_map.bits_phase.get(bits)
 
-        # Convert to a tuple
-        phase_array = tuple([matching_phases])
-
-        return phase_array
-    except Exception as e:
-        print(f"An error occurred: {e}")
+    # Check if any phases were found
+    if matching_phases is None:
+        print(f"No phases found for bits: {bits}")
         return tuple()
 
+    return tuple([matching_phases])
+
 
 def filter_and_correct_truth_table(
     truth_table_dictionary: dict, input_ports: list, output_ports: list
@@ -344,37 +372,65 @@ def filter_and_correct_truth_table(
         if port not in truth_table_dictionary:
             raise ValueError(f"Port '{port}' not found in truth_table_dictionary.")
 
-    # Initialize a dictionary to keep track of mappings
-    mapping_dict = {}
+    # The first row of each unique input is kept, which also drops any later conflicting outputs
+    truth_table_dataframe = pd.DataFrame(
+        {
+            port: list(truth_table_dictionary[port])
+            for port in input_ports + output_ports
+        }
+    )
+    is_first_input = ~truth_table_dataframe.duplicated(subset=input_ports, keep="first")
+    corrected_truth_table = truth_table_dataframe.loc[is_first_input].to_dict(
+        orient="list"
+    )
 
-    # Initialize lists to store the corrected inputs and outputs
-    corrected_inputs = {input_port: [] for input_port in input_ports}
-    corrected_outputs = {output_port: [] for output_port in output_ports}
+    return corrected_truth_table
 
-    # Get the length of the files lists
-    num_entries = len(truth_table_dictionary[input_ports[0]])
 
-    for i in range(num_entries):
-        # Extract the current input value
-        input_value = tuple(
-            truth_table_dictionary[input_port][i] for input_port in input_ports
-        )
+def find_truth_table_array_conflicts(
+    truth_table_array: TruthTableArray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the rows of a truth table whose input has already appeared in a previous row, and the subset of those
+    rows whose output differs from the output of the first row with the same input. All the rows are compared at
+    once on the integer-encoded port columns.
 
-        # Extract the current set of output values
-        output_values = tuple(
-            truth_table_dictionary[output_port][i] for output_port in output_ports
-        )
+    Args:
+        truth_table_array (TruthTableArray): The integer-encoded truth table.
 
-        if input_value not in mapping_dict:
-            # Store the unique mapping
-            mapping_dict[input_value] = output_values
-            # Append to the corrected lists
-            for input_port, value in zip(input_ports, input_value):
-                corrected_inputs[input_port].append(value)
-            for output_port, value in zip(output_ports, output_values):
-                corrected_outputs[output_port].append(value)
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The boolean ``is_duplicate`` and ``is_conflict`` masks of the rows.
+    """
+    data = truth_table_array.data
+    input_amount = len(truth_table_array.input_ports)
+    row_amount = data.shape[0]
+    if row_amount == 0:
+        empty_mask = np.zeros(0, dtype=bool)
+        return empty_mask, empty_mask
+
+    _, first_indexes, inverse_indexes = np.unique(
+        data[:, :input_amount], axis=0, return_index=True, return_inverse=True
+    )
+    first_row_indexes = first_indexes[inverse_indexes.ravel()]
+    is_duplicate = first_row_indexes != np.arange(row_amount)
+    is_conflict = is_duplicate & np.any(
+        data[:, input_amount:] != data[first_row_indexes, input_amount:], axis=1
+    )
+    return is_duplicate, is_conflict
 
-    # Combine the corrected inputs and outputs into a single dictionary
-    corrected_truth_table = {**corrected_inputs, **corrected_outputs}
 
-    return corrected_truth_table
+def filter_truth_table_array(truth_table_array: TruthTableArray) -> TruthTableArray:
+    """
+    The array equivalent of ``filter_and_correct_truth_table``, which retains the first row of each unique input so
+    that each input maps to a single output.
+
+    Args:
+        truth_table_array (TruthTableArray): The integer-encoded truth table.
+
+    Returns:
+        TruthTableArray: The integer-encoded truth table with unique inputs.
+    """
+    is_duplicate, _ = find_truth_table_array_conflicts(truth_table_array)
+    return truth_table_array.model_copy(
+        update={"data": truth_table_array.data[~is_duplicate]}
+    )
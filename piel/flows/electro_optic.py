@@ -1,28 +1,40 @@
+import jax
 import jax.numpy as jnp  # TODO add typing
 import logging
+import numpy as np
 from itertools import product
-from typing import Optional, Callable, Any
+from typing import Iterator, Literal, Optional, Callable, Any
 from ..types import (
     absolute_to_threshold,
     convert_array_type,
     ArrayTypes,
     PhotonicCircuitComponent,
     FockStatePhaseTransitionType,
+    FockStateTransitionAmplitudes,
     NumericalTypes,
     PhaseTransitionTypes,
     OpticalTransmissionCircuit,
     OpticalStateTransitions,
     SParameterCollection,
+    SwitchUnitaryBatch,
     TupleIntType,
 )
 from ..tools.sax.netlist import (
     address_value_dictionary_to_function_parameter_dictionary,
     get_matched_model_recursive_netlist_instances,
 )
+from ..tools.sax.cache import get_cached_sax_circuit
 from ..tools.sax.utils import sax_to_s_parameters_standard_matrix
-from ..tools.qutip import fock_states_only_individual_modes
+from ..tools.qutip import (
+    fock_state_to_photon_number_tuple,
+    fock_states_only_individual_modes,
+)
 from ..models.frequency.defaults import get_default_models
-from ..integration.thewalrus_qutip import fock_transition_probability_amplitude
+from ..integration.thewalrus_qutip import (
+    calculate_fock_transition_probability_amplitudes,
+    compose_fock_transition_index_table,
+    fock_transition_probability_amplitude,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -108,6 +120,298 @@ def calculate_switch_unitaries(
     return implemented_unitary_dictionary
 
 
+def compose_phase_configurations_array(
+    switch_states: list,
+    switch_amount: int,
+) -> np.ndarray:
+    """
+    This function composes every phase configuration of a switch fabric into a single array. The configurations follow
+    the ``itertools.product(switch_states, repeat=switch_amount)`` order, so that row ``i`` is the same configuration
+    as the ``i`` key of the dictionaries generated by ``compose_phase_address_state``. The phases are kept in double
+    precision, as in the non-batched flow, and a fabric without switches has a single empty configuration.
+
+    Args:
+        switch_states (list): The list of switch states.
+        switch_amount (int): The amount of switches in the fabric.
+
+    Returns:
+        np.ndarray: The ``(len(switch_states) ** switch_amount, switch_amount)`` phase configurations array.
+    """
+    phase_configurations = np.array(
+        list(product(switch_states, repeat=switch_amount)), dtype=float
+    )
+    return phase_configurations.reshape(
+        len(switch_states) ** switch_amount, switch_amount
+    )
+
+
+def compose_phase_configurations_from_indexes(
+    switch_states: list,
+    switch_amount: int,
+    configuration_indexes: ArrayTypes,
+) -> np.ndarray:
+    """
+    This function composes the phase configurations corresponding to a set of configuration indexes, without
+    enumerating the full Cartesian product of the switch states. The index of a configuration is its position in the
+    ``itertools.product(switch_states, repeat=switch_amount)`` order, so each configuration is the base
+    ``len(switch_states)`` representation of its index.
+
+    Args:
+        switch_states (list): The list of switch states.
+        switch_amount (int): The amount of switches in the fabric.
+        configuration_indexes (ArrayTypes): The configuration indexes to compose.
+
+    Returns:
+        np.ndarray: The ``(len(configuration_indexes), switch_amount)`` phase configurations array.
+    """
+    # The index arithmetic is done in numpy as jax defaults to 32-bit integers.
+    configuration_indexes = np.asarray(configuration_indexes, dtype=np.int64)
+    state_amount = len(switch_states)
+    state_place_values = state_amount ** np.arange(
+        switch_amount - 1, -1, -1, dtype=np.int64
+    )
+    state_indexes = (
+        configuration_indexes[:, None] // state_place_values
+    ) % state_amount
+    return np.asarray(switch_states, dtype=float)[state_indexes]
+
+
+def compose_switch_circuit_batch_function(
+    circuit: OpticalTransmissionCircuit,
+    switch_instance_list: list,
+    parameter_key: str = "active_phase_rad",
+    jit: bool = True,
+) -> Callable:
+    """
+    This function composes a function that evaluates the ``circuit`` over a ``(n_configurations, n_switches)`` phase
+    configurations array in a single call. Each switch column is applied as a stacked parameter array onto the
+    corresponding switch instance, so ``sax`` evaluates every configuration at once. The returned function can be
+    reused across calls so that the ``jax.jit`` compilation is only performed once per configuration array shape.
+
+    Note that we rely on the native ``sax`` parameter broadcasting rather than ``jax.vmap`` as the default ``klu``
+    backend only supports a single batch dimension.
+
+    Args:
+        circuit (OpticalTransmissionCircuit): The optical transmission circuit.
+        switch_instance_list (list): The recursive netlist address of each switch, in the phase configuration column order.
+        parameter_key (str): The switch model parameter the phases are applied to.
+        jit (bool): Whether to ``jax.jit`` compile the circuit evaluation.
+
+    Returns:
+        Callable: The function that returns the batched ``sax`` S-parameters for a phase configurations array.
+    """
+
+    def circuit_batch_function(phase_configurations):
+        phase_address_state = {
+            instance_address_i: phase_configurations[:, i]
+            for i, instance_address_i in enumerate(switch_instance_list)
+        }
+        function_parameter_state = (
+            address_value_dictionary_to_function_parameter_dictionary(
+                address_value_dictionary=phase_address_state,
+                parameter_key=parameter_key,
+            )
+        )
+        return circuit(**function_parameter_state)
+
+    if jit:
+        circuit_batch_function = jax.jit(circuit_batch_function)
+
+    return circuit_batch_function
+
+
+def calculate_switch_unitaries_batch(
+    circuit: OpticalTransmissionCircuit,
+    switch_instance_list: list,
+    phase_configurations: ArrayTypes,
+    parameter_key: str = "active_phase_rad",
+    input_ports_order: tuple[str] | None = None,
+    jit: bool = True,
+    configuration_indexes: ArrayTypes | None = None,
+    circuit_batch_function: Optional[Callable] = None,
+) -> SwitchUnitaryBatch:
+    """
+    This function calculates the switch unitaries for all the phase configurations in a single circuit evaluation,
+    rather than once per configuration as in ``calculate_switch_unitaries``. The circuit evaluation is ``jax.jit``
+    compiled by default, see ``compose_switch_circuit_batch_function``.
+
+    Args:
+        circuit (OpticalTransmissionCircuit): The optical transmission circuit.
+        switch_instance_list (list): The recursive netlist address of each switch, in the phase configuration column order.
+        phase_configurations (ArrayTypes): The ``(n_configurations, n_switches)`` phase configurations array.
+        parameter_key (str): The switch model parameter the phases are applied to.
+        input_ports_order (tuple[str] | None): The input ports order of the unitary. Defaults to the ``in`` prefix ports.
+        jit (bool): Whether to ``jax.jit`` compile the circuit evaluation.
+        configuration_indexes (ArrayTypes | None): The sweep index of each phase configuration, if part of a larger sweep.
+        circuit_batch_function (Optional[Callable]): A precomposed ``compose_switch_circuit_batch_function`` to reuse.
+
+    Returns:
+        SwitchUnitaryBatch: The ``(n_configurations, N, N)`` unitaries and the corresponding phase configurations.
+    """
+    # The phase configurations are stored in double precision and only cast for the circuit evaluation
+    phase_configurations = np.asarray(phase_configurations, dtype=float)
+    if phase_configurations.ndim != 2:
+        phase_configurations = phase_configurations.reshape(
+            -1, len(switch_instance_list)
+        )
+
+    if circuit_batch_function is None:
+        circuit_batch_function = compose_switch_circuit_batch_function(
+            circuit=circuit,
+            switch_instance_list=switch_instance_list,
+            parameter_key=parameter_key,
+            jit=jit,
+        )
+
+    unitaries, input_ports_order = sax_to_s_parameters_standard_matrix(
+        circuit_batch_function(jnp.asarray(phase_configurations)),
+        input_ports_order=input_ports_order,
+    )
+    # Configuration-independent circuits evaluate to a single matrix, so we make sure the configuration axis exists.
+    unitaries = jnp.broadcast_to(
+        unitaries, (phase_configurations.shape[0], *unitaries.shape[-2:])
+    )
+
+    return SwitchUnitaryBatch(
+        unitaries=unitaries,
+        phase_configurations=phase_configurations,
+        switch_instance_list=list(switch_instance_list),
+        input_ports_order=tuple(input_ports_order),
+        parameter_key=parameter_key,
+        configuration_indexes=configuration_indexes,
+    )
+
+
+def iterate_switch_unitaries_batches(
+    circuit: OpticalTransmissionCircuit,
+    switch_instance_list: list,
+    switch_states: list,
+    chunk_size: int = 1024,
+    start_index: int = 0,
+    stop_index: int | None = None,
+    parameter_key: str = "active_phase_rad",
+    input_ports_order: tuple[str] | None = None,
+    jit: bool = True,
+) -> Iterator[SwitchUnitaryBatch]:
+    """
+    This function sweeps the switch fabric phase configurations in fixed-size chunks, yielding a ``SwitchUnitaryBatch``
+    per chunk. Only the phase configurations of the current chunk are composed, so the memory used is bounded by the
+    ``chunk_size`` rather than growing with ``len(switch_states) ** len(switch_instance_list)``.
+
+    Each batch contains the ``configuration_indexes`` of its phase configurations, so a sweep can be checkpointed and
+    resumed by restarting with ``start_index`` set to the last index processed plus one. The last chunk is padded to the
+    ``chunk_size`` before the circuit evaluation, so the ``jax.jit`` compilation is performed only once.
+
+    Usage:
+
+        for switch_unitary_batch in iterate_switch_unitaries_batches(
+            circuit=circuit,
+            switch_instance_list=switch_instance_list,
+            switch_states=[0, jnp.pi],
+            chunk_size=4096,
+        ):
+            save(switch_unitary_batch.configuration_indexes, switch_unitary_batch.unitaries)
+
+    Args:
+        circuit (OpticalTransmissionCircuit): The optical transmission circuit.
+        switch_instance_list (list): The recursive netlist address of each switch.
+        switch_states (list): The list of switch states.
+        chunk_size (int): The amount of phase configurations evaluated per batch.
+        start_index (int): The configuration index to start the sweep from.
+        stop_index (int | None): The configuration index to stop the sweep at, exclusive. Defaults to the full sweep.
+        parameter_key (str): The switch model parameter the phases are applied to.
+        input_ports_order (tuple[str] | None): The input ports order of the unitary. Defaults to the ``in`` prefix ports.
+        jit (bool): Whether to ``jax.jit`` compile the circuit evaluation.
+
+    Yields:
+        SwitchUnitaryBatch: The unitaries and configuration indexes of each chunk of the sweep.
+    """
+    if chunk_size < 1:
+        raise ValueError("The chunk_size must be a positive integer.")
+
+    configuration_amount = len(switch_states) ** len(switch_instance_list)
+    if stop_index is None or stop_index > configuration_amount:
+        stop_index = configuration_amount
+
+    circuit_batch_function = compose_switch_circuit_batch_function(
+        circuit=circuit,
+        switch_instance_list=switch_instance_list,
+        parameter_key=parameter_key,
+        jit=jit,
+    )
+
+    for chunk_start_index in range(start_index, stop_index, chunk_size):
+        configuration_indexes = np.arange(
+            chunk_start_index,
+            min(chunk_start_index + chunk_size, stop_index),
+            dtype=np.int64,
+        )
+        padded_configuration_indexes = np.pad(
+            configuration_indexes,
+            (0, chunk_size - len(configuration_indexes)),
+            mode="edge",
+        )
+        switch_unitary_batch = calculate_switch_unitaries_batch(
+            circuit=circuit,
+            switch_instance_list=switch_instance_list,
+            phase_configurations=compose_phase_configurations_from_indexes(
+                switch_states=switch_states,
+                switch_amount=len(switch_instance_list),
+                configuration_indexes=padded_configuration_indexes,
+            ),
+            parameter_key=parameter_key,
+            input_ports_order=input_ports_order,
+            circuit_batch_function=circuit_batch_function,
+        )
+        chunk_length = len(configuration_indexes)
+        yield switch_unitary_batch.model_copy(
+            update={
+                "unitaries": switch_unitary_batch.unitaries[:chunk_length],
+                "phase_configurations": switch_unitary_batch.phase_configurations[
+                    :chunk_length
+                ],
+                "configuration_indexes": configuration_indexes,
+            }
+        )
+
+
+def convert_switch_unitary_batch_to_dictionaries(
+    switch_unitary_batch: SwitchUnitaryBatch,
+) -> tuple[SParameterCollection, dict, dict]:
+    """
+    This function converts a ``SwitchUnitaryBatch`` into the per-configuration dictionaries generated by the
+    non-batched ``compose_network_matrix_from_models`` flow. This should only be used when the dictionary form is
+    actually required, as it creates an entry per phase configuration.
+
+    Args:
+        switch_unitary_batch (SwitchUnitaryBatch): The batch of switch unitaries.
+
+    Returns:
+        tuple[SParameterCollection, dict, dict]: The unitaries, the switch function parameter state and the switch phase address state dictionaries.
+    """
+    switch_phase_address_state = compose_phase_address_state(
+        switch_instance_map=switch_unitary_batch.switch_instance_list,
+        switch_phase_permutation_map=[
+            tuple(phase_configuration_i)
+            for phase_configuration_i in np.asarray(
+                switch_unitary_batch.phase_configurations
+            ).tolist()
+        ],
+    )
+    switch_function_parameter_state = compose_switch_function_parameter_state(
+        switch_phase_address_state=switch_phase_address_state
+    )
+    switch_unitaries = {
+        id_i: (unitary_i, switch_unitary_batch.input_ports_order)
+        for id_i, unitary_i in enumerate(switch_unitary_batch.unitaries)
+    }
+    return (
+        switch_unitaries,
+        switch_function_parameter_state,
+        switch_phase_address_state,
+    )
+
+
 def calculate_all_transition_probability_amplitudes(
     unitary_matrix: ArrayTypes,
     input_fock_states: list[ArrayTypes],
@@ -219,38 +523,425 @@ def calculate_classical_transition_probability_amplitudes(
     return circuit_transition_probability_data
 
 
+def compose_fock_states_matrix(
+    input_fock_states: list[ArrayTypes] | ArrayTypes,
+) -> jnp.ndarray:
+    """
+    This function stacks a list of Fock states into a ``(n_input, N)`` matrix, where each row is a Fock state. An
+    array of Fock states, ie. already in this form, is returned as is.
+
+    Args:
+        input_fock_states (list[ArrayTypes] | ArrayTypes): The list of input Fock states.
+
+    Returns:
+        jnp.ndarray: The ``(n_input, N)`` Fock states matrix.
+    """
+    if isinstance(input_fock_states, (np.ndarray, jnp.ndarray)):
+        return jnp.asarray(input_fock_states).reshape(len(input_fock_states), -1)
+    return jnp.stack(
+        [
+            jnp.asarray(input_fock_state).reshape(-1)
+            for input_fock_state in input_fock_states
+        ]
+    )
+
+
+@jax.jit
+def _classical_mode_transformation(
+    unitary_matrix: jnp.ndarray,
+    fock_states_matrix: jnp.ndarray,
+) -> jnp.ndarray:
+    return jnp.einsum("...ij,kj->...ki", unitary_matrix, fock_states_matrix)
+
+
+def calculate_classical_transition_probability_amplitudes_batch(
+    unitary_matrix: ArrayTypes,
+    input_fock_states: list[ArrayTypes] | ArrayTypes,
+    target_mode_index: Optional[int] = None,
+    jit: bool = True,
+) -> jnp.ndarray:
+    """
+    This is the batched equivalent of ``calculate_classical_transition_probability_amplitudes``. The unitary, or a
+    stack of unitaries, is multiplied by the matrix of all the input Fock states in a single tensor operation, so that
+    a sweep over many unitaries does not require a Python iteration per unitary and input state. The unitary is not
+    copied into the outputs.
+
+    Args:
+        unitary_matrix (ArrayTypes): The ``(N, N)`` unitary, or ``(..., N, N)`` stack of unitaries.
+        input_fock_states (list[ArrayTypes] | ArrayTypes): The list of input Fock states, or a ``(n_input, N)`` matrix.
+        target_mode_index (Optional[int]): If provided, only the probabilities of the target mode are returned.
+        jit (bool): Whether to use the ``jax.jit`` compiled transformation.
+
+    Returns:
+        jnp.ndarray: The ``(..., n_input, N)`` classical transition mode probabilities, or the ``(..., n_input)``
+        target mode probabilities if a ``target_mode_index`` is provided.
+    """
+    unitary_matrix = jnp.asarray(unitary_matrix)
+    fock_states_matrix = compose_fock_states_matrix(input_fock_states).astype(
+        unitary_matrix.dtype
+    )
+
+    if jit:
+        mode_transformation = _classical_mode_transformation(
+            unitary_matrix, fock_states_matrix
+        )
+    else:
+        mode_transformation = jnp.einsum(
+            "...ij,kj->...ki", unitary_matrix, fock_states_matrix
+        )
+
+    # Assuming probabilities are the amplitudes as in calculate_classical_transition_probability_amplitudes TODO recheck
+    classical_transition_mode_probability = jnp.abs(mode_transformation)
+
+    if target_mode_index is not None:
+        return classical_transition_mode_probability[..., target_mode_index]
+    return classical_transition_mode_probability
+
+
+def construct_unitary_transition_probability_performance_array(
+    unitaries: ArrayTypes | SwitchUnitaryBatch,
+    input_fock_states: list,
+    output_fock_states: list,
+    phase_configurations: ArrayTypes | None = None,
+    configuration_keys: list | None = None,
+) -> FockStateTransitionAmplitudes:
+    """
+    This function determines the Fock state transition probability amplitudes for a stack of implemented unitaries.
+    The Fock state tables are computed once and all the amplitudes are computed with
+    ``calculate_fock_transition_probability_amplitudes``, returning a dense ``FockStateTransitionAmplitudes``.
+
+    Args:
+        unitaries (ArrayTypes | SwitchUnitaryBatch): The ``(n_configurations, N, N)`` stack of unitaries, or a batch of switch unitaries.
+        input_fock_states (list): The list of input Fock states.
+        output_fock_states (list): The list of output Fock states.
+        phase_configurations (ArrayTypes | None): The phase configuration of each unitary. Defaults to the ``SwitchUnitaryBatch`` phase configurations.
+        configuration_keys (list | None): The key of each unitary in its originating dictionary.
+
+    Returns:
+        FockStateTransitionAmplitudes: The ``(n_configurations, n_input, n_output)`` transition probability amplitudes.
+    """
+    if isinstance(unitaries, SwitchUnitaryBatch):
+        if phase_configurations is None:
+            phase_configurations = unitaries.phase_configurations
+        unitaries = unitaries.unitaries
+
+    unitaries = np.asarray(unitaries)
+    unitaries = unitaries.reshape(-1, *unitaries.shape[-2:])
+
+    fock_transition_index_table = compose_fock_transition_index_table(
+        input_fock_states=input_fock_states,
+        output_fock_states=output_fock_states,
+    )
+    transition_probability_amplitudes = (
+        calculate_fock_transition_probability_amplitudes(
+            unitary_matrix=unitaries,
+            fock_transition_index_table=fock_transition_index_table,
+        )
+    )
+
+    return FockStateTransitionAmplitudes(
+        transition_probability_amplitudes=transition_probability_amplitudes,
+        input_fock_states=np.array(
+            [fock_state_to_photon_number_tuple(state) for state in input_fock_states],
+            dtype=int,
+        ),
+        output_fock_states=np.array(
+            [fock_state_to_photon_number_tuple(state) for state in output_fock_states],
+            dtype=int,
+        ),
+        phase_configurations=phase_configurations,
+        configuration_keys=configuration_keys,
+    )
+
+
+def convert_fock_state_transition_amplitudes_to_dictionary(
+    fock_state_transition_amplitudes: FockStateTransitionAmplitudes,
+    input_fock_states: list | None = None,
+    output_fock_states: list | None = None,
+) -> dict[int, dict[int, FockStatePhaseTransitionType]]:
+    """
+    This function converts a ``FockStateTransitionAmplitudes`` into the per-unitary dictionaries generated by
+    ``calculate_all_transition_probability_amplitudes``, keyed by the ``configuration_keys`` if available. This should
+    only be used when the dictionary form is actually required, as it creates an entry per transition.
+
+    The entries reference the provided Fock state objects, such as the ``qutip.Qobj`` states the amplitudes were
+    computed from. If they are not provided, the states are the ``(N, 1)`` photon number columns of the amplitudes.
+
+    Args:
+        fock_state_transition_amplitudes (FockStateTransitionAmplitudes): The transition probability amplitudes.
+        input_fock_states (list | None): The input Fock state objects, in the order of the amplitudes.
+        output_fock_states (list | None): The output Fock state objects, in the order of the amplitudes.
+
+    Returns:
+        dict[int, dict[int, FockStatePhaseTransitionType]]: The transition probability dictionary of each unitary.
+    """
+    transition_probability_amplitudes = np.asarray(
+        fock_state_transition_amplitudes.transition_probability_amplitudes
+    )
+    if input_fock_states is None:
+        input_fock_states = [
+            state.reshape(-1, 1)
+            for state in np.asarray(fock_state_transition_amplitudes.input_fock_states)
+        ]
+    if output_fock_states is None:
+        output_fock_states = [
+            state.reshape(-1, 1)
+            for state in np.asarray(fock_state_transition_amplitudes.output_fock_states)
+        ]
+    configuration_keys = fock_state_transition_amplitudes.configuration_keys
+    if configuration_keys is None:
+        configuration_keys = list(range(transition_probability_amplitudes.shape[0]))
+
+    transition_probability_dictionary = dict()
+    for configuration_key_i, amplitudes_i in zip(
+        configuration_keys, transition_probability_amplitudes, strict=True
+    ):
+        transition_probability_dictionary[configuration_key_i] = {
+            i * len(output_fock_states) + j: {
+                "input_fock_state": input_fock_states[i],
+                "output_fock_state": output_fock_states[j],
+                "fock_transition_probability_amplitude": amplitudes_i[i, j],
+            }
+            for i in range(len(input_fock_states))
+            for j in range(len(output_fock_states))
+        }
+    return transition_probability_dictionary
+
+
+def convert_fock_state_transition_amplitudes_to_optical_state_transitions(
+    fock_state_transition_amplitudes: FockStateTransitionAmplitudes,
+    target_mode_index: Optional[int] = None,
+) -> OpticalStateTransitions:
+    """
+    This function converts a ``FockStateTransitionAmplitudes`` into ``OpticalStateTransitions``. For each phase
+    configuration and input Fock state, the output Fock state is the most probable output Fock state, and the
+    ``raw_output`` contains the transition probability to every output Fock state. The most probable outputs are
+    determined for all the configurations in a single operation before composing the transition entries.
+
+    Args:
+        fock_state_transition_amplitudes (FockStateTransitionAmplitudes): The transition probability amplitudes.
+        target_mode_index (Optional[int]): The target mode index used to determine the ``target_mode_output``.
+
+    Returns:
+        OpticalStateTransitions: The optical state transitions of each phase configuration and input Fock state.
+    """
+    if fock_state_transition_amplitudes.phase_configurations is None:
+        raise ValueError(
+            "The phase_configurations are required to compose the optical state transitions."
+        )
+
+    transition_probabilities = (
+        np.abs(
+            np.asarray(
+                fock_state_transition_amplitudes.transition_probability_amplitudes
+            )
+        )
+        ** 2
+    )
+    input_fock_states = np.asarray(fock_state_transition_amplitudes.input_fock_states)
+    output_fock_states = np.asarray(fock_state_transition_amplitudes.output_fock_states)
+    most_probable_output_fock_states = output_fock_states[
+        np.argmax(transition_probabilities, axis=-1)
+    ]  # (n_configurations, n_input, n_modes)
+
+    phase_configurations = np.asarray(
+        fock_state_transition_amplitudes.phase_configurations
+    ).tolist()
+    input_fock_states_list = [tuple(state) for state in input_fock_states.tolist()]
+    most_probable_output_fock_states_list = most_probable_output_fock_states.tolist()
+
+    transmission_data = list()
+    for configuration_i, phase_configuration_i in enumerate(phase_configurations):
+        for input_i, input_fock_state_i in enumerate(input_fock_states_list):
+            output_fock_state_i = tuple(
+                most_probable_output_fock_states_list[configuration_i][input_i]
+            )
+            transmission_data.append(
+                {
+                    "phase": tuple(phase_configuration_i),
+                    "input_fock_state": input_fock_state_i,
+                    "output_fock_state": output_fock_state_i,
+                    "target_mode_output": output_fock_state_i[target_mode_index]
+                    if target_mode_index is not None
+                    else None,
+                    "raw_output": transition_probabilities[configuration_i, input_i],
+                }
+            )
+
+    return OpticalStateTransitions(
+        mode_amount=input_fock_states.shape[-1],
+        target_mode_index=target_mode_index,
+        transmission_data=transmission_data,
+    )
+
+
 def construct_unitary_transition_probability_performance(
     unitary_phase_implementations_dictionary: dict,
     input_fock_states: list,
     output_fock_states: list,
-) -> dict[int, dict[int, FockStatePhaseTransitionType]]:
+    output_type: Literal["dict", "array"] = "dict",
+) -> (
+    dict[int, dict[int, FockStatePhaseTransitionType]]
+    | dict[int, FockStateTransitionAmplitudes]
+):
     """
     This function determines the Fock state probability performance for a given implemented unitary. This means we
     iterate over each circuit, then each implemented unitary, and we determine the probability transformation
     accordingly.
 
+    The transition probability amplitudes of all the unitaries of a circuit are computed together with
+    ``construct_unitary_transition_probability_performance_array``. If the ``output_type`` is ``array``, the dense
+    ``FockStateTransitionAmplitudes`` of each circuit are returned directly rather than converted into dictionaries.
+
     Args:
         unitary_phase_implementations_dictionary (dict): The dictionary of the unitary phase implementations.
         input_fock_states (list): The list of input Fock states.
         output_fock_states (list): The list of output Fock states.
+        output_type (Literal["dict", "array"]): Whether to return the dictionaries or the dense amplitudes of each circuit.
 
     Returns:
         implemented_unitary_probability_dictionary (dict): The dictionary of the implemented unitary probability.
     """
     implemented_unitary_probability_dictionary = dict()
     for id_i, circuit_unitaries_i in unitary_phase_implementations_dictionary.items():
-        implemented_unitary_probability_dictionary[id_i] = dict()
-        for id_i_i, implemented_unitaries_i in circuit_unitaries_i.items():
-            implemented_unitary_probability_dictionary[id_i][id_i_i] = (
-                calculate_all_transition_probability_amplitudes(
-                    unitary_matrix=implemented_unitaries_i[0],
+        fock_state_transition_amplitudes_i = (
+            construct_unitary_transition_probability_performance_array(
+                unitaries=jnp.stack(
+                    [
+                        implemented_unitaries_i[0]
+                        for implemented_unitaries_i in circuit_unitaries_i.values()
+                    ]
+                ),
+                input_fock_states=input_fock_states,
+                output_fock_states=output_fock_states,
+                configuration_keys=list(circuit_unitaries_i.keys()),
+            )
+        )
+        if output_type == "array":
+            implemented_unitary_probability_dictionary[id_i] = (
+                fock_state_transition_amplitudes_i
+            )
+        elif output_type == "dict":
+            implemented_unitary_probability_dictionary[id_i] = (
+                convert_fock_state_transition_amplitudes_to_dictionary(
+                    fock_state_transition_amplitudes_i,
                     input_fock_states=input_fock_states,
                     output_fock_states=output_fock_states,
                 )
             )
+        else:
+            raise ValueError(f"Output type {output_type} not recognised.")
     return implemented_unitary_probability_dictionary
 
 
+def compose_network_matrix_batch_from_models(
+    circuit_component: PhotonicCircuitComponent,
+    models: dict,
+    switch_states: list,
+    top_level_instance_prefix: str = "component_lattice_generic",
+    target_component_prefix: str = "mzi",
+    jit: bool = True,
+) -> tuple[SwitchUnitaryBatch, OpticalTransmissionCircuit, Any]:
+    """
+    This function is the batched equivalent of ``compose_network_matrix_from_models``. All the switch phase
+    configurations are stacked into a single array and the circuit is evaluated once, returning a dense
+    ``SwitchUnitaryBatch``. The per-configuration dictionaries can be generated on demand with
+    ``convert_switch_unitary_batch_to_dictionaries``.
+
+    Args:
+        circuit_component (gf.Component): The circuit.
+        models (dict): The measurement dictionary.
+        switch_states (list): The list of switch states.
+        top_level_instance_prefix (str): The top level instance prefix.
+        target_component_prefix (str): The target component prefix.
+        jit (bool): Whether to ``jax.jit`` compile the circuit evaluation.
+
+    Returns:
+        tuple[SwitchUnitaryBatch, OpticalTransmissionCircuit, Any]: The batch of switch unitaries, the circuit and the circuit information.
+    """
+    netlist = circuit_component.get_netlist_recursive(allow_multiple=True)
+    (
+        switch_fabric_circuit,
+        switch_fabric_circuit_info_i,
+    ) = generate_s_parameter_circuit_from_photonic_circuit(
+        circuit=circuit_component,
+        models=models,
+        netlist=netlist,
+    )
+    switch_instance_list_i = get_matched_model_recursive_netlist_instances(
+        recursive_netlist=netlist,
+        top_level_instance_prefix=top_level_instance_prefix,
+        target_component_prefix=target_component_prefix,
+        models=models,
+    )
+
+    switch_unitary_batch = calculate_switch_unitaries_batch(
+        circuit=switch_fabric_circuit,
+        switch_instance_list=switch_instance_list_i,
+        phase_configurations=compose_phase_configurations_array(
+            switch_states=switch_states,
+            switch_amount=len(switch_instance_list_i),
+        ),
+        jit=jit,
+    )
+
+    return switch_unitary_batch, switch_fabric_circuit, switch_fabric_circuit_info_i
+
+
+def iterate_network_matrix_batches_from_models(
+    circuit_component: PhotonicCircuitComponent,
+    models: dict,
+    switch_states: list,
+    chunk_size: int = 1024,
+    start_index: int = 0,
+    stop_index: int | None = None,
+    top_level_instance_prefix: str = "component_lattice_generic",
+    target_component_prefix: str = "mzi",
+    jit: bool = True,
+) -> Iterator[SwitchUnitaryBatch]:
+    """
+    This function is the streaming equivalent of ``compose_network_matrix_batch_from_models``. The circuit is composed
+    once and the phase configurations are swept in chunks through ``iterate_switch_unitaries_batches``, so sweeps
+    of millions of configurations run in bounded memory and can be resumed from a ``start_index``.
+
+    Args:
+        circuit_component (gf.Component): The circuit.
+        models (dict): The measurement dictionary.
+        switch_states (list): The list of switch states.
+        chunk_size (int): The amount of phase configurations evaluated per batch.
+        start_index (int): The configuration index to start the sweep from.
+        stop_index (int | None): The configuration index to stop the sweep at, exclusive. Defaults to the full sweep.
+        top_level_instance_prefix (str): The top level instance prefix.
+        target_component_prefix (str): The target component prefix.
+        jit (bool): Whether to ``jax.jit`` compile the circuit evaluation.
+
+    Yields:
+        SwitchUnitaryBatch: The unitaries and configuration indexes of each chunk of the sweep.
+    """
+    netlist = circuit_component.get_netlist_recursive(allow_multiple=True)
+    switch_fabric_circuit, _ = generate_s_parameter_circuit_from_photonic_circuit(
+        circuit=circuit_component,
+        models=models,
+        netlist=netlist,
+    )
+    switch_instance_list_i = get_matched_model_recursive_netlist_instances(
+        recursive_netlist=netlist,
+        top_level_instance_prefix=top_level_instance_prefix,
+        target_component_prefix=target_component_prefix,
+        models=models,
+    )
+
+    yield from iterate_switch_unitaries_batches(
+        circuit=switch_fabric_circuit,
+        switch_instance_list=switch_instance_list_i,
+        switch_states=switch_states,
+        chunk_size=chunk_size,
+        start_index=start_index,
+        stop_index=stop_index,
+        jit=jit,
+    )
+
+
 def compose_network_matrix_from_models(
     circuit_component: PhotonicCircuitComponent,
     models: dict,
@@ -258,6 +949,7 @@ def compose_network_matrix_from_models(
     top_level_instance_prefix: str = "component_lattice_generic",
     target_component_prefix: str = "mzi",
     netlist_function: Optional[Callable] = None,
+    batch: bool = False,
     **kwargs,
 ):
     """
@@ -265,6 +957,10 @@ def compose_network_matrix_from_models(
     composing the switch functions, then composing the switch matrix, then composing the network matrix. It returns
     the network matrix and the switch matrix.
 
+    If ``batch`` is set, the switch unitaries are evaluated in a single circuit evaluation through
+    ``compose_network_matrix_batch_from_models`` and then converted into the same dictionary outputs. The batched
+    evaluation matches the switches in the recursive netlist, so it cannot be combined with a ``netlist_function``.
+
     Args:
         circuit_component (gf.Component): The circuit.
         models (dict): The measurement dictionary.
@@ -272,10 +968,51 @@ def compose_network_matrix_from_models(
         top_level_instance_prefix (str): The top level instance prefix.
         target_component_prefix (str): The target component prefix.
         netlist_function (Optional[Callable]): The netlist function.
+        batch (bool): Whether to evaluate all the switch phase configurations in a single circuit evaluation.
+        **kwargs: The ``compose_network_matrix_batch_from_models`` keyword arguments if ``batch`` is set, such as ``jit``.
 
     Returns:
         network_matrix (np.ndarray): The network matrix.
     """
+    if batch and netlist_function is not None:
+        raise ValueError(
+            "The batched network matrix evaluation does not support a custom netlist_function, set batch=False."
+        )
+
+    if batch:
+        (
+            switch_unitary_batch,
+            switch_fabric_circuit,
+            switch_fabric_circuit_info_i,
+        ) = compose_network_matrix_batch_from_models(
+            circuit_component=circuit_component,
+            models=models,
+            switch_states=switch_states,
+            top_level_instance_prefix=top_level_instance_prefix,
+            target_component_prefix=target_component_prefix,
+            **kwargs,
+        )
+        (
+            switch_fabric_switch_unitaries,
+            switch_fabric_switch_function_parameter_state,
+            switch_fabric_switch_phase_address_state,
+        ) = convert_switch_unitary_batch_to_dictionaries(switch_unitary_batch)
+        return (
+            switch_fabric_switch_unitaries,
+            switch_fabric_switch_function_parameter_state,
+            switch_fabric_switch_phase_address_state,
+            dict(),
+            switch_unitary_batch.switch_instance_list,
+            switch_fabric_circuit,
+            switch_fabric_circuit_info_i,
+        )
+
+    if netlist_function is None:
+        # Generate the netlist recursively
+        netlist = circuit_component.get_netlist_recursive(allow_multiple=True)
+    else:
+        netlist = netlist_function(circuit_component)
+
     # Compose the netlists as functions
     (
         switch_fabric_circuit,
@@ -283,13 +1020,10 @@ def compose_network_matrix_from_models(
     ) = generate_s_parameter_circuit_from_photonic_circuit(
         circuit=circuit_component,
         models=models,
-        netlist_function=netlist_function,
+        netlist=netlist,
     )
 
     if netlist_function is None:
-        # Generate the netlist recursively
-        netlist = circuit_component.get_netlist_recursive(allow_multiple=True)
-
         switch_instance_list_i = get_matched_model_recursive_netlist_instances(
             recursive_netlist=netlist,
             top_level_instance_prefix=top_level_instance_prefix,
@@ -445,14 +1179,21 @@ def generate_s_parameter_circuit_from_photonic_circuit(
     circuit: PhotonicCircuitComponent,
     models: Any = None,  # sax.modelfactory
     netlist_function: Optional[Callable] = None,
+    netlist: Optional[dict] = None,
+    use_cache: bool = True,
 ) -> tuple[any, any]:
     """
     Generates the S-parameters and related information for a given circuit using SAX and custom measurement.
 
+    The compiled circuits are cached by a hash of the netlist and the models, so composing the same circuit again
+    reuses the compiled circuit. See ``piel.tools.sax.get_cached_sax_circuit``.
+
     Args:
         circuit (gf.Component): The circuit for which the S-parameters are to be generated.
         models (sax.ModelFactory, optional): The measurement to be used for the S-parameter generation. Defaults to None.
         netlist_function (Callable, optional): The function to generate the netlist. Defaults to None.
+        netlist (dict, optional): The precomputed netlist of the circuit, to avoid generating it again. Defaults to None.
+        use_cache (bool): Whether to reuse a previously compiled circuit. Defaults to True.
 
     Returns:
         tuple[any, any]: The S-parameters circuit and related information.
@@ -463,19 +1204,26 @@ def generate_s_parameter_circuit_from_photonic_circuit(
     if models is None:
         models = get_default_models()
 
-    if netlist_function is None:
+    if netlist is None and netlist_function is None:
         # Step 2: Generate the netlist recursively
         netlist = circuit.get_netlist_recursive(allow_multiple=True)
-    else:
+    elif netlist is None:
         netlist = netlist_function(circuit)
 
     try:
         # Step 7: Compute the S-parameters using the custom library and netlist
-        s_parameters, s_parameters_info = sax.circuit(
-            netlist=netlist,
-            models=models,
-            ignore_missing_ports=True,
-        )
+        if use_cache:
+            s_parameters, s_parameters_info = get_cached_sax_circuit(
+                netlist=netlist,
+                models=models,
+                ignore_missing_ports=True,
+            )
+        else:
+            s_parameters, s_parameters_info = sax.circuit(
+                netlist=netlist,
+                models=models,
+                ignore_missing_ports=True,
+            )
     except Exception as e:
         """
         Custom exception mapping.
@@ -513,6 +1261,65 @@ def generate_s_parameter_circuit_from_photonic_circuit(
     return s_parameters, s_parameters_info
 
 
+def _calculate_classical_state_transition_probabilities(
+    circuit_unitaries: dict,
+    input_fock_states: list[ArrayTypes],
+    target_mode_index: Optional[int] = None,
+    determine_ideal_mode_function: Optional[Callable] = None,
+) -> list[list[tuple]]:
+    """
+    Calculates the classical mode probabilities and target mode probability of every input Fock state for every
+    unitary. Without a ``determine_ideal_mode_function``, all the unitaries and input states are evaluated in a single
+    tensor operation with ``calculate_classical_transition_probability_amplitudes_batch``. Otherwise, each mode
+    transformation is inspected with ``calculate_classical_transition_probability_amplitudes``.
+
+    Returns the ``(classical_transition_mode_probability, classical_transition_target_mode_probability)`` of each
+    input Fock state, for each unitary.
+    """
+    if determine_ideal_mode_function is None and len(circuit_unitaries) > 0:
+        classical_transition_mode_probabilities = np.asarray(
+            calculate_classical_transition_probability_amplitudes_batch(
+                unitary_matrix=jnp.stack(
+                    [unitary_i for unitary_i, _ in circuit_unitaries.values()]
+                ),
+                input_fock_states=input_fock_states,
+            )
+        )  # (n_configurations, n_input, N)
+        return [
+            [
+                (
+                    mode_probabilities_i_i.reshape(np.shape(input_fock_state_i)),
+                    mode_probabilities_i_i[target_mode_index]
+                    if target_mode_index is not None
+                    else None,
+                )
+                for input_fock_state_i, mode_probabilities_i_i in zip(
+                    input_fock_states, mode_probabilities_i
+                )
+            ]
+            for mode_probabilities_i in classical_transition_mode_probabilities
+        ]
+
+    classical_transition_probabilities = list()
+    for unitary_i, _ in circuit_unitaries.values():
+        data_i = calculate_classical_transition_probability_amplitudes(
+            unitary_matrix=unitary_i,
+            input_fock_states=input_fock_states,
+            target_mode_index=target_mode_index,
+            determine_ideal_mode_function=determine_ideal_mode_function,
+        )
+        classical_transition_probabilities.append(
+            [
+                (
+                    data_i_i["classical_transition_mode_probability"],
+                    data_i_i["classical_transition_target_mode_probability"],
+                )
+                for data_i_i in data_i.values()
+            ]
+        )
+    return classical_transition_probabilities
+
+
 def get_state_phase_transitions(
     circuit_component: PhotonicCircuitComponent,
     models: dict = None,
@@ -522,6 +1329,7 @@ def get_state_phase_transitions(
     determine_ideal_mode_function: Optional[Callable] = None,
     netlist_function: Optional[Callable] = None,
     target_mode_index: Optional[int] = None,
+    fock_state_transition_amplitudes: FockStateTransitionAmplitudes | None = None,
     **kwargs,
 ) -> OpticalStateTransitions:
     """
@@ -552,7 +1360,17 @@ def get_state_phase_transitions(
     As such, this function will help us extract the corresponding phase for a particular switch transition.
 
     When the switch function is larger than a single switch, it is necessary to extract the location of the corresponding switches as function parameters.
+
+    If the ``fock_state_transition_amplitudes`` of the switch fabric have already been computed, for example with
+    ``construct_unitary_transition_probability_performance_array``, the state transitions are extracted directly from
+    them with ``convert_fock_state_transition_amplitudes_to_optical_state_transitions`` without evaluating the circuit.
     """
+    if fock_state_transition_amplitudes is not None:
+        return convert_fock_state_transition_amplitudes_to_optical_state_transitions(
+            fock_state_transition_amplitudes=fock_state_transition_amplitudes,
+            target_mode_index=target_mode_index,
+        )
+
     # We compose the fock states we want to apply
     if input_fock_states is None:
         input_fock_states = fock_states_only_individual_modes(
@@ -579,37 +1397,34 @@ def get_state_phase_transitions(
         **kwargs,
     )
 
-    id_i = 0
-    for unitary_i, _ in circuit_unitaries.values():
-        data_i = calculate_classical_transition_probability_amplitudes(
-            unitary_matrix=unitary_i,
+    classical_transition_probabilities = (
+        _calculate_classical_state_transition_probabilities(
+            circuit_unitaries=circuit_unitaries,
             input_fock_states=input_fock_states,
             target_mode_index=target_mode_index,
             determine_ideal_mode_function=determine_ideal_mode_function,
         )
+    )
 
-        for id_i_i, _ in data_i.items():
+    for id_i, (unitary_i, _) in enumerate(circuit_unitaries.values()):
+        phase_i = extract_phase_tuple_from_phase_address_state(
+            circuit_phase_address_state[id_i]
+        )
+        for input_fock_state_i, (
+            classical_transition_mode_probability_i,
+            classical_transition_target_mode_probability_i,
+        ) in zip(input_fock_states, classical_transition_probabilities[id_i]):
             output_state_i = format_electro_optic_fock_transition(
-                switch_state_array=extract_phase_tuple_from_phase_address_state(
-                    circuit_phase_address_state[id_i]
-                ),
-                input_fock_state_array=data_i[id_i_i]["input_fock_state"],
-                raw_output_state=data_i[id_i_i][
-                    "classical_transition_mode_probability"
-                ],
-                target_mode_output=int(
-                    data_i[id_i_i]["classical_transition_target_mode_probability"]
-                )
-                if data_i[id_i_i]["classical_transition_target_mode_probability"]
-                is not None
+                switch_state_array=phase_i,
+                input_fock_state_array=input_fock_state_i,
+                raw_output_state=classical_transition_mode_probability_i,
+                target_mode_output=int(classical_transition_target_mode_probability_i)
+                if classical_transition_target_mode_probability_i is not None
                 else None,  # set if available otherwise None,
-                raw_output=data_i[id_i_i]["classical_transition_mode_probability"]
-                if data_i[id_i_i]["classical_transition_mode_probability"] is not None
-                else None,
+                raw_output=classical_transition_mode_probability_i,
                 unitary=unitary_i,
             )
             output_states.append(output_state_i)
-        id_i += 1
 
     output_optical_state_transitions = OpticalStateTransitions(
         mode_amount=mode_amount,
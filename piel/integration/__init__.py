@@ -23,4 +23,9 @@ from .sax_qutip import (
     sax_to_ideal_qutip_unitary,
     verify_sax_model_is_unitary,
 )
-from .thewalrus_qutip import fock_transition_probability_amplitude
+from .thewalrus_qutip import (
+    calculate_fock_transition_probability_amplitudes,
+    clear_fock_permanent_cache,
+    compose_fock_transition_index_table,
+    fock_transition_probability_amplitude,
+)
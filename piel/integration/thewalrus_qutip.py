@@ -1,12 +1,23 @@
+import collections
+import hashlib
 import jax.numpy as jnp
+import math
+import numpy as np
 from typing import Any
-from ..tools.thewalrus import unitary_permanent
+from ..types import ArrayTypes
+from ..tools.thewalrus import unitary_permanent, unitary_permanent_batch
 from ..tools.qutip import (
     fock_state_nonzero_indexes,
     fock_state_to_photon_number_factorial,
+    fock_state_to_photon_number_tuple,
     subunitary_selection_on_index,
 )
 
+FOCK_PERMANENT_CACHE_MAXSIZE = 64
+
+# The permanents of each unitary by transition, least recently used unitaries first
+_FOCK_PERMANENT_CACHE: collections.OrderedDict[str, dict] = collections.OrderedDict()
+
 
 def fock_transition_probability_amplitude(
     initial_fock_state: Any,  # qutip.Qobj | jnp.ndarray,
@@ -65,3 +76,229 @@ def fock_transition_probability_amplitude(
         )
     )
     return transition_probability_amplitude
+
+
+def compose_fock_transition_index_table(
+    input_fock_states: list[Any],
+    output_fock_states: list[Any],
+) -> dict:
+    """
+    This function precomputes everything required to compute the transition probability amplitudes between a set of
+    input and output Fock states that does not depend on the unitary. This means that, for a sweep over many unitaries,
+    the Fock state indexes and factorials are only computed once.
+
+    Each Fock state is keyed by its photon number tuple, so repeated Fock states are only processed once. The mode
+    index of each photon is repeated according to the photon number in that mode, so that the subunitary of a
+    transition is selected by ``unitary[rows_index][:, columns_index]``. The transitions are grouped by total photon
+    number as transitions between Fock states of different photon numbers have a zero amplitude.
+
+    Args:
+        input_fock_states (list[qutip.Qobj | jnp.ndarray]): The list of input Fock states.
+        output_fock_states (list[qutip.Qobj | jnp.ndarray]): The list of output Fock states.
+
+    Returns:
+        dict: The ``input_amount`` and ``output_amount`` of Fock states, and the ``photon_number_groups``. For each
+        photon number, these contain the ``input_indexes`` and ``output_indexes`` of the Fock states in the provided
+        lists, the ``columns_index`` and ``rows_index`` photon mode indexes of each state, and the
+        ``(n_output, n_input)`` factorial ``normalisation`` of each transition.
+    """
+    fock_state_table = dict()
+
+    def get_fock_state_table_entry(fock_state):
+        photon_number_tuple = fock_state_to_photon_number_tuple(fock_state)
+        if photon_number_tuple not in fock_state_table:
+            fock_state_table[photon_number_tuple] = (
+                sum(photon_number_tuple),
+                np.repeat(np.arange(len(photon_number_tuple)), photon_number_tuple),
+                math.prod(
+                    math.factorial(photon_number)
+                    for photon_number in photon_number_tuple
+                ),
+            )
+        return fock_state_table[photon_number_tuple]
+
+    input_entries = [get_fock_state_table_entry(state) for state in input_fock_states]
+    output_entries = [get_fock_state_table_entry(state) for state in output_fock_states]
+
+    photon_number_groups = dict()
+    for photon_number in {entry[0] for entry in input_entries}:
+        input_indexes = np.array(
+            [i for i, entry in enumerate(input_entries) if entry[0] == photon_number],
+            dtype=int,
+        )
+        output_indexes = np.array(
+            [i for i, entry in enumerate(output_entries) if entry[0] == photon_number],
+            dtype=int,
+        )
+        if len(output_indexes) == 0:
+            continue
+
+        input_factorials = np.array([input_entries[i][2] for i in input_indexes])
+        output_factorials = np.array([output_entries[i][2] for i in output_indexes])
+        photon_number_groups[photon_number] = {
+            "input_indexes": input_indexes,
+            "output_indexes": output_indexes,
+            "columns_index": np.array(
+                [input_entries[i][1] for i in input_indexes], dtype=int
+            ).reshape(len(input_indexes), photon_number),
+            "rows_index": np.array(
+                [output_entries[i][1] for i in output_indexes], dtype=int
+            ).reshape(len(output_indexes), photon_number),
+            "normalisation": 1
+            / np.sqrt(output_factorials[:, None] * input_factorials[None, :]),
+        }
+
+    return {
+        "input_amount": len(input_entries),
+        "output_amount": len(output_entries),
+        "photon_number_groups": photon_number_groups,
+    }
+
+
+def clear_fock_permanent_cache() -> None:
+    """
+    Clears the cache of the subunitary permanents computed by ``calculate_fock_transition_probability_amplitudes``.
+    """
+    _FOCK_PERMANENT_CACHE.clear()
+
+
+def _calculate_cached_permanents(
+    unitary_matrix: np.ndarray,
+    rows_index: np.ndarray,
+    columns_index: np.ndarray,
+    maxsize: int = FOCK_PERMANENT_CACHE_MAXSIZE,
+) -> np.ndarray:
+    """
+    Computes the ``(n_output, n_input)`` permanents of the subunitaries of a single unitary, reusing the permanents
+    cached for the same unitary and transition. The cache is keyed by the bytes of the unitary and, for each
+    transition, by the photon mode indexes of its output and input Fock states. Only the missing permanents are
+    computed, in a single ``unitary_permanent_batch`` call.
+    """
+    unitary_key = hashlib.sha256(
+        repr((unitary_matrix.shape, unitary_matrix.dtype.str)).encode()
+        + unitary_matrix.tobytes()
+    ).hexdigest()
+    if unitary_key in _FOCK_PERMANENT_CACHE:
+        _FOCK_PERMANENT_CACHE.move_to_end(unitary_key)
+    else:
+        _FOCK_PERMANENT_CACHE[unitary_key] = dict()
+        while len(_FOCK_PERMANENT_CACHE) > maxsize:
+            _FOCK_PERMANENT_CACHE.popitem(last=False)
+    unitary_permanents = _FOCK_PERMANENT_CACHE[unitary_key]
+
+    rows_keys = [tuple(rows) for rows in rows_index.tolist()]
+    columns_keys = [tuple(columns) for columns in columns_index.tolist()]
+    missing_rows_ids, missing_columns_ids = [], []
+    for rows_id, rows_key in enumerate(rows_keys):
+        for columns_id, columns_key in enumerate(columns_keys):
+            if (rows_key, columns_key) not in unitary_permanents:
+                missing_rows_ids.append(rows_id)
+                missing_columns_ids.append(columns_id)
+
+    if missing_rows_ids:
+        photon_number = rows_index.shape[1]
+        subunitaries = unitary_matrix[
+            rows_index[missing_rows_ids][:, :, None],
+            columns_index[missing_columns_ids][:, None, :],
+        ]
+        missing_permanents = unitary_permanent_batch(
+            subunitaries.reshape(-1, photon_number, photon_number)
+        )
+        for rows_id, columns_id, permanent in zip(
+            missing_rows_ids, missing_columns_ids, missing_permanents
+        ):
+            unitary_permanents[(rows_keys[rows_id], columns_keys[columns_id])] = (
+                permanent
+            )
+
+    return np.array(
+        [
+            [
+                unitary_permanents[(rows_key, columns_key)]
+                for columns_key in columns_keys
+            ]
+            for rows_key in rows_keys
+        ],
+        dtype=complex,
+    ).reshape(len(rows_keys), len(columns_keys))
+
+
+def calculate_fock_transition_probability_amplitudes(
+    unitary_matrix: ArrayTypes,
+    input_fock_states: list[Any] | None = None,
+    output_fock_states: list[Any] | None = None,
+    fock_transition_index_table: dict | None = None,
+    use_cache: bool = False,
+) -> np.ndarray:
+    """
+    This function computes the transition probability amplitudes between every input and output Fock state for a
+    unitary, or a stack of unitaries, as described in ``fock_transition_probability_amplitude``.
+
+    Rather than selecting the subunitary and computing a permanent per transition, all the subunitaries of a given
+    photon number are gathered in a single indexing operation and their permanents computed in one batched call with
+    ``unitary_permanent_batch``. The Fock state tables can be precomputed with ``compose_fock_transition_index_table``
+    and reused between unitaries, in which case the Fock state lists do not need to be provided.
+
+    If ``use_cache`` is set, the permanents are cached per unitary and Fock state transition, so evaluating the same
+    unitary again, for example with an overlapping set of Fock states, only computes the missing permanents. This
+    is meant for repeated evaluations of few unitaries, as every unitary of a stack is looked up separately.
+
+    Args:
+        unitary_matrix (ArrayTypes): The ``(N, N)`` unitary, or ``(..., N, N)`` stack of unitaries.
+        input_fock_states (list[qutip.Qobj | jnp.ndarray] | None): The list of input Fock states.
+        output_fock_states (list[qutip.Qobj | jnp.ndarray] | None): The list of output Fock states.
+        fock_transition_index_table (dict | None): The precomputed ``compose_fock_transition_index_table``.
+        use_cache (bool): Whether to reuse the permanents cached per unitary and Fock state transition.
+
+    Returns:
+        np.ndarray: The ``(..., n_input, n_output)`` complex transition probability amplitudes.
+    """
+    if fock_transition_index_table is None:
+        if input_fock_states is None or output_fock_states is None:
+            raise ValueError(
+                "Either the input and output Fock states or a fock_transition_index_table must be provided."
+            )
+        fock_transition_index_table = compose_fock_transition_index_table(
+            input_fock_states=input_fock_states,
+            output_fock_states=output_fock_states,
+        )
+
+    unitary_matrix = np.asarray(unitary_matrix, dtype=complex)
+    batch_shape = unitary_matrix.shape[:-2]
+    input_amount = fock_transition_index_table["input_amount"]
+    output_amount = fock_transition_index_table["output_amount"]
+
+    transition_probability_amplitudes = np.zeros(
+        (*batch_shape, input_amount, output_amount), dtype=complex
+    )
+    for photon_number, entry in fock_transition_index_table[
+        "photon_number_groups"
+    ].items():
+        rows_index = entry["rows_index"]
+        columns_index = entry["columns_index"]
+        if use_cache:
+            permanents = np.empty(
+                (*batch_shape, len(rows_index), len(columns_index)), dtype=complex
+            )
+            for batch_index in np.ndindex(batch_shape):
+                permanents[batch_index] = _calculate_cached_permanents(
+                    unitary_matrix[batch_index], rows_index, columns_index
+                )
+        else:
+            # (..., n_output, n_input, photon_number, photon_number) subunitaries
+            subunitaries = unitary_matrix[
+                ...,
+                rows_index[:, None, :, None],
+                columns_index[None, :, None, :],
+            ]
+            permanents = unitary_permanent_batch(
+                subunitaries.reshape(-1, photon_number, photon_number)
+            ).reshape(subunitaries.shape[:-2])
+        amplitudes = np.swapaxes(permanents * entry["normalisation"], -1, -2)
+        transition_probability_amplitudes[
+            ...,
+            entry["input_indexes"][:, None],
+            entry["output_indexes"][None, :],
+        ] = amplitudes
+
+    return transition_probability_amplitudes
@@ -2,6 +2,11 @@ from .stainless_steel import stainless_steel
 from .aluminum import aluminum
 from .copper import copper
 from .teflon import teflon
+from .registry import (
+    calculate_thermal_conductivity,
+    get_thermal_conductivity_coefficients,
+    load_thermal_conductivity_registry,
+)
 
 from .stainless_steel import material_references as stainless_steel_material_references
 from .aluminum import material_references as aluminum_material_references
@@ -1,6 +1,7 @@
 import jax.numpy as jnp
 from piel.types.materials import MaterialReferenceType, MaterialReferencesTypes
 from piel.types.physical import TemperatureRangeTypes
+from .registry import calculate_thermal_conductivity
 
 __all__ = ["aluminum", "material_references"]
 
@@ -19,20 +20,13 @@ def aluminum(
     **kwargs,
 ) -> float:
     specification = material_reference[1]
-    if specification == "1100":
-        thermal_conductivity_fit = jnp.power(
-            10,
-            23.39172
-            - 148.5733 * (jnp.log10(temperature_range_K))
-            + 422.1917 * (jnp.log10(temperature_range_K) ** 2)
-            - 653.6664 * (jnp.log10(temperature_range_K) ** 3)
-            + 607.0402 * (jnp.log10(temperature_range_K) ** 4)
-            - 346.152 * (jnp.log10(temperature_range_K) ** 5)
-            + 118.4276 * (jnp.log10(temperature_range_K) ** 6)
-            - 22.2781 * (jnp.log10(temperature_range_K) ** 7)
-            + 1.770187 * (jnp.log10(temperature_range_K) ** 8),
-        )
-    else:
+    if specification not in supported_specifications:
         raise ValueError("Invalid specification: " + specification)
 
-    return thermal_conductivity_fit
+    # The fit is evaluated in double precision by the thermal conductivity registry
+    thermal_conductivity_fit = calculate_thermal_conductivity(
+        temperature_K=temperature_range_K,
+        material_references=[("aluminum", specification)],
+    )[0]
+
+    return jnp.asarray(thermal_conductivity_fit)
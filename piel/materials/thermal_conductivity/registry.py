@@ -0,0 +1,209 @@
+"""
+The thermal conductivity fits of all the supported materials are loaded once into NumPy coefficient arrays, so that
+they can be evaluated for many materials and temperatures in a single vectorized operation.
+"""
+
+import functools
+import pathlib
+import numpy as np
+import pandas as pd
+from piel.types import ArrayTypes
+from piel.types.materials import MaterialReferenceType, MaterialReferencesTypes
+
+__all__ = [
+    "calculate_thermal_conductivity",
+    "get_thermal_conductivity_coefficients",
+    "load_thermal_conductivity_registry",
+]
+
+# The NIST cryogenic material fits, https://trc.nist.gov/cryogenics/materials/materialproperties.htm
+#   log10_polynomial: log10(k) = sum_n c_n log10(T)^n
+#   log10_rational: log10(k) = (a + c T^0.5 + e T + g T^1.5 + i T^2) / (1 + b T^0.5 + d T + f T^1.5 + h T^2)
+# Both fits are stored as nine coefficients, in ascending powers of log10(T) or in the a to i order respectively.
+FIT_COEFFICIENT_AMOUNT = 9
+
+_STAINLESS_STEEL_304_COEFFICIENTS = (
+    -1.4087,
+    1.3982,
+    0.2543,
+    -0.6260,
+    0.2334,
+    0.4256,
+    -0.4658,
+    0.1650,
+    -0.0199,
+)
+_LOG10_POLYNOMIAL_COEFFICIENTS = {
+    ("aluminum", "1100"): (
+        23.39172,
+        -148.5733,
+        422.1917,
+        -653.6664,
+        607.0402,
+        -346.152,
+        118.4276,
+        -22.2781,
+        1.770187,
+    ),
+    # https://trc.nist.gov/cryogenics/materials/304Stainless/304Stainless_rev.htm
+    ("stainless_steel", "304"): _STAINLESS_STEEL_304_COEFFICIENTS,
+    # https://trc.nist.gov/cryogenics/materials/310%20Stainless/310Stainless_rev.htm
+    ("stainless_steel", "310"): (
+        -0.81907,
+        -2.1967,
+        9.1059,
+        -13.078,
+        10.853,
+        -5.1269,
+        1.2583,
+        -0.12395,
+    ),
+    # Assumed to be the same as 304 until a fit for 316 is added.
+    ("stainless_steel", "316"): _STAINLESS_STEEL_304_COEFFICIENTS,
+    # https://trc.nist.gov/cryogenics/materials/Teflon/Teflon_rev.htm
+    ("teflon", None): (
+        2.7380,
+        -30.677,
+        89.430,
+        -136.99,
+        124.69,
+        -69.556,
+        23.320,
+        -4.3135,
+        0.33829,
+    ),
+}
+
+COPPER_THERMAL_CONDUCTIVITY_FILE = (
+    pathlib.Path(__file__).parent / "data" / "ofhc_copper_thermal_conductivity.csv"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def load_thermal_conductivity_registry() -> dict[MaterialReferenceType, tuple]:
+    """
+    Loads the thermal conductivity fit of every supported material once. The copper datasets are read from the
+    ``ofhc_copper_thermal_conductivity.csv`` file on the first call.
+
+    Returns:
+        dict[MaterialReferenceType, tuple[str, np.ndarray]]: The fit type and the nine fit coefficients of each
+        material reference.
+    """
+    registry = {}
+    for material_reference, coefficients in _LOG10_POLYNOMIAL_COEFFICIENTS.items():
+        coefficients_array = np.zeros(FIT_COEFFICIENT_AMOUNT)
+        coefficients_array[: len(coefficients)] = coefficients
+        registry[material_reference] = ("log10_polynomial", coefficients_array)
+
+    copper_dataset = pd.read_csv(
+        COPPER_THERMAL_CONDUCTIVITY_FILE, encoding="utf-8-sig"
+    ).set_index("coefficient")
+    copper_dataset = copper_dataset.loc[list("abcdefghi")]
+    for specification in copper_dataset.columns:
+        registry[("copper", specification)] = (
+            "log10_rational",
+            copper_dataset[specification].to_numpy(dtype=float),
+        )
+
+    for _, coefficients_array in registry.values():
+        coefficients_array.flags.writeable = False
+    return registry
+
+
+def get_thermal_conductivity_coefficients(
+    material_reference: MaterialReferenceType,
+) -> tuple[str, np.ndarray]:
+    """
+    Returns the cached fit type and coefficients of a material.
+
+    Args:
+        material_reference (MaterialReferenceType): The material name and specification.
+
+    Returns:
+        tuple[str, np.ndarray]: The fit type and the read-only fit coefficients.
+    """
+    registry = load_thermal_conductivity_registry()
+    material_reference = tuple(material_reference)
+    if material_reference not in registry:
+        material_name = material_reference[0]
+        if any(reference[0] == material_name for reference in registry):
+            raise ValueError(
+                f"Invalid specification for {material_name}: {material_reference[1]}. Valid options are: "
+                + ", ".join(
+                    str(reference[1])
+                    for reference in registry
+                    if reference[0] == material_name
+                )
+            )
+        raise ValueError(f"Material {material_name} not supported.")
+    return registry[material_reference]
+
+
+@functools.lru_cache(maxsize=128)
+def _compose_coefficient_matrix(
+    material_references: tuple[MaterialReferenceType, ...],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stacks the coefficients of the materials into a matrix, with a mask of the materials with a rational fit.
+    """
+    fits = [
+        get_thermal_conductivity_coefficients(material_reference)
+        for material_reference in material_references
+    ]
+    coefficient_matrix = np.array([coefficients for _, coefficients in fits]).reshape(
+        len(fits), FIT_COEFFICIENT_AMOUNT
+    )
+    is_rational_fit = np.array(
+        [fit_type == "log10_rational" for fit_type, _ in fits], dtype=bool
+    )
+    # The cached arrays are shared between calls
+    coefficient_matrix.flags.writeable = False
+    is_rational_fit.flags.writeable = False
+    return coefficient_matrix, is_rational_fit
+
+
+def calculate_thermal_conductivity(
+    temperature_K: ArrayTypes | float,
+    material_references: MaterialReferencesTypes,
+) -> np.ndarray:
+    """
+    Evaluates the thermal conductivity of every material at every temperature with two matrix products, one per fit
+    type, instead of evaluating each material fit separately.
+
+    Args:
+        temperature_K (ArrayTypes | float): The temperatures in Kelvin.
+        material_references (MaterialReferencesTypes): The materials to evaluate.
+
+    Returns:
+        np.ndarray: The thermal conductivity in W/(m K) with shape ``(len(material_references), *temperature_K.shape)``.
+    """
+    temperature_K = np.asarray(temperature_K, dtype=float)
+    coefficient_matrix, is_rational_fit = _compose_coefficient_matrix(
+        tuple(tuple(material_reference) for material_reference in material_references)
+    )
+    temperature_flat_K = temperature_K.ravel()
+    log10_thermal_conductivity = np.empty(
+        (len(coefficient_matrix), temperature_flat_K.size)
+    )
+
+    if not is_rational_fit.all():
+        log10_temperature_powers = np.log10(temperature_flat_K) ** np.arange(
+            FIT_COEFFICIENT_AMOUNT
+        ).reshape(-1, 1)
+        log10_thermal_conductivity[~is_rational_fit] = (
+            coefficient_matrix[~is_rational_fit] @ log10_temperature_powers
+        )
+
+    if is_rational_fit.any():
+        # Powers of T^0.5 from 0 to 4, the numerator is a, c, e, g, i and the denominator is 1, b, d, f, h
+        sqrt_temperature_powers = temperature_flat_K ** (
+            np.arange(5).reshape(-1, 1) / 2
+        )
+        rational_coefficients = coefficient_matrix[is_rational_fit]
+        numerator = rational_coefficients[:, 0::2] @ sqrt_temperature_powers
+        denominator = 1 + rational_coefficients[:, 1::2] @ sqrt_temperature_powers[1:]
+        log10_thermal_conductivity[is_rational_fit] = numerator / denominator
+
+    return np.power(10, log10_thermal_conductivity).reshape(
+        len(coefficient_matrix), *temperature_K.shape
+    )
@@ -1,6 +1,7 @@
 import jax.numpy as jnp
 from piel.types.materials import MaterialReferencesTypes
 from piel.types.physical import TemperatureRangeTypes
+from .registry import calculate_thermal_conductivity
 
 __all__ = ["teflon", "material_references"]
 
@@ -20,15 +21,8 @@ def teflon(temperature_range_K: TemperatureRangeTypes, *args, **kwargs):
     Returns:
 
     """
-    thermal_conductivity_fit = 10 ** (
-        +2.7380
-        - 30.677 * jnp.log10(temperature_range_K)
-        + 89.430 * (jnp.log10(temperature_range_K) ** 2)
-        - 136.99 * (jnp.log10(temperature_range_K) ** 3)
-        + 124.69 * (jnp.log10(temperature_range_K) ** 4)
-        - 69.556 * (jnp.log10(temperature_range_K) ** 5)
-        + 23.320 * (jnp.log10(temperature_range_K) ** 6)
-        - 4.3135 * (jnp.log10(temperature_range_K) ** 7)
-        + 0.33829 * (jnp.log10(temperature_range_K) ** 8)
-    )
-    return thermal_conductivity_fit
+    # The fit is evaluated in double precision by the thermal conductivity registry
+    thermal_conductivity_fit = calculate_thermal_conductivity(
+        temperature_K=temperature_range_K, material_references=[("teflon", None)]
+    )[0]
+    return jnp.asarray(thermal_conductivity_fit)
@@ -2,7 +2,7 @@ import numpy as np
 from piel.types import ArrayTypes
 from piel.types.physical import TemperatureRangeTypes
 from piel.types.materials import MaterialReferenceType
-from piel.materials import thermal_conductivity
+from .registry import calculate_thermal_conductivity
 
 __all__ = ["get_thermal_conductivity_fit"]
 
@@ -14,20 +14,15 @@ def get_thermal_conductivity_fit(
     **kwargs,
 ) -> ArrayTypes:
     """
-    Get the thermal conductivity fit for a given material.
+    Get the thermal conductivity fit for a given material from the cached coefficient registry.
 
     Args:
-        temperature_range_K:
-        material:
+        temperature_range_K: The temperature range in Kelvin, either as limits or as an array.
+        material: The material reference.
 
     Returns:
+        ArrayTypes: The thermal conductivity in W/(m K) at each temperature.
     """
-    try:
-        print(material)
-        material_name = material[0]
-    except Exception as e:
-        raise e
-
     if type(temperature_range_K) is tuple:
         # TODO how to compare this with the TemperatureRangeLimitType?
         temperature_range_K = np.linspace(
@@ -44,21 +39,7 @@ def get_thermal_conductivity_fit(
             "Invalid temperature_range_K type. Must be a TemperatureRangeType."
         )
 
-    if material_name == "copper":
-        return thermal_conductivity.copper(
-            temperature_range_K=temperature_range_K, material_reference=material
-        )
-    if material_name == "stainless_steel":
-        return thermal_conductivity.stainless_steel(
-            temperature_range_K=temperature_range_K, material_reference=material
-        )
-    if material_name == "aluminum":
-        return thermal_conductivity.aluminum(
-            temperature_range_K=temperature_range_K, material_reference=material
-        )
-    if material_name == "teflon":
-        return thermal_conductivity.teflon(
-            temperature_range_K=temperature_range_K, material_reference=material
-        )
-    else:
-        raise ValueError(f"Material {material_name} not supported.")
+    # All the materials are served from the cached coefficient registry
+    return calculate_thermal_conductivity(
+        temperature_K=temperature_range_K, material_references=[material]
+    )[0]
@@ -1,2 +1,3 @@
 from . import dc as dc
 from . import rf as rf
+from .thermal import calculate_cables_heat_transfer_matrix
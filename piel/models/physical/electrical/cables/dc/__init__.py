@@ -1,4 +1,7 @@
 from .common import generic_banana
 from .geometry import calculate_dc_cable_geometry
 from .materials import define_dc_cable_materials
-from .thermal import calculate_dc_cable_heat_transfer
+from .thermal import (
+    calculate_dc_cable_heat_transfer,
+    calculate_dc_cables_heat_transfer_matrix,
+)
@@ -1,3 +1,4 @@
+import numpy as np
 from piel.models.physical.thermal import heat_transfer_1d_W
 from piel.materials.thermal_conductivity.utils import get_thermal_conductivity_fit
 from piel.types.electrical.cables import (
@@ -7,6 +8,10 @@ from piel.types.electrical.cables import (
 )
 from piel.types.materials import MaterialReferenceType
 from piel.types.physical import TemperatureRangeTypes
+from piel.types import ArrayTypes
+from ..thermal import calculate_cables_heat_transfer_matrix
+
+DC_CABLE_MATERIAL_NAMES = ("core",)
 
 
 def calculate_dc_cable_heat_transfer(
@@ -30,12 +35,20 @@ def calculate_dc_cable_heat_transfer(
     """
 
     if material_class is not None:
-        provided_materials = material_class.supplied_parameters()
+        provided_materials = [
+            material_name
+            for material_name in DC_CABLE_MATERIAL_NAMES
+            if getattr(material_class, material_name) is not None
+        ]
     elif material_class is None:
         material_class = DCCableMaterialSpecificationType(
             core=core_material,
         )
-        provided_materials = material_class.supplied_parameters()
+        provided_materials = [
+            material_name
+            for material_name in DC_CABLE_MATERIAL_NAMES
+            if getattr(material_class, material_name) is not None
+        ]
     else:
         raise ValueError("No material class or material parameters provided.")
 
@@ -61,3 +74,32 @@ def calculate_dc_cable_heat_transfer(
     return DCCableHeatTransferType(
         **heat_transfer_parameters,
     )
+
+
+def calculate_dc_cables_heat_transfer_matrix(
+    temperature_stages_K: ArrayTypes,
+    geometry_classes: list[DCCableGeometryType],
+    material_classes: list[DCCableMaterialSpecificationType],
+    num: int = 10000,
+) -> dict[str, np.ndarray]:
+    """
+    Calculate the heat load of many DC cables between many pairs of temperature stages in a single vectorized pass,
+    with precomputed thermal conductivity integrals rather than one integration per cable and material.
+
+    Args:
+        temperature_stages_K: The ``(n_stages, 2)`` pairs of temperatures in Kelvin each cable spans.
+        geometry_classes: The geometry of each of the ``n_cables`` cables.
+        material_classes: The material of each cable.
+        num: The number of temperature grid points of the thermal conductivity integrals.
+
+    Returns:
+        dict[str, np.ndarray]: The ``(n_cables, n_stages)`` heat transfer matrix in watts of each material and their
+        ``total``.
+    """
+    return calculate_cables_heat_transfer_matrix(
+        temperature_stages_K=temperature_stages_K,
+        geometry_classes=geometry_classes,
+        material_classes=material_classes,
+        material_names=DC_CABLE_MATERIAL_NAMES,
+        num=num,
+    )
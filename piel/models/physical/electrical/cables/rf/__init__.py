@@ -1,4 +1,7 @@
 from .common import cryo_cable, generic_sma, rg164
 from .generic import create_coaxial_cable
 from .geometry import calculate_coaxial_cable_geometry
-from .thermal import calculate_coaxial_cable_heat_transfer
+from .thermal import (
+    calculate_coaxial_cable_heat_transfer,
+    calculate_coaxial_cables_heat_transfer_matrix,
+)
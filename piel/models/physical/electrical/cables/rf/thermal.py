@@ -1,3 +1,4 @@
+import numpy as np
 from piel.models.physical.thermal import heat_transfer_1d_W
 from piel.materials.thermal_conductivity.utils import get_thermal_conductivity_fit
 from piel.types.electrical.cables import (
@@ -7,6 +8,10 @@ from piel.types.electrical.cables import (
 )
 from piel.types.materials import MaterialReferenceType
 from piel.types.physical import TemperatureRangeTypes
+from piel.types import ArrayTypes
+from ..thermal import calculate_cables_heat_transfer_matrix
+
+COAXIAL_CABLE_MATERIAL_NAMES = ("core", "sheath", "dielectric")
 
 
 def calculate_coaxial_cable_heat_transfer(
@@ -32,12 +37,20 @@ def calculate_coaxial_cable_heat_transfer(
         CoaxialCableHeatTransferType: The heat transfer of the cable.
     """
     if material_class is not None:
-        provided_materials = material_class.supplied_parameters()
+        provided_materials = [
+            material_name
+            for material_name in COAXIAL_CABLE_MATERIAL_NAMES
+            if getattr(material_class, material_name) is not None
+        ]
     elif material_class is None:
         material_class = CoaxialCableMaterialSpecificationType(
             core=core_material, sheath=sheath_material, dielectric=dielectric_material
         )
-        provided_materials = material_class.supplied_parameters()
+        provided_materials = [
+            material_name
+            for material_name in COAXIAL_CABLE_MATERIAL_NAMES
+            if getattr(material_class, material_name) is not None
+        ]
     else:
         raise ValueError("No material class or material parameters provided.")
 
@@ -63,3 +76,32 @@ def calculate_coaxial_cable_heat_transfer(
     return CoaxialCableHeatTransferType(
         **heat_transfer_parameters,
     )
+
+
+def calculate_coaxial_cables_heat_transfer_matrix(
+    temperature_stages_K: ArrayTypes,
+    geometry_classes: list[CoaxialCableGeometryType],
+    material_classes: list[CoaxialCableMaterialSpecificationType],
+    num: int = 10000,
+) -> dict[str, np.ndarray]:
+    """
+    Calculate the heat load of many coaxial cables between many pairs of temperature stages in a single vectorized pass,
+    with precomputed thermal conductivity integrals rather than one integration per cable and material.
+
+    Args:
+        temperature_stages_K: The ``(n_stages, 2)`` pairs of temperatures in Kelvin each cable spans.
+        geometry_classes: The geometry of each of the ``n_cables`` cables.
+        material_classes: The material of each cable.
+        num: The number of temperature grid points of the thermal conductivity integrals.
+
+    Returns:
+        dict[str, np.ndarray]: The ``(n_cables, n_stages)`` heat transfer matrix in watts of each material and their
+        ``total``.
+    """
+    return calculate_cables_heat_transfer_matrix(
+        temperature_stages_K=temperature_stages_K,
+        geometry_classes=geometry_classes,
+        material_classes=material_classes,
+        material_names=COAXIAL_CABLE_MATERIAL_NAMES,
+        num=num,
+    )
@@ -0,0 +1,82 @@
+import numpy as np
+from piel.models.physical.thermal import calculate_heat_transfer_1d_matrix_W
+from piel.types import ArrayTypes
+from piel.types.electrical.cables import (
+    CoaxialCableGeometryType,
+    CoaxialCableMaterialSpecificationType,
+    DCCableGeometryType,
+    DCCableMaterialSpecificationType,
+)
+
+__all__ = ["calculate_cables_heat_transfer_matrix"]
+
+
+def calculate_cables_heat_transfer_matrix(
+    temperature_stages_K: ArrayTypes,
+    geometry_classes: list[CoaxialCableGeometryType | DCCableGeometryType],
+    material_classes: list[
+        CoaxialCableMaterialSpecificationType | DCCableMaterialSpecificationType
+    ],
+    material_names: tuple[str, ...],
+    num: int = 10000,
+) -> dict[str, np.ndarray]:
+    """
+    Calculate the heat transfer of many cables between many pairs of temperature stages in a single vectorized pass.
+    Every supplied material of every cable is treated as a conductor across the total cross-sectional area of the
+    cable, as in the single cable calculations.
+
+    Args:
+        temperature_stages_K: The ``(n_stages, 2)`` pairs of temperatures in Kelvin each cable spans.
+        geometry_classes: The geometry of each of the ``n_cables`` cables.
+        material_classes: The material specification of each cable.
+        material_names: The material fields of the material specifications, such as ``("core", "sheath")``.
+        num: The number of temperature grid points of the thermal conductivity integrals.
+
+    Returns:
+        dict[str, np.ndarray]: The ``(n_cables, n_stages)`` heat transfer matrix in watts of each material name,
+        zero where a cable does not have the material, and their ``total``.
+    """
+    if len(geometry_classes) != len(material_classes):
+        raise ValueError(
+            "geometry_classes and material_classes must be of the same length."
+        )
+
+    temperature_stages_K = np.asarray(temperature_stages_K, dtype=float).reshape(-1, 2)
+    cable_indexes = []
+    material_name_indexes = []
+    material_references = []
+    for cable_index, material_class in enumerate(material_classes):
+        for material_name_index, material_name in enumerate(material_names):
+            material_reference = getattr(material_class, material_name)
+            if material_reference is not None:
+                cable_indexes.append(cable_index)
+                material_name_indexes.append(material_name_index)
+                material_references.append(material_reference)
+
+    cable_indexes = np.array(cable_indexes, dtype=np.int64)
+    material_name_indexes = np.array(material_name_indexes, dtype=np.int64)
+    cross_sectional_area_m2 = np.array(
+        [geometry.total_cross_sectional_area_m2 for geometry in geometry_classes],
+        dtype=float,
+    )
+    length_m = np.array(
+        [geometry.length_m for geometry in geometry_classes], dtype=float
+    )
+
+    conductors_heat_transfer_W = calculate_heat_transfer_1d_matrix_W(
+        temperature_stages_K=temperature_stages_K,
+        material_references=material_references,
+        cross_sectional_area_m2=cross_sectional_area_m2[cable_indexes],
+        length_m=length_m[cable_indexes],
+        num=num,
+    )
+
+    heat_transfer_matrices = np.zeros(
+        (len(material_names), len(material_classes), len(temperature_stages_K))
+    )
+    heat_transfer_matrices[material_name_indexes, cable_indexes] = (
+        conductors_heat_transfer_W
+    )
+    heat_transfer_parameters = dict(zip(material_names, heat_transfer_matrices))
+    heat_transfer_parameters["total"] = heat_transfer_matrices.sum(axis=0)
+    return heat_transfer_parameters
@@ -1,8 +1,12 @@
+import functools
 import numpy as np
 from piel.types.physical import TemperatureRangeTypes
+from piel.types.materials import MaterialReferencesTypes
 from piel.types import ArrayTypes
 
 __all__ = [
+    "calculate_heat_transfer_1d_matrix_W",
+    "compose_thermal_conductivity_integral",
     "heat_transfer_1d_W",
 ]
 
@@ -49,3 +53,137 @@ def heat_transfer_1d_W(
         thermal_conductivity_fit, temperature_range_K
     )
     return cross_sectional_area_m2 * thermal_conductivity_integral_area / length_m
+
+
+@functools.lru_cache(maxsize=32)
+def _compose_thermal_conductivity_integral(
+    material_references: tuple,
+    minimum_temperature_K: float,
+    maximum_temperature_K: float,
+    num: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    from piel.materials.thermal_conductivity import calculate_thermal_conductivity
+
+    temperature_K = np.linspace(minimum_temperature_K, maximum_temperature_K, num=num)
+    thermal_conductivity = calculate_thermal_conductivity(
+        temperature_K, material_references
+    )
+    # Cumulative trapezoidal integral of k(T) from the minimum temperature
+    thermal_conductivity_integral = np.zeros_like(thermal_conductivity)
+    np.cumsum(
+        (thermal_conductivity[:, 1:] + thermal_conductivity[:, :-1])
+        * np.diff(temperature_K)
+        / 2,
+        axis=1,
+        out=thermal_conductivity_integral[:, 1:],
+    )
+    temperature_K.flags.writeable = False
+    thermal_conductivity_integral.flags.writeable = False
+    return temperature_K, thermal_conductivity_integral
+
+
+def compose_thermal_conductivity_integral(
+    material_references: MaterialReferencesTypes,
+    temperature_limits_K: tuple[float, float],
+    num: int = 10000,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate the cumulative integral of the thermal conductivity of each material over a shared temperature grid.
+    The integral between any two temperatures within the limits is then the difference of two interpolated values.
+    The integrals are cached, so they are only calculated once per set of materials and temperature limits.
+
+    .. math::
+
+        K(T) = \\int_{T_{min}}^{T} k(T') dT'
+
+    Args:
+        material_references: The materials to integrate.
+        temperature_limits_K: The minimum and maximum temperatures of the grid in Kelvin.
+        num: The number of temperature grid points.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The temperature grid in Kelvin and the read-only cumulative integrals in W/m
+        with shape ``(len(material_references), num)``.
+    """
+    return _compose_thermal_conductivity_integral(
+        tuple(tuple(material_reference) for material_reference in material_references),
+        float(temperature_limits_K[0]),
+        float(temperature_limits_K[1]),
+        num,
+    )
+
+
+def calculate_heat_transfer_1d_matrix_W(
+    temperature_stages_K: ArrayTypes,
+    material_references: MaterialReferencesTypes,
+    cross_sectional_area_m2: ArrayTypes,
+    length_m: ArrayTypes,
+    num: int = 10000,
+) -> np.ndarray:
+    """
+    Calculate the heat transfer in watts of many 1D conductors between many pairs of temperature stages in a single
+    vectorized pass. The integral of the thermal conductivity of each distinct material is precomputed once with
+    ``compose_thermal_conductivity_integral``, so each conductor and stage pair only costs a lookup.
+
+    .. math::
+
+        q_{ij} = \\frac{A_i}{L_i} \\left( K_i(T_{j,2}) - K_i(T_{j,1}) \\right)
+
+    Args:
+        temperature_stages_K: The ``(n_stages, 2)`` pairs of temperatures in Kelvin each conductor spans.
+        material_references: The material of each of the ``n_conductors`` conductors.
+        cross_sectional_area_m2: The cross-sectional area of each conductor.
+        length_m: The length of each conductor.
+        num: The number of temperature grid points of the thermal conductivity integrals.
+
+    Returns:
+        np.ndarray: The ``(n_conductors, n_stages)`` heat transfer matrix in watts.
+    """
+    temperature_stages_K = np.asarray(temperature_stages_K, dtype=float).reshape(-1, 2)
+    cross_sectional_area_m2 = np.broadcast_to(
+        np.asarray(cross_sectional_area_m2, dtype=float), (len(material_references),)
+    )
+    length_m = np.broadcast_to(
+        np.asarray(length_m, dtype=float), (len(material_references),)
+    )
+
+    material_references = [
+        tuple(material_reference) for material_reference in material_references
+    ]
+    unique_material_references = list(dict.fromkeys(material_references))
+    unique_material_index = {
+        material_reference: index
+        for index, material_reference in enumerate(unique_material_references)
+    }
+    material_indexes = np.array(
+        [
+            unique_material_index[material_reference]
+            for material_reference in material_references
+        ],
+        dtype=np.int64,
+    )
+
+    if len(unique_material_references) == 0 or temperature_stages_K.size == 0:
+        return np.zeros((len(material_references), len(temperature_stages_K)))
+
+    temperature_K, thermal_conductivity_integral = (
+        compose_thermal_conductivity_integral(
+            unique_material_references,
+            temperature_limits_K=(
+                temperature_stages_K.min(),
+                temperature_stages_K.max(),
+            ),
+            num=num,
+        )
+    )
+    # (n_materials, n_stages) integral of each distinct material between each stage pair
+    stage_integral = np.array(
+        [
+            np.interp(temperature_stages_K[:, 1], temperature_K, integral)
+            - np.interp(temperature_stages_K[:, 0], temperature_K, integral)
+            for integral in thermal_conductivity_integral
+        ]
+    )
+    return (cross_sectional_area_m2 / length_m)[:, np.newaxis] * stage_integral[
+        material_indexes
+    ]
@@ -1,12 +1,88 @@
+import collections
+import concurrent.futures
+import json
+import pathlib
+import re
+import pandas as pd
 from ....file_system import return_path, get_files_recursively_in_directory
+from ..utils import find_all_design_runs
+from .sta_rpt import (
+    compose_timing_data_table,
+    get_frame_lines_data,
+    get_frame_meta_data,
+)
 
 __all__ = [
+    "clear_run_report_cache",
     "filter_timing_sta_files",
     "filter_power_sta_files",
     "get_all_timing_sta_files",
     "get_all_power_sta_files",
+    "get_all_run_report_files",
+    "read_power_sta_file",
+    "read_run_report",
+    "read_all_design_runs_reports",
 ]
 
+RUN_REPORT_COLUMNS = [
+    "report_type",
+    "report_file",
+    "item",
+    "metric",
+    "value",
+]
+POWER_STA_COLUMN_NAMES = [
+    "internal_power",
+    "switching_power",
+    "leakage_power",
+    "total_power",
+]
+_POWER_STA_ROW_PATTERN = re.compile(
+    r"^\s*(?P<group>[A-Za-z_][\w ]*?)\s+"
+    + r"\s+".join(
+        rf"(?P<{column}>[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)"
+        for column in POWER_STA_COLUMN_NAMES
+    )
+    + r"(?:\s+(?P<percentage>[-+]?\d*\.?\d+)%)?\s*$"
+)
+
+RUN_REPORT_CACHE_MAXSIZE = 4096
+
+# Least recently used parsed reports first, keyed by ``(resolved path, report_type)`` with the ``(modification time,
+# size)`` signature they were parsed at, so unchanged reports are never parsed twice in the same session and a modified
+# report replaces its stale entry.
+_RUN_REPORT_CACHE: collections.OrderedDict[
+    tuple[str, str], tuple[tuple[int, int], pd.DataFrame]
+] = collections.OrderedDict()
+
+
+def _get_cached_run_report(
+    report_key: tuple[str, str], file_signature: tuple[int, int]
+) -> pd.DataFrame | None:
+    """
+    Returns the cached report if it was parsed at the current file signature, or None.
+    """
+    cached_report = _RUN_REPORT_CACHE.get(report_key)
+    if cached_report is None or cached_report[0] != file_signature:
+        return None
+    _RUN_REPORT_CACHE.move_to_end(report_key)
+    return cached_report[1]
+
+
+def _cache_run_report(
+    report_key: tuple[str, str],
+    file_signature: tuple[int, int],
+    report_rows: pd.DataFrame,
+) -> None:
+    """
+    Caches a parsed report, replacing any stale entry of the same report and evicting the least recently used reports
+    beyond ``RUN_REPORT_CACHE_MAXSIZE`` entries.
+    """
+    _RUN_REPORT_CACHE[report_key] = (file_signature, report_rows)
+    _RUN_REPORT_CACHE.move_to_end(report_key)
+    while len(_RUN_REPORT_CACHE) > RUN_REPORT_CACHE_MAXSIZE:
+        _RUN_REPORT_CACHE.popitem(last=False)
+
 
 def filter_timing_sta_files(file_list):
     """
@@ -72,3 +148,303 @@ def get_all_power_sta_files(run_directory):
     all_rpt_files_list = get_files_recursively_in_directory(run_directory, "rpt")
     power_sta_files_list = filter_power_sta_files(all_rpt_files_list)
     return power_sta_files_list
+
+
+def get_all_run_report_files(run_directory) -> dict[str, list[str]]:
+    """
+    List the timing, power and metrics report files of a run from a single walk of the run directory.
+
+    Args:
+        run_directory (PathTypes): The run directory to list the report files of.
+
+    Returns:
+        run_report_files (dict): Dictionary of the ``timing``, ``power`` and ``metrics`` report file lists.
+    """
+    run_directory = return_path(run_directory)
+    all_rpt_files_list = get_files_recursively_in_directory(run_directory, "rpt")
+    metrics_files_list = [
+        str(file_path.resolve())
+        for file_path in [
+            run_directory / "final" / "metrics.json",
+            run_directory / "reports" / "metrics.json",
+        ]
+        if file_path.exists()
+    ]
+    return {
+        "timing": filter_timing_sta_files(all_rpt_files_list),
+        "power": filter_power_sta_files(all_rpt_files_list),
+        "metrics": metrics_files_list,
+    }
+
+
+def read_power_sta_file(file_path) -> pd.DataFrame:
+    """
+    Read the power groups of an OpenSTA ``report_power`` file.
+
+    Args:
+        file_path (PathTypes): Path to the power report file.
+
+    Returns:
+        power_data (pd.DataFrame): DataFrame with one row per power group and the internal, switching, leakage and
+        total power in Watts, and the percentage of the total power.
+    """
+    file_path = return_path(file_path)
+    power_data = (
+        pd.Series(file_path.read_text().splitlines(), dtype=object)
+        .str.extract(_POWER_STA_ROW_PATTERN)
+        .dropna(subset=POWER_STA_COLUMN_NAMES)
+        .reset_index(drop=True)
+    )
+    power_data[POWER_STA_COLUMN_NAMES + ["percentage"]] = power_data[
+        POWER_STA_COLUMN_NAMES + ["percentage"]
+    ].astype(float)
+    return power_data
+
+
+def _compose_timing_report_rows(file_path: str) -> pd.DataFrame:
+    """
+    Calculates the propagation delay between the start and end point of every frame of a timing report.
+    """
+    file_lines_data = get_frame_lines_data(file_path)
+    start_point_name, end_point_name, _, _ = get_frame_meta_data(file_lines_data)
+    timing_data = compose_timing_data_table(file_lines_data)
+    timing_data["Time"] = pd.to_numeric(timing_data["Time"], errors="coerce")
+
+    input_time = (
+        timing_data[timing_data["net_type"] == "in"].groupby("frame_id")["Time"].first()
+    )
+    output_time = (
+        timing_data[timing_data["net_type"] == "out"].groupby("frame_id")["Time"].last()
+    )
+    propagation_delay = (output_time - input_time).dropna()
+
+    frame_points = pd.DataFrame(
+        {
+            "start_point": start_point_name[0].to_numpy(),
+            "end_point": end_point_name[0].to_numpy(),
+        }
+    )
+    frame_id = propagation_delay.index.to_numpy()
+    frame_id = frame_id[frame_id < len(frame_points)]
+    return pd.DataFrame(
+        {
+            "item": frame_points["start_point"].to_numpy()[frame_id]
+            + " -> "
+            + frame_points["end_point"].to_numpy()[frame_id],
+            "metric": "propagation_delay",
+            "value": propagation_delay.loc[frame_id].to_numpy(),
+        }
+    )
+
+
+def _compose_power_report_rows(file_path: str) -> pd.DataFrame:
+    """
+    Melts the power groups of a power report into one row per group and power type.
+    """
+    power_data = read_power_sta_file(file_path)
+    return power_data.melt(
+        id_vars="group",
+        value_vars=POWER_STA_COLUMN_NAMES,
+        var_name="metric",
+        value_name="value",
+    ).rename(columns={"group": "item"})
+
+
+def _compose_metrics_report_rows(file_path: str) -> pd.DataFrame:
+    """
+    Flattens the numeric entries of a ``metrics.json`` file into one row per metric.
+    """
+    with open(file_path, "r") as file:
+        metrics_dictionary = json.load(file)
+    metrics = pd.Series(metrics_dictionary, dtype=object)
+    values = pd.to_numeric(metrics, errors="coerce").dropna()
+    return pd.DataFrame(
+        {
+            "item": "",
+            "metric": values.index.to_numpy(dtype=object),
+            "value": values.to_numpy(dtype=float),
+        }
+    )
+
+
+_RUN_REPORT_PARSERS = {
+    "timing": _compose_timing_report_rows,
+    "power": _compose_power_report_rows,
+    "metrics": _compose_metrics_report_rows,
+}
+
+
+def _read_run_report(file_path: str, report_type: str) -> pd.DataFrame:
+    """
+    Parses a single report into the tidy run report columns. Runs in the worker processes.
+    """
+    report_rows = _RUN_REPORT_PARSERS[report_type](file_path)
+    report_rows.insert(0, "report_file", file_path)
+    report_rows.insert(0, "report_type", report_type)
+    return report_rows[RUN_REPORT_COLUMNS]
+
+
+def _get_file_signature(file_path: str) -> tuple[int, int]:
+    file_stat = pathlib.Path(file_path).stat()
+    return file_stat.st_mtime_ns, file_stat.st_size
+
+
+def clear_run_report_cache() -> None:
+    """
+    Clear the cache of parsed run reports.
+    """
+    _RUN_REPORT_CACHE.clear()
+
+
+def read_run_report(
+    file_path,
+    report_type: str,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """
+    Read a timing, power or metrics report into a tidy table with one row per value. The parsed report is cached
+    with its modification time and size, so it is only parsed again if the file changes, and the least recently used
+    reports are evicted beyond ``RUN_REPORT_CACHE_MAXSIZE`` entries. A copy of the cached report is returned, so
+    modifying it does not affect later reads.
+
+    Args:
+        file_path (PathTypes): Path to the report file.
+        report_type (str): One of ``timing``, ``power`` or ``metrics``.
+        use_cache (bool): Whether to use the parsed report cache. Defaults to True.
+
+    Returns:
+        report_rows (pd.DataFrame): DataFrame with the ``report_type``, ``report_file``, ``item``, ``metric`` and
+        ``value`` columns.
+    """
+    if report_type not in _RUN_REPORT_PARSERS:
+        raise ValueError(
+            f"report_type must be one of {list(_RUN_REPORT_PARSERS)}, got {report_type}."
+        )
+    file_path = str(return_path(file_path).resolve())
+    report_key = (file_path, report_type)
+    file_signature = _get_file_signature(file_path)
+
+    if use_cache:
+        cached_report = _get_cached_run_report(report_key, file_signature)
+        if cached_report is not None:
+            return cached_report.copy()
+
+    report_rows = _read_run_report(file_path, report_type)
+    if use_cache:
+        _cache_run_report(report_key, file_signature, report_rows.copy())
+    return report_rows
+
+
+def read_all_design_runs_reports(
+    design_directory_list: list,
+    run_name: str | None = None,
+    report_types: tuple[str, ...] = ("timing", "power", "metrics"),
+    parallel: bool = True,
+    max_workers: int | None = None,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """
+    Aggregate the timing, power and metrics reports of all the OpenLane runs of many designs into a single tidy
+    table. The runs are discovered with ``find_all_design_runs`` and the reports that are not already cached are
+    parsed concurrently in a process pool.
+
+    Usage:
+
+        ```python
+        from piel.tools.openlane import read_all_design_runs_reports
+
+        reports = read_all_design_runs_reports(["designs/inverter_0", "designs/inverter_1"])
+        reports.pivot_table(index=["design_directory", "run_directory"], columns="metric", values="value")
+        ```
+
+    Args:
+        design_directory_list (list[PathTypes]): The design directories containing the ``runs`` subdirectory.
+        run_name (str, optional): The name of the run to read in each design. Defaults to all the runs.
+        report_types (tuple[str, ...]): The report types to read. Defaults to ``timing``, ``power`` and ``metrics``.
+        parallel (bool): Whether to parse the reports in a process pool. Defaults to True.
+        max_workers (int, optional): The maximum number of worker processes. Defaults to the number of processors.
+        use_cache (bool): Whether to reuse the reports parsed since they were last modified. Defaults to True.
+
+    Returns:
+        run_reports (pd.DataFrame): DataFrame with one row per reported value, with the ``design_directory``,
+        ``run_directory``, ``run_version``, ``report_type``, ``report_file``, ``item``, ``metric`` and ``value``
+        columns.
+    """
+    for report_type in report_types:
+        if report_type not in _RUN_REPORT_PARSERS:
+            raise ValueError(
+                f"report_type must be one of {list(_RUN_REPORT_PARSERS)}, got {report_type}."
+            )
+
+    report_keys = []
+    report_run_data = []
+    for design_directory in design_directory_list:
+        design_directory = return_path(design_directory)
+        sorted_runs_per_version = find_all_design_runs(
+            design_directory=design_directory, run_name=run_name
+        )
+        for run_version, run_directory_list in sorted_runs_per_version.items():
+            for run_directory in run_directory_list:
+                run_report_files = get_all_run_report_files(run_directory)
+                for report_type in report_types:
+                    for file_path in sorted(run_report_files[report_type]):
+                        report_keys.append(
+                            (str(pathlib.Path(file_path).resolve()), report_type)
+                        )
+                        report_run_data.append(
+                            (str(design_directory), str(run_directory), run_version)
+                        )
+
+    file_signatures = [_get_file_signature(file_path) for file_path, _ in report_keys]
+    report_rows_list = [None] * len(report_keys)
+    missing_report_indexes = []
+    for index, (report_key, file_signature) in enumerate(
+        zip(report_keys, file_signatures)
+    ):
+        cached_report = (
+            _get_cached_run_report(report_key, file_signature) if use_cache else None
+        )
+        if cached_report is not None:
+            report_rows_list[index] = cached_report
+        else:
+            missing_report_indexes.append(index)
+
+    missing_report_keys = [report_keys[index] for index in missing_report_indexes]
+    if parallel and len(missing_report_keys) > 1:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            missing_report_rows = list(
+                executor.map(_read_run_report, *zip(*missing_report_keys))
+            )
+    else:
+        missing_report_rows = [
+            _read_run_report(file_path, report_type)
+            for file_path, report_type in missing_report_keys
+        ]
+
+    for index, report_rows in zip(missing_report_indexes, missing_report_rows):
+        report_rows_list[index] = report_rows
+        if use_cache:
+            _cache_run_report(report_keys[index], file_signatures[index], report_rows)
+
+    run_reports_list = []
+    for report_rows, (design_directory, run_directory, run_version) in zip(
+        report_rows_list, report_run_data
+    ):
+        run_reports_list.append(
+            report_rows.assign(
+                design_directory=design_directory,
+                run_directory=run_directory,
+                run_version=run_version,
+            )
+        )
+
+    run_report_columns = [
+        "design_directory",
+        "run_directory",
+        "run_version",
+    ] + RUN_REPORT_COLUMNS
+    if len(run_reports_list) == 0:
+        return pd.DataFrame(columns=run_report_columns)
+    return pd.concat(run_reports_list, ignore_index=True)[run_report_columns]
@@ -1,3 +1,5 @@
+import io
+import numpy as np
 import pandas as pd
 import pathlib
 from piel.file_system import return_path
@@ -13,6 +15,7 @@ __all__ = [
     "calculate_propagation_delay_from_file",
     "calculate_propagation_delay_from_timing_data",
     "configure_timing_data_rows",
+    "compose_timing_data_table",
     "configure_frame_id",
     "filter_timing_data_by_net_name_and_type",
     "get_frame_meta_data",
@@ -20,6 +23,27 @@ __all__ = [
     "get_frame_timing_data",
     "get_all_timing_data_from_file",
     "read_sta_rpt_fwf_file",
+    "read_sta_rpt_timing_data_table",
+    "split_timing_data_table_by_frame",
+]
+
+STA_RPT_COLUMN_SPECIFICATIONS = [
+    (0, 6),
+    (6, 14),
+    (14, 22),
+    (22, 30),
+    (30, 38),
+    (38, 40),
+    (40, 100),
+]
+STA_RPT_COLUMN_NAMES = [
+    "Fanout",
+    "Cap",
+    "Slew",
+    "Delay",
+    "Time",
+    "Direction",
+    "Description",
 ]
 
 
@@ -104,7 +128,10 @@ def calculate_propagation_delay_from_file(
         path_type_name,
     ) = get_frame_meta_data(file_lines_data)
 
-    frame_timing_data = get_all_timing_data_from_file(file_path)
+    # The timing data is parsed from the same lines rather than reading the file again
+    frame_timing_data = split_timing_data_table_by_frame(
+        compose_timing_data_table(file_lines_data), maximum_frame_amount
+    )
     propagation_delay = {}
     for frame_id in range(maximum_frame_amount):
         if len(start_point_name.values) > frame_id:
@@ -116,6 +143,113 @@ def calculate_propagation_delay_from_file(
     return propagation_delay
 
 
+def compose_timing_data_table(
+    file_lines_data: pd.DataFrame,
+):
+    """
+    Parse the timing files of all the frames in a single vectorized pass. The timing lines of each frame are the
+    non-blank lines between its first and last ``---------`` delimiter, which are identified with a line index and
+    parsed together as a single fixed width table.
+
+    Args:
+        file_lines_data (pd.DataFrame): Dataframe containing the file lines, with the frame IDs from ``configure_frame_id``
+
+    Returns:
+        timing_data (pd.DataFrame): DataFrame containing the timing files of all the frames, keyed by the ``frame_id`` column
+    """
+    frame_id = file_lines_data["frame_id"].to_numpy()
+    timing_data_line = file_lines_data["timing_data_line"].to_numpy()
+    line_index = np.arange(len(file_lines_data))
+
+    # First and last timing delimiter line of each frame, the frames are offset by one to include frame -1
+    frame_amount = int(frame_id.max()) + 2 if len(frame_id) > 0 else 0
+    first_delimiter_index = np.full(frame_amount, len(file_lines_data))
+    last_delimiter_index = np.full(frame_amount, -1)
+    np.minimum.at(
+        first_delimiter_index,
+        frame_id[timing_data_line] + 1,
+        line_index[timing_data_line],
+    )
+    np.maximum.at(
+        last_delimiter_index,
+        frame_id[timing_data_line] + 1,
+        line_index[timing_data_line],
+    )
+
+    is_timing_row = (
+        (frame_id >= 0)
+        & (line_index > first_delimiter_index[frame_id + 1])
+        & (line_index < last_delimiter_index[frame_id + 1])
+        & (file_lines_data["lines"].str.strip() != "").to_numpy()
+    )
+
+    timing_lines = file_lines_data["lines"].to_numpy()[is_timing_row]
+    if len(timing_lines) > 0:
+        timing_data = pd.read_fwf(
+            io.StringIO("\n".join(line.rstrip("\n") for line in timing_lines)),
+            colspecs=STA_RPT_COLUMN_SPECIFICATIONS,
+            names=STA_RPT_COLUMN_NAMES,
+            header=None,
+            skip_blank_lines=False,
+        )
+    else:
+        timing_data = pd.DataFrame(columns=STA_RPT_COLUMN_NAMES)
+
+    timing_data.insert(0, "frame_id", frame_id[is_timing_row])
+    timing_data["net_type"] = timing_data["Description"].str.extract(
+        r"\(([^()]+)\)", expand=False
+    )
+    timing_data["net_name"] = timing_data["Description"].str.extract(
+        r"(.*?)\s?\(.*?\)", expand=False
+    )
+    return timing_data
+
+
+def split_timing_data_table_by_frame(
+    timing_data: pd.DataFrame,
+    maximum_frame_amount: int,
+):
+    """
+    Split a frame-keyed timing files table into one DataFrame per frame.
+
+    Args:
+        timing_data (pd.DataFrame): DataFrame containing the timing files of all the frames
+        maximum_frame_amount (int): Maximum number of frames in the file
+
+    Returns:
+        frame_timing_data (dict): Dictionary containing the timing files for each frame
+    """
+    frame_ids = timing_data["frame_id"].to_numpy()
+    # The table rows are ordered by frame, so each frame is a contiguous slice
+    frame_boundaries = np.searchsorted(frame_ids, np.arange(maximum_frame_amount + 1))
+    frame_timing_data = {}
+    for frame_id in range(maximum_frame_amount):
+        frame_timing_data[frame_id] = (
+            timing_data.iloc[
+                frame_boundaries[frame_id] : frame_boundaries[frame_id + 1]
+            ]
+            .drop(columns="frame_id")
+            .reset_index(drop=True)
+        )
+    return frame_timing_data
+
+
+def read_sta_rpt_timing_data_table(
+    file_path: str | pathlib.Path,
+):
+    """
+    Read the file once and return the timing files of all the frames in a single frame-keyed table.
+
+    Args:
+        file_path (str | pathlib.Path): Path to the file
+
+    Returns:
+        timing_data (pd.DataFrame): DataFrame containing the timing files of all the frames, keyed by the ``frame_id`` column
+    """
+    file_lines_data = get_frame_lines_data(file_path)
+    return compose_timing_data_table(file_lines_data)
+
+
 def configure_timing_data_rows(
     file_lines_data: pd.DataFrame,
 ):
@@ -169,18 +303,9 @@ def configure_frame_id(
     file_lines_data["timing_data_line"] = file_lines_data.lines.str.contains(
         "---------"
     )
-    frame_data = []
-    frame_id_counter = 0
-    parity_counter = 1
-    for delimiter in file_lines_data["delimiters_line"]:
-        if delimiter:
-            if parity_counter % 2:
-                frame_id_counter += 1
-                parity_counter = 0
-            else:
-                parity_counter += 1
-        frame_data.append(frame_id_counter - 1)
-    file_lines_data["frame_id"] = frame_data
+    # Every pair of delimiter lines opens a new frame, and the lines before the first delimiter belong to frame -1
+    delimiter_count = file_lines_data["delimiters_line"].to_numpy().cumsum()
+    file_lines_data["frame_id"] = (delimiter_count + 1) // 2 - 1
     return file_lines_data
 
 
@@ -286,7 +411,8 @@ def get_all_timing_data_from_file(
     file_path: str | pathlib.Path,
 ):
     """
-    Calculate the timing files for each frame in the file
+    Calculate the timing files for each frame in the file. The file is read once and the timing files of all the
+    frames are parsed together with ``compose_timing_data_table``.
 
     Args:
         file_path (str | pathlib.Path): Path to the file
@@ -296,13 +422,8 @@ def get_all_timing_data_from_file(
     """
     file_lines_data = get_frame_lines_data(file_path)
     maximum_frame_amount = calculate_max_frame_amount(file_lines_data)
-    frame_meta_data = configure_timing_data_rows(file_lines_data)
-    frame_timing_data = {}
-    for frame_id in range(maximum_frame_amount):
-        frame_timing_data[frame_id] = get_frame_timing_data(
-            file_path, frame_meta_data, frame_id
-        )
-    return frame_timing_data
+    timing_data_table = compose_timing_data_table(file_lines_data)
+    return split_timing_data_table_by_frame(timing_data_table, maximum_frame_amount)
 
 
 def read_sta_rpt_fwf_file(
@@ -324,9 +445,9 @@ def read_sta_rpt_fwf_file(
     file = return_path(file)
     file_data = pd.read_fwf(
         str(file.resolve()),
-        colspecs=[(0, 6), (6, 14), (14, 22), (22, 30), (30, 38), (38, 40), (40, 100)],
+        colspecs=STA_RPT_COLUMN_SPECIFICATIONS,
         skiprows=frame_meta_data[frame_id]["start_rows_skip"],
         skipfooter=frame_meta_data[frame_id]["end_rows_skip"],
-        names=["Fanout", "Cap", "Slew", "Delay", "Time", "Direction", "Description"],
+        names=STA_RPT_COLUMN_NAMES,
     )
     return file_data
@@ -55,7 +55,7 @@ def find_all_design_runs(
         print(run_path)
         if run_path in all_runs_list:
             # Check that the run exists
-            pass
+            sorted_runs_per_version = sort_design_runs([run_path])
         else:
             raise ValueError(
                 "Run: " + str(run_path) + "not found in " + str(all_runs_list)
@@ -4,6 +4,7 @@ from .fock import (
     convert_qobj_to_jax,
     convert_output_type,
     fock_state_nonzero_indexes,
+    fock_state_to_photon_number_tuple,
     fock_state_to_photon_number_factorial,
     fock_states_at_mode_index,
     fock_states_only_individual_modes,
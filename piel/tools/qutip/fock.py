@@ -98,6 +98,27 @@ def fock_state_nonzero_indexes(fock_state: Any) -> tuple[int]:
     return tuple(nonzero_indexes)
 
 
+def fock_state_to_photon_number_tuple(fock_state: Any) -> tuple[int, ...]:
+    """
+    This function returns the photon number of each mode of a Fock state as a tuple of integers. This is a hashable
+    representation of the Fock state that can be used to index precomputed Fock state tables.
+
+    Args:
+        fock_state (qutip.Qobj): A QuTip QObj representation of the Fock state.
+
+    Returns:
+        tuple[int, ...]: The photon number of each mode of the Fock state.
+    """
+    import qutip
+
+    if isinstance(fock_state, qutip.Qobj):
+        fock_state = convert_qobj_to_jax(fock_state)
+
+    return tuple(
+        np.rint(np.real(np.asarray(fock_state))).astype(int).reshape(-1).tolist()
+    )
+
+
 def fock_states_at_mode_index(
     mode_amount: int,
     target_mode_index: int,
@@ -64,7 +64,7 @@ def subunitary_selection_on_index(
         rows_index = jnp.asarray(rows_index)
 
     if type(columns_index) is tuple:
-        rows_index = jnp.asarray(columns_index)
+        columns_index = jnp.asarray(columns_index)
 
     unitary_matrix_row_selection = unitary_matrix.at[rows_index, :].get()
     unitary_matrix_row_column_selection = unitary_matrix_row_selection.at[
@@ -1,3 +1,11 @@
+from .cache import (
+    clear_sax_circuit_cache,
+    compose_sax_circuit_cache_key,
+    enable_sax_circuit_disk_cache,
+    get_cached_sax_circuit,
+    hash_sax_models,
+    hash_sax_netlist,
+)
 from .netlist import (
     address_value_dictionary_to_function_parameter_dictionary,
     compose_recursive_instance_location,
@@ -5,4 +13,10 @@ from .netlist import (
     get_netlist_instances_by_prefix,
     get_matched_model_recursive_netlist_instances,
 )
-from .utils import get_sdense_ports_index, sax_to_s_parameters_standard_matrix, snet
+from .utils import (
+    convert_dense_network_transmission_to_sdense,
+    convert_sdense_to_dense_network_transmission,
+    get_sdense_ports_index,
+    sax_to_s_parameters_standard_matrix,
+    snet,
+)
@@ -0,0 +1,310 @@
+"""
+This module caches the compiled ``sax`` circuits, so that evaluating an unchanged netlist with an unchanged model
+dictionary reuses the same circuit function and its ``jax.jit`` traces rather than recompiling it.
+"""
+
+import collections
+import functools
+import hashlib
+import json
+import pathlib
+import types
+from typing import Any, Callable
+
+SAX_CIRCUIT_CACHE_MAXSIZE = 32
+
+# Least recently used circuits first, keyed by ``compose_sax_circuit_cache_key``
+_SAX_CIRCUIT_CACHE: collections.OrderedDict[str, tuple[Callable, Any]] = (
+    collections.OrderedDict()
+)
+
+
+class _UncacheableValueError(Exception):
+    """
+    Raised when a netlist or model value cannot be described stably, so its circuit must not be cached.
+    """
+
+
+def _describe_array(value: Any) -> list:
+    """
+    Describes an array by its dtype, shape and the hash of its bytes, as its ``repr`` truncates large arrays.
+    """
+    import numpy as np
+
+    array = np.asarray(value)
+    if array.dtype.hasobject:
+        raise _UncacheableValueError(f"Cannot hash the object array {value!r}")
+    return [
+        "array",
+        str(array.dtype),
+        list(array.shape),
+        hashlib.sha256(np.ascontiguousarray(array).tobytes()).hexdigest(),
+    ]
+
+
+def _describe_value(value: Any, seen: set | None = None) -> Any:
+    """
+    Describes a netlist or model value as JSON serialisable data that only depends on its contents.
+
+    Raises:
+        _UncacheableValueError: If the value cannot be described stably.
+    """
+    if seen is None:
+        seen = set()
+
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, complex):
+        return ["complex", value.real, value.imag]
+    if isinstance(value, (list, tuple)):
+        return [
+            type(value).__name__,
+            [_describe_value(value_i, seen) for value_i in value],
+        ]
+    if isinstance(value, dict):
+        return {
+            json.dumps(_describe_value(key, seen), sort_keys=True): _describe_value(
+                value_i, seen
+            )
+            for key, value_i in value.items()
+        }
+    if isinstance(value, types.ModuleType):
+        return ["module", value.__name__]
+    if isinstance(value, type):
+        return ["type", value.__module__, value.__qualname__]
+    if isinstance(value, types.CodeType):
+        return [
+            "code",
+            hashlib.sha256(value.co_code).hexdigest(),
+            _describe_value(value.co_consts, seen),
+            list(value.co_names),
+        ]
+    if all(hasattr(value, attribute) for attribute in ("__array__", "dtype", "shape")):
+        return _describe_array(value)
+    if hasattr(value, "model_dump"):
+        return [
+            "model",
+            type(value).__module__,
+            type(value).__qualname__,
+            _describe_value(value.model_dump(), seen),
+        ]
+    if callable(value):
+        return _describe_model(value, seen)
+    raise _UncacheableValueError(f"Cannot hash {value!r}")
+
+
+def _get_code_global_names(code: types.CodeType) -> set[str]:
+    """
+    Returns the names that a code object and the code objects nested in it may read from the module globals.
+    """
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if isinstance(constant, types.CodeType):
+            names |= _get_code_global_names(constant)
+    return names
+
+
+def _describe_model(model: Any, seen: set | None = None) -> Any:
+    """
+    Describes a model by its identity and configuration, so that equivalent model functions in different
+    processes, such as notebook re-runs or parallel workers, have the same description. The configuration includes
+    the values the model captures in its closure and reads from its module globals.
+
+    Raises:
+        _UncacheableValueError: If the model or its configuration cannot be described stably.
+    """
+    if seen is None:
+        seen = set()
+
+    if isinstance(model, functools.partial):
+        return [
+            "partial",
+            _describe_model(model.func, seen),
+            _describe_value(model.args, seen),
+            _describe_value(model.keywords, seen),
+        ]
+
+    code = getattr(model, "__code__", None)
+    if code is None:
+        raise _UncacheableValueError(f"Cannot hash the model {model!r}")
+
+    description = [
+        getattr(model, "__module__", None),
+        getattr(model, "__qualname__", None),
+    ]
+    if id(model) in seen:
+        # Recursive references are described by name only
+        return description
+    seen.add(id(model))
+
+    try:
+        # Models composed by factories capture their configuration in the closure
+        closure = [
+            _describe_value(cell.cell_contents, seen)
+            for cell in getattr(model, "__closure__", None) or ()
+        ]
+    except ValueError as error:
+        # Closure cells that are not assigned yet
+        raise _UncacheableValueError(f"Cannot hash the model {model!r}") from error
+
+    model_globals = getattr(model, "__globals__", {})
+    global_values = {
+        name: _describe_value(model_globals[name], seen)
+        for name in sorted(_get_code_global_names(code))
+        if name in model_globals
+    }
+
+    return description + [
+        _describe_value(code, seen),
+        _describe_value(getattr(model, "__defaults__", None), seen),
+        _describe_value(getattr(model, "__kwdefaults__", None), seen),
+        closure,
+        global_values,
+    ]
+
+
+def _hash_description(description: Any) -> str:
+    """
+    Computes the hexadecimal SHA-256 hash of a JSON serialisable description.
+    """
+    description_json = json.dumps(description, sort_keys=True)
+    return hashlib.sha256(description_json.encode()).hexdigest()
+
+
+def hash_sax_netlist(netlist: dict) -> str | None:
+    """
+    Computes a stable hash of a flat or recursive ``sax`` netlist, independent of the order of its keys. Arrays in
+    the netlist settings are hashed by their contents.
+
+    Args:
+        netlist (dict): The netlist.
+
+    Returns:
+        str | None: The hexadecimal SHA-256 hash of the netlist, or ``None`` if a netlist value cannot be hashed
+        stably.
+    """
+    try:
+        return _hash_description(_describe_value(netlist))
+    except _UncacheableValueError:
+        return None
+
+
+def hash_sax_models(models: dict) -> str | None:
+    """
+    Computes a stable hash of a ``sax`` model dictionary from the name, code and configuration of each model,
+    including the values each model captures in its closure and reads from its module globals.
+
+    Args:
+        models (dict): The model dictionary.
+
+    Returns:
+        str | None: The hexadecimal SHA-256 hash of the models, or ``None`` if a model cannot be hashed stably.
+    """
+    try:
+        return _hash_description(
+            {model_name: _describe_model(model) for model_name, model in models.items()}
+        )
+    except _UncacheableValueError:
+        return None
+
+
+def compose_sax_circuit_cache_key(netlist: dict, models: dict, **kwargs) -> str | None:
+    """
+    Composes the cache key of a circuit compiled from a netlist, a model dictionary and the ``sax.circuit`` keyword
+    arguments.
+
+    Args:
+        netlist (dict): The netlist.
+        models (dict): The model dictionary.
+        **kwargs: The ``sax.circuit`` keyword arguments.
+
+    Returns:
+        str | None: The hexadecimal SHA-256 cache key, or ``None`` if the circuit cannot be cached because a value
+        cannot be hashed stably.
+    """
+    netlist_hash = hash_sax_netlist(netlist)
+    models_hash = hash_sax_models(models)
+    try:
+        kwargs_description = _describe_value(kwargs)
+    except _UncacheableValueError:
+        return None
+
+    if netlist_hash is None or models_hash is None:
+        return None
+    return _hash_description([netlist_hash, models_hash, kwargs_description])
+
+
+def enable_sax_circuit_disk_cache(cache_directory: str | pathlib.Path) -> pathlib.Path:
+    """
+    Stores the XLA executables of the ``jax.jit`` compiled circuits in ``cache_directory``, so that other processes
+    evaluating the same circuits load them instead of compiling them again.
+
+    The compiled ``sax`` circuit functions themselves are closures that cannot be serialised, so the on-disk store is
+    the ``jax`` persistent compilation cache.
+
+    Args:
+        cache_directory (str | pathlib.Path): The directory of the persistent compilation cache.
+
+    Returns:
+        pathlib.Path: The resolved cache directory.
+    """
+    import jax
+
+    cache_directory = pathlib.Path(cache_directory).expanduser().resolve()
+    cache_directory.mkdir(parents=True, exist_ok=True)
+    jax.config.update("jax_compilation_cache_dir", str(cache_directory))
+    # Circuit compilations are cached regardless of how long they took to compile
+    jax.config.update("jax_persistent_cache_min_compile_time_secs", 0)
+    return cache_directory
+
+
+def clear_sax_circuit_cache() -> None:
+    """
+    Clears the in-memory cache of compiled ``sax`` circuits.
+    """
+    _SAX_CIRCUIT_CACHE.clear()
+
+
+def get_cached_sax_circuit(
+    netlist: dict,
+    models: dict,
+    jit: bool = False,
+    maxsize: int = SAX_CIRCUIT_CACHE_MAXSIZE,
+    **kwargs,
+) -> tuple[Callable, Any]:
+    """
+    Returns the ``sax`` circuit of the netlist and models, compiling it only if the same netlist and models have not
+    been compiled before. The least recently used circuits are evicted beyond ``maxsize`` entries, and circuits whose
+    netlist or models cannot be hashed stably are always compiled fresh.
+
+    Args:
+        netlist (dict): The netlist.
+        models (dict): The model dictionary.
+        jit (bool): Whether to ``jax.jit`` compile the circuit, so that its traces are reused across calls.
+        maxsize (int): The maximum amount of cached circuits.
+        **kwargs: The ``sax.circuit`` keyword arguments.
+
+    Returns:
+        tuple[Callable, Any]: The circuit function and the circuit information.
+    """
+    import sax
+
+    cache_key = compose_sax_circuit_cache_key(netlist, models, jit=jit, **kwargs)
+    if cache_key is not None and cache_key in _SAX_CIRCUIT_CACHE:
+        _SAX_CIRCUIT_CACHE.move_to_end(cache_key)
+        return _SAX_CIRCUIT_CACHE[cache_key]
+
+    circuit, circuit_info = sax.circuit(netlist=netlist, models=models, **kwargs)
+    if jit:
+        import jax
+
+        circuit = jax.jit(circuit)
+
+    if cache_key is None:
+        # Circuits whose netlist or models cannot be hashed stably are compiled fresh every time
+        return circuit, circuit_info
+
+    _SAX_CIRCUIT_CACHE[cache_key] = (circuit, circuit_info)
+    while len(_SAX_CIRCUIT_CACHE) > maxsize:
+        _SAX_CIRCUIT_CACHE.popitem(last=False)
+    return circuit, circuit_info
@@ -5,7 +5,7 @@ This file provides a set of utilities that allow much easier integration between
 import jax.numpy as jnp
 from ..gdsfactory.netlist import get_matched_ports_tuple_index
 from ...utils import round_complex_array
-from ...types import SParameterMatrixTuple
+from ...types import DenseNetworkTransmission, SParameterMatrixTuple
 from typing import Optional, Any  # NOQA : F401
 
 
@@ -156,7 +156,10 @@ def sax_to_s_parameters_standard_matrix(
     # Now we get the indexes of the input connection that we care about to restructure the dense matrix with the columns
     # we care about.
     if input_ports_order is not None:
-        output_ports_order = tuple(set(all_ports_list) - set(input_ports_order))
+        # Keep the SDense port order so the output ordering does not depend on string hashing
+        output_ports_order = tuple(
+            port for port in all_ports_list if port not in input_ports_order
+        )
         (
             input_ports_index_tuple_order,
             input_matched_ports_name_tuple_order,
@@ -189,11 +192,12 @@ def sax_to_s_parameters_standard_matrix(
 
     output_ports_index_tuple_order_jax = jnp.asarray(output_ports_index_tuple_order)
     input_ports_index_tuple_order_jax = jnp.asarray(input_ports_index_tuple_order)
-    # We now select the SDense columns that we care about.
+    # We now select the SDense columns that we care about. The selection operates on the trailing two axes so that
+    # batched SDicts, ie. evaluated over a stack of parameters, return a ``(..., N, N)`` stack of matrices.
     try:
-        s_parameters_standard_matrix = dense_s_parameter_matrix.at[
-            output_ports_index_tuple_order_jax
-        ].get()
+        s_parameters_standard_matrix = dense_s_parameter_matrix[
+            ..., output_ports_index_tuple_order_jax, :
+        ]
     except TypeError as e:
         print("sax_input: " + str(sax_input))
         print("all_ports_list: " + str(all_ports_list))
@@ -201,9 +205,9 @@ def sax_to_s_parameters_standard_matrix(
         raise TypeError(
             "Verify your network composition contains `out` keywords. This can be caused by the network topology."
         ) from e
-    s_parameters_standard_matrix = s_parameters_standard_matrix.at[
-        :, input_ports_index_tuple_order_jax
-    ].get()
+    s_parameters_standard_matrix = s_parameters_standard_matrix[
+        ..., input_ports_index_tuple_order_jax
+    ]
     # Now we select the SDense rows that we care about after transposing the matrix.
 
     if round_int:
@@ -215,4 +219,44 @@ def sax_to_s_parameters_standard_matrix(
     return value
 
 
+def convert_sdense_to_dense_network_transmission(
+    sdense: tuple[Any, dict],
+    input: Any,
+) -> DenseNetworkTransmission:
+    """
+    Converts a ``sax`` SDense into a DenseNetworkTransmission without copying the S-matrix. The transmission tensor
+    is a transposed view of the S-matrix, as a ``sax`` SDense is the transpose of the scikit-rf orientation of
+    the DenseNetworkTransmission. A single ``(N, N)`` S-matrix is converted into a single point ``(1, N, N)`` view.
+
+    Args:
+        sdense (tuple[Any, dict]): The S-matrix or batched ``(n_points, N, N)`` S-matrices and the port map.
+        input (PhasorTypes): The input state of each point, such as a Phasor with the frequency of each point.
+
+    Returns:
+        DenseNetworkTransmission: The network transmission.
+    """
+    s_matrix, port_map = sdense
+    if s_matrix.ndim == 2:
+        s_matrix = s_matrix[None, :, :]
+    return DenseNetworkTransmission(
+        input=input, s=s_matrix.swapaxes(-1, -2), port_map=dict(port_map)
+    )
+
+
+def convert_dense_network_transmission_to_sdense(
+    network_transmission: DenseNetworkTransmission,
+) -> tuple[Any, dict]:
+    """
+    Converts a DenseNetworkTransmission into a batched ``sax`` SDense, as a transposed view of the transmission
+    tensor without copying it.
+
+    Args:
+        network_transmission (DenseNetworkTransmission): The network transmission.
+
+    Returns:
+        tuple[Any, dict]: The ``(n_points, N, N)`` S-matrices and the port map.
+    """
+    return network_transmission.sdense
+
+
 snet = sax_to_s_parameters_standard_matrix
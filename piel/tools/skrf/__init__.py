@@ -1 +1,5 @@
-from .convert import convert_skrf_network_to_network_transmission
+from .convert import (
+    convert_dense_network_transmission_to_skrf_network,
+    convert_skrf_network_to_dense_network_transmission,
+    convert_skrf_network_to_network_transmission,
+)
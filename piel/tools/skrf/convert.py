@@ -1,78 +1,97 @@
 import numpy as np
-from typing import List
 
 # Import your custom Pydantic models
-from piel.types.units import Hz, degree
-from piel.types import NetworkTransmission, Phasor, PathTransmission
+from piel.types import (
+    DenseNetworkTransmission,
+    NetworkTransmission,
+    PathTransmission,
+    Phasor,
+)
 
 
-def convert_skrf_network_to_network_transmission(network) -> NetworkTransmission:
+def convert_skrf_network_to_dense_network_transmission(
+    network, input_port: int = 0
+) -> DenseNetworkTransmission:
     """
-    Converts a scikit-rf Network object to a NetworkTransmission object.
+    Converts a scikit-rf Network object to a DenseNetworkTransmission object without copying its S-parameters.
 
     Parameters:
     - network (rf.Network): The scikit-rf Network object to convert.
+    - input_port (int): The zero-based index of the port whose reflection is the input. Defaults to the first port.
 
     Returns:
-    - NetworkTransmission: The converted NetworkTransmission object.
+    - DenseNetworkTransmission: The converted DenseNetworkTransmission object, with ports ``1`` to ``N``.
     """
+    s = network.s  # The (n_frequencies, n_ports, n_ports) S-parameters
+    input_s_param = s[:, input_port, input_port]
+    input_phasor = Phasor(
+        magnitude=20 * np.log10(np.abs(input_s_param)),
+        phase=np.angle(input_s_param, deg=True),
+        frequency=network.frequency.f,  # Frequency values in Hz
+    )
+    return DenseNetworkTransmission(
+        input=input_phasor,
+        s=s,
+        port_map={port_index + 1: port_index for port_index in range(s.shape[1])},
+    )
 
-    # Extract frequency data
-    frequencies = network.frequency.f  # Frequency values in Hz
-
-    # Number of connection
-    num_ports = network.number_of_ports
-
-    # Initialize list to hold PathTransmission objects
-    path_transmissions: List[PathTransmission] = []
 
-    # Iterate over all S-parameters
-    for i in range(num_ports):
-        for j in range(num_ports):
-            s_param = network.s[:, i, j]  # S-parameter Sij across all frequencies
+def convert_dense_network_transmission_to_skrf_network(
+    network_transmission: DenseNetworkTransmission, **kwargs
+):
+    """
+    Converts a DenseNetworkTransmission object to a scikit-rf Network object, with the ports in index order.
 
-            # Calculate magnitude in dBm and phase in degrees
-            # Note: S-parameters are typically unitless; adjust units as needed
-            magnitude = 20 * np.log10(np.abs(s_param))  # Convert to dB
-            phase = np.angle(s_param, deg=True)  # Convert to degrees
+    Parameters:
+    - network_transmission (DenseNetworkTransmission): The object to convert. Its input frequency is in Hz.
+    - **kwargs: Additional keyword arguments for the ``rf.Network``, such as its ``name``.
 
-            # Create Phasor object
-            phasor = Phasor(
-                magnitude=magnitude,
-                phase=phase,
-                frequency=frequencies,
-            )
+    Returns:
+    - rf.Network: The converted scikit-rf Network object.
+    """
+    import skrf as rf
 
-            # Define port mapping
-            connection = (i + 1, j + 1)
+    frequency = rf.Frequency.from_f(
+        np.asarray(network_transmission.input.frequency, dtype=float), unit="hz"
+    )
+    return rf.Network(
+        frequency=frequency, s=np.asarray(network_transmission.s), **kwargs
+    )
 
-            # Create PathTransmission object
-            path_transmission = PathTransmission(
-                connection=connection, transmission=phasor
-            )
 
-            path_transmissions.append(path_transmission)
+def convert_skrf_network_to_network_transmission(network) -> NetworkTransmission:
+    """
+    Converts a scikit-rf Network object to a NetworkTransmission object. The magnitude and phase of all the
+    S-parameters are composed from views of the dense S-parameter tensor, see
+    ``convert_skrf_network_to_dense_network_transmission`` to operate on the tensor directly.
 
-    # Define input Phasor (for example, input port 1 across all frequencies)
-    # This can be adjusted based on specific requirements
-    input_s_param = network.s[:, 0, 0]  # Assuming port 1 is the input port
+    Each path is named by the indexes of its S-parameter, so ``Sij``, the transmission from port ``j`` to port
+    ``i``, is the ``(i, j)`` path.
 
-    input_magnitude = 20 * np.log10(np.abs(input_s_param))
-    input_phase = np.angle(input_s_param, deg=True)
+    Parameters:
+    - network (rf.Network): The scikit-rf Network object to convert.
 
-    input_phasor = Phasor(
-        magnitude=input_magnitude,
-        phase=input_phase,
-        frequency=frequencies,
+    Returns:
+    - NetworkTransmission: The converted NetworkTransmission object.
+    """
+    dense_network_transmission = convert_skrf_network_to_dense_network_transmission(
+        network
     )
-
-    # Create NetworkTransmission object
-    network_transmission = NetworkTransmission(
-        input=input_phasor, network=path_transmissions
+    port_names = dense_network_transmission.port_names
+    return NetworkTransmission(
+        input=dense_network_transmission.input,
+        network=[
+            PathTransmission(
+                connection=(port_i, port_j),
+                transmission=dense_network_transmission.get_path_transmission(
+                    port_j, port_i
+                ).transmission,
+            )
+            for port_i in port_names
+            for port_j in port_names
+        ],
     )
 
-    return network_transmission
-
 
 # def convert_skrf_network_to_network_transmission(network, input_port: int = 0) -> NetworkTransmission:
 #     """
@@ -1 +1 @@
-from .operations import unitary_permanent
+from .operations import unitary_permanent, unitary_permanent_batch
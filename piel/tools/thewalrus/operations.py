@@ -32,3 +32,57 @@ def unitary_permanent(
     end_time = time.time()
     computed_time = end_time - start_time
     return circuit_permanent, computed_time
+
+
+def unitary_permanent_batch(
+    unitary_matrices: jnp.ndarray,
+    maximum_vectorized_size: int = 12,
+) -> np.ndarray:
+    """
+    Computes the permanents of a stack of equally sized square matrices in a single vectorized operation.
+
+    This implements the Balasubramanian-Bax-Franklin-Glynn formula:
+
+    .. math::
+
+        \\text{per}(A) = \\frac{1}{2^{n-1}} \\sum_{\\delta} \\left( \\prod_{k=1}^{n} \\delta_k \\right)
+            \\prod_{j=1}^{n} \\sum_{i=1}^{n} \\delta_i a_{ij}
+
+    where the sum is over all the :math:`\\delta \\in \\{\\pm 1\\}^n` with :math:`\\delta_1 = 1`. The Gray-code
+    ordering of the :math:`\\delta` vectors used by ``thewalrus`` is the sequential form of this sum, here all the
+    :math:`2^{n-1}` vectors are evaluated at once for every matrix in the stack. Above ``maximum_vectorized_size``
+    the memory of the vectorized sum becomes prohibitive, so each matrix is computed with ``thewalrus.perm`` instead.
+
+    Args:
+        unitary_matrices (jnp.ndarray): The ``(batch, n, n)`` stack of matrices.
+        maximum_vectorized_size (int): The largest matrix size computed with the vectorized formula.
+
+    Returns:
+        np.ndarray: The ``(batch,)`` complex permanents.
+    """
+    unitary_matrices = np.asarray(unitary_matrices, dtype=complex)
+    batch_size, matrix_size = unitary_matrices.shape[0], unitary_matrices.shape[-1]
+
+    if matrix_size == 0:
+        return np.ones(batch_size, dtype=complex)
+
+    if matrix_size > maximum_vectorized_size:
+        import thewalrus
+
+        return np.array(
+            [thewalrus.perm(unitary_matrix) for unitary_matrix in unitary_matrices],
+            dtype=complex,
+        )
+
+    # All the delta vectors with the first element fixed to 1, as rows of a (2^(n-1), n) matrix.
+    delta_bits = (
+        np.arange(2 ** (matrix_size - 1))[:, None] >> np.arange(matrix_size - 1)
+    ) & 1
+    deltas = np.hstack(
+        [np.ones((delta_bits.shape[0], 1)), 1 - 2 * delta_bits]
+    )  # (2^(n-1), n)
+    delta_signs = np.prod(deltas, axis=1)
+    delta_row_sums = np.einsum("di,bij->bdj", deltas, unitary_matrices)
+    return (delta_signs * np.prod(delta_row_sums, axis=2)).sum(axis=1) / (
+        2 ** (matrix_size - 1)
+    )
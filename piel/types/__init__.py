@@ -35,6 +35,11 @@ from piel.types.connectivity.physical import (
     PhysicalConnection,
     PhysicalPort,
 )
+from piel.types.connectivity.graph import ConnectivityGraph
+from piel.types.connectivity.static_timing import (
+    MonteCarloTimingAnalysis,
+    StaticTimingAnalysis,
+)
 from piel.types.connectivity.metrics import ComponentMetrics
 from piel.types.connectivity.timing import (
     TimeMetric,
@@ -54,9 +59,10 @@ from piel.types.digital import (
     LogicSignalsList,
     LogicImplementationType,
     TruthTable,
+    TruthTableArray,
     TruthTableLogicType,
 )
-from piel.types.digital_electro_optic import BitPhaseMap
+from piel.types.digital_electro_optic import BitPhaseMap, CompiledBitPhaseMap
 
 from piel.types.environment import Environment
 from piel.types.experimental import *  # NOQA: F403
@@ -83,10 +89,12 @@ from piel.types.electrical.rf_passives import (
 
 from piel.types.electro_optic.transition import (
     FockStatePhaseTransitionType,
+    FockStateTransitionAmplitudes,
     OpticalStateTransitions,
     PhaseMapType,
     PhaseTransitionTypes,
     SwitchFunctionParameter,
+    SwitchUnitaryBatch,
     SParameterCollection,
 )
 
@@ -139,6 +147,7 @@ from piel.types.signal.frequency.generic import PhasorTypes
 from piel.types.signal.frequency.transmission import (
     PathTransmission,
     NetworkTransmission,
+    DenseNetworkTransmission,
     FrequencyTransmissionModel,
 )
 
@@ -178,6 +187,7 @@ from piel.types.signal.time_data import (
     MultiDataTimeSignalCollectionTypes,
     MultiDataTimeSignalAnalysisTypes,
     DataTimeSignalAnalysisTypes,
+    PulseSet,
 )
 
 
@@ -204,6 +214,11 @@ from piel.types.type_conversion import (
     convert_2d_array_to_string,
     convert_to_bits,
     convert_dataframe_to_bits,
+    convert_bits_to_integer_array,
+    convert_integer_array_to_bits,
+    convert_digit_tuples_to_strings,
+    convert_truth_table_to_array,
+    convert_array_to_truth_table,
 )
 
 from piel.types.units import (
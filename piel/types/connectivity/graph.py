@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import numpy as np
+from typing import Optional
+from .core import PielBaseModel
+from .abstract import Port, Connection, Component
+
+
+class ConnectivityGraph(PielBaseModel):
+    """
+    An index of the components, ports and connections of a component hierarchy, so that they can be looked up by
+    name and traversed without scanning the hierarchy.
+
+    Every component and port has a stable integer ID, its position in the ``components`` and ``ports`` lists, which
+    does not change when more components are added. Components are referenced by their dot-separated path from the
+    top level components, such as ``"lattice.mzi_0"``, and ports by the path of their component followed by their
+    name, such as ``"lattice.mzi_0.in0"``. The ports of the root component of a hierarchy are referenced by their
+    name alone.
+
+    The graph is filled in place by ``piel.connectivity.compose_connectivity_graph``.
+    """
+
+    components: list[Component] = []
+    component_paths: list[str] = []
+    component_ids: dict[str, int] = {}
+    """
+    component_ids (dict[str, int]): The ID of each component path.
+    """
+    component_parent_ids: list[int] = []
+    """
+    component_parent_ids (list[int]): The ID of the parent of each component, -1 for the top level components.
+    """
+    component_children_ids: list[list[int]] = []
+
+    ports: list[Port] = []
+    port_component_ids: list[int] = []
+    port_ids: dict[str, int] = {}
+    """
+    port_ids (dict[str, int]): The ID of each port reference.
+    """
+    port_object_ids: dict[int, int] = {}
+    """
+    port_object_ids (dict[int, int]): The port ID of each indexed ``Port`` instance by its ``id``, used to resolve the
+    ports of the existing connections.
+    """
+
+    connections: list[Connection] = []
+    connection_port_ids: list[tuple[int, int]] = []
+    adjacency: list[list[int]] = []
+    """
+    adjacency (list[list[int]]): The IDs of the ports connected to each port.
+    """
+
+    @property
+    def edges(self) -> np.ndarray:
+        """
+        Returns the ``(n_connections, 2)`` array of the port IDs of each connection.
+
+        Returns:
+            np.ndarray: The port ID pairs.
+        """
+        return np.array(self.connection_port_ids, dtype=np.int64).reshape(-1, 2)
+
+    def get_component(self, component_path: str) -> Optional[Component]:
+        """
+        Get a component by its path.
+        """
+        component_id = self.component_ids.get(component_path, None)
+        return None if component_id is None else self.components[component_id]
+
+    def get_port_id(self, port_reference: str) -> Optional[int]:
+        """
+        Get the ID of a port by its reference.
+        """
+        return self.port_ids.get(port_reference, None)
+
+    def get_port(self, port_reference: str) -> Optional[Port]:
+        """
+        Get a port by its reference.
+        """
+        port_id = self.port_ids.get(port_reference, None)
+        return None if port_id is None else self.ports[port_id]
+
+    def get_connected_ports(self, port_reference: str) -> list[Port]:
+        """
+        Get the ports directly connected to a port.
+        """
+        port_id = self.port_ids.get(port_reference, None)
+        if port_id is None:
+            raise ValueError(f"Port {port_reference} not found in the graph.")
+        return [self.ports[neighbour_id] for neighbour_id in self.adjacency[port_id]]
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+from .core import PielBaseModel
+from .graph import ConnectivityGraph
+
+
+class StaticTimingAnalysis(PielBaseModel):
+    """
+    The arrival times, required times and slack of every port of a connectivity graph, computed by propagating the
+    connection delays in topological order. Each connection is a timing arc from its first port to its second port.
+
+    The edge arrays are indexed by the connection ID in ``graph.connections`` and the port arrays by the port ID in
+    ``graph.ports``. The arrays are updated in place by ``piel.analysis.timing.update_connection_timing``.
+    """
+
+    graph: ConnectivityGraph
+
+    edge_source_ids: np.ndarray
+    edge_target_ids: np.ndarray
+    edge_delay_mean_s: np.ndarray
+    edge_delay_min_s: np.ndarray
+    edge_delay_max_s: np.ndarray
+    edge_delay_standard_deviation_s: np.ndarray
+
+    incoming_edge_ids: np.ndarray
+    incoming_edge_pointers: np.ndarray
+    """
+    incoming_edge_pointers (np.ndarray): The incoming connection IDs of port ``i`` are
+    ``incoming_edge_ids[incoming_edge_pointers[i]:incoming_edge_pointers[i + 1]]``.
+    """
+    outgoing_edge_ids: np.ndarray
+    outgoing_edge_pointers: np.ndarray
+    """
+    outgoing_edge_pointers (np.ndarray): The outgoing connection IDs of port ``i`` are
+    ``outgoing_edge_ids[outgoing_edge_pointers[i]:outgoing_edge_pointers[i + 1]]``.
+    """
+
+    topological_order: np.ndarray
+    """
+    topological_order (np.ndarray): The port IDs in topological order.
+    """
+    topological_position: np.ndarray
+    """
+    topological_position (np.ndarray): The position of each port ID in the topological order.
+    """
+
+    start_arrival_time_s: np.ndarray
+    """
+    start_arrival_time_s (np.ndarray): The arrival time of the ports without incoming connections.
+    """
+    arrival_time_mean_s: np.ndarray
+    arrival_time_min_s: np.ndarray
+    arrival_time_max_s: np.ndarray
+    arrival_time_standard_deviation_s: np.ndarray
+    """
+    arrival_time_standard_deviation_s (np.ndarray): The statistical arrival time is propagated as a normal
+    distribution, and the latest of several arrivals is approximated with Clark's moment matching.
+    """
+    critical_edge_ids: np.ndarray
+    """
+    critical_edge_ids (np.ndarray): The incoming connection ID of the latest arrival of each port, -1 if none.
+    """
+
+    required_time_constraint_s: float | None = None
+    """
+    required_time_constraint_s (float | None): The required time of the endpoints, defaults to the latest arrival.
+    """
+    required_time_s: np.ndarray
+    slack_s: np.ndarray
+
+    @property
+    def port_references(self) -> list[str]:
+        """
+        Returns the reference of each port ID.
+
+        Returns:
+            list[str]: The port references.
+        """
+        port_references = [""] * len(self.graph.ports)
+        for port_reference, port_id in self.graph.port_ids.items():
+            port_references[port_id] = port_reference
+        return port_references
+
+    @property
+    def worst_slack_s(self) -> float:
+        """
+        Returns the worst slack of all the ports.
+
+        Returns:
+            float: The worst slack in seconds.
+        """
+        return float(np.min(self.slack_s)) if len(self.slack_s) > 0 else np.inf
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """
+        Returns the timing of every port as a table.
+
+        Returns:
+            pd.DataFrame: One row per port with its arrival times, required time and slack.
+        """
+        return pd.DataFrame(
+            {
+                "port": self.port_references,
+                "arrival_time_mean_s": self.arrival_time_mean_s,
+                "arrival_time_min_s": self.arrival_time_min_s,
+                "arrival_time_max_s": self.arrival_time_max_s,
+                "arrival_time_standard_deviation_s": self.arrival_time_standard_deviation_s,
+                "required_time_s": self.required_time_s,
+                "slack_s": self.slack_s,
+            }
+        )
+
+
+class MonteCarloTimingAnalysis(PielBaseModel):
+    """
+    The delay distribution of the endpoints of a connectivity graph, estimated by propagating sampled connection
+    delays through the graph.
+
+    The ``delay_*`` attributes describe the latest arrival over all the endpoints of each sample, which is the delay
+    of the whole graph.
+    """
+
+    endpoint_references: list[str]
+    sample_amount: int
+    percentiles: np.ndarray
+    endpoint_delay_mean_s: np.ndarray
+    endpoint_delay_standard_deviation_s: np.ndarray
+    endpoint_delay_percentiles_s: np.ndarray
+    """
+    endpoint_delay_percentiles_s (np.ndarray): The ``(n_endpoints, n_percentiles)`` delay percentiles.
+    """
+    delay_mean_s: float
+    delay_standard_deviation_s: float
+    delay_percentiles_s: np.ndarray
+
+    timing_budget_s: float | None = None
+    endpoint_timing_yield: np.ndarray | None = None
+    """
+    endpoint_timing_yield (np.ndarray | None): The fraction of the samples in which each endpoint is reached within
+    the timing budget.
+    """
+    timing_yield: float | None = None
+    """
+    timing_yield (float | None): The fraction of the samples in which all the endpoints are reached within the timing
+    budget.
+    """
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        """
+        Returns the delay statistics of every endpoint as a table.
+
+        Returns:
+            pd.DataFrame: One row per endpoint with its delay mean, standard deviation, percentiles and timing yield.
+        """
+        dataframe = pd.DataFrame(
+            {
+                "port": self.endpoint_references,
+                "delay_mean_s": self.endpoint_delay_mean_s,
+                "delay_standard_deviation_s": self.endpoint_delay_standard_deviation_s,
+            }
+        )
+        for percentile_index, percentile in enumerate(self.percentiles):
+            dataframe[f"delay_p{percentile:g}_s"] = self.endpoint_delay_percentiles_s[
+                :, percentile_index
+            ]
+        if self.endpoint_timing_yield is not None:
+            dataframe["timing_yield"] = self.endpoint_timing_yield
+        return dataframe
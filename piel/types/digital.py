@@ -3,6 +3,7 @@ This module defines files measurement and measurement for working with digital c
 It leverages pydantic for model validation and pandas for files manipulation.
 """
 
+import numpy as np
 import pandas as pd
 from pydantic import ConfigDict
 from typing import Literal, Iterable, Any
@@ -120,5 +121,64 @@ class TruthTable(PielBaseModel):
         filtered_dict = {k: v for k, v in self.dict().items() if k in selected_ports}
         return filtered_dict
 
+    @property
+    def array(self) -> "TruthTableArray":
+        """
+        Returns the integer-encoded array representation of the input and output connection of the truth table.
+
+        Returns:
+            TruthTableArray: The truth table with one integer column per port.
+        """
+        from .type_conversion import convert_truth_table_to_array
+
+        return convert_truth_table_to_array(self)
+
+
+class TruthTableArray(PielBaseModel):
+    """
+    An array representation of a truth table, where the bits of each port are encoded as an integer column. This
+    allows the truth table to be compared, deduplicated and converted without manipulating the bit strings of each row.
+
+    Attributes:
+        input_ports (LogicSignalsList): List of input signal names for the truth table.
+        output_ports (LogicSignalsList): List of output signal names for the truth table.
+        data (np.ndarray): The ``(n_rows, n_ports)`` integer array, with the input ports first and the output ports
+            after, in order.
+        bit_widths (list[int]): The number of bits of each port, used to decode the integers into bit strings.
+
+    Properties:
+        ports_list (list[str]): A combined list of input and output signal names.
+    """
+
+    input_ports: LogicSignalsList
+    """
+    input_ports (LogicSignalsList): List of input signal names for the truth table.
+    """
+
+    output_ports: LogicSignalsList
+    """
+    output_ports (LogicSignalsList): List of output signal names for the truth table.
+    """
+
+    data: np.ndarray
+    """
+    data (np.ndarray): The ``(n_rows, n_ports)`` integer array, with the input ports first and the output ports after.
+    """
+
+    bit_widths: list[int]
+    """
+    bit_widths (list[int]): The number of bits of each port, used to decode the integers into bit strings.
+    """
+
+    @property
+    def ports_list(self) -> list[str]:
+        """
+        Returns a combined list of input and output signal names.
+
+        Returns:
+            list[str]: The concatenated list of input and output connection.
+        """
+        return self.input_ports + self.output_ports
+
 
 DigitalLogicModule = Any
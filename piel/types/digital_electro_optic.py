@@ -53,3 +53,42 @@ class BitPhaseMap(PielBaseModel):
 This class contains a set of unitaries that interest us to model, probably a sequence of unitaries that represent
 a given simulation. It also contains a given input sequence, and a given output sequence.
 """
+
+
+class CompiledBitPhaseMap(PielBaseModel):
+    """
+    A lookup representation of a BitPhaseMap, compiled once so that phases and bits can be mapped in batches
+    without rebuilding the ``dataframe``.
+
+    Attributes:
+        phase (np.ndarray): The sorted unique phases of the map.
+        phase_bits (np.ndarray): The bits of the first entry with each unique phase.
+        phase_first_index (np.ndarray): The index of the first entry with each unique phase in the original map.
+        bits_phase (dict[BitsType, np.ndarray]): The phases of each bits entry, in the original order.
+        max_bit_length (int): The length of the last bits entry, which the mapped bits are padded to.
+    """
+
+    phase: np.ndarray
+    """
+    phase (np.ndarray): The sorted unique phases of the map.
+    """
+
+    phase_bits: np.ndarray
+    """
+    phase_bits (np.ndarray): The bits of the first entry with each unique phase.
+    """
+
+    phase_first_index: np.ndarray
+    """
+    phase_first_index (np.ndarray): The index of the first entry with each unique phase in the original map.
+    """
+
+    bits_phase: dict[BitsType, np.ndarray]
+    """
+    bits_phase (dict[BitsType, np.ndarray]): The phases of each bits entry, in the original order.
+    """
+
+    max_bit_length: int
+    """
+    max_bit_length (int): The length of the last bits entry, which the mapped bits are padded to.
+    """
@@ -152,3 +152,103 @@ class OpticalStateTransitions(PielBaseModel):
 
 SwitchFunctionParameter = dict
 SParameterCollection = dict[int, ArrayTypes]
+
+
+class SwitchUnitaryBatch(PielBaseModel):
+    """
+    A dense, array-backed collection of the unitaries implemented by a switch fabric over a set of phase configurations.
+
+    Rather than storing one dictionary entry per phase configuration, all the implemented unitaries are stacked into a
+    single ``(n_configurations, N, N)`` tensor which shares the configuration axis with ``phase_configurations``.
+
+    Attributes:
+        unitaries (ArrayTypes): The ``(n_configurations, N, N)`` stack of implemented unitaries.
+        phase_configurations (ArrayTypes): The ``(n_configurations, n_switches)`` phase applied to each switch.
+        switch_instance_list (list): The recursive netlist address of each switch, in the phase configuration column order.
+        input_ports_order (tuple): The port names corresponding to the unitary input order.
+        parameter_key (str): The switch model parameter the phases are applied to.
+        configuration_indexes (ArrayTypes | None): The sweep index of each phase configuration, when part of a chunked sweep.
+    """
+
+    unitaries: ArrayTypes
+    """
+    unitaries (ArrayTypes):
+        The ``(n_configurations, N, N)`` stack of implemented unitaries.
+    """
+
+    phase_configurations: ArrayTypes
+    """
+    phase_configurations (ArrayTypes):
+        The ``(n_configurations, n_switches)`` phase applied to each switch.
+    """
+
+    switch_instance_list: list = []
+    """
+    switch_instance_list (list):
+        The recursive netlist address of each switch, in the phase configuration column order.
+    """
+
+    input_ports_order: tuple = ()
+    """
+    input_ports_order (tuple):
+        The port names corresponding to the unitary input order.
+    """
+
+    parameter_key: str = "active_phase_rad"
+    """
+    parameter_key (str):
+        The switch model parameter the phases are applied to.
+    """
+
+    configuration_indexes: ArrayTypes | None = None
+    """
+    configuration_indexes (ArrayTypes | None):
+        The sweep index of each phase configuration, when part of a chunked sweep.
+    """
+
+
+class FockStateTransitionAmplitudes(PielBaseModel):
+    """
+    A dense, array-backed collection of the transition probability amplitudes between a set of input and output Fock
+    states over a set of implemented unitaries.
+
+    The Fock states are stored once in shared state tables, rather than copied into every transition entry, and the
+    amplitudes are indexed as ``[configuration, input_state, output_state]``.
+
+    Attributes:
+        transition_probability_amplitudes (ArrayTypes): The ``(n_configurations, n_input, n_output)`` complex amplitudes.
+        input_fock_states (ArrayTypes): The ``(n_input, n_modes)`` photon numbers of each input Fock state.
+        output_fock_states (ArrayTypes): The ``(n_output, n_modes)`` photon numbers of each output Fock state.
+        phase_configurations (ArrayTypes | None): The ``(n_configurations, n_switches)`` phase of each configuration.
+        configuration_keys (list | None): The key of each configuration in the originating unitary dictionaries.
+    """
+
+    transition_probability_amplitudes: ArrayTypes
+    """
+    transition_probability_amplitudes (ArrayTypes):
+        The ``(n_configurations, n_input, n_output)`` complex transition probability amplitudes.
+    """
+
+    input_fock_states: ArrayTypes
+    """
+    input_fock_states (ArrayTypes):
+        The ``(n_input, n_modes)`` photon numbers of each input Fock state.
+    """
+
+    output_fock_states: ArrayTypes
+    """
+    output_fock_states (ArrayTypes):
+        The ``(n_output, n_modes)`` photon numbers of each output Fock state.
+    """
+
+    phase_configurations: ArrayTypes | None = None
+    """
+    phase_configurations (ArrayTypes | None):
+        The ``(n_configurations, n_switches)`` phase of each configuration.
+    """
+
+    configuration_keys: list | None = None
+    """
+    configuration_keys (list | None):
+        The key of each configuration in the originating unitary dictionaries.
+    """
@@ -1,5 +1,8 @@
 from __future__ import annotations
+import numpy as np
+from piel.types.core import ArrayTypes
 from piel.types.connectivity.abstract import Instance
+from piel.types.signal.frequency.core import Phasor
 from piel.types.signal.frequency.sax_core import SType
 from piel.types.signal.frequency.generic import PhasorTypes
 from piel.types.connectivity.generic import ConnectionTypes
@@ -71,7 +74,138 @@ class NetworkTransmission(Instance):
         return model
 
 
-FrequencyTransmissionModel = NetworkTransmission | SType | Any | None
+class DenseNetworkTransmission(Instance):
+    """
+    An array-native equivalent of ``NetworkTransmission``, which stores the complex transmission of all the paths as a
+    single ``(n_points, n_ports, n_ports)`` tensor, where each point is a frequency or a power of the ``input``.
+    The tensor is oriented as the ``s`` attribute of a scikit-rf Network, so ``s[:, i, j]`` is the transmission from
+    port ``j`` to port ``i``. The path ``(port_a, port_b)`` is the transmission from ``port_a`` to ``port_b``, which
+    is ``s[:, port_map[port_b], port_map[port_a]]``. A ``sax`` SDense is the transpose of this orientation.
+
+    The per-path ``PathTransmission`` are composed on access from views of the tensor, so existing ``network``
+    consumers work unchanged whilst array computations operate on the tensor directly.
+    """
+
+    input: PhasorTypes
+    """
+    The input state with magnitude and phase information, one point per transmission point.
+    """
+
+    s: ArrayTypes
+    """
+    The ``(n_points, n_ports, n_ports)`` complex transmission tensor, where ``s[:, i, j]`` is the transmission from
+    port ``j`` to port ``i``.
+    """
+
+    port_map: dict[str | int, int] = {}
+    """
+    The index of each port in the last two dimensions of ``s``.
+    """
+
+    @model_validator(mode="after")
+    def check_shape_consistency(cls, model):
+        s_shape = np.shape(model.s)
+        if len(s_shape) != 3 or s_shape[1] != s_shape[2]:
+            raise ValueError(
+                f"The transmission tensor must have a (n_points, n_ports, n_ports) shape, got {s_shape}."
+            )
+
+        if sorted(model.port_map.values()) != list(range(s_shape[1])):
+            raise ValueError(
+                f"The port map {model.port_map} must index each of the {s_shape[1]} ports once."
+            )
+
+        input_length = get_phasor_length(model.input)
+        if input_length != s_shape[0]:
+            raise ValueError(
+                f"Length mismatch: transmission length {s_shape[0]} does not match input length {input_length}"
+            )
+        return model
+
+    @property
+    def port_names(self) -> list[str | int]:
+        """
+        Returns the port names in index order.
+
+        Returns:
+            list[str | int]: The port names.
+        """
+        return sorted(self.port_map, key=self.port_map.get)
+
+    @property
+    def sdense(self) -> tuple[ArrayTypes, dict[str | int, int]]:
+        """
+        Returns the transmission as a ``sax`` SDense, as a transposed view of the tensor without copying it.
+
+        Returns:
+            tuple[ArrayTypes, dict[str | int, int]]: The ``sax`` oriented transmission tensor and the port map.
+        """
+        return self.s.swapaxes(-1, -2), self.port_map
+
+    def _compose_phasor(self, transmission: np.ndarray) -> Phasor:
+        """
+        Composes the magnitude in dB and phase in degrees phasor of a complex transmission.
+        """
+        frequency = getattr(self.input, "frequency", None)
+        if frequency is None:
+            frequency = np.full(len(transmission), np.nan)
+        with np.errstate(divide="ignore"):
+            magnitude = 20 * np.log10(np.abs(transmission))
+        return Phasor(
+            magnitude=magnitude,
+            phase=np.angle(transmission, deg=True),
+            frequency=frequency,
+        )
+
+    def get_path_transmission(
+        self, port_a: str | int, port_b: str | int
+    ) -> PathTransmission:
+        """
+        Composes the transmission of a single path, from ``port_a`` to ``port_b``.
+
+        Args:
+            port_a (str | int): The input port of the path.
+            port_b (str | int): The output port of the path.
+
+        Returns:
+            PathTransmission: The magnitude in dB and phase in degrees transmission of the path.
+        """
+        transmission = np.asarray(self.s)[
+            :, self.port_map[port_b], self.port_map[port_a]
+        ]
+        return PathTransmission(
+            connection=(port_a, port_b),
+            transmission=self._compose_phasor(transmission),
+        )
+
+    @property
+    def network(self) -> list[PathTransmission]:
+        """
+        Composes the ``PathTransmission`` of every path, in row-major port index order.
+
+        Returns:
+            list[PathTransmission]: The magnitude in dB and phase in degrees transmission of every path.
+        """
+        port_names = self.port_names
+        return [
+            self.get_path_transmission(port_a, port_b)
+            for port_a in port_names
+            for port_b in port_names
+        ]
+
+    def to_network_transmission(self) -> NetworkTransmission:
+        """
+        Converts the tensor into the per-path ``NetworkTransmission`` representation.
+
+        Returns:
+            NetworkTransmission: The equivalent network transmission.
+        """
+        return NetworkTransmission(input=self.input, network=self.network)
+
+
+FrequencyTransmissionModel = (
+    NetworkTransmission | DenseNetworkTransmission | SType | Any | None
+)
 """
 Corresponds to a container that contains a s-parameter transmission model, for example.
 
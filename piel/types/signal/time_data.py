@@ -23,6 +23,54 @@ Collection of DataTimeSignals that can be used to analyse a set of signals toget
 MultiDataTimeSignalCollectionTypes = ["equivalent", "different"]
 
 
+class PulseSet(PielBaseModel):
+    """
+    Compact collection of pulses that all belong to the same parent signal. Rather than copying each pulse into its
+    own ``DataTimeSignalData``, the parent ``time_s`` and ``data`` arrays are stored once alongside the ``[start, stop)``
+    sample index range of every pulse, so each pulse can be accessed as a zero-copy array view.
+    """
+
+    time_s: ArrayTypes = []
+    """
+    The time array of the parent signal, shared by all the pulses.
+    """
+
+    data: ArrayTypes = []
+    """
+    The data array of the parent signal, shared by all the pulses.
+    """
+
+    start_indexes: ArrayTypes = []
+    """
+    The parent sample index where each pulse starts, inclusive.
+    """
+
+    stop_indexes: ArrayTypes = []
+    """
+    The parent sample index where each pulse stops, exclusive.
+    """
+
+    peak_indexes: ArrayTypes = []
+    """
+    Optional parent sample index of the peak that triggered each pulse, if any.
+    """
+
+    data_name: str = ""
+    """
+    The name of the parent signal data.
+    """
+
+    time_s_unit: Unit = s
+    """
+    The unit of the time array.
+    """
+
+    data_unit: Unit = V
+    """
+    The unit of the data array.
+    """
+
+
 EdgeTransitionAnalysisTypes = Literal["mean", "peak_to_peak", "rise_time"]
 MultiDataTimeSignalAnalysisTypes = Literal["delay"]
 
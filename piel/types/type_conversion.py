@@ -3,11 +3,18 @@ This module provides a set of utilities for converting between common files meas
 """
 
 from functools import partial
+from typing import Iterable
 import jax.numpy as jnp
 import numpy as np
 import pandas as pd
 from .core import ArrayTypes, PackageArrayType, TupleIntType
-from .digital import AbstractBitsType, BitsType, LogicSignalsList
+from .digital import (
+    AbstractBitsType,
+    BitsType,
+    LogicSignalsList,
+    TruthTable,
+    TruthTableArray,
+)
 
 
 def convert_array_type(array: ArrayTypes, output_type: PackageArrayType):
@@ -214,3 +221,172 @@ def convert_dataframe_to_bits(
             raise ValueError(f"Port '{port}' not found in DataFrame columns")
 
     return binary_converted_data
+
+
+def convert_bits_to_integer_array(bits_list: Iterable) -> tuple[np.ndarray, int]:
+    """
+    Converts a sequence of bit strings into an integer array in a single vectorized operation, by viewing the
+    zero-padded strings as an array of characters. Integer values are returned unchanged.
+
+    Args:
+        bits_list (Iterable): The bit strings, such as ``["01", "11"]``, or integers.
+
+    Returns:
+        tuple[np.ndarray, int]: The integer array and the number of bits of the widest value.
+
+    Examples:
+        >>> convert_bits_to_integer_array(["01", "110"])
+        (array([1, 6]), 3)
+    """
+    bits_array = np.asarray(list(bits_list))
+    if bits_array.dtype.kind in "iub":
+        integer_array = bits_array.astype(np.int64)
+        maximum_value = int(integer_array.max()) if integer_array.size > 0 else 0
+        return integer_array, max(maximum_value.bit_length(), 1)
+
+    bits_array = bits_array.astype(str)
+    bit_width = max(int(np.char.str_len(bits_array).max(initial=0)), 1)
+    if bit_width > 63:
+        raise ValueError(f"Bits wider than 63 bits cannot be encoded, got {bit_width}.")
+
+    # Each padded string is viewed as its unicode code points, which are 48 for "0" and 49 for "1"
+    characters = (
+        np.char.zfill(bits_array, bit_width)
+        .astype(f"U{bit_width}")
+        .view(np.uint32)
+        .reshape(len(bits_array), bit_width)
+    )
+    bit_values = characters.astype(np.int64) - ord("0")
+    if np.any((bit_values != 0) & (bit_values != 1)):
+        raise ValueError("The bits must only contain the characters 0 and 1.")
+    integer_array = bit_values @ (1 << np.arange(bit_width - 1, -1, -1, dtype=np.int64))
+    return integer_array, bit_width
+
+
+def convert_integer_array_to_bits(
+    integer_array: ArrayTypes,
+    bit_width: int,
+) -> np.ndarray:
+    """
+    Converts an integer array into zero-padded bit strings in a single vectorized operation.
+
+    Args:
+        integer_array (ArrayTypes): The integers to convert.
+        bit_width (int): The number of bits of each bit string.
+
+    Returns:
+        np.ndarray: The bit strings.
+
+    Examples:
+        >>> convert_integer_array_to_bits(np.array([1, 6]), 3)
+        array(['001', '110'], dtype='<U3')
+    """
+    integer_array = np.asarray(integer_array, dtype=np.int64)
+    shifts = np.arange(bit_width - 1, -1, -1, dtype=np.int64)
+    characters = (((integer_array[:, np.newaxis] >> shifts) & 1) + ord("0")).astype(
+        np.uint32
+    )
+    return np.ascontiguousarray(characters).view(f"U{bit_width}").ravel()
+
+
+def convert_digit_tuples_to_strings(tuple_list: Iterable) -> list[str]:
+    """
+    Converts a sequence of equal length tuples of single digits, such as Fock states, into strings by viewing them
+    as character arrays. Other sequences are converted element by element with ``convert_tuple_to_string``.
+
+    Args:
+        tuple_list (Iterable): The tuples to convert.
+
+    Returns:
+        list[str]: The concatenated digits of each tuple.
+
+    Examples:
+        >>> convert_digit_tuples_to_strings([(1, 0), (0, 2)])
+        ['10', '02']
+    """
+    tuple_list = list(tuple_list)
+    try:
+        digit_array = np.asarray(tuple_list)
+    except ValueError:
+        digit_array = None
+
+    if (
+        digit_array is None
+        or digit_array.ndim != 2
+        or digit_array.dtype.kind not in "iub"
+        or digit_array.shape[1] == 0
+        or np.any((digit_array < 0) | (digit_array > 9))
+    ):
+        return [convert_tuple_to_string(tuple_i) for tuple_i in tuple_list]
+
+    characters = (digit_array.astype(np.int64) + ord("0")).astype(np.uint32)
+    return (
+        np.ascontiguousarray(characters)
+        .view(f"U{digit_array.shape[1]}")
+        .ravel()
+        .tolist()
+    )
+
+
+def _get_port_values(values) -> list:
+    """
+    Returns the values of a truth table port, which are stored either as a sequence or as an index-value mapping.
+    """
+    if isinstance(values, dict):
+        return list(values.values())
+    return list(values)
+
+
+def convert_truth_table_to_array(truth_table: TruthTable) -> TruthTableArray:
+    """
+    Encodes the input and output connection of a truth table as an integer array.
+
+    Args:
+        truth_table (TruthTable): The truth table with bit string or integer port values.
+
+    Returns:
+        TruthTableArray: The integer-encoded truth table.
+    """
+    columns = []
+    bit_widths = []
+    for port in truth_table.input_ports + truth_table.output_ports:
+        integer_array, bit_width = convert_bits_to_integer_array(
+            _get_port_values(getattr(truth_table, port))
+        )
+        columns.append(integer_array)
+        bit_widths.append(bit_width)
+
+    row_amount = len(columns[0]) if len(columns) > 0 else 0
+    return TruthTableArray(
+        input_ports=list(truth_table.input_ports),
+        output_ports=list(truth_table.output_ports),
+        data=np.column_stack(columns).astype(np.int64)
+        if len(columns) > 0
+        else np.empty((row_amount, 0), dtype=np.int64),
+        bit_widths=bit_widths,
+    )
+
+
+def convert_array_to_truth_table(truth_table_array: TruthTableArray) -> TruthTable:
+    """
+    Decodes an integer-encoded truth table into a TruthTable with zero-padded bit string port values.
+
+    Args:
+        truth_table_array (TruthTableArray): The integer-encoded truth table.
+
+    Returns:
+        TruthTable: The truth table with one list of bit strings per port.
+    """
+    port_values = {
+        port: convert_integer_array_to_bits(
+            truth_table_array.data[:, column_index], bit_width
+        ).tolist()
+        for column_index, (port, bit_width) in enumerate(
+            zip(truth_table_array.ports_list, truth_table_array.bit_widths)
+        )
+    }
+    return TruthTable(
+        input_ports=list(truth_table_array.input_ports),
+        output_ports=list(truth_table_array.output_ports),
+        **port_values,
+    )
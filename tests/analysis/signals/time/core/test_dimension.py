@@ -645,3 +645,40 @@ def test_extract_statistical_metrics_collection_invalid_analysis_types():
             multi_data_time_signal,
             analysis_types="mean",  # Should be a list
         )
+
+
+def test_extract_statistical_metrics_passes_kwargs(monkeypatch):
+    """
+    Test that the keyword arguments reach the per-signal metrics before they are aggregated.
+    """
+    from piel.analysis.signals.time.core import metrics
+    from piel.types import DataTimeSignalData, dB
+
+    signal1 = DataTimeSignalData(
+        time_s=[0, 1, 2], data=[10, 20, 15], data_name="Signal1"
+    )
+    signal2 = DataTimeSignalData(
+        time_s=[0, 1, 2], data=[40, 50, 42], data_name="Signal2"
+    )
+    converted_kwargs = []
+    convert = metrics.convert_metrics_table_to_scalar_metric_collection
+
+    def spy_convert(metrics_table, **kwargs):
+        converted_kwargs.append(kwargs)
+        return convert(metrics_table, **kwargs)
+
+    monkeypatch.setattr(
+        metrics, "convert_metrics_table_to_scalar_metric_collection", spy_convert
+    )
+    metric_kwargs_list = [{"name": "first"}, {"name": "second"}]
+    aggregated_metrics = extract_multi_time_signal_statistical_metrics(
+        [signal1, signal2],
+        analysis_type="peak_to_peak",
+        unit=dB,
+        metric_kwargs_list=metric_kwargs_list,
+    )
+
+    assert converted_kwargs[0]["metric_kwargs_list"] is metric_kwargs_list
+    assert aggregated_metrics.unit == dB
+    assert aggregated_metrics.mean == pytest.approx(10.0)
+    assert aggregated_metrics.count == 2
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from piel.types import DataTimeSignalData, ScalarMetricCollection
+from piel.analysis.signals.time import (
+    convert_metrics_table_to_scalar_metric_collection,
+    extract_multi_data_time_signal_metrics_table,
+    extract_statistical_metrics_collection,
+)
+
+
+@pytest.fixture
+def ragged_multi_data_time_signal():
+    """
+    Fixture with signals of different lengths, including an empty one.
+    """
+    return [
+        DataTimeSignalData(time_s=[0, 1, 2], data=[1.0, 2.0, 3.0], data_name="a"),
+        DataTimeSignalData(time_s=[0, 1], data=[-1.0, 5.0], data_name="b"),
+        DataTimeSignalData(time_s=[], data=[], data_name="empty"),
+        DataTimeSignalData(time_s=[0], data=[4.0], data_name="c"),
+    ]
+
+
+def test_extract_multi_data_time_signal_metrics_table(
+    ragged_multi_data_time_signal,
+):
+    metrics_table = extract_multi_data_time_signal_metrics_table(
+        ragged_multi_data_time_signal
+    )
+
+    assert metrics_table["data_name"].tolist() == ["a", "b", "empty", "c"]
+    assert metrics_table["count"].tolist() == [3, 2, 0, 1]
+    for column, expected in {
+        "mean": [2.0, 2.0, np.nan, 4.0],
+        "min": [1.0, -1.0, np.nan, 4.0],
+        "max": [3.0, 5.0, np.nan, 4.0],
+        "peak_to_peak": [2.0, 6.0, np.nan, 0.0],
+        "standard_deviation": [np.std([1.0, 2.0, 3.0]), 3.0, np.nan, 0.0],
+    }.items():
+        np.testing.assert_allclose(metrics_table[column], expected)
+
+
+def test_convert_metrics_table_to_scalar_metric_collection(
+    ragged_multi_data_time_signal,
+):
+    metrics_table = extract_multi_data_time_signal_metrics_table(
+        ragged_multi_data_time_signal[:2]
+    )
+
+    mean_collection = convert_metrics_table_to_scalar_metric_collection(
+        metrics_table, analysis_type="mean"
+    )
+    peak_to_peak_collection = convert_metrics_table_to_scalar_metric_collection(
+        metrics_table, analysis_type="peak_to_peak"
+    )
+
+    assert isinstance(mean_collection, ScalarMetricCollection)
+    assert [metric.min for metric in mean_collection.metrics] == [1.0, -1.0]
+    assert [metric.value for metric in peak_to_peak_collection.metrics] == [2.0, 6.0]
+
+    with pytest.raises(TypeError, match="Undefined analysis type."):
+        convert_metrics_table_to_scalar_metric_collection(
+            metrics_table, analysis_type="invalid_type"
+        )
+
+
+def test_extract_statistical_metrics_collection_empty_signal(
+    ragged_multi_data_time_signal,
+):
+    with pytest.raises(ValueError, match="Signal 'empty' has an empty data array."):
+        extract_statistical_metrics_collection(
+            ragged_multi_data_time_signal, analysis_types=["mean"]
+        )
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+from piel.types import DataTimeSignalData, PulseSet
+from piel.analysis.signals.time import (
+    compose_pulse_set,
+    convert_pulse_set_to_multi_data_time_signal,
+    extract_pulse_set_above_threshold,
+    extract_pulse_set_from_signal,
+    extract_pulse_set_metrics,
+    extract_signal_above_threshold,
+    get_pulse_view,
+)
+
+
+@pytest.fixture
+def rectangular_pulse_signal():
+    """
+    Fixture with rectangular pulses of heights 1, 2 and 3 at samples [2, 5), [10, 14) and [18, 20).
+    """
+    time_s = np.arange(20, dtype=float)
+    data = np.zeros(20)
+    data[2:5] = 1.0
+    data[10:14] = 2.0
+    data[18:20] = 3.0
+    return DataTimeSignalData(
+        time_s=time_s.tolist(), data=data.tolist(), data_name="rectangular"
+    )
+
+
+def test_extract_pulse_set_above_threshold(rectangular_pulse_signal):
+    pulse_set = extract_pulse_set_above_threshold(
+        rectangular_pulse_signal, threshold=0.5
+    )
+
+    assert isinstance(pulse_set, PulseSet)
+    assert pulse_set.start_indexes.tolist() == [2, 10, 18]
+    assert pulse_set.stop_indexes.tolist() == [5, 14, 20]
+
+    # Widths are 2, 3 and 1 seconds so only the last pulse is dropped
+    pulse_set = extract_pulse_set_above_threshold(
+        rectangular_pulse_signal, threshold=0.5, min_pulse_width_s=2.0
+    )
+    assert pulse_set.start_indexes.tolist() == [2, 10]
+
+
+def test_get_pulse_view_is_zero_copy(rectangular_pulse_signal):
+    pulse_set = extract_pulse_set_above_threshold(
+        rectangular_pulse_signal, threshold=0.5
+    )
+    time_s, data = get_pulse_view(pulse_set, 1)
+
+    assert time_s.tolist() == [10.0, 11.0, 12.0, 13.0]
+    assert np.shares_memory(data, pulse_set.data)
+
+
+def test_extract_pulse_set_metrics(rectangular_pulse_signal):
+    pulse_set = extract_pulse_set_above_threshold(
+        rectangular_pulse_signal, threshold=0.5
+    )
+    metrics = extract_pulse_set_metrics(pulse_set)
+
+    assert metrics["peak"].tolist() == [1.0, 2.0, 3.0]
+    assert metrics["mean"].tolist() == [1.0, 2.0, 3.0]
+    assert metrics["width_s"].tolist() == [2.0, 3.0, 1.0]
+    assert metrics["area"].tolist() == [2.0, 6.0, 3.0]
+    assert metrics["start_time_s"].tolist() == [2.0, 10.0, 18.0]
+
+
+def test_extract_pulse_set_metrics_empty_pulse(rectangular_pulse_signal):
+    pulse_set = compose_pulse_set(
+        rectangular_pulse_signal, start_indexes=[3, 20], stop_indexes=[3, 20]
+    )
+    metrics = extract_pulse_set_metrics(pulse_set)
+
+    assert np.isnan(metrics["peak"]).all()
+    assert metrics["area"].tolist() == [0.0, 0.0]
+
+
+def test_extract_signal_above_threshold_matches_pulse_set(rectangular_pulse_signal):
+    pulses = extract_signal_above_threshold(rectangular_pulse_signal, threshold=1.5)
+
+    assert [pulse.data for pulse in pulses] == [[2.0] * 4, [3.0] * 2]
+    assert [pulse.data_name for pulse in pulses] == [
+        "rectangular_pulse_1",
+        "rectangular_pulse_2",
+    ]
+
+
+def test_extract_pulse_set_from_signal():
+    time_s = np.linspace(0, 10e-9, 1001)
+    data = np.exp(-((time_s - 3e-9) ** 2) / (2 * (0.1e-9) ** 2)) + 2 * np.exp(
+        -((time_s - 7e-9) ** 2) / (2 * (0.1e-9) ** 2)
+    )
+    signal = DataTimeSignalData(time_s=time_s.tolist(), data=data.tolist())
+
+    pulse_set = extract_pulse_set_from_signal(
+        signal, pre_pulse_time_s=1e-9, post_pulse_time_s=1e-9, min_pulse_height=0.5
+    )
+
+    assert pulse_set.peak_indexes.tolist() == [300, 700]
+    assert np.allclose(time_s[pulse_set.start_indexes], [2e-9, 6e-9])
+    assert extract_pulse_set_metrics(pulse_set)["peak"].tolist() == pytest.approx(
+        [1.0, 2.0]
+    )
+
+    pulses = convert_pulse_set_to_multi_data_time_signal(pulse_set)
+    assert [pulse.data_name for pulse in pulses] == ["_pulse_300", "_pulse_700"]
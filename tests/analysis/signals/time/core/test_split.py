@@ -0,0 +1,147 @@
+import numpy as np
+import pytest
+from piel.types import DataTimeSignalData
+from piel.analysis.signals.time import (
+    extract_pulse_index_ranges_per_threshold,
+    separate_per_pulse_threshold,
+)
+
+
+@pytest.fixture
+def triggered_pulse_signal():
+    """
+    Fixture with high pulses at 10 ns and 60 ns, each followed 5 ns later by a low pulse,
+    plus an untriggered low pulse at 40 ns.
+    """
+    time_s = np.linspace(0, 100e-9, 10001)
+    data = np.zeros_like(time_s)
+    for center, amplitude in [
+        (10e-9, 5.0),
+        (15e-9, 2.0),
+        (40e-9, 2.0),
+        (60e-9, 5.0),
+        (65e-9, 2.0),
+    ]:
+        data += amplitude * np.exp(-((time_s - center) ** 2) / (2 * (0.1e-9) ** 2))
+    return DataTimeSignalData(
+        time_s=time_s.tolist(), data=data.tolist(), data_name="triggered"
+    )
+
+
+def test_extract_pulse_index_ranges_per_threshold(triggered_pulse_signal):
+    high_ranges, low_ranges = extract_pulse_index_ranges_per_threshold(
+        triggered_pulse_signal,
+        signal_thresholds=[4.0, 1.0],
+        trigger_delay_s=2e-9,
+        trigger_window_s=10e-9,
+    )
+    time_s = np.asarray(triggered_pulse_signal.time_s)
+
+    assert high_ranges.shape == (2, 2)
+    assert low_ranges.shape == (2, 2)
+    # Windows span pre and post pulse time around each peak
+    assert np.allclose(time_s[high_ranges[:, 0]], [9e-9, 59e-9])
+    assert np.allclose(time_s[low_ranges[:, 1] - 1], [16e-9, 66e-9])
+
+
+def test_extract_pulse_index_ranges_per_threshold_invalid():
+    signal = DataTimeSignalData(time_s=[0.0, 1.0], data=[0.0, 1.0])
+    with pytest.raises(ValueError):
+        extract_pulse_index_ranges_per_threshold(
+            signal, signal_thresholds=[1.0, 2.0], trigger_delay_s=0.0
+        )
+    with pytest.raises(ValueError):
+        extract_pulse_index_ranges_per_threshold(
+            signal,
+            signal_thresholds=[2.0, 1.0],
+            trigger_delay_s=0.0,
+            pre_pulse_time_s=[1.0, 1.0, 1.0],
+        )
+
+
+def test_separate_per_pulse_threshold(triggered_pulse_signal):
+    high_pulses, low_pulses = separate_per_pulse_threshold(
+        triggered_pulse_signal,
+        first_signal_threshold=4.0,
+        second_signal_threshold=1.0,
+        trigger_delay_s=2e-9,
+        trigger_window_s=10e-9,
+    )
+
+    assert len(high_pulses) == 2
+    # The untriggered low pulse is excluded and no low pulse is duplicated
+    assert len(low_pulses) == 2
+    assert [max(pulse.data) for pulse in low_pulses] == pytest.approx([2.0, 2.0])
+    assert low_pulses[0].time_s[np.argmax(low_pulses[0].data)] == pytest.approx(15e-9)
+
+
+def test_separate_per_pulse_threshold_names_pulses_by_peak_index(
+    triggered_pulse_signal,
+):
+    high_pulses, low_pulses = separate_per_pulse_threshold(
+        triggered_pulse_signal,
+        first_signal_threshold=4.0,
+        second_signal_threshold=1.0,
+        trigger_delay_s=2e-9,
+        trigger_window_s=10e-9,
+    )
+    assert [pulse.data_name for pulse in high_pulses] == [
+        "triggered_pulse_1000",
+        "triggered_pulse_6000",
+    ]
+    assert [pulse.data_name for pulse in low_pulses] == [
+        "triggered_pulse_1500",
+        "triggered_pulse_6500",
+    ]
+
+
+def test_separate_per_pulse_threshold_per_band_pulse_distance():
+    """
+    High pulses closer than the first band window are merged, regardless of the second band window.
+    """
+    time_s = np.linspace(0, 100e-9, 10001)
+    data = np.zeros_like(time_s)
+    for center, amplitude in [(10e-9, 5.0), (12e-9, 4.5), (15e-9, 2.0)]:
+        data += amplitude * np.exp(-((time_s - center) ** 2) / (2 * (0.1e-9) ** 2))
+    signal = DataTimeSignalData(time_s=time_s.tolist(), data=data.tolist())
+
+    high_pulses, low_pulses = separate_per_pulse_threshold(
+        signal,
+        first_signal_threshold=4.0,
+        second_signal_threshold=1.0,
+        trigger_delay_s=2e-9,
+        trigger_window_s=10e-9,
+        first_pre_pulse_time_s=2e-9,
+        first_post_pulse_time_s=2e-9,
+        second_pre_pulse_time_s=0.5e-9,
+        second_post_pulse_time_s=0.5e-9,
+    )
+    assert len(high_pulses) == 1
+    assert max(high_pulses[0].data) == pytest.approx(5.0)
+    assert len(low_pulses) == 1
+
+
+def test_separate_per_pulse_threshold_without_pulses():
+    signal = DataTimeSignalData(
+        time_s=np.linspace(0, 10e-9, 101).tolist(), data=np.zeros(101).tolist()
+    )
+    with pytest.raises(ValueError, match="No pulses detected"):
+        separate_per_pulse_threshold(
+            signal,
+            first_signal_threshold=4.0,
+            second_signal_threshold=1.0,
+            trigger_delay_s=2e-9,
+        )
+
+
+def test_separate_per_pulse_threshold_noise_std_multiplier_deprecated(
+    triggered_pulse_signal,
+):
+    with pytest.warns(DeprecationWarning):
+        separate_per_pulse_threshold(
+            triggered_pulse_signal,
+            first_signal_threshold=4.0,
+            second_signal_threshold=1.0,
+            trigger_delay_s=2e-9,
+            noise_std_multiplier=3.0,
+        )
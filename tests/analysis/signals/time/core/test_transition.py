@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+from piel.types import DataTimeSignalData
+from piel.analysis.signals.time import (
+    extract_edge_transitions,
+    extract_falling_edges,
+    extract_rising_edges,
+    extract_transition_times,
+)
+
+
+@pytest.fixture
+def trapezoid_signal():
+    """
+    Fixture with two trapezoid pulses between 0 and 1 with 10 s linear rising and 20 s linear falling edges,
+    sampled every second, offset so that the threshold crossings fall between samples.
+    """
+    time_s = np.arange(0.5, 200, 1.0)
+    period = np.mod(time_s, 100)
+    data = np.clip(
+        np.minimum((period - 10) / 10, (80 - period) / 20),
+        0,
+        1,
+    )
+    return DataTimeSignalData(time_s=time_s.tolist(), data=data.tolist())
+
+
+def test_extract_edge_transitions_rising(trapezoid_signal):
+    edge_transitions = extract_edge_transitions(trapezoid_signal)
+
+    assert len(edge_transitions) == 2
+    # The 10% to 90% crossings are interpolated between the samples
+    assert edge_transitions["start_crossing_time_s"].tolist() == pytest.approx(
+        [11.0, 111.0]
+    )
+    assert edge_transitions["transition_time_s"].tolist() == pytest.approx([8.0, 8.0])
+
+
+def test_extract_transition_times_falling(trapezoid_signal):
+    fall_times = extract_transition_times(trapezoid_signal, edge_type="falling")
+
+    assert fall_times.tolist() == pytest.approx([16.0, 16.0])
+
+
+def test_extract_edges_thresholds(trapezoid_signal):
+    rising_edges = extract_rising_edges(trapezoid_signal)
+    falling_edges = extract_falling_edges(trapezoid_signal)
+
+    assert len(rising_edges) == len(falling_edges) == 2
+    for edge in rising_edges:
+        assert edge.data[0] < 0.1
+        assert edge.data[-1] >= 0.9
+    for edge in falling_edges:
+        assert edge.data[0] > 0.9
+        assert edge.data[-1] <= 0.1
+    assert falling_edges[0].data_name == "_falling_edge_1"
+
+
+def test_extract_rising_edges_discards_incomplete_transition():
+    # The first transition falls back below the lower threshold before reaching the upper threshold
+    data = [0.0, 0.5, 0.0, 0.2, 0.6, 1.0, 1.0, 0.0]
+    signal = DataTimeSignalData(
+        time_s=list(np.arange(len(data), dtype=float)), data=data
+    )
+
+    edge_transitions = extract_edge_transitions(signal)
+
+    assert edge_transitions["start_index"].tolist() == [2]
+    assert edge_transitions["stop_index"].tolist() == [6]
@@ -0,0 +1,92 @@
+import numpy as np
+
+from piel import compose_connectivity_graph, create_connectivity_graph_connections
+from piel.analysis.timing import (
+    compose_monte_carlo_timing_analysis,
+    compose_static_timing_analysis,
+    propagate_delay_samples,
+    sample_connection_delays,
+)
+from piel.types import Component, Connection, Port, TimeMetric
+
+
+def _compose_stage(name: str, time: TimeMetric) -> Component:
+    ports = [Port(name="in"), Port(name="out")]
+    return Component(
+        name=name, ports=ports, connections=[Connection(ports=tuple(ports), time=time)]
+    )
+
+
+def _compose_reconvergent_graph():
+    graph = compose_connectivity_graph(
+        [
+            _compose_stage("source", TimeMetric(value=1.0)),
+            _compose_stage("fast", TimeMetric(value=2.0, standard_deviation=0.5)),
+            _compose_stage(
+                "slow", TimeMetric(value=5.0, min=4.0, max=6.0, standard_deviation=1.0)
+            ),
+            _compose_stage("sink", TimeMetric(value=1.0)),
+        ]
+    )
+    create_connectivity_graph_connections(
+        graph,
+        [
+            ["source.out", "fast.in"],
+            ["source.out", "slow.in"],
+            ["fast.out", "sink.in"],
+            ["slow.out", "sink.in"],
+        ],
+    )
+    return graph
+
+
+def test_sample_connection_delays():
+    analysis = compose_static_timing_analysis(_compose_reconvergent_graph())
+    connection_delays_s = sample_connection_delays(analysis, 10000, seed=0)
+    assert connection_delays_s.shape == (10000, len(analysis.graph.connections))
+
+    slow_connection_id = int(np.argmax(analysis.edge_delay_mean_s))
+    assert connection_delays_s[:, slow_connection_id].min() >= 4.0
+    assert connection_delays_s[:, slow_connection_id].max() <= 6.0
+    # Connections without a range keep their full distribution
+    fast_connection_id = int(
+        np.flatnonzero(analysis.edge_delay_standard_deviation_s == 0.5)[0]
+    )
+    assert np.isclose(connection_delays_s[:, fast_connection_id].std(), 0.5, rtol=0.05)
+
+
+def test_propagate_delay_samples_matches_static_timing_analysis():
+    analysis = compose_static_timing_analysis(_compose_reconvergent_graph())
+    connection_delays_s = np.stack(
+        [analysis.edge_delay_min_s, analysis.edge_delay_max_s]
+    )
+    arrival_times_s = propagate_delay_samples(analysis, connection_delays_s)
+    # Every path ends at the sink, so its latest arrival over the extreme delays is the static maximum
+    np.testing.assert_allclose(arrival_times_s[1], analysis.arrival_time_max_s)
+
+
+def test_compose_monte_carlo_timing_analysis():
+    monte_carlo_analysis = compose_monte_carlo_timing_analysis(
+        _compose_reconvergent_graph(),
+        sample_amount=100000,
+        timing_budget_s=7.0,
+        seed=0,
+        chunk_size=30000,
+    )
+    assert monte_carlo_analysis.endpoint_references == ["sink.out"]
+    # The slow path dominates and is clipped symmetrically around its mean
+    assert np.isclose(monte_carlo_analysis.delay_percentiles_s[0], 7.0, atol=0.02)
+    assert monte_carlo_analysis.delay_percentiles_s[-1] <= 8.0
+    assert np.isclose(monte_carlo_analysis.timing_yield, 0.5, atol=0.02)
+
+    dataframe = monte_carlo_analysis.dataframe
+    assert list(dataframe.columns) == [
+        "port",
+        "delay_mean_s",
+        "delay_standard_deviation_s",
+        "delay_p50_s",
+        "delay_p90_s",
+        "delay_p99_s",
+        "delay_p99.9_s",
+        "timing_yield",
+    ]
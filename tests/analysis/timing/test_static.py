@@ -0,0 +1,144 @@
+import numpy as np
+import pytest
+
+from piel import compose_connectivity_graph, create_connectivity_graph_connections
+from piel.analysis.timing import (
+    compose_static_timing_analysis,
+    extract_critical_path,
+    resolve_time_metric_statistics,
+    update_connection_timing,
+)
+from piel.types import (
+    Component,
+    Connection,
+    DispersiveTimeMetrics,
+    Port,
+    TimeMetric,
+)
+
+
+def _compose_stage(name: str, delay_s: float) -> Component:
+    ports = [Port(name="in"), Port(name="out")]
+    return Component(
+        name=name,
+        ports=ports,
+        connections=[Connection(ports=tuple(ports), time=TimeMetric(value=delay_s))],
+    )
+
+
+@pytest.fixture
+def reconvergent_graph():
+    # source -> fast -> sink and source -> slow -> sink
+    graph = compose_connectivity_graph(
+        [
+            _compose_stage("source", 1.0),
+            _compose_stage("fast", 2.0),
+            _compose_stage("slow", 5.0),
+            _compose_stage("sink", 1.0),
+        ]
+    )
+    create_connectivity_graph_connections(
+        graph,
+        [
+            ["source.out", "fast.in"],
+            ["source.out", "slow.in"],
+            ["fast.out", "sink.in"],
+            ["slow.out", "sink.in"],
+        ],
+    )
+    return graph
+
+
+def test_resolve_time_metric_statistics():
+    assert resolve_time_metric_statistics(TimeMetric(value=2.0)) == (2.0, 2.0, 2.0, 0.0)
+    assert resolve_time_metric_statistics(
+        TimeMetric(value=2.0, mean=2.0, min=1.0, max=4.0, standard_deviation=0.5)
+    ) == (2.0, 1.0, 4.0, 0.5)
+
+    dispersive_time = DispersiveTimeMetrics(
+        frequency_group={1e9: TimeMetric(value=1.0), 1e10: TimeMetric(value=3.0)}
+    )
+    assert resolve_time_metric_statistics(dispersive_time, frequency_Hz=2e9) == (
+        1.0,
+        1.0,
+        1.0,
+        0.0,
+    )
+    assert resolve_time_metric_statistics(dispersive_time) == (3.0, 1.0, 3.0, 0.0)
+
+
+def test_compose_static_timing_analysis(reconvergent_graph):
+    analysis = compose_static_timing_analysis(reconvergent_graph)
+    timing = analysis.dataframe.set_index("port")
+
+    assert timing.loc["sink.out", "arrival_time_max_s"] == 7.0
+    assert timing.loc["sink.out", "arrival_time_min_s"] == 4.0
+    assert timing.loc["fast.out", "slack_s"] == 3.0
+    assert analysis.worst_slack_s == 0.0
+    assert extract_critical_path(analysis) == [
+        "source.in",
+        "source.out",
+        "slow.in",
+        "slow.out",
+        "sink.in",
+        "sink.out",
+    ]
+
+    constrained_analysis = compose_static_timing_analysis(
+        reconvergent_graph,
+        required_time_s=7.0,
+        start_arrival_times_s={"source.in": 0.5},
+    )
+    assert constrained_analysis.worst_slack_s == -0.5
+
+
+def test_statistical_arrival_time():
+    graph = compose_connectivity_graph(
+        [
+            Component(name="a", ports=[Port(name="out")]),
+            Component(name="b", ports=[Port(name="out")]),
+            Component(name="c", ports=[Port(name="in")]),
+        ]
+    )
+    for source in ["a.out", "b.out"]:
+        (connection,) = create_connectivity_graph_connections(graph, [source, "c.in"])
+        connection.time = TimeMetric(value=1.0, standard_deviation=1.0)
+
+    analysis = compose_static_timing_analysis(graph)
+    port_id = graph.get_port_id("c.in")
+    # The maximum of two independent standard normal distributions has a mean of 1 / sqrt(pi)
+    assert np.isclose(analysis.arrival_time_mean_s[port_id], 1.0 + 1 / np.sqrt(np.pi))
+    assert np.isclose(
+        analysis.arrival_time_standard_deviation_s[port_id], np.sqrt(1 - 1 / np.pi)
+    )
+
+
+def test_update_connection_timing_matches_full_analysis(reconvergent_graph):
+    analysis = compose_static_timing_analysis(reconvergent_graph)
+    fast_connection_id = next(
+        connection_id
+        for connection_id, connection in enumerate(reconvergent_graph.connections)
+        if connection.ports[0] is reconvergent_graph.get_port("fast.in")
+    )
+
+    update_connection_timing(analysis, fast_connection_id, TimeMetric(value=10.0))
+    full_analysis = compose_static_timing_analysis(reconvergent_graph)
+    for column in [
+        "arrival_time_max_s",
+        "arrival_time_min_s",
+        "required_time_s",
+        "slack_s",
+    ]:
+        np.testing.assert_array_equal(
+            getattr(analysis, column), getattr(full_analysis, column)
+        )
+    assert extract_critical_path(analysis, "sink.out")[2] == "fast.in"
+
+
+def test_compose_static_timing_analysis_rejects_cycles():
+    graph = compose_connectivity_graph(
+        [_compose_stage("a", 1.0), _compose_stage("b", 1.0)]
+    )
+    create_connectivity_graph_connections(graph, [["a.out", "b.in"], ["b.out", "a.in"]])
+    with pytest.raises(ValueError):
+        compose_static_timing_analysis(graph)
@@ -0,0 +1,83 @@
+import pytest
+from click.testing import CliRunner
+from piel.cli import main
+from piel.cli.profile import (
+    check_import_time_budget,
+    compose_import_profile_tree,
+    parse_import_time_log,
+    profile_import,
+)
+
+IMPORT_TIME_LOG = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     leaf_a
+import time:       200 |        300 |   child_a
+import time:       400 |        400 |   child_b
+import time:      1000 |       1700 | root
+import time:        50 |         50 | other_root
+"""
+
+
+def test_parse_import_time_log():
+    import_profile = parse_import_time_log(IMPORT_TIME_LOG)
+
+    assert [module["name"] for module in import_profile] == [
+        "leaf_a",
+        "child_a",
+        "child_b",
+        "root",
+        "other_root",
+    ]
+    assert [module["depth"] for module in import_profile] == [2, 1, 1, 0, 0]
+    assert import_profile[1]["children"] == [0]
+    assert import_profile[3]["children"] == [1, 2]
+    assert import_profile[3]["cumulative_time_s"] == pytest.approx(1.7e-3)
+
+
+def test_compose_import_profile_tree():
+    import_profile = parse_import_time_log(IMPORT_TIME_LOG)
+
+    tree = compose_import_profile_tree(import_profile, minimum_time_s=0.2e-3)
+    module_names = [line.split()[-1] for line in tree.splitlines()[1:]]
+
+    # The slowest modules come first and faster modules than the minimum are hidden
+    assert module_names == ["root", "child_b", "child_a"]
+
+    tree = compose_import_profile_tree(import_profile, maximum_depth=0)
+    assert [line.split()[-1] for line in tree.splitlines()[1:]] == [
+        "root",
+        "other_root",
+    ]
+
+
+def test_profile_import():
+    import_profile, peak_memory = profile_import(["colorsys"], trace_memory=True)
+
+    assert [module["name"] for module in import_profile] == ["colorsys"]
+    assert import_profile[0]["cumulative_memory_bytes"] > 0
+    assert peak_memory > 0
+
+    with pytest.raises(ImportError):
+        profile_import(["piel_module_that_does_not_exist"])
+
+
+def test_check_import_time_budget():
+    (budget_result,) = check_import_time_budget({"colorsys": 10.0})
+
+    assert budget_result["name"] == "colorsys"
+    assert budget_result["within_budget"]
+
+
+def test_profile_import_command():
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["profile-import", "colorsys", "--min-time-ms", "0"])
+    assert result.exit_code == 0
+    assert "colorsys" in result.output
+
+    result = runner.invoke(main, ["profile-import", "--budget", "colorsys=0"])
+    assert result.exit_code == 1
+    assert "EXCEEDED: colorsys" in result.output
+
+    result = runner.invoke(main, ["profile-import", "--budget", "colorsys"])
+    assert result.exit_code == 2
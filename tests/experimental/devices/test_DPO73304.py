@@ -1,8 +1,14 @@
+import pytest
+import os
+import numpy as np
 import pandas as pd
 from piel.experimental.devices.DPO73304 import (
     extract_measurement_to_dataframe,
     extract_waveform_to_dataframe,
     extract_to_data_time_signal,
+    extract_to_data_time_signal_from_binary_cache,
+    extract_waveform_to_binary_cache,
+    is_waveform_binary_cache_valid,
 )
 from piel.types import (
     DataTimeSignalData,
@@ -136,4 +142,65 @@ def test_combine_channel_data():
         pass
 
 
+def write_waveform_csv(file, time_s, voltage_V):
+    pd.DataFrame(
+        {
+            "record_length": "",
+            "sample_interval": "",
+            "trigger_point": "",
+            "time": time_s,
+            "voltage": voltage_V,
+        }
+    ).to_csv(file, index=False)
+
+
+# Test the memory-mapped binary cache
+def test_extract_to_data_time_signal_from_binary_cache(tmp_path):
+    file = tmp_path / "waveform.csv"
+    time_s = np.linspace(0, 1e-9, 11)
+    voltage_V = np.sin(time_s * 1e9)
+    write_waveform_csv(file, time_s, voltage_V)
+
+    assert not is_waveform_binary_cache_valid(file)
+    # A small chunk size streams the csv across several chunks
+    cache_paths = extract_waveform_to_binary_cache(file, chunk_size=3)
+    assert is_waveform_binary_cache_valid(file)
+    assert cache_paths["time_s"].parent == tmp_path / ".piel_cache"
+
+    signal = extract_to_data_time_signal_from_binary_cache(file)
+    assert isinstance(signal.data, np.memmap)
+    np.testing.assert_allclose(signal.time_s, time_s)
+    np.testing.assert_allclose(signal.data, voltage_V)
+    np.testing.assert_allclose(
+        extract_to_data_time_signal(file, use_cache=True).data,
+        extract_to_data_time_signal(file).data,
+    )
+
+
+def test_binary_cache_invalidated_on_change(tmp_path):
+    file = tmp_path / "waveform.csv"
+    write_waveform_csv(file, [0.0, 1.0], [1.0, 2.0])
+    extract_waveform_to_binary_cache(file, cache_directory=tmp_path / "cache")
+
+    write_waveform_csv(file, [0.0, 1.0, 2.0], [3.0, 4.0, 5.0])
+    stat = file.stat()
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert not is_waveform_binary_cache_valid(file, cache_directory=tmp_path / "cache")
+
+    signal = extract_to_data_time_signal(
+        file, use_cache=True, cache_directory=tmp_path / "cache"
+    )
+    assert signal.data.tolist() == [3.0, 4.0, 5.0]
+
+
+def test_binary_cache_removes_temporary_files_on_failure(tmp_path):
+    file = tmp_path / "waveform.csv"
+    write_waveform_csv(file, [0.0, 1.0], ["1.0", "not a number"])
+
+    with pytest.raises(ValueError):
+        extract_waveform_to_binary_cache(file, cache_directory=tmp_path / "cache")
+    assert list((tmp_path / "cache").glob("*.tmp")) == []
+    assert not is_waveform_binary_cache_valid(file, cache_directory=tmp_path / "cache")
+
+
 # Add more tests as needed to cover additional scenarios and edge cases.
@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+from piel.experimental import (
+    extract_dc_sweep_experiment_data_from_csv,
+    extract_dc_sweeps_from_operating_point_dataframe,
+    split_operating_point_dataframe,
+)
+
+
+@pytest.fixture
+def operating_point_dataframe():
+    """
+    Fixture with interleaved rows of three operating points over two columns.
+    """
+    return pd.DataFrame(
+        {
+            "driver_a_v_set": [1.0, 2.0, 1.0, 2.0, 1.0, 3.0],
+            "driver_b_v_set": [0.5, 0.5, 0.5, 0.5, 0.5, 0.5],
+            "source_v": [0.0, 0.0, 0.1, 0.1, 0.2, 0.0],
+            "source_i": [0.0, 1.0, 0.1, 1.1, 0.2, 2.0],
+            "output_v": [10.0, 20.0, 11.0, 21.0, 12.0, 30.0],
+        }
+    )
+
+
+def test_split_operating_point_dataframe(operating_point_dataframe):
+    parameters_list, operating_point_dataframes = split_operating_point_dataframe(
+        operating_point_dataframe,
+        unique_operating_point_columns=["driver_a_v_set", "driver_b_v_set"],
+    )
+
+    # Operating points keep their first appearance order, and the rows their original order
+    assert [parameters["driver_a_v_set"] for parameters in parameters_list] == [
+        1.0,
+        2.0,
+        3.0,
+    ]
+    assert [len(dataframe) for dataframe in operating_point_dataframes] == [3, 2, 1]
+    assert operating_point_dataframes[0]["source_v"].tolist() == [0.0, 0.1, 0.2]
+
+
+@pytest.mark.parametrize("max_workers", [None, 2])
+def test_extract_dc_sweeps_from_operating_point_dataframe(
+    operating_point_dataframe, max_workers
+):
+    dc_sweeps = extract_dc_sweeps_from_operating_point_dataframe(
+        operating_point_dataframe,
+        input_signal_name_list=[("source_v", "source_i")],
+        output_signal_name_list=["output_v"],
+        power_signal_name_list=[],
+        unique_operating_point_columns=["driver_a_v_set", "driver_b_v_set"],
+        max_workers=max_workers,
+    )
+
+    assert len(dc_sweeps.collection) == 3
+    output_values = [
+        np.asarray(dc_sweep.outputs[0].trace_list[0].values).tolist()
+        for dc_sweep in dc_sweeps.collection
+    ]
+    assert output_values == [[10.0, 11.0, 12.0], [20.0, 21.0], [30.0]]
+
+
+def test_extract_dc_sweep_experiment_data_from_csv(operating_point_dataframe, tmp_path):
+    file = tmp_path / "operating_points.csv"
+    operating_point_dataframe.to_csv(file, index=False)
+
+    experiment_data = extract_dc_sweep_experiment_data_from_csv(
+        file,
+        input_signal_name_list=[("source_v", "source_i")],
+        output_signal_name_list=["output_v"],
+        power_signal_name_list=[],
+        unique_operating_point_columns=["driver_a_v_set"],
+    )
+
+    assert len(experiment_data.experiment.parameters_list) == 3
+    assert len(experiment_data.data.collection) == 3
@@ -0,0 +1,258 @@
+import logging
+import numpy as np
+import pandas as pd
+import pytest
+
+from piel.experimental import (
+    convert_power_sweep_s2p_array_to_s_parameters,
+    extract_data_from_measurement_collection,
+    extract_power_sweep_data_from_vna_measurement,
+    convert_power_sweep_s2p_to_dense_network_transmission,
+    convert_power_sweep_s2p_to_network_transmission,
+    extract_power_sweep_s2p_files_to_dense_network_transmissions,
+    extract_power_sweep_s2p_to_dataframe,
+    load_power_sweep_s2p_array,
+    load_power_sweep_s2p_arrays,
+)
+from piel.types import (
+    FrequencyMeasurementDataCollection,
+    VNAPowerSweepMeasurement,
+    VNAPowerSweepMeasurementCollection,
+)
+from piel.tools.skrf import (
+    convert_dense_network_transmission_to_skrf_network,
+    convert_skrf_network_to_dense_network_transmission,
+)
+
+
+def _compose_power_sweep_dataframe():
+    return pd.DataFrame(
+        {
+            "p_in_dbm": [-10.0, -5.0, 0.0],
+            "s_11_db": [-20.0, -19.0, -18.0],
+            "s_11_deg": [10.0, 20.0, 30.0],
+            "s_21_db": [10.0, 9.5, 8.0],
+            "s_21_deg": [-90.0, -95.0, -100.0],
+            "s_12_db": [-40.0, -40.0, -40.0],
+            "s_12_deg": [0.0, 0.0, 0.0],
+            "s_22_db": [-15.0, -15.0, -15.0],
+            "s_22_deg": [45.0, 45.0, 45.0],
+            "input_frequency_Hz": [1e9, 1e9, 1e9],
+        }
+    )
+
+
+def test_convert_power_sweep_s2p_to_dense_network_transmission():
+    network_transmission = convert_power_sweep_s2p_to_dense_network_transmission(
+        _compose_power_sweep_dataframe()
+    )
+    assert network_transmission.s.shape == (3, 2, 2)
+    np.testing.assert_allclose(
+        np.abs(network_transmission.s[:, 1, 0]), 10 ** (np.array([10, 9.5, 8]) / 20)
+    )
+    np.testing.assert_allclose(np.abs(network_transmission.s[:, 0, 1]), 10**-2)
+    np.testing.assert_allclose(network_transmission.input.magnitude, [-10, -5, 0])
+
+
+def test_convert_power_sweep_s2p_to_dense_network_transmission_skrf_round_trip():
+    network_transmission = convert_power_sweep_s2p_to_dense_network_transmission(
+        _compose_power_sweep_dataframe()
+    )
+    network = convert_dense_network_transmission_to_skrf_network(network_transmission)
+    np.testing.assert_allclose(network.s_db[:, 1, 0], [10.0, 9.5, 8.0])
+    np.testing.assert_allclose(network.s_deg[:, 1, 0], [-90.0, -95.0, -100.0])
+    np.testing.assert_allclose(network.s_db[:, 0, 1], -40.0)
+    np.testing.assert_allclose(network.s_db[:, 0, 0], [-20.0, -19.0, -18.0])
+
+    round_trip_network_transmission = (
+        convert_skrf_network_to_dense_network_transmission(network)
+    )
+    np.testing.assert_allclose(
+        round_trip_network_transmission.s, network_transmission.s
+    )
+
+
+def test_convert_power_sweep_s2p_to_network_transmission():
+    network_transmission = convert_power_sweep_s2p_to_network_transmission(
+        _compose_power_sweep_dataframe()
+    )
+    path_transmissions = {
+        path_transmission.connection: path_transmission.transmission
+        for path_transmission in network_transmission.network
+    }
+    assert set(path_transmissions) == {
+        ("in0", "in0"),
+        ("in0", "out0"),
+        ("out0", "in0"),
+        ("out0", "out0"),
+    }
+    np.testing.assert_allclose(
+        path_transmissions[("in0", "out0")].magnitude, [10.0, 9.5, 8.0]
+    )
+    np.testing.assert_allclose(
+        path_transmissions[("in0", "out0")].phase, [-90.0, -95.0, -100.0]
+    )
+    np.testing.assert_allclose(path_transmissions[("out0", "in0")].magnitude, -40.0)
+
+
+S2P_POWER_SWEEP_FILE = """! Power sweep
+# Hz S DB R 50
+-10.0 -20.0 10.0 10.0 -90.0 -40.0 0.0 -15.0 45.0
+-5.0 -19.0 20.0 9.5 -95.0 -40.0 0.0 -15.0 45.0 ! inline comment
+0.0 -18.0 30.0 8.0 -100.0 -40.0 0.0 -15.0 45.0
+"""
+
+
+def test_load_power_sweep_s2p_array(tmp_path):
+    file_path = tmp_path / "sweep.s2p"
+    file_path.write_text(S2P_POWER_SWEEP_FILE)
+    data = load_power_sweep_s2p_array(file_path)
+    assert data.shape == (3, 9)
+    np.testing.assert_allclose(data[:, 0], [-10.0, -5.0, 0.0])
+
+    dataframe = extract_power_sweep_s2p_to_dataframe(file_path, input_frequency_Hz=1e9)
+    pd.testing.assert_frame_equal(
+        dataframe[_compose_power_sweep_dataframe().columns],
+        _compose_power_sweep_dataframe(),
+    )
+
+
+def test_load_power_sweep_s2p_array_skips_malformed_lines(tmp_path):
+    file_path = tmp_path / "sweep.s2p"
+    file_path.write_text(S2P_POWER_SWEEP_FILE + "1.0 2.0\nnan_value 1 2 3 4 5 6 7 8\n")
+    data = load_power_sweep_s2p_array(file_path)
+    assert data.shape == (3, 9)
+    np.testing.assert_allclose(data[:, 0], [-10.0, -5.0, 0.0])
+
+
+def test_extract_power_sweep_s2p_files_to_dense_network_transmissions(tmp_path):
+    file_paths = []
+    for file_index in range(3):
+        file_path = tmp_path / f"sweep_{file_index}.s2p"
+        file_path.write_text(S2P_POWER_SWEEP_FILE)
+        file_paths.append(file_path)
+
+    data = load_power_sweep_s2p_arrays(file_paths, max_workers=2)
+    assert data.shape == (3, 3, 9)
+    p_in_dbm, s = convert_power_sweep_s2p_array_to_s_parameters(data)
+    assert s.shape == (3, 3, 2, 2)
+
+    network_transmissions = (
+        extract_power_sweep_s2p_files_to_dense_network_transmissions(
+            file_paths, input_frequencies_Hz=[1e9, 2e9, 3e9]
+        )
+    )
+    expected_network_transmission = (
+        convert_power_sweep_s2p_to_dense_network_transmission(
+            _compose_power_sweep_dataframe()
+        )
+    )
+    for network_transmission, input_frequency_Hz in zip(
+        network_transmissions, [1e9, 2e9, 3e9]
+    ):
+        np.testing.assert_allclose(
+            network_transmission.s, expected_network_transmission.s
+        )
+        np.testing.assert_allclose(
+            network_transmission.input.frequency, input_frequency_Hz
+        )
+
+    (tmp_path / "short.s2p").write_text(S2P_POWER_SWEEP_FILE.rsplit("\n", 2)[0])
+    with pytest.raises(ValueError):
+        load_power_sweep_s2p_arrays(file_paths + [tmp_path / "short.s2p"])
+
+
+def _assert_power_sweep_network_transmissions_equal(
+    network_transmission, expected_network_transmission
+):
+    assert [
+        path_transmission.connection
+        for path_transmission in network_transmission.network
+    ] == [
+        path_transmission.connection
+        for path_transmission in expected_network_transmission.network
+    ]
+    for path_transmission, expected_path_transmission in zip(
+        network_transmission.network, expected_network_transmission.network
+    ):
+        np.testing.assert_allclose(
+            path_transmission.transmission.magnitude,
+            expected_path_transmission.transmission.magnitude,
+        )
+        np.testing.assert_allclose(
+            path_transmission.transmission.phase,
+            expected_path_transmission.transmission.phase,
+        )
+
+
+def test_extract_power_sweep_data_from_vna_measurement(tmp_path):
+    file_path = tmp_path / "sweep.s2p"
+    file_path.write_text(S2P_POWER_SWEEP_FILE)
+    expected_network_transmission = convert_power_sweep_s2p_to_network_transmission(
+        _compose_power_sweep_dataframe().assign(input_frequency_Hz=0.0)
+    )
+
+    measurement_data = extract_power_sweep_data_from_vna_measurement(
+        VNAPowerSweepMeasurement(name="sweep", spectrum_file=file_path)
+    )
+    assert measurement_data.name == "sweep"
+    _assert_power_sweep_network_transmissions_equal(
+        measurement_data.network, expected_network_transmission
+    )
+
+
+def test_extract_data_from_power_sweep_measurement_collection(tmp_path, caplog):
+    measurements = []
+    for file_index in range(3):
+        file_path = tmp_path / f"sweep_{file_index}.s2p"
+        file_path.write_text(S2P_POWER_SWEEP_FILE)
+        measurements.append(
+            VNAPowerSweepMeasurement(
+                name=f"sweep_{file_index}", spectrum_file=file_path
+            )
+        )
+    measurement_collection = VNAPowerSweepMeasurementCollection(
+        name="sweeps", collection=measurements
+    )
+    expected_network_transmission = extract_power_sweep_data_from_vna_measurement(
+        measurements[0]
+    ).network
+
+    # The collection is extracted at once, without the per-measurement extraction methods
+    measurement_data_collection = extract_data_from_measurement_collection(
+        measurement_collection, measurement_to_data_method_map={}
+    )
+
+    assert isinstance(measurement_data_collection, FrequencyMeasurementDataCollection)
+    assert [
+        measurement_data.name
+        for measurement_data in measurement_data_collection.collection
+    ] == ["sweep_0", "sweep_1", "sweep_2"]
+    for measurement_data in measurement_data_collection.collection:
+        _assert_power_sweep_network_transmissions_equal(
+            measurement_data.network, expected_network_transmission
+        )
+
+    # Missing files fall back to extracting each measurement on its own
+    measurement_collection.collection.append(
+        VNAPowerSweepMeasurement(name="missing", spectrum_file=tmp_path / "missing.s2p")
+    )
+    with caplog.at_level(logging.WARNING):
+        measurement_data_collection = extract_data_from_measurement_collection(
+            measurement_collection, skip_missing=True
+        )
+    assert "one at a time" in caplog.text
+    assert len(measurement_data_collection.collection) == 4
+    assert measurement_data_collection.collection[-1].network is None
+
+    # Unexpected failures of the collection extraction are not hidden by the fallback
+    def extract_collection_data(measurement_collection):
+        raise RuntimeError("Unexpected failure")
+
+    with pytest.raises(RuntimeError):
+        extract_data_from_measurement_collection(
+            measurement_collection,
+            measurement_collection_to_data_method_map={
+                "VNAPowerSweepMeasurementCollection": extract_collection_data
+            },
+        )
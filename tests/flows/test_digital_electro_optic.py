@@ -0,0 +1,182 @@
+import jax.numpy as jnp
+import numpy as np
+import pytest
+from piel.flows import get_state_phase_transitions
+from piel.flows.digital_electro_optic import (
+    add_truth_table_bit_to_phase_data,
+    add_truth_table_phase_to_bit_data,
+    compile_bit_phase_map,
+    convert_optical_transitions_to_truth_table,
+    convert_phase_to_bit_iterable,
+    filter_and_correct_truth_table,
+    filter_truth_table_array,
+    find_nearest_bit_for_phase,
+    find_nearest_bits_for_phases,
+    find_nearest_phase_for_bit,
+    find_truth_table_array_conflicts,
+)
+from piel.models.frequency.defaults import get_default_models
+from piel.models.logic.electro_optic import linear_bit_phase_map
+from piel.types import BitPhaseMap, CompiledBitPhaseMap, TruthTable
+from .test_electro_optic import mzi_netlist
+
+
+def find_nearest_bit_for_phase_reference(target_phase, bit_phase_map):
+    phases = np.asarray(bit_phase_map.phase)
+    nearest_phase = phases[np.argmin(np.abs(phases - target_phase))]
+    return bit_phase_map.bits[list(phases).index(nearest_phase)], nearest_phase
+
+
+@pytest.fixture
+def bit_phase_map():
+    # Unsorted phases with a repeated phase and a phase equally near two others
+    return BitPhaseMap(
+        bits=["11", "0", "10", "1"],
+        phase=[np.pi, 0.0, 1.0, 1.0],
+    )
+
+
+def test_compile_bit_phase_map(bit_phase_map):
+    compiled_bit_phase_map = compile_bit_phase_map(bit_phase_map)
+
+    assert isinstance(compiled_bit_phase_map, CompiledBitPhaseMap)
+    assert compile_bit_phase_map(compiled_bit_phase_map) is compiled_bit_phase_map
+    np.testing.assert_array_equal(compiled_bit_phase_map.phase, [0.0, 1.0, np.pi])
+    assert compiled_bit_phase_map.phase_bits.tolist() == ["0", "10", "11"]
+    assert compiled_bit_phase_map.max_bit_length == 1
+
+
+@pytest.mark.parametrize("target_phase", [-1.0, 0.0, 0.4, 0.5, 1.0, 2.0, 3.5])
+def test_find_nearest_bit_for_phase_matches_linear_search(bit_phase_map, target_phase):
+    assert find_nearest_bit_for_phase(
+        target_phase, bit_phase_map
+    ) == find_nearest_bit_for_phase_reference(target_phase, bit_phase_map)
+
+
+def test_find_nearest_bits_for_phases_tie_uses_first_entry():
+    # 0.5 is equally near 0 and 1, and 1 appears first in the map
+    bit_phase_map = BitPhaseMap(bits=["01", "00"], phase=[1.0, 0.0])
+
+    bits, nearest_phase = find_nearest_bits_for_phases([0.5, 0.2], bit_phase_map)
+
+    assert bits.tolist() == ["01", "00"]
+    np.testing.assert_array_equal(nearest_phase, [1.0, 0.0])
+
+
+def test_find_nearest_bits_for_phases_batch():
+    bit_phase_map = linear_bit_phase_map(bits_amount=4, final_phase_rad=np.pi)
+    target_phases = np.random.default_rng(0).uniform(-0.5, 3.5, size=200)
+
+    bits, nearest_phase = find_nearest_bits_for_phases(
+        target_phases, compile_bit_phase_map(bit_phase_map)
+    )
+
+    for bits_i, nearest_phase_i, target_phase in zip(
+        bits, nearest_phase, target_phases
+    ):
+        assert (bits_i, nearest_phase_i) == find_nearest_bit_for_phase_reference(
+            target_phase, bit_phase_map
+        )
+
+
+def test_convert_phase_to_bit_iterable_pads_bits(bit_phase_map):
+    bit_phase_map = BitPhaseMap(bits=["1", "0", "11"], phase=[1.0, 0.0, 3.0])
+
+    assert convert_phase_to_bit_iterable((0.0, 2.9, 1.2), bit_phase_map) == (
+        "00",
+        "11",
+        "01",
+    )
+    assert convert_phase_to_bit_iterable(
+        (0.6,), bit_phase_map, rounding_function=np.floor
+    ) == ("00",)
+
+
+def test_find_nearest_phase_for_bit(bit_phase_map):
+    (phases,) = find_nearest_phase_for_bit("1", bit_phase_map)
+    np.testing.assert_array_equal(phases, [1.0])
+
+    assert find_nearest_phase_for_bit("111", bit_phase_map) == tuple()
+
+
+def test_add_truth_table_bit_to_phase_data():
+    bit_phase_map = linear_bit_phase_map(bits_amount=2, final_phase_rad=np.pi)
+    truth_table = TruthTable(
+        input_ports=["a"],
+        output_ports=["x"],
+        a={0: "0", 1: "1"},
+        x={0: "01", 1: "11"},
+    )
+
+    truth_table = add_truth_table_bit_to_phase_data(
+        truth_table, bit_phase_map, bit_phase_column_name="x"
+    )
+
+    assert list(truth_table.phase_0.values()) == pytest.approx(
+        [bit_phase_map.phase[1], bit_phase_map.phase[3]]
+    )
+
+
+def test_add_truth_table_phase_to_bit_data(bit_phase_map):
+    truth_table = TruthTable(
+        input_ports=["a"],
+        output_ports=["x"],
+        a={0: "0", 1: "1", 2: "1"},
+        x={0: 0.1, 1: 0.9, 2: 3.0},
+    )
+
+    truth_table = add_truth_table_phase_to_bit_data(
+        truth_table, bit_phase_map, phase_column_name="x"
+    )
+
+    expected_bits = [
+        convert_phase_to_bit_iterable((phase_i,), bit_phase_map)[0]
+        for phase_i in truth_table.x.values()
+    ]
+    assert list(truth_table.bit_phase_0.values()) == expected_bits
+
+
+def test_convert_optical_transitions_to_truth_table():
+    optical_state_transitions = get_state_phase_transitions(
+        circuit_component=mzi_netlist,
+        models=get_default_models(type="optical_logic_verification"),
+        mode_amount=2,
+        switch_states=[0, jnp.pi],
+        netlist_function=lambda circuit: circuit,
+        target_mode_index=0,
+    )
+    bit_phase_map = linear_bit_phase_map(bits_amount=1, final_phase_rad=np.pi)
+
+    truth_table = convert_optical_transitions_to_truth_table(
+        optical_state_transitions, bit_phase_map, logic="implementation"
+    )
+
+    assert truth_table.dataframe["input_fock_state_str"].tolist() == ["01", "10"]
+    assert truth_table.dataframe["bit_phase_0"].tolist() == ["0", "1"]
+
+
+def test_filter_and_correct_truth_table_keeps_first_mapping():
+    truth_table_dictionary = {
+        "a": ["00", "01", "00", "10", "01"],
+        "b": ["1", "0", "0", "1", "0"],
+        "unused": [0, 1, 2, 3, 4],
+    }
+    corrected_truth_table = filter_and_correct_truth_table(
+        truth_table_dictionary, input_ports=["a"], output_ports=["b"]
+    )
+    assert corrected_truth_table == {"a": ["00", "01", "10"], "b": ["1", "0", "1"]}
+
+
+def test_truth_table_array_conflicts():
+    truth_table = TruthTable(
+        input_ports=["a"],
+        output_ports=["b"],
+        a=["00", "01", "00", "10", "01"],
+        b=["1", "0", "0", "1", "0"],
+    )
+    is_duplicate, is_conflict = find_truth_table_array_conflicts(truth_table.array)
+    assert is_duplicate.tolist() == [False, False, True, False, True]
+    assert is_conflict.tolist() == [False, False, True, False, False]
+
+    filtered_truth_table_array = filter_truth_table_array(truth_table.array)
+    assert filtered_truth_table_array.data.tolist() == [[0, 1], [1, 0], [2, 1]]
@@ -0,0 +1,360 @@
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+from piel.flows.electro_optic import (
+    calculate_classical_transition_probability_amplitudes,
+    calculate_classical_transition_probability_amplitudes_batch,
+    calculate_switch_unitaries,
+    calculate_switch_unitaries_batch,
+    compose_network_matrix_from_models,
+    compose_phase_address_state,
+    compose_phase_configurations_array,
+    compose_phase_configurations_from_indexes,
+    compose_switch_function_parameter_state,
+    construct_unitary_transition_probability_performance,
+    construct_unitary_transition_probability_performance_array,
+    get_state_phase_transitions,
+    convert_switch_unitary_batch_to_dictionaries,
+    iterate_switch_unitaries_batches,
+)
+from piel.models.frequency import get_default_models
+from piel.tools.qutip import fock_states_only_individual_modes
+from piel.types import (
+    FockStateTransitionAmplitudes,
+    OpticalStateTransitions,
+    SwitchUnitaryBatch,
+)
+
+sax = pytest.importorskip("sax")
+
+switch_instance_list = [
+    ("lattice", "mzi_1", "sxt"),
+    ("lattice", "mzi_2", "sxt"),
+]
+switch_states = [0, jnp.pi]
+
+
+mzi_netlist = {
+    "instances": {
+        "mmi_in": "mmi2x2",
+        "mmi_out": "mmi2x2",
+        "sxt": "straight_heater_metal_simple",
+        "sxb": "straight",
+    },
+    "connections": {
+        "mmi_in,o3": "sxt,o1",
+        "sxt,o2": "mmi_out,o2",
+        "mmi_in,o4": "sxb,o1",
+        "sxb,o2": "mmi_out,o1",
+    },
+    "ports": {
+        "o1": "mmi_in,o1",
+        "o2": "mmi_in,o2",
+        "o3": "mmi_out,o3",
+        "o4": "mmi_out,o4",
+    },
+}
+
+
+@pytest.fixture(scope="module")
+def lattice_circuit():
+    lattice_netlist = {
+        "instances": {"mzi_1": "mzi", "mzi_2": "mzi"},
+        "connections": {"mzi_1,o3": "mzi_2,o1", "mzi_1,o4": "mzi_2,o2"},
+        "ports": {
+            "in_o_0": "mzi_1,o1",
+            "in_o_1": "mzi_1,o2",
+            "out_o_0": "mzi_2,o3",
+            "out_o_1": "mzi_2,o4",
+        },
+    }
+    circuit, _ = sax.circuit(
+        netlist={"lattice": lattice_netlist, "mzi": mzi_netlist},
+        models=get_default_models(type="optical_logic_verification"),
+    )
+    return circuit
+
+
+def test_compose_phase_configurations_array():
+    phase_configurations = compose_phase_configurations_array(
+        switch_states=[0, 1, 2], switch_amount=2
+    )
+    assert phase_configurations.shape == (9, 2)
+    assert phase_configurations[1].tolist() == [0, 1]
+    assert phase_configurations[-1].tolist() == [2, 2]
+    assert phase_configurations.dtype == np.float64
+
+    # A fabric without switches has a single empty configuration
+    assert compose_phase_configurations_array(
+        switch_states=[0, 1], switch_amount=0
+    ).shape == (1, 0)
+
+
+@pytest.mark.parametrize("jit", [True, False])
+def test_calculate_switch_unitaries_batch_matches_sequential(lattice_circuit, jit):
+    phase_configurations = compose_phase_configurations_array(
+        switch_states=switch_states, switch_amount=len(switch_instance_list)
+    )
+    switch_unitary_batch = calculate_switch_unitaries_batch(
+        circuit=lattice_circuit,
+        switch_instance_list=switch_instance_list,
+        phase_configurations=phase_configurations,
+        jit=jit,
+    )
+    assert isinstance(switch_unitary_batch, SwitchUnitaryBatch)
+    assert switch_unitary_batch.unitaries.shape == (4, 2, 2)
+    assert switch_unitary_batch.input_ports_order == ("in_o_0", "in_o_1")
+
+    sequential_unitaries = calculate_switch_unitaries(
+        circuit=lattice_circuit,
+        switch_function_parameter_state=compose_switch_function_parameter_state(
+            compose_phase_address_state(
+                switch_instance_map=switch_instance_list,
+                switch_phase_permutation_map=[
+                    tuple(phase_configuration_i)
+                    for phase_configuration_i in phase_configurations.tolist()
+                ],
+            )
+        ),
+    )
+    for id_i, (unitary_i, _) in sequential_unitaries.items():
+        assert jnp.allclose(switch_unitary_batch.unitaries[id_i], unitary_i, atol=1e-5)
+
+
+def test_convert_switch_unitary_batch_to_dictionaries(lattice_circuit):
+    switch_unitary_batch = calculate_switch_unitaries_batch(
+        circuit=lattice_circuit,
+        switch_instance_list=switch_instance_list,
+        phase_configurations=compose_phase_configurations_array(
+            switch_states=switch_states, switch_amount=len(switch_instance_list)
+        ),
+    )
+    (
+        switch_unitaries,
+        switch_function_parameter_state,
+        switch_phase_address_state,
+    ) = convert_switch_unitary_batch_to_dictionaries(switch_unitary_batch)
+    assert len(switch_unitaries) == 4
+    assert switch_unitaries[0][1] == ("in_o_0", "in_o_1")
+    # The phases are the exact switch states, as in the non-batched flow
+    assert switch_phase_address_state[1][("lattice", "mzi_2", "sxt")] == jnp.pi
+    assert (
+        switch_function_parameter_state[1]["mzi_2"]["sxt"]["active_phase_rad"] == jnp.pi
+    )
+
+
+def test_compose_phase_configurations_from_indexes():
+    phase_configurations = compose_phase_configurations_array(
+        switch_states=[0, 1, 2], switch_amount=3
+    )
+    configuration_indexes = [0, 5, 13, 26]
+    assert jnp.array_equal(
+        compose_phase_configurations_from_indexes(
+            switch_states=[0, 1, 2],
+            switch_amount=3,
+            configuration_indexes=configuration_indexes,
+        ),
+        phase_configurations[jnp.asarray(configuration_indexes)],
+    )
+
+
+def test_iterate_switch_unitaries_batches(lattice_circuit):
+    switch_unitary_batch = calculate_switch_unitaries_batch(
+        circuit=lattice_circuit,
+        switch_instance_list=switch_instance_list,
+        phase_configurations=compose_phase_configurations_array(
+            switch_states=switch_states, switch_amount=len(switch_instance_list)
+        ),
+    )
+    batches = list(
+        iterate_switch_unitaries_batches(
+            circuit=lattice_circuit,
+            switch_instance_list=switch_instance_list,
+            switch_states=switch_states,
+            chunk_size=3,
+        )
+    )
+    assert [batch.configuration_indexes.tolist() for batch in batches] == [
+        [0, 1, 2],
+        [3],
+    ]
+    assert batches[1].unitaries.shape == (1, 2, 2)
+    assert jnp.allclose(
+        jnp.concatenate([batch.unitaries for batch in batches]),
+        switch_unitary_batch.unitaries,
+        atol=1e-5,
+    )
+
+    # Resuming a sweep only evaluates the remaining configurations.
+    resumed_batches = list(
+        iterate_switch_unitaries_batches(
+            circuit=lattice_circuit,
+            switch_instance_list=switch_instance_list,
+            switch_states=switch_states,
+            chunk_size=3,
+            start_index=2,
+        )
+    )
+    assert [batch.configuration_indexes.tolist() for batch in resumed_batches] == [
+        [2, 3]
+    ]
+
+
+def test_construct_unitary_transition_probability_performance_array(lattice_circuit):
+    pytest.importorskip("qutip")
+    switch_unitary_batch = calculate_switch_unitaries_batch(
+        circuit=lattice_circuit,
+        switch_instance_list=switch_instance_list,
+        phase_configurations=compose_phase_configurations_array(
+            switch_states=switch_states, switch_amount=len(switch_instance_list)
+        ),
+    )
+    fock_states = fock_states_only_individual_modes(mode_amount=2, output_type="jax")
+    fock_state_transition_amplitudes = (
+        construct_unitary_transition_probability_performance_array(
+            unitaries=switch_unitary_batch,
+            input_fock_states=fock_states,
+            output_fock_states=fock_states,
+        )
+    )
+    assert isinstance(fock_state_transition_amplitudes, FockStateTransitionAmplitudes)
+    assert fock_state_transition_amplitudes.transition_probability_amplitudes.shape == (
+        4,
+        2,
+        2,
+    )
+    assert fock_state_transition_amplitudes.input_fock_states.tolist() == [
+        [1, 0],
+        [0, 1],
+    ]
+
+    # The dictionary form matches the dense amplitudes.
+    transition_probability_dictionary = (
+        construct_unitary_transition_probability_performance(
+            unitary_phase_implementations_dictionary={
+                0: convert_switch_unitary_batch_to_dictionaries(switch_unitary_batch)[0]
+            },
+            input_fock_states=fock_states,
+            output_fock_states=fock_states,
+        )
+    )
+    assert transition_probability_dictionary[0][3][1][
+        "fock_transition_probability_amplitude"
+    ] == pytest.approx(
+        fock_state_transition_amplitudes.transition_probability_amplitudes[3, 0, 1]
+    )
+    # The dictionaries reference the provided Fock state objects
+    assert (
+        transition_probability_dictionary[0][3][1]["input_fock_state"] is fock_states[0]
+    )
+    assert (
+        transition_probability_dictionary[0][3][1]["output_fock_state"]
+        is fock_states[1]
+    )
+
+    optical_state_transitions = get_state_phase_transitions(
+        circuit_component=None,
+        fock_state_transition_amplitudes=fock_state_transition_amplitudes,
+        target_mode_index=0,
+    )
+    assert isinstance(optical_state_transitions, OpticalStateTransitions)
+    assert len(optical_state_transitions.transmission_data) == 8
+    # Both switches in the same state implement an identity, otherwise a cross.
+    transition_dataframe = optical_state_transitions.transition_dataframe
+    assert transition_dataframe["output_fock_state"].tolist()[:4] == [
+        (1, 0),
+        (0, 1),
+        (0, 1),
+        (1, 0),
+    ]
+    assert transition_dataframe["target_mode_output"].tolist()[:4] == [1, 0, 0, 1]
+
+
+@pytest.mark.parametrize("jit", [True, False])
+def test_calculate_classical_transition_probability_amplitudes_batch(jit):
+    unitaries = jnp.stack(
+        [
+            jnp.array([[1, 0, 0], [0, 0, 1j], [0, 1, 0]], dtype=complex),
+            jnp.array([[0, 1, 0], [1, 0, 0], [0, 0, -1]], dtype=complex),
+        ]
+    )
+    fock_states = [
+        jnp.array([[1], [0], [0]]),
+        jnp.array([[0], [1], [0]]),
+        jnp.array([[0], [0], [1]]),
+    ]
+    mode_probabilities = calculate_classical_transition_probability_amplitudes_batch(
+        unitary_matrix=unitaries,
+        input_fock_states=fock_states,
+        jit=jit,
+    )
+    assert mode_probabilities.shape == (2, 3, 3)
+    for id_i, unitary_i in enumerate(unitaries):
+        data_i = calculate_classical_transition_probability_amplitudes(
+            unitary_matrix=unitary_i,
+            input_fock_states=fock_states,
+        )
+        for id_i_i, data_i_i in data_i.items():
+            assert jnp.allclose(
+                mode_probabilities[id_i, id_i_i],
+                data_i_i["classical_transition_mode_probability"].reshape(-1),
+            )
+
+    target_mode_probabilities = (
+        calculate_classical_transition_probability_amplitudes_batch(
+            unitary_matrix=unitaries,
+            input_fock_states=jnp.eye(3),
+            target_mode_index=1,
+            jit=jit,
+        )
+    )
+    assert target_mode_probabilities.tolist() == [[0, 0, 1], [1, 0, 0]]
+
+
+def test_get_state_phase_transitions_classical():
+    optical_state_transitions = get_state_phase_transitions(
+        circuit_component=mzi_netlist,
+        models=get_default_models(type="optical_logic_verification"),
+        mode_amount=2,
+        switch_states=[0, jnp.pi],
+        netlist_function=lambda circuit: circuit,
+        target_mode_index=0,
+    )
+    transition_dataframe = optical_state_transitions.transition_dataframe
+    assert transition_dataframe["input_fock_state"].tolist() == [
+        (1, 0),
+        (0, 1),
+        (1, 0),
+        (0, 1),
+    ]
+    # A balanced MZI is in the cross state at zero phase
+    assert transition_dataframe["output_fock_state"].tolist() == [
+        (0, 1),
+        (1, 0),
+        (1, 0),
+        (0, 1),
+    ]
+    assert transition_dataframe["target_mode_output"].tolist() == [0, 1, 1, 0]
+
+
+def test_compose_network_matrix_from_models_batch_kwargs():
+    with pytest.raises(TypeError):
+        compose_network_matrix_from_models(
+            circuit_component=None,
+            models=get_default_models(),
+            switch_states=switch_states,
+            batch=True,
+            jitt=False,
+        )
+
+
+def test_compose_network_matrix_from_models_batch_netlist_function():
+    with pytest.raises(ValueError):
+        compose_network_matrix_from_models(
+            circuit_component=None,
+            models=get_default_models(),
+            switch_states=switch_states,
+            netlist_function=lambda circuit_component: mzi_netlist,
+            batch=True,
+        )
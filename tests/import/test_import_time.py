@@ -0,0 +1,90 @@
+import re
+import subprocess
+import sys
+
+# A generous bound on the cumulative time of a bare ``import piel``, which takes tens of milliseconds, so that loaded
+# runners do not fail it. Eager imports are caught precisely by the heavy dependencies test instead.
+MAXIMUM_IMPORT_TIME_S = 5.0
+HEAVY_MODULES = ["jax", "pandas", "matplotlib", "sax", "qutip"]
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def get_cumulative_import_time_s(import_time_log: str, module_name: str) -> float:
+    match = re.search(
+        rf"import time:\s+\d+ \|\s+(\d+) \| {re.escape(module_name)}$",
+        import_time_log,
+        flags=re.MULTILINE,
+    )
+    assert match is not None, f"{module_name} was not imported."
+    return int(match.group(1)) * 1e-6
+
+
+def test_import_piel_does_not_load_heavy_dependencies():
+    result = run_python(
+        "import sys, piel; "
+        f"print([module for module in {HEAVY_MODULES!r} if module in sys.modules])"
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_import_time():
+    result = run_python("import piel")
+
+    assert get_cumulative_import_time_s(result.stderr, "piel") < MAXIMUM_IMPORT_TIME_S
+
+
+def test_lazy_attributes():
+    result = run_python(
+        "import piel; "
+        "assert piel.types.PulseSet is not None; "
+        "assert piel.return_path is piel.file_system.return_path; "
+        "assert piel.round_complex_array is not None; "
+        "assert 'flows' in dir(piel); "
+        "print(sorted(set(['types', 'return_path', 'create_setup_py']) - set(piel.__all__)))"
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_submodule_attributes():
+    # The submodules bound as attributes of the package when it was imported eagerly
+    submodule_names = {
+        "analysis": "piel.analysis",
+        "base": "piel.base",
+        "connectivity": "piel.connectivity",
+        "develop": "piel.develop",
+        "experimental": "piel.experimental",
+        "file_system": "piel.file_system",
+        "flows": "piel.flows",
+        "integration": "piel.integration",
+        "materials": "piel.materials",
+        "models": "piel.models",
+        "numerical": "piel.utils.numerical",
+        "parametric": "piel.utils.parametric",
+        "project_structure": "piel.project_structure",
+        "tools": "piel.tools",
+        "types": "piel.types",
+        "units": "piel.units",
+        "utils": "piel.utils",
+        "visual": "piel.visual",
+    }
+    # The attributes are resolved in a single fresh interpreter and compared with the imported modules
+    result = run_python(
+        "import sys, types, piel; "
+        f"submodule_names = {submodule_names!r}; "
+        "print(sorted("
+        "name for name, module_name in submodule_names.items() "
+        "if not isinstance(getattr(piel, name), types.ModuleType) "
+        "or getattr(piel, name) is not sys.modules[module_name]"
+        "))"
+    )
+    assert result.stdout.strip() == "[]"
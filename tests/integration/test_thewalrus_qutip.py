@@ -0,0 +1,139 @@
+import math
+
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+thewalrus = pytest.importorskip("thewalrus")
+qutip = pytest.importorskip("qutip")
+
+from piel.integration import (
+    calculate_fock_transition_probability_amplitudes,
+    clear_fock_permanent_cache,
+    compose_fock_transition_index_table,
+    fock_transition_probability_amplitude,
+)
+from piel.tools.qutip import all_fock_states_from_photon_number
+from piel.tools.thewalrus import unitary_permanent_batch
+
+
+def random_unitary(mode_amount: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    matrix = rng.normal(size=(mode_amount, mode_amount)) + 1j * rng.normal(
+        size=(mode_amount, mode_amount)
+    )
+    q, _ = np.linalg.qr(matrix)
+    return q
+
+
+@pytest.mark.parametrize("matrix_size", [1, 2, 3, 5])
+def test_unitary_permanent_batch(matrix_size):
+    rng = np.random.default_rng(matrix_size)
+    matrices = rng.normal(size=(4, matrix_size, matrix_size)) + 1j * rng.normal(
+        size=(4, matrix_size, matrix_size)
+    )
+    expected = [thewalrus.perm(matrix) for matrix in matrices]
+    assert np.allclose(unitary_permanent_batch(matrices), expected)
+    # The fallback path should match the vectorized path.
+    assert np.allclose(
+        unitary_permanent_batch(matrices, maximum_vectorized_size=0), expected
+    )
+
+
+def test_calculate_fock_transition_probability_amplitudes_single_photon():
+    unitary = random_unitary(3)
+    fock_states = all_fock_states_from_photon_number(
+        mode_amount=3, photon_amount=1, output_type="jax"
+    )
+    single_photon_states = [state for state in fock_states if state.sum() == 1]
+
+    amplitudes = calculate_fock_transition_probability_amplitudes(
+        unitary_matrix=unitary,
+        input_fock_states=single_photon_states,
+        output_fock_states=single_photon_states,
+    )
+    assert amplitudes.shape == (3, 3)
+    for i, input_fock_state in enumerate(single_photon_states):
+        for j, output_fock_state in enumerate(single_photon_states):
+            expected = fock_transition_probability_amplitude(
+                initial_fock_state=input_fock_state,
+                final_fock_state=output_fock_state,
+                unitary_matrix=jnp.asarray(unitary),
+            )
+            assert amplitudes[i, j] == pytest.approx(complex(expected), abs=1e-5)
+
+
+def test_calculate_fock_transition_probability_amplitudes_multiphoton():
+    unitary = random_unitary(3, seed=1)
+    input_fock_states = [
+        np.array([[2], [0], [0]]),
+        np.array([[1], [1], [0]]),
+        np.array([[1], [0], [0]]),
+    ]
+    output_fock_states = [
+        np.array([[0], [1], [1]]),
+        np.array([[0], [0], [2]]),
+        np.array([[0], [1], [0]]),
+    ]
+    fock_transition_index_table = compose_fock_transition_index_table(
+        input_fock_states=input_fock_states,
+        output_fock_states=output_fock_states,
+    )
+    amplitudes = calculate_fock_transition_probability_amplitudes(
+        unitary_matrix=np.stack([unitary, unitary.T]),
+        fock_transition_index_table=fock_transition_index_table,
+    )
+    assert amplitudes.shape == (2, 3, 3)
+
+    # <0,1,1| U |2,0,0> selects rows (1, 2) and the first column twice.
+    expected = thewalrus.perm(unitary[np.ix_([1, 2], [0, 0])]) / math.sqrt(2)
+    assert amplitudes[0, 0, 0] == pytest.approx(expected)
+    # <0,0,2| U |1,1,0> selects the last row twice and columns (0, 1).
+    expected = thewalrus.perm(unitary[np.ix_([2, 2], [0, 1])]) / math.sqrt(2)
+    assert amplitudes[0, 1, 1] == pytest.approx(expected)
+    # Transitions which do not conserve the photon number have a zero amplitude.
+    assert amplitudes[0, 0, 2] == 0
+    assert amplitudes[1, 2, 2] == pytest.approx(unitary.T[1, 0])
+
+
+def test_calculate_fock_transition_probability_amplitudes_cache(monkeypatch):
+    from piel.integration import thewalrus_qutip
+
+    unitary = random_unitary(3, seed=2)
+    input_fock_states = [np.array([[2], [0], [0]]), np.array([[1], [1], [0]])]
+    output_fock_states = [np.array([[0], [1], [1]]), np.array([[0], [0], [2]])]
+    expected = calculate_fock_transition_probability_amplitudes(
+        unitary_matrix=np.stack([unitary, unitary.T]),
+        input_fock_states=input_fock_states,
+        output_fock_states=output_fock_states,
+    )
+
+    clear_fock_permanent_cache()
+    permanent_amounts = []
+    unitary_permanent_batch = thewalrus_qutip.unitary_permanent_batch
+
+    def counted_unitary_permanent_batch(unitary_matrices):
+        permanent_amounts.append(len(unitary_matrices))
+        return unitary_permanent_batch(unitary_matrices)
+
+    monkeypatch.setattr(
+        thewalrus_qutip, "unitary_permanent_batch", counted_unitary_permanent_batch
+    )
+    for _ in range(2):
+        amplitudes = calculate_fock_transition_probability_amplitudes(
+            unitary_matrix=np.stack([unitary, unitary.T]),
+            input_fock_states=input_fock_states,
+            output_fock_states=output_fock_states,
+            use_cache=True,
+        )
+        np.testing.assert_allclose(amplitudes, expected)
+    # The permanents are only computed on the first evaluation of each unitary
+    assert permanent_amounts == [4, 4]
+
+    calculate_fock_transition_probability_amplitudes(
+        unitary_matrix=unitary,
+        input_fock_states=input_fock_states[:1],
+        output_fock_states=output_fock_states + [np.array([[1], [0], [1]])],
+        use_cache=True,
+    )
+    assert permanent_amounts == [4, 4, 1]
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from piel.materials.thermal_conductivity import (
+    aluminum,
+    calculate_thermal_conductivity,
+    copper,
+    get_thermal_conductivity_coefficients,
+    load_thermal_conductivity_registry,
+    material_references,
+    stainless_steel,
+    teflon,
+)
+from piel.materials.thermal_conductivity.utils import get_thermal_conductivity_fit
+
+
+def test_load_thermal_conductivity_registry_is_cached():
+    registry = load_thermal_conductivity_registry()
+
+    assert load_thermal_conductivity_registry() is registry
+    assert set(material_references) <= set(registry)
+
+    fit_type, coefficients = get_thermal_conductivity_coefficients(("copper", "rrr50"))
+    assert fit_type == "log10_rational"
+    assert coefficients[0] == pytest.approx(1.8743)
+    assert not coefficients.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "material_reference, expected",
+    [
+        (("copper", "rrr100"), 396.3),  # NIST OFHC copper at room temperature
+        (("aluminum", "1100"), 211.79),
+        (("stainless_steel", "304"), 15.308),
+    ],
+)
+def test_calculate_thermal_conductivity_values(material_reference, expected):
+    thermal_conductivity = calculate_thermal_conductivity(300, [material_reference])
+
+    assert thermal_conductivity.shape == (1,)
+    assert thermal_conductivity[0] == pytest.approx(expected, rel=1e-2)
+
+
+def test_calculate_thermal_conductivity_matches_material_functions():
+    temperature_K = np.array([[4.0, 20.0, 77.0], [150.0, 250.0, 300.0]])
+    material_functions = {
+        "aluminum": aluminum,
+        "copper": copper,
+        "stainless_steel": stainless_steel,
+        "teflon": teflon,
+    }
+
+    thermal_conductivity = calculate_thermal_conductivity(
+        temperature_K, material_references
+    )
+
+    assert thermal_conductivity.shape == (len(material_references), 2, 3)
+    for material_reference, thermal_conductivity_i in zip(
+        material_references, thermal_conductivity
+    ):
+        expected = material_functions[material_reference[0]](
+            temperature_K, material_reference
+        )
+        # The material functions only return the registry fit as a single precision jax array
+        np.testing.assert_allclose(thermal_conductivity_i, expected, rtol=1e-6)
+        np.testing.assert_allclose(
+            get_thermal_conductivity_fit(temperature_K, material_reference),
+            thermal_conductivity_i,
+        )
+
+
+def test_calculate_thermal_conductivity_invalid_material():
+    with pytest.raises(ValueError, match="Invalid specification"):
+        calculate_thermal_conductivity(300, [("copper", "rrr9")])
+
+    with pytest.raises(ValueError, match="not supported"):
+        calculate_thermal_conductivity(300, [("gold", None)])
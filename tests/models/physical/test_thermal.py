@@ -0,0 +1,126 @@
+import numpy as np
+import pytest
+from piel.materials.thermal_conductivity.utils import get_thermal_conductivity_fit
+from piel.models.physical.electrical.cables.dc import (
+    calculate_dc_cable_heat_transfer,
+    calculate_dc_cables_heat_transfer_matrix,
+)
+from piel.models.physical.electrical.cables.rf import (
+    calculate_coaxial_cable_heat_transfer,
+    calculate_coaxial_cables_heat_transfer_matrix,
+)
+from piel.models.physical.thermal import (
+    calculate_heat_transfer_1d_matrix_W,
+    compose_thermal_conductivity_integral,
+    heat_transfer_1d_W,
+)
+from piel.types.electrical.cables import (
+    CoaxialCableGeometryType,
+    CoaxialCableMaterialSpecificationType,
+    DCCableGeometryType,
+    DCCableMaterialSpecificationType,
+)
+
+TEMPERATURE_STAGES_K = [(50.0, 300.0), (4.0, 50.0), (1.0, 4.0)]
+
+
+def test_compose_thermal_conductivity_integral_is_cached():
+    temperature_K, integral = compose_thermal_conductivity_integral(
+        [("teflon", None)], temperature_limits_K=(4, 300), num=1000
+    )
+
+    assert integral.shape == (1, 1000)
+    assert integral[0, 0] == 0
+    assert np.all(np.diff(integral[0]) > 0)
+    assert (
+        compose_thermal_conductivity_integral(
+            [("teflon", None)], temperature_limits_K=(4, 300), num=1000
+        )[1]
+        is integral
+    )
+
+
+def test_calculate_heat_transfer_1d_matrix_W_matches_heat_transfer_1d_W():
+    material_references = [("copper", "rrr50"), ("stainless_steel", "304")]
+    heat_transfer_matrix_W = calculate_heat_transfer_1d_matrix_W(
+        temperature_stages_K=TEMPERATURE_STAGES_K,
+        material_references=material_references,
+        cross_sectional_area_m2=[1e-7, 2e-7],
+        length_m=0.5,
+    )
+
+    assert heat_transfer_matrix_W.shape == (2, 3)
+    for material_index, material_reference in enumerate(material_references):
+        for stage_index, temperature_range_K in enumerate(TEMPERATURE_STAGES_K):
+            expected = heat_transfer_1d_W(
+                thermal_conductivity_fit=get_thermal_conductivity_fit(
+                    temperature_range_K, material_reference
+                ),
+                temperature_range_K=temperature_range_K,
+                cross_sectional_area_m2=[1e-7, 2e-7][material_index],
+                length_m=0.5,
+            )
+            assert heat_transfer_matrix_W[material_index, stage_index] == pytest.approx(
+                expected, rel=1e-3
+            )
+
+
+def test_calculate_coaxial_cables_heat_transfer_matrix():
+    geometry_classes = [
+        CoaxialCableGeometryType(total_cross_sectional_area_m2=1e-6, length_m=1),
+        CoaxialCableGeometryType(total_cross_sectional_area_m2=3e-7, length_m=0.2),
+    ]
+    material_classes = [
+        CoaxialCableMaterialSpecificationType(
+            core=("copper", "rrr100"),
+            sheath=("stainless_steel", "304"),
+            dielectric=("teflon", None),
+        ),
+        CoaxialCableMaterialSpecificationType(core=("stainless_steel", "304")),
+    ]
+
+    heat_transfer = calculate_coaxial_cables_heat_transfer_matrix(
+        TEMPERATURE_STAGES_K, geometry_classes, material_classes
+    )
+
+    assert set(heat_transfer) == {"core", "sheath", "dielectric", "total"}
+    assert heat_transfer["total"].shape == (2, 3)
+    assert np.all(heat_transfer["sheath"][1] == 0)
+    np.testing.assert_allclose(
+        heat_transfer["total"],
+        heat_transfer["core"] + heat_transfer["sheath"] + heat_transfer["dielectric"],
+    )
+
+    for cable_index, (geometry_class, material_class) in enumerate(
+        zip(geometry_classes, material_classes)
+    ):
+        expected = calculate_coaxial_cable_heat_transfer(
+            temperature_range_K=TEMPERATURE_STAGES_K[0],
+            geometry_class=geometry_class,
+            material_class=material_class,
+        )
+        assert heat_transfer["total"][cable_index, 0] == pytest.approx(
+            expected.total, rel=1e-3
+        )
+
+
+def test_calculate_dc_cables_heat_transfer_matrix():
+    geometry_class = DCCableGeometryType(total_cross_sectional_area_m2=1e-8, length_m=1)
+    material_class = DCCableMaterialSpecificationType(core=("copper", "rrr50"))
+
+    heat_transfer = calculate_dc_cables_heat_transfer_matrix(
+        TEMPERATURE_STAGES_K, [geometry_class] * 4, [material_class] * 4
+    )
+
+    assert heat_transfer["total"].shape == (4, 3)
+    expected = calculate_dc_cable_heat_transfer(
+        temperature_range_K=TEMPERATURE_STAGES_K[1],
+        geometry_class=geometry_class,
+        material_class=material_class,
+    )
+    np.testing.assert_allclose(heat_transfer["core"][:, 1], expected.core, rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        calculate_dc_cables_heat_transfer_matrix(
+            TEMPERATURE_STAGES_K, [geometry_class], []
+        )
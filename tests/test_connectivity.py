@@ -1,9 +1,16 @@
+import pytest
+
 from piel import (
+    add_components_to_connectivity_graph,
+    compose_connectivity_graph,
     create_all_connections,
     create_connection_list_from_ports_lists,
     create_component_connections,
+    create_connectivity_graph_connections,
+    create_sequential_component_path,
 )
 from piel.types import (
+    Component,
     Port,
     PhysicalPort,
     Connection,
@@ -68,4 +75,101 @@ def test_create_component_connections():
     assert connections[0].ports[1] == component2.get_port("port1")
 
 
-# Add more tests as needed for additional behaviors, edge cases, and validation logic.
+def test_component_get_port_follows_ports():
+    component = Component(name="component", ports=[Port(name="a"), Port(name="b")])
+    assert component.get_port("b").name == "b"
+    assert component.get_port("c") is None
+
+    component.ports = [Port(name="c")]
+    assert component.get_port("c").name == "c"
+    assert component.get_port("a") is None
+
+    component.ports.append(Port(name="d"))
+    assert component.get_port("d").name == "d"
+
+    # In-place replacements and renames keep the length and identity of the list
+    component.ports[0] = Port(name="z")
+    assert component.get_port("z").name == "z"
+    assert component.get_port("c") is None
+
+    component.ports[1].name = "e"
+    assert component.get_port("e") is component.ports[1]
+    assert component.get_port("d") is None
+
+
+def _compose_mzi(name: str) -> Component:
+    ports = [Port(name="in0", parent_component_name=name), Port(name="out0")]
+    return Component(name=name, ports=ports)
+
+
+def test_compose_connectivity_graph():
+    mzi_0 = _compose_mzi("mzi_0")
+    mzi_1 = _compose_mzi("mzi_1")
+    lattice = Component(
+        name="lattice",
+        ports=[Port(name="in0"), Port(name="out0")],
+        components=[mzi_0, mzi_1],
+        connections=[Connection(ports=(mzi_0.ports[1], mzi_1.ports[0]))],
+    )
+    system = Component(name="system", ports=[Port(name="in0")], components=[lattice])
+
+    graph = compose_connectivity_graph(system)
+    assert graph.component_paths == ["", "lattice", "lattice.mzi_0", "lattice.mzi_1"]
+    assert graph.component_parent_ids == [-1, 0, 1, 1]
+    assert graph.component_children_ids[1] == [2, 3]
+    assert graph.get_component("lattice.mzi_1") is mzi_1
+    assert graph.get_port("in0") is system.ports[0]
+    assert graph.get_port("lattice.mzi_0.out0") is mzi_0.ports[1]
+    assert graph.get_port("lattice.mzi_2.out0") is None
+    assert graph.get_connected_ports("lattice.mzi_1.in0") == [mzi_0.ports[1]]
+    assert graph.edges.tolist() == [
+        [
+            graph.get_port_id("lattice.mzi_0.out0"),
+            graph.get_port_id("lattice.mzi_1.in0"),
+        ]
+    ]
+
+    connections = create_connectivity_graph_connections(
+        graph,
+        [["in0", "lattice.in0"], ["lattice.mzi_1.out0", "lattice.out0"]],
+    )
+    assert len(connections) == 2
+    assert connections[0].ports == (system.ports[0], lattice.ports[0])
+    assert graph.get_connected_ports("lattice.out0") == [mzi_1.ports[1]]
+    assert len(graph.edges) == 3
+
+    with pytest.raises(ValueError):
+        create_connectivity_graph_connections(graph, ["in0", "lattice.in1"])
+
+
+def test_add_components_to_connectivity_graph_keeps_ids():
+    graph = compose_connectivity_graph([_compose_mzi("mzi_0"), _compose_mzi("mzi_1")])
+    port_ids = dict(graph.port_ids)
+
+    mzi_2 = _compose_mzi("mzi_2")
+    add_components_to_connectivity_graph(graph, mzi_2, parent_path="mzi_1")
+    assert graph.port_ids.items() >= port_ids.items()
+    assert graph.get_port("mzi_1.mzi_2.in0") is mzi_2.ports[0]
+    assert graph.component_parent_ids[-1] == graph.component_ids["mzi_1"]
+
+    create_connectivity_graph_connections(graph, ["mzi_0.out0", "mzi_1.mzi_2.in0"])
+    assert graph.get_connected_ports("mzi_0.out0") == [mzi_2.ports[0]]
+
+    with pytest.raises(ValueError):
+        add_components_to_connectivity_graph(graph, mzi_2, parent_path="mzi_1")
+    with pytest.raises(ValueError):
+        add_components_to_connectivity_graph(graph, mzi_2, parent_path="mzi_3")
+
+
+def test_create_sequential_component_path():
+    components = [
+        PhysicalComponent(
+            name=f"component{i}",
+            ports=[PhysicalPort(name="in"), PhysicalPort(name="out")],
+        )
+        for i in range(3)
+    ]
+    path_component = create_sequential_component_path(components)
+    assert path_component.ports == [components[0].ports[0], components[-1].ports[-1]]
+    assert len(path_component.connections) == 3
+    assert path_component.connections[-1].connections[0].time.max == 0
@@ -0,0 +1,165 @@
+import json
+import pandas as pd
+import pytest
+from piel.tools.openlane.parse import (
+    clear_run_report_cache,
+    get_all_run_report_files,
+    read_all_design_runs_reports,
+    read_power_sta_file,
+    read_run_report,
+)
+from piel.tools.openlane.parse import run_output
+from .test_sta_rpt import timing_frame
+
+POWER_RPT = """\
+Group                  Internal  Switching    Leakage      Total
+                          Power      Power      Power      Power (Watts)
+----------------------------------------------------------------
+Sequential             0.00e+00   0.00e+00   0.00e+00   0.00e+00   0.0%
+Combinational          1.00e-06   2.00e-06   1.00e-09   3.00e-06 100.0%
+Macro                  0.00e+00   0.00e+00   0.00e+00   0.00e+00   0.0%
+Pad                    0.00e+00   0.00e+00   0.00e+00   0.00e+00   0.0%
+----------------------------------------------------------------
+Total                  1.00e-06   2.00e-06   1.00e-09   3.00e-06 100.0%
+                          33.3%      66.7%       0.0%
+"""
+
+
+def write_run(run_directory, output_time):
+    reports_directory = run_directory / "reports"
+    reports_directory.mkdir(parents=True)
+    lines = ["OpenSTA report"] + timing_frame("in_a", "out_a", "1.00", output_time)
+    (reports_directory / "sta.rpt").write_text("\n".join(lines) + "\n")
+    (reports_directory / "power.rpt").write_text(POWER_RPT)
+    (run_directory / "final").mkdir()
+    (run_directory / "final" / "metrics.json").write_text(
+        json.dumps({"design__instance__count": 10, "flow__status": "done"})
+    )
+
+
+@pytest.fixture
+def design_directory(tmp_path):
+    # The designs are discovered as piel modules, which are identified by their setup.py
+    design_directory = tmp_path / "inverter"
+    design_directory.mkdir()
+    (design_directory / "setup.py").write_text("")
+    write_run(design_directory / "runs" / "RUN_2024-01-01_10-00-00", "1.30")
+    write_run(design_directory / "runs" / "RUN_2024-01-02_10-00-00", "1.50")
+    clear_run_report_cache()
+    yield design_directory
+    clear_run_report_cache()
+
+
+def test_read_power_sta_file(design_directory):
+    power_data = read_power_sta_file(
+        design_directory / "runs" / "RUN_2024-01-01_10-00-00" / "reports" / "power.rpt"
+    )
+
+    assert power_data["group"].tolist() == [
+        "Sequential",
+        "Combinational",
+        "Macro",
+        "Pad",
+        "Total",
+    ]
+    assert power_data["total_power"].iloc[-1] == pytest.approx(3e-6)
+    assert power_data["percentage"].iloc[1] == pytest.approx(100.0)
+
+
+def test_get_all_run_report_files(design_directory):
+    run_report_files = get_all_run_report_files(
+        design_directory / "runs" / "RUN_2024-01-01_10-00-00"
+    )
+
+    assert [len(run_report_files[key]) for key in ["timing", "power", "metrics"]] == [
+        1,
+        1,
+        1,
+    ]
+
+
+def test_read_run_report_cache_is_invalidated_on_change(design_directory):
+    file_path = (
+        design_directory / "runs" / "RUN_2024-01-01_10-00-00" / "reports" / "sta.rpt"
+    )
+    report_rows = read_run_report(file_path, "timing")
+
+    assert report_rows["item"].tolist() == ["in_a -> out_a"]
+    assert report_rows["value"].tolist() == pytest.approx([0.3])
+    # Modifying a returned report does not corrupt the cached report
+    report_rows["value"] = 0.0
+    assert read_run_report(file_path, "timing")["value"].tolist() == pytest.approx(
+        [0.3]
+    )
+
+    lines = ["OpenSTA report"] + timing_frame("in_a", "out_a", "1.00", "1.40")
+    file_path.write_text("\n".join(lines) + "\n\n")
+
+    assert read_run_report(file_path, "timing")["value"].tolist() == pytest.approx(
+        [0.4]
+    )
+    # The modified report replaces its stale entry
+    assert len(run_output._RUN_REPORT_CACHE) == 1
+
+    with pytest.raises(ValueError):
+        read_run_report(file_path, "area")
+
+
+def test_read_run_report_cache_evicts_least_recently_used(
+    design_directory, monkeypatch
+):
+    monkeypatch.setattr(run_output, "RUN_REPORT_CACHE_MAXSIZE", 2)
+    reports_directory = (
+        design_directory / "runs" / "RUN_2024-01-01_10-00-00" / "reports"
+    )
+    read_run_report(reports_directory / "sta.rpt", "timing")
+    read_run_report(reports_directory / "power.rpt", "power")
+    read_run_report(reports_directory / "sta.rpt", "timing")
+    read_run_report(
+        design_directory / "runs" / "RUN_2024-01-02_10-00-00" / "reports" / "sta.rpt",
+        "timing",
+    )
+
+    assert [report_key[1] for report_key in run_output._RUN_REPORT_CACHE] == [
+        "timing",
+        "timing",
+    ]
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_read_all_design_runs_reports(design_directory, parallel):
+    run_reports = read_all_design_runs_reports(
+        [design_directory], parallel=parallel, max_workers=2
+    )
+
+    assert set(run_reports["run_version"]) == {"v2"}
+    assert run_reports["report_type"].value_counts().to_dict() == {
+        "power": 40,
+        "timing": 2,
+        "metrics": 2,
+    }
+    propagation_delay = run_reports[run_reports["metric"] == "propagation_delay"]
+    assert propagation_delay["run_directory"].str.endswith("00").all()
+    assert propagation_delay["value"].tolist() == pytest.approx([0.3, 0.5])
+
+    # The non numeric metrics are dropped from the numeric value column
+    assert set(run_reports[run_reports["report_type"] == "metrics"]["metric"]) == {
+        "design__instance__count"
+    }
+
+    # The cached reports give the same table
+    pd.testing.assert_frame_equal(
+        read_all_design_runs_reports([design_directory], parallel=parallel),
+        run_reports,
+    )
+
+
+def test_read_all_design_runs_reports_run_name(design_directory):
+    run_reports = read_all_design_runs_reports(
+        [design_directory],
+        run_name="RUN_2024-01-02_10-00-00",
+        report_types=("timing",),
+        parallel=False,
+    )
+
+    assert run_reports["value"].tolist() == pytest.approx([0.5])
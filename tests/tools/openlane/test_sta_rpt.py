@@ -0,0 +1,107 @@
+import pandas as pd
+import pytest
+from piel.tools.openlane.parse import (
+    calculate_propagation_delay_from_file,
+    compose_timing_data_table,
+    configure_timing_data_rows,
+    get_all_timing_data_from_file,
+    get_frame_lines_data,
+    get_frame_timing_data,
+    read_sta_rpt_timing_data_table,
+)
+
+
+def timing_line(
+    fanout="", cap="", slew="", delay="", time="", direction="", description=""
+):
+    return (
+        f"{fanout:>6}{cap:>8}{slew:>8}{delay:>8}{time:>8}{direction:>2} {description}"
+    )
+
+
+def timing_frame(input_net, output_net, input_time, output_time):
+    return [
+        "=" * 76,
+        "report_checks -path_delay min_max",
+        "=" * 76,
+        f"Startpoint: {input_net} (input port clocked by clk)",
+        f"Endpoint: {output_net} (output port clocked by clk)",
+        "Path Group: clk",
+        "Path Type: max",
+        "",
+        "Fanout     Cap    Slew   Delay    Time   Description",
+        "-" * 76,
+        timing_line(delay="0.00", time="0.00", description="clock clk (rise edge)"),
+        timing_line(
+            slew="0.02",
+            delay="0.01",
+            time=input_time,
+            direction="^",
+            description=f"{input_net} (in)",
+        ),
+        timing_line(fanout="1", cap="0.00", description=f"{input_net} (net)"),
+        "",
+        timing_line(
+            slew="0.05",
+            delay="0.30",
+            time=output_time,
+            direction="^",
+            description=f"{output_net} (out)",
+        ),
+        timing_line(time=output_time, description="data arrival time"),
+        "-" * 76,
+        "",
+    ]
+
+
+@pytest.fixture
+def sta_rpt_file(tmp_path):
+    file = tmp_path / "sta.rpt"
+    lines = ["OpenSTA report"]
+    lines += timing_frame("in_a", "out_a", "2.01", "2.31")
+    lines += timing_frame("in_b", "out_b", "1.00", "1.50")
+    file.write_text("\n".join(lines) + "\n")
+    return file
+
+
+def test_compose_timing_data_table(sta_rpt_file):
+    timing_data = read_sta_rpt_timing_data_table(sta_rpt_file)
+
+    assert timing_data["frame_id"].tolist() == [0] * 5 + [1] * 5
+    assert timing_data["net_type"].tolist()[:4] == ["rise edge", "in", "net", "out"]
+    assert pd.isna(timing_data["net_type"].iloc[4])
+    assert timing_data["Time"].tolist()[:2] == [0.0, 2.01]
+
+
+def test_get_all_timing_data_from_file_matches_per_frame_parser(sta_rpt_file):
+    frame_timing_data = get_all_timing_data_from_file(sta_rpt_file)
+
+    file_lines_data = get_frame_lines_data(sta_rpt_file)
+    frame_meta_data = configure_timing_data_rows(file_lines_data)
+    assert list(frame_timing_data.keys()) == [0, 1]
+    for frame_id, timing_data in frame_timing_data.items():
+        pd.testing.assert_frame_equal(
+            timing_data,
+            get_frame_timing_data(sta_rpt_file, frame_meta_data, frame_id),
+            check_dtype=False,
+        )
+
+
+def test_calculate_propagation_delay_from_file(sta_rpt_file):
+    propagation_delay = calculate_propagation_delay_from_file(sta_rpt_file)
+
+    assert propagation_delay[0]["propagation_delay"].tolist() == pytest.approx([0.3])
+    assert propagation_delay[1]["propagation_delay"].tolist() == pytest.approx([0.5])
+
+
+def test_compose_timing_data_table_without_timing_lines():
+    file_lines_data = pd.DataFrame(
+        {
+            "lines": ["header", "=" * 10],
+            "timing_data_line": [False, False],
+            "frame_id": [-1, 0],
+        }
+    )
+    timing_data = compose_timing_data_table(file_lines_data)
+    assert len(timing_data) == 0
+    assert "net_name" in timing_data.columns
@@ -0,0 +1,187 @@
+import functools
+
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+from piel.models.frequency.defaults import get_default_models
+from piel.tools.sax import (
+    clear_sax_circuit_cache,
+    compose_sax_circuit_cache_key,
+    enable_sax_circuit_disk_cache,
+    get_cached_sax_circuit,
+    hash_sax_models,
+    hash_sax_netlist,
+)
+from piel.flows.electro_optic import generate_s_parameter_circuit_from_photonic_circuit
+from ...flows.test_electro_optic import mzi_netlist
+
+_MODEL_COUPLING = 0.5
+
+
+@pytest.fixture(autouse=True)
+def empty_sax_circuit_cache():
+    clear_sax_circuit_cache()
+    yield
+    clear_sax_circuit_cache()
+
+
+def test_hash_sax_netlist_is_independent_of_key_order():
+    reordered_netlist = dict(reversed(list(mzi_netlist.items())))
+    assert hash_sax_netlist(reordered_netlist) == hash_sax_netlist(mzi_netlist)
+
+    modified_netlist = {**mzi_netlist, "instances": {"mmi_in": "mmi2x2"}}
+    assert hash_sax_netlist(modified_netlist) != hash_sax_netlist(mzi_netlist)
+
+
+def test_hash_sax_models():
+    models = get_default_models(type="optical_logic_verification")
+    assert hash_sax_models(dict(models)) == hash_sax_models(models)
+    assert hash_sax_models(models) != hash_sax_models(
+        get_default_models(type="classical")
+    )
+
+    def coupler(coupling=0.5):
+        return coupling
+
+    assert hash_sax_models(
+        {"coupler": functools.partial(coupler, coupling=0.3)}
+    ) != hash_sax_models({"coupler": functools.partial(coupler, coupling=0.4)})
+
+
+def test_hash_sax_models_hashes_array_contents():
+    def make_model(coefficients):
+        def model():
+            return coefficients
+
+        return model
+
+    # The two arrays only differ beyond the truncated part of their repr
+    coefficients = np.zeros(10_000)
+    modified_coefficients = coefficients.copy()
+    modified_coefficients[5_000] = 1.0
+    assert repr(coefficients) == repr(modified_coefficients)
+
+    assert hash_sax_models({"model": make_model(coefficients)}) != hash_sax_models(
+        {"model": make_model(modified_coefficients)}
+    )
+    assert hash_sax_models({"model": make_model(coefficients)}) == hash_sax_models(
+        {"model": make_model(coefficients.copy())}
+    )
+
+    def coupler(coefficients=None):
+        return coefficients
+
+    assert hash_sax_models(
+        {"coupler": functools.partial(coupler, coefficients=coefficients)}
+    ) != hash_sax_models(
+        {"coupler": functools.partial(coupler, coefficients=modified_coefficients)}
+    )
+
+    netlist = {"instances": {"a": {"component": "coupler", "settings": {}}}}
+    netlist["instances"]["a"]["settings"]["coefficients"] = coefficients
+    modified_netlist = {
+        "instances": {
+            "a": {
+                "component": "coupler",
+                "settings": {"coefficients": modified_coefficients},
+            }
+        }
+    }
+    assert hash_sax_netlist(netlist) != hash_sax_netlist(modified_netlist)
+
+
+def test_hash_sax_models_includes_module_globals(monkeypatch):
+    def coupler():
+        return _MODEL_COUPLING
+
+    models_hash = hash_sax_models({"coupler": coupler})
+    monkeypatch.setitem(globals(), "_MODEL_COUPLING", 0.3)
+    assert hash_sax_models({"coupler": coupler}) != models_hash
+
+
+def test_get_cached_sax_circuit_compiles_uncacheable_models():
+    models = dict(get_default_models(type="optical_logic_verification"))
+    unhashable_value = object()
+    straight = models["straight"]
+
+    def unhashable_straight(**kwargs):
+        assert unhashable_value is not None
+        return straight(**kwargs)
+
+    models["straight"] = unhashable_straight
+    assert hash_sax_models(models) is None
+    assert compose_sax_circuit_cache_key(mzi_netlist, models) is None
+
+    circuit, _ = get_cached_sax_circuit(mzi_netlist, models, ignore_missing_ports=True)
+    recompiled_circuit, _ = get_cached_sax_circuit(
+        mzi_netlist, models, ignore_missing_ports=True
+    )
+    assert recompiled_circuit is not circuit
+
+
+def test_get_cached_sax_circuit_reuses_circuit():
+    models = get_default_models(type="optical_logic_verification")
+    circuit, circuit_info = get_cached_sax_circuit(
+        mzi_netlist, models, ignore_missing_ports=True
+    )
+    cached_circuit, cached_circuit_info = get_cached_sax_circuit(
+        dict(mzi_netlist), dict(models), ignore_missing_ports=True
+    )
+    assert cached_circuit is circuit
+    assert cached_circuit_info is circuit_info
+
+    jit_circuit, _ = get_cached_sax_circuit(
+        mzi_netlist, models, jit=True, ignore_missing_ports=True
+    )
+    assert jit_circuit is not circuit
+    s_parameters = circuit(sxt={"active_phase_rad": jnp.pi})
+    jit_s_parameters = jit_circuit(sxt={"active_phase_rad": jnp.pi})
+    for port_pair, value in s_parameters.items():
+        assert jnp.allclose(jit_s_parameters[port_pair], value, atol=1e-6)
+
+
+def test_get_cached_sax_circuit_evicts_least_recently_used():
+    models = get_default_models(type="optical_logic_verification")
+    circuit, _ = get_cached_sax_circuit(
+        mzi_netlist, models, maxsize=1, ignore_missing_ports=True
+    )
+    get_cached_sax_circuit(mzi_netlist, models, jit=True, maxsize=1)
+    recompiled_circuit, _ = get_cached_sax_circuit(
+        mzi_netlist, models, maxsize=1, ignore_missing_ports=True
+    )
+    assert recompiled_circuit is not circuit
+
+
+def test_generate_s_parameter_circuit_uses_cache():
+    models = get_default_models(type="optical_logic_verification")
+    circuit, _ = generate_s_parameter_circuit_from_photonic_circuit(
+        mzi_netlist, models=models, netlist_function=lambda circuit: circuit
+    )
+    cached_circuit, _ = generate_s_parameter_circuit_from_photonic_circuit(
+        mzi_netlist, models=models, netlist=mzi_netlist
+    )
+    uncached_circuit, _ = generate_s_parameter_circuit_from_photonic_circuit(
+        mzi_netlist, models=models, netlist=mzi_netlist, use_cache=False
+    )
+    assert cached_circuit is circuit
+    assert uncached_circuit is not circuit
+    assert compose_sax_circuit_cache_key(
+        mzi_netlist, models
+    ) != compose_sax_circuit_cache_key(mzi_netlist, models, jit=True)
+
+
+def test_enable_sax_circuit_disk_cache(tmp_path):
+    import jax
+
+    previous_cache_directory = jax.config.jax_compilation_cache_dir
+    previous_min_compile_time_s = jax.config.jax_persistent_cache_min_compile_time_secs
+    try:
+        cache_directory = enable_sax_circuit_disk_cache(tmp_path / "sax")
+        assert cache_directory.is_dir()
+        assert jax.config.jax_compilation_cache_dir == str(cache_directory)
+    finally:
+        jax.config.update("jax_compilation_cache_dir", previous_cache_directory)
+        jax.config.update(
+            "jax_persistent_cache_min_compile_time_secs", previous_min_compile_time_s
+        )
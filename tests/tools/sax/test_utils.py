@@ -0,0 +1,72 @@
+import jax.numpy as jnp
+import numpy as np
+import pytest
+
+from piel.tools.sax import (
+    convert_dense_network_transmission_to_sdense,
+    convert_sdense_to_dense_network_transmission,
+)
+from piel.types import Phasor
+
+
+def test_sdense_dense_network_transmission_round_trip():
+    s_matrix = jnp.array([[0, 1j], [1j, 0]], dtype=complex)
+    port_map = {"in0": 0, "out0": 1}
+    input_phasor = Phasor(magnitude=[0.0], phase=[0.0], frequency=[1.93e14])
+
+    network_transmission = convert_sdense_to_dense_network_transmission(
+        (s_matrix, port_map), input=input_phasor
+    )
+    assert network_transmission.s.shape == (1, 2, 2)
+    path_transmission = network_transmission.get_path_transmission("in0", "out0")
+    np.testing.assert_allclose(path_transmission.transmission.magnitude, [0.0])
+    np.testing.assert_allclose(path_transmission.transmission.phase, [90.0])
+
+    batched_s_matrix, batched_port_map = convert_dense_network_transmission_to_sdense(
+        network_transmission
+    )
+    np.testing.assert_array_equal(batched_s_matrix, s_matrix[None, :, :])
+    assert batched_port_map == port_map
+
+    with pytest.raises(ValueError):
+        convert_sdense_to_dense_network_transmission(
+            (s_matrix, {"in0": 0, "out0": 0}), input=input_phasor
+        )
+
+
+def test_non_reciprocal_sdense_skrf_round_trip():
+    import sax
+    from piel.tools.skrf import convert_dense_network_transmission_to_skrf_network
+
+    # A 20 dB amplifier from in0 to out0 with 40 dB of reverse isolation
+    s_matrix, port_map = sax.sdense({("in0", "out0"): 10.0, ("out0", "in0"): 0.01})
+    s_matrix = np.asarray(s_matrix)
+    input_phasor = Phasor(magnitude=[0.0], phase=[0.0], frequency=[1e9])
+
+    network_transmission = convert_sdense_to_dense_network_transmission(
+        (s_matrix, port_map), input=input_phasor
+    )
+    assert np.shares_memory(network_transmission.s, s_matrix)
+    np.testing.assert_allclose(
+        network_transmission.get_path_transmission(
+            "in0", "out0"
+        ).transmission.magnitude,
+        [20.0],
+    )
+    path_transmissions = {
+        path_transmission.connection: path_transmission.transmission
+        for path_transmission in network_transmission.network
+    }
+    np.testing.assert_allclose(path_transmissions[("out0", "in0")].magnitude, [-40.0])
+
+    network = convert_dense_network_transmission_to_skrf_network(network_transmission)
+    port_order = sorted(port_map, key=port_map.get)
+    in0_index, out0_index = port_order.index("in0"), port_order.index("out0")
+    np.testing.assert_allclose(network.s_db[:, out0_index, in0_index], [20.0])
+    np.testing.assert_allclose(network.s_db[:, in0_index, out0_index], [-40.0])
+
+    round_trip_s_matrix, round_trip_port_map = (
+        convert_dense_network_transmission_to_sdense(network_transmission)
+    )
+    np.testing.assert_array_equal(round_trip_s_matrix[0], s_matrix)
+    assert round_trip_port_map == port_map
@@ -253,3 +253,37 @@ def test_non_standard_units(two_port_network):
     assert network_trans.input.frequency.tolist() == expected_frequencies
     for path in network_trans.network:
         assert path.transmission.frequency.tolist() == expected_frequencies
+
+
+def test_dense_network_transmission_conversion(two_port_network):
+    """
+    Test the zero-copy dense conversion and its per-path views.
+    """
+    from piel.tools.skrf import (
+        convert_dense_network_transmission_to_skrf_network,
+        convert_skrf_network_to_dense_network_transmission,
+    )
+
+    dense_network_transmission = convert_skrf_network_to_dense_network_transmission(
+        two_port_network
+    )
+    assert np.shares_memory(dense_network_transmission.s, two_port_network.s)
+    assert dense_network_transmission.port_names == [1, 2]
+
+    # The path from port 1 to port 2 is S21
+    path_transmission = dense_network_transmission.get_path_transmission(1, 2)
+    assert path_transmission.connection == (1, 2)
+    np.testing.assert_allclose(
+        path_transmission.transmission.magnitude,
+        20 * np.log10(np.abs(two_port_network.s[:, 1, 0])),
+    )
+    assert [
+        path_transmission.connection
+        for path_transmission in dense_network_transmission.network
+    ] == [(1, 1), (1, 2), (2, 1), (2, 2)]
+
+    network = convert_dense_network_transmission_to_skrf_network(
+        dense_network_transmission
+    )
+    np.testing.assert_array_equal(network.s, two_port_network.s)
+    np.testing.assert_array_equal(network.frequency.f, two_port_network.frequency.f)
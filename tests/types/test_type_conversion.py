@@ -12,6 +12,12 @@ from piel.types import (
     absolute_to_threshold,
     convert_to_bits,
     convert_dataframe_to_bits,
+    convert_bits_to_integer_array,
+    convert_integer_array_to_bits,
+    convert_digit_tuples_to_strings,
+    convert_truth_table_to_array,
+    convert_array_to_truth_table,
+    TruthTable,
     PielBaseModel,
     Quantity,
     a2d,
@@ -177,3 +183,51 @@ def test_quantity_type_initialization():
 def test_quantity_type_default():
     quantity = Quantity()
     assert quantity.unit == piel.types.ratio
+
+
+def test_convert_bits_to_integer_array():
+    integer_array, bit_width = convert_bits_to_integer_array(["01", "110", "0"])
+    assert integer_array.tolist() == [1, 6, 0]
+    assert bit_width == 3
+
+    integer_array, bit_width = convert_bits_to_integer_array([3, 4])
+    assert integer_array.tolist() == [3, 4]
+    assert bit_width == 3
+
+    with pytest.raises(ValueError):
+        convert_bits_to_integer_array(["012"])
+
+
+def test_convert_integer_array_to_bits():
+    bits = convert_integer_array_to_bits(np.array([1, 6, 0]), 3)
+    assert bits.tolist() == ["001", "110", "000"]
+
+
+def test_convert_digit_tuples_to_strings():
+    assert convert_digit_tuples_to_strings([(1, 0), (0, 2)]) == ["10", "02"]
+    # Multi-digit and ragged tuples fall back to the per-tuple conversion
+    assert convert_digit_tuples_to_strings([(12, 0)]) == [
+        convert_tuple_to_string((12, 0))
+    ]
+    assert convert_digit_tuples_to_strings([(1,), (1, 0)]) == ["1", "10"]
+
+
+def test_truth_table_array_round_trip():
+    truth_table = TruthTable(
+        input_ports=["a", "b"],
+        output_ports=["x"],
+        a=["00", "01", "10"],
+        b=["1", "0", "1"],
+        x=["011", "100", "111"],
+    )
+    truth_table_array = truth_table.array
+    np.testing.assert_array_equal(
+        truth_table_array.data, convert_truth_table_to_array(truth_table).data
+    )
+    assert truth_table_array.data.tolist() == [[0, 1, 3], [1, 0, 4], [2, 1, 7]]
+    assert truth_table_array.bit_widths == [2, 1, 3]
+
+    converted_truth_table = convert_array_to_truth_table(truth_table_array)
+    assert converted_truth_table.implementation_dictionary == (
+        truth_table.implementation_dictionary
+    )